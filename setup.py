@@ -29,9 +29,9 @@ def prepare_build_kwargs():
     library_dirs = []
     include_dirs = []
     libraries = []
-    extra_link_args = ["-g"]
+    extra_link_args = ["-g", "-pthread"]
     imagclib = []
-    extra_compile_args = ["-DImMagick", "-DLinuxBuild", "-g"]
+    extra_compile_args = ["-DImMagick", "-DLinuxBuild", "-g", "-pthread"]
 
     pathvar = os.environ.get("PATH", "")
     for pv in map(lambda x: x.rstrip("/"), pathvar.split(':')):
@@ -107,6 +107,14 @@ setup(
                 "src/isk/backends/imgseeklib/haar.cpp",
                 "src/isk/backends/imgseeklib/imgdb.i",
                 "src/isk/backends/imgseeklib/bloom_filter.cpp",
+                "src/isk/backends/imgseeklib/postings.cpp",
+                "src/isk/backends/imgseeklib/keywords.cpp",
+                "src/isk/backends/imgseeklib/bitmap.cpp",
+                "src/isk/backends/imgseeklib/threadpool.cpp",
+                "src/isk/backends/imgseeklib/avgl.cpp",
+                "src/isk/backends/imgseeklib/mapped.cpp",
+                "src/isk/backends/imgseeklib/wal.cpp",
+                "src/isk/backends/imgseeklib/rawio.cpp",
                 ],
             swig_opts=['-c++'],
             **build_kwargs,
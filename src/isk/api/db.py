@@ -126,7 +126,8 @@ def save_all_dbs_as(path: str) -> int:
 
 def save_all_dbs() -> int:
     """
-    Persist all existing database spaces on the data file defined at the config file I{settings.py}
+    Persist all database spaces changed since their last save, each on its own file next to the data file defined at
+    the config file I{settings.py}
 
     :since: 0.7
     :return:  count of persisted db spaces
@@ -135,6 +136,18 @@ def save_all_dbs() -> int:
     return backend.savealldbs(db_path)
 
 
+def checkpoint_dbs() -> int:
+    """
+    Persist all database spaces changed since their last save, as L{save_all_dbs} does, once the write ahead log holds
+    I{settings.CHECKPOINT_LOG_SIZE} bytes of changes. Without a log they are always persisted.
+
+    :since: 0.11
+    :return:  count of persisted db spaces, 0 if it was not time yet, -1 on failure
+    """
+
+    return backend.checkpoint(settings.CHECKPOINT_LOG_SIZE)
+
+
 def load_all_dbs_as(path: str) -> int:
     """
     Loads from disk all previously persisted database spaces. (File resulting from a previous call to L{saveAllDbs}).
@@ -155,7 +168,7 @@ def load_all_dbs() -> int:
     :return:  count of persisted db spaces
     """
 
-    return backend.loadalldbs(db_path)
+    return backend.load_database(db_path, settings.LOAD_THREADS, settings.LAZY_LOAD)
 
 
 def remove_db(db_id: int) -> bool:
@@ -182,6 +195,44 @@ def is_valid_db(db_id: int) -> bool:
     return backend.is_valid_db(db_id)
 
 
+def compact_db(db_id: int) -> int:
+    """
+    Free the memory held by removed images of a database space now, instead of waiting for
+    the periodic compaction. Queries go on while it runs.
+
+    :since: 0.11
+    :param db_id: Database space id.
+    :return:  count of removed images freed
+    """
+
+    return backend.compact_db(db_id, settings.COMPACTION_STEP)
+
+
+def compact_dbs() -> int:
+    """
+    Compact database spaces with at least I{settings.COMPACTION_MIN_DEAD} removed images.
+
+    :since: 0.11
+    :return:  count of removed images freed
+    """
+
+    return backend.compact_dbs(settings.COMPACTION_MIN_DEAD, settings.COMPACTION_STEP)
+
+
+def evict_idle_dbs() -> int:
+    """
+    Free the memory of database spaces unused for I{settings.EVICT_IDLE_AFTER} seconds. They are loaded again from
+    their file on their next use. Does nothing when I{settings.EVICT_IDLE_AFTER} is 0.
+
+    :since: 0.11
+    :return:  count of evicted db spaces
+    """
+
+    if not settings.EVICT_IDLE_AFTER:
+        return 0
+    return backend.evict_idle_db_spaces(settings.EVICT_IDLE_AFTER)
+
+
 exporting = (
     save_db,
     load_db,
@@ -197,4 +248,5 @@ exporting = (
     load_all_dbs_as,
     remove_db,
     is_valid_db,
+    compact_db,
 )
\ No newline at end of file
@@ -2,11 +2,14 @@
 As long Isk API is blocking, we need to run its calls with executor.
 """
 
-# TODO: Use process pool
 from concurrent.futures import ThreadPoolExecutor
 
+from sunhead.conf import settings
 
-MAX_SIMULTANEOUS_ISK_API_CALLS = 1  # No diff with ThreadPoolExecutor, migrate to Process pool
+
+# The engine releases the GIL on queries and adds and locks its db spaces itself,
+# so calls on a thread pool really run in parallel.
+MAX_SIMULTANEOUS_ISK_API_CALLS = settings.ISK_API_WORKERS
 
 
 isk_api_executor = ThreadPoolExecutor(max_workers=MAX_SIMULTANEOUS_ISK_API_CALLS)
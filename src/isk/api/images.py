@@ -29,11 +29,12 @@
 import time
 import logging
 import os
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from sunhead.conf import settings
 
 from isk.backends.factory import backend
+from isk.backends.imgseeklib.signatures import ImageSignature
 from isk.urldownloader import url_to_file
 
 logger = logging.getLogger(__name__)
@@ -103,7 +104,9 @@ def query_img_blob(dbId, data, numres=12, sketch=0, fast=False):
     dbId = int(dbId)
     numres = int(numres)
     
-    return backend.query_img_blob(dbId, data.data, numres, sketch, fast)
+    # binary rpc params keep their bytes on .data, rest views pass them as they are
+    results = backend.query_img_blob(dbId, getattr(data, "data", data), numres, sketch, fast)
+    return tuple(results)
 
 
 def query_img_path(dbId, path, numres=12, sketch=0, fast=False):
@@ -134,6 +137,82 @@ def query_img_path(dbId, path, numres=12, sketch=0, fast=False):
     return backend.query_img_path(dbId, path, numres, sketch, fast)
 
 
+def query_img_ids_batch(db_id: int, image_ids: Sequence[int], numres: int = 12, sketch: bool = False,
+                        fast: bool = False) -> list:
+    """
+    Return the most similar images to each of the supplied ones.
+    The supplied images must be already indexed, and are referenced by their IDs.
+
+    Queries are scored together by the engine, which is much faster than querying
+    for them one by one with L{query_img_id}. In return you get list of results::
+
+        [
+            (img1_id, [(img2_id, img2_score), (img5_id, img5_score), ...]),
+            (img2_id, [(img16_id, img16_score), ...]),
+        ]
+
+    :param db_id: Database space id.
+    :param image_ids: Target image ids.
+    :param numres: Number of results to return for each target image. The target image is on its result list.
+    :param sketch: False for photographs, True for hand-sketched images or low-resolution vector images.
+    :param fast: if true, only the average color for each image is considered.
+        Image geometry/features are ignored. Search is faster this way.
+    :since: 0.11
+    :return: List of image ids and corresponding results in format, described above. Image ids not
+        found on the database space get an empty result list.
+    """
+    db_id = int(db_id)
+    image_ids = [int(image_id) for image_id in image_ids]
+
+    results = backend.query_img_ids_batch(db_id, image_ids, numres, sketch, fast)
+    return list(zip(image_ids, results))
+
+
+def query_img_blobs_batch(db_id: int, blobs: Sequence, numres: int = 12, sketch: bool = False,
+                          fast: bool = False) -> list:
+    """
+    Return the most similar images to each of the supplied ones, given by their raw binary
+    file data. Batch version of L{query_img_blob}, see L{query_img_ids_batch}.
+
+    :param db_id: Database space id.
+    :param blobs: Target images file binary data.
+    :param numres: Number of results to return for each target image.
+    :param sketch: False for photographs, True for hand-sketched images or low-resolution vector images.
+    :param fast: if true, only the average color for each image is considered.
+        Image geometry/features are ignored. Search is faster this way.
+    :since: 0.11
+    :return: List with the results of every target image, in the same order:
+        M{[[[image id 1, score],[image id 2, score], ...], ...]}. Images which can't be read
+        get an empty result list.
+    """
+    db_id = int(db_id)
+
+    # binary rpc params keep their bytes on .data, rest views pass them as they are
+    return backend.query_img_blobs_batch(db_id, [getattr(blob, "data", blob) for blob in blobs], numres, sketch, fast)
+
+
+def query_img_paths_batch(db_id: int, paths: Sequence[str], numres: int = 12, sketch: bool = False,
+                          fast: bool = False) -> list:
+    """
+    Return the most similar images to each of the supplied ones, given by their full path on
+    the server filesystem. Batch version of L{query_img_path}, see L{query_img_ids_batch}.
+
+    :param db_id: Database space id.
+    :param paths: Target images paths on the server disk.
+    :param numres: Number of results to return for each target image.
+    :param sketch: False for photographs, True for hand-sketched images or low-resolution vector images.
+    :param fast: if true, only the average color for each image is considered.
+        Image geometry/features are ignored. Search is faster this way.
+    :since: 0.11
+    :return: List of paths and corresponding results, as L{query_img_ids_batch} does for ids.
+        Images which can't be read get an empty result list.
+    """
+    db_id = int(db_id)
+
+    results = backend.query_img_paths_batch(db_id, paths, numres, sketch, fast)
+    return list(zip(paths, results))
+
+
 def add_img_blob(dbId, id, data):
     """
     Add image to database space. Image data is passed directly. It is then processed and indexed. 
@@ -155,7 +234,7 @@ def add_img_blob(dbId, id, data):
 
     try:
         # TODO id should be unsigned long int or something even bigger, also must review swig declarations
-        res = backend.add_image_blob(dbId, data.data, id)
+        res = backend.add_image_blob(dbId, getattr(data, "data", data), id)
     except Exception as e:
         if str(e) == 'image already in db':
             logger.warn(e)
@@ -210,6 +289,63 @@ def add_img(db_id: int, image_id: int, filename: str, file_is_url: bool = False)
     return res
 
 
+def add_img_bulk(db_id: int, items: Sequence) -> list:
+    """
+    Add many images to database space at once, see L{add_img}. Images are read and processed in
+    parallel, and indexed many at a time, so this is much faster than adding them one by one.
+
+    :param db_id: Database space id.
+    :param items: M{[[image id, filename], ...]} pairs. Image id 0 takes the next free one.
+    :since: 0.11
+    :return: List with the id every image was added as, in the same order, 0 for the ones that failed.
+    """
+    db_id = int(db_id)
+
+    return backend.add_images(db_id, [(filename, int(image_id)) for image_id, filename in items])
+
+
+def add_img_blob_bulk(db_id: int, items: Iterable, window: int = 0) -> list:
+    """
+    Add many images to database space at once, given by their raw binary file data.
+    Bulk version of L{add_img_blob}, see L{add_img_bulk}.
+
+    :param db_id: Database space id.
+    :param items: M{[[image id, data], ...]} pairs. Image id 0 takes the next free one. Called from python, any
+        iterable of them, even a generator reading them from a stream: they are taken as they are added.
+    :param window: Most images being processed at once, which bounds the memory used.
+        0 for 4 per signature worker.
+    :since: 0.11
+    :return: List with the id every image was added as, in the same order, 0 for the ones that failed.
+    """
+    db_id = int(db_id)
+
+    # binary rpc params keep their bytes on .data
+    items = ((getattr(data, "data", data), int(image_id)) for image_id, data in items)
+    return backend.add_image_blobs(db_id, items, int(window))
+
+
+def add_img_signature(db_id: int, image_id: int, sig1: Sequence[int], sig2: Sequence[int], sig3: Sequence[int],
+                      avgl: Sequence[float], width: int, height: int) -> bool:
+    """
+    Add image to database space with its signature, computed elsewhere (see isk.backends.imgseeklib.signatures),
+    so the image isn't decoded here. Adding is then cheap, backfills can decode on as many machines as they like.
+
+    :param db_id: Database space id.
+    :param image_id: Target image id, 0 for the next free one.
+    :param sig1: 40 Haar coefficients of the Y channel, see isk.backends.imgseeklib.signatures.ImageSignature
+    :param sig2: 40 Haar coefficients of the I channel.
+    :param sig3: 40 Haar coefficients of the Q channel.
+    :param avgl: Average luminance of the 3 channels.
+    :param width: Image width.
+    :param height: Image height.
+
+    :since: 0.11
+    :return:  True in case of success.
+    """
+    signature = ImageSignature(list(sig1), list(sig2), list(sig3), list(avgl), int(width), int(height))
+    return backend.add_image_signature(int(db_id), signature, int(image_id))
+
+
 def remove_img(db_id: int, id: int) -> bool:
     """
     Remove image from database space.
@@ -235,10 +371,8 @@ def remove_img_bulk(dbId, ids):
     :since: 0.10
     :return: True if all images was removed.
     """
-    result = True
-    for image_id in ids:
-        result &= remove_img(dbId, image_id)
-    return result
+    ids = set(int(image_id) for image_id in ids)
+    return backend.remove_img_bulk(int(dbId), ids) == len(ids)
 
 
 def is_img_on_db(dbId, id):
@@ -461,14 +595,19 @@ def get_cluster_db(dbId, numClusters):
 
 def get_keywords_popular(dbId, numres):
     """
-    Return whether image id exists on database space.
+    Return the keywords most images on database space have.
+
+    Keyword frequencies are kept up to date as keywords are added and removed, so this is cheap
+    enough to call on every page view.
 
     :type  dbId: number
     :param dbId: Database space id.
-    :rtype:   boolean
+    :type  numres: number
+    :param numres: Number of keyword results desired
+    :rtype:   array
     
     :since: 0.7
-    :return:  true if image id exists
+    :return:  array of keyword ids and frequencies, most frequent first: [kwd1_id, kwd1_freq, kwd2_id, kwd2_freq, ...]
     """    
     dbId = int(dbId)
     return backend.get_keywords_popular(dbId, numres)
@@ -509,6 +648,49 @@ def get_all_imgs_by_keywords(db_id, numres: int, kw_join_type: int, keyword_id_l
     return backend.get_all_imgs_by_keywords(db_id, numres, kw_join_type, keyword_id_list)
 
 
+def get_imgs_by_keywords_page(db_id: int, keyword_id_list: Sequence[int], kw_join_type: int = 1,
+                              cursor: int = 0, limit: int = 1000) -> dict:
+    """
+    Return a page of the images with the given keywords.
+    Unlike L{get_all_imgs_by_keywords}, every image can be listed a page at a time::
+
+        {
+            "image_ids": [img3_id, img8_id, ...],
+            "next_cursor": 1234,
+        }
+
+    Pass ``next_cursor`` as ``cursor`` to get the next page. It is None on the last page.
+
+    Images come in the order they are stored, not by id, so a page costs as much as its images wherever it
+    starts. Images added or removed meanwhile may or may not be listed, and a db space evicted and loaded
+    again between two pages stores its images anew, so the pages after may skip or repeat some.
+
+    :param db_id: Database space id.
+    :param keyword_id_list: List of keyword ids, at least one
+    :param kw_join_type: Logical operator for target keywords: 1 for AND, 0 for OR
+    :param cursor: Where the page starts, as returned with the previous page. 0 starts from the first image.
+    :param limit: Maximum number of image ids on the page, at least 1
+    :since: 0.11
+    :raises ValueError: if no keyword, a negative cursor or a limit under 1 is given
+    :return: Page of image ids and the cursor of the next page, in format, described above.
+    """
+    db_id = int(db_id)
+    cursor = int(cursor)
+    limit = int(limit)
+    if not keyword_id_list:
+        raise ValueError("At least one keyword id is required")
+    if cursor < 0:
+        raise ValueError("Page cursor must not be negative, got %d" % cursor)
+    if limit < 1:
+        raise ValueError("Page limit must be at least 1, got %d" % limit)
+
+    image_ids, next_cursor = backend.get_imgs_by_keywords_page(db_id, kw_join_type, keyword_id_list, cursor, limit)
+    return {
+        "image_ids": image_ids,
+        "next_cursor": next_cursor or None,
+    }
+
+
 def query_img_id_fast_keywords(dbId, imgId, numres, kwJoinType, keywords):
     """
     Fast query (only considers average color) for similar images considering keywords
@@ -618,7 +800,7 @@ def most_popular_keywords(dbId, imgs, excludedKwds, count, mode):
     :rtype:   array
     
     :since: 0.7
-    :return:  array of keyword ids and frequencies: [kwd1_id, kwd1_freq, kwd2_id, kwd2_freq, ...]
+    :return:  array of keyword ids and frequencies, most frequent first: [kwd1_id, kwd1_freq, kwd2_id, kwd2_freq, ...]
     """    
     dbId = int(dbId)
     excludedKwds = [int(x) for x in excludedKwds.split(',') if len(x) > 0]
@@ -648,9 +830,6 @@ def get_keywords_img(dbId, imgId):
 def remove_all_keyword_img(db_id: int, image_id: int) -> bool:
     """
     Remove all keyword associations this image has.
-    
-    Known issue: keyword based queries will continue to consider the image to be associated
-    to this keyword until the database is saved and restored.
 
     :param db_id: Database space id.
     :param image_id: Target image id.
@@ -688,9 +867,6 @@ def remove_all_keyword_img_bulk(dbId, imgIdList):
 def remove_keyword_img(db_id: int, image_id: int, keyword_id: int) -> bool:
     """
     Remove the association of a keyword to an image
-    
-    Known issue: keyword based queries will continue to consider the image to be associated to this
-    keyword until the database is saved and restored.
 
     :param db_id: Database space id.
     :param image_id: Target image id.
@@ -722,26 +898,57 @@ def add_keywords_img(dbId, imgId, hashes):
     return backend.add_keywords_img(dbId, imgId, hashes)
 
 
-def add_dir(db_id: int, path: str, recursive: bool, fname_as_id: bool = False) -> bool:
+def add_dir(db_id: int, path: str, recursive: bool, fname_as_id: bool = False, checkpoint: str = None) -> int:
     """
     Visits a directory recursively and add supported images into database space.
+    Images are read and processed in parallel, see L{add_img_bulk}.
 
     :param db_id: Database space id.
     :param path: Target filesystem full path of the initial dir.
     :param recursive: True if should visit recursively
     :param fname_as_id: Whether to use file names as id. If false, id will be assigned automatically.
+    :param checkpoint: Full path of a file to save progress to. Calling again with the same checkpoint after a
+        crash or restart resumes adding where it stopped. It is removed once the whole dir is added.
     
     :since: 0.7
     :return:  count of images succesfully added
     """    
 
-    added_count = backend.add_dir(db_id, path, recursive, fname_as_id)
+    added_count = backend.add_dir(db_id, path, recursive, fname_as_id, checkpoint)
     return added_count
 
 
+def get_add_dir_progress() -> list:
+    """
+    Return the progress of the L{add_dir} calls running, and the last ones finished::
+
+        [
+            {
+                "db_id": 1,
+                "path": "/images",
+                "seen": 5120,  # image files found
+                "added": 4990,
+                "failed": 2,
+                "rate": 310.5,  # images added or failed per second
+                "elapsed": 16.1,  # seconds
+                "finished": False,
+            },
+            ...
+        ]
+
+    Images done by an interrupted call are not counted when resuming it.
+
+    :since: 0.11
+    :return: List of progress dicts, in format, described above.
+    """
+    return backend.get_dir_indexings()
+
+
 exporting = (
     query_img_id,
     add_img,
+    add_img_bulk,
+    add_img_signature,
     remove_img,
     remove_img_bulk,
     is_img_on_db,
@@ -751,6 +958,7 @@ exporting = (
     get_img_avgl,
     get_db_img_id_list,
     add_dir,
+    get_add_dir_progress,
     add_keyword_img,
     add_keywords_img,
     add_keyword_img_bulk,
@@ -762,13 +970,18 @@ exporting = (
     query_img_id_keywords_bulk,
     query_img_id_fast_keywords,
     get_all_imgs_by_keywords,
+    get_imgs_by_keywords_page,
     get_keywords_visual_distance,
     get_keywords_popular,
     get_ids_bloom_filter,
     most_popular_keywords,
     query_img_blob,
     query_img_path,
+    query_img_ids_batch,
+    query_img_blobs_batch,
+    query_img_paths_batch,
     add_img_blob,
+    add_img_blob_bulk,
 
     get_cluster_db,
     get_cluster_keywords,
@@ -19,8 +19,12 @@ db_path = os.path.expanduser(settings.DATABASE_PATH)
 
 logger.info("+- Initializing isk api (version %s) ...", __version__)
 
-backend = ImgDB(settings.AUTOMATIC_SAVE, settings.SAVE_INTERVAL)
-backend.loadalldbs(db_path)
+backend = ImgDB(settings.AUTOMATIC_SAVE, settings.SAVE_INTERVAL, settings.PACK_COLD_POSTINGS)
+backend.set_query_threads(settings.QUERY_THREADS)
+backend.set_signature_workers(settings.SIGNATURE_WORKERS)
+backend.load_database(db_path, settings.LOAD_THREADS, settings.LAZY_LOAD)
+if settings.WRITE_AHEAD_LOG:
+    backend.open_log(db_path + ".wal", settings.WAL_SYNC_INTERVAL)
 
 logger.info("| image database initialized")
 logger.info("| using database from %s", db_path)
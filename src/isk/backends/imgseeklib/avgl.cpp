@@ -0,0 +1,61 @@
+/***************************************************************************
+    imgSeek ::  Average luminance distance kernels
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include <math.h>
+
+#ifdef __SSE2__
+#include <emmintrin.h>
+#endif
+
+#include "avgl.h"
+
+// widens 2 floats at p to doubles
+#ifdef __SSE2__
+static inline __m128d loadWide(const float* p) {
+	return _mm_cvtps_pd(_mm_castsi128_ps(_mm_loadl_epi64((const __m128i*) p)));
+}
+#endif
+
+void avglDistances(const float* a0, const float* a1, const float* a2,
+		const double* q, const float* w, double* dists, size_t n) {
+	size_t i = 0;
+
+#ifdef __SSE2__
+	// |x| is x with its sign bit cleared
+	const __m128d signMask = _mm_set1_pd(-0.0);
+	const __m128d q0 = _mm_set1_pd(q[0]), q1 = _mm_set1_pd(q[1]), q2 = _mm_set1_pd(q[2]);
+	const __m128d w0 = _mm_set1_pd(w[0]), w1 = _mm_set1_pd(w[1]), w2 = _mm_set1_pd(w[2]);
+
+	// same operations, in the same order, as the scalar loop below
+	for (; i + 2 <= n; i += 2) {
+		__m128d d = _mm_mul_pd(w0, _mm_andnot_pd(signMask, _mm_sub_pd(loadWide(a0 + i), q0)));
+		d = _mm_add_pd(d, _mm_mul_pd(w1, _mm_andnot_pd(signMask, _mm_sub_pd(loadWide(a1 + i), q1))));
+		d = _mm_add_pd(d, _mm_mul_pd(w2, _mm_andnot_pd(signMask, _mm_sub_pd(loadWide(a2 + i), q2))));
+		_mm_storeu_pd(dists + i, d);
+	}
+#endif
+
+	for (; i < n; i++) {
+		double d = w[0] * fabs((double) a0[i] - q[0]);
+		d += w[1] * fabs((double) a1[i] - q[1]);
+		d += w[2] * fabs((double) a2[i] - q[2]);
+		dists[i] = d;
+	}
+}
@@ -0,0 +1,37 @@
+/***************************************************************************
+    imgSeek ::  Average luminance distance kernels
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef AVGL_H
+#define AVGL_H
+
+#include <stddef.h>
+
+/* Weighted average luminance distance of n signatures to a query:
+
+   dists[i] = w[0]*|a0[i]-q[0]| + w[1]*|a1[i]-q[1]| + w[2]*|a2[i]-q[2]|
+
+   a0, a1 and a2 are the Y, I and Q columns of the signatures, stored in
+   single precision and computed with in double. Uses SSE2 when available.
+   Results are the same as the scalar loop, bit for bit.
+ */
+void avglDistances(const float* a0, const float* a1, const float* a2,
+		const double* q, const float* w, double* dists, size_t n);
+
+#endif
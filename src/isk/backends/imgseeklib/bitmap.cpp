@@ -0,0 +1,270 @@
+/***************************************************************************
+    imgSeek ::  Compressed bitmaps of signature slots
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include <algorithm>
+#include <iterator>
+
+#include "bitmap.h"
+
+unsigned int SlotBitmap::bitCount(uint64_t word) {
+#ifdef __GNUC__
+	return __builtin_popcountll(word);
+#else
+	unsigned int n = 0;
+	for (; word; word &= word - 1) n++;
+	return n;
+#endif
+}
+
+// orders chunks by key
+struct ChunkKeyLess {
+	template <class Chunk>
+	bool operator()(const Chunk& chunk, const unsigned int key) const { return chunk.key < key; }
+};
+
+SlotBitmap::Chunk* SlotBitmap::findChunk(const unsigned int key) {
+	std::vector<Chunk>::iterator it = std::lower_bound(chunks.begin(), chunks.end(), key, ChunkKeyLess());
+	return it != chunks.end() && it->key == key ? &*it : 0;
+}
+
+const SlotBitmap::Chunk* SlotBitmap::findChunk(const unsigned int key) const {
+	std::vector<Chunk>::const_iterator it = std::lower_bound(chunks.begin(), chunks.end(), key, ChunkKeyLess());
+	return it != chunks.end() && it->key == key ? &*it : 0;
+}
+
+void SlotBitmap::toBits(Chunk& chunk) {
+	chunk.bits.assign(BITMAP_WORDS, 0);
+	for (size_t k = 0; k < chunk.array.size(); k++) {
+		chunk.bits[chunk.array[k] >> 6] |= (uint64_t) 1 << (chunk.array[k] & 63);
+	}
+	std::vector<unsigned short>().swap(chunk.array);
+}
+
+void SlotBitmap::toArray(Chunk& chunk) {
+	std::vector<unsigned short> array;
+	array.reserve(chunk.count);
+	for (size_t w = 0; w < BITMAP_WORDS; w++) {
+		for (uint64_t word = chunk.bits[w]; word; word &= word - 1) {
+			array.push_back(w * 64 + lowestBit(word));
+		}
+	}
+	chunk.array.swap(array);
+	std::vector<uint64_t>().swap(chunk.bits);
+}
+
+bool SlotBitmap::add(const sigSlot slot) {
+	const unsigned int key = slot >> 16;
+	const unsigned short low = slot & 0xffff;
+	std::vector<Chunk>::iterator it = std::lower_bound(chunks.begin(), chunks.end(), key, ChunkKeyLess());
+	if (it == chunks.end() || it->key != key) {
+		it = chunks.insert(it, Chunk());
+		it->key = key;
+		it->count = 0;
+	}
+	Chunk& chunk = *it;
+
+	if (chunk.bits.empty()) {
+		std::vector<unsigned short>::iterator pos = std::lower_bound(chunk.array.begin(), chunk.array.end(), low);
+		if (pos != chunk.array.end() && *pos == low) return false;
+		chunk.array.insert(pos, low);
+		if (chunk.array.size() > ARRAY_MAX) toBits(chunk);
+	} else {
+		uint64_t& word = chunk.bits[low >> 6];
+		const uint64_t bit = (uint64_t) 1 << (low & 63);
+		if (word & bit) return false;
+		word |= bit;
+	}
+	chunk.count++;
+	count++;
+	return true;
+}
+
+bool SlotBitmap::remove(const sigSlot slot) {
+	const unsigned short low = slot & 0xffff;
+	Chunk* chunk = findChunk(slot >> 16);
+	if (!chunk) return false;
+
+	if (chunk->bits.empty()) {
+		std::vector<unsigned short>::iterator pos = std::lower_bound(chunk->array.begin(), chunk->array.end(), low);
+		if (pos == chunk->array.end() || *pos != low) return false;
+		chunk->array.erase(pos);
+	} else {
+		uint64_t& word = chunk->bits[low >> 6];
+		const uint64_t bit = (uint64_t) 1 << (low & 63);
+		if (!(word & bit)) return false;
+		word &= ~bit;
+	}
+	chunk->count--;
+	count--;
+
+	if (!chunk->count) {
+		chunks.erase(chunks.begin() + (chunk - &chunks[0]));
+	} else if (!chunk->bits.empty() && chunk->count <= ARRAY_MAX / 2) {
+		// not right at ARRAY_MAX, so a chunk going up and down around it doesn't convert each time
+		toArray(*chunk);
+	}
+	return true;
+}
+
+bool SlotBitmap::contains(const sigSlot slot) const {
+	const unsigned short low = slot & 0xffff;
+	const Chunk* chunk = findChunk(slot >> 16);
+	if (!chunk) return false;
+	if (chunk->bits.empty()) return std::binary_search(chunk->array.begin(), chunk->array.end(), low);
+	return (chunk->bits[low >> 6] >> (low & 63)) & 1;
+}
+
+bool SlotBitmap::next(sigSlot& slot) const {
+	const unsigned int key = slot >> 16;
+	std::vector<Chunk>::const_iterator it = std::lower_bound(chunks.begin(), chunks.end(), key, ChunkKeyLess());
+	for (; it != chunks.end(); it++) {
+		// chunks after the one of slot are looked at from their start
+		const unsigned int low = it->key == key ? slot & 0xffff : 0;
+		const sigSlot high = (sigSlot) it->key << 16;
+		if (it->bits.empty()) {
+			std::vector<unsigned short>::const_iterator pos = std::lower_bound(it->array.begin(), it->array.end(), low);
+			if (pos == it->array.end()) continue;
+			slot = high | *pos;
+			return true;
+		}
+		size_t w = low >> 6;
+		uint64_t word = it->bits[w] & (~(uint64_t) 0 << (low & 63));
+		while (!word && ++w < BITMAP_WORDS) word = it->bits[w];
+		if (!word) continue;
+		slot = high | (sigSlot) (w * 64 + lowestBit(word));
+		return true;
+	}
+	return false;
+}
+
+void SlotBitmap::intersect(Chunk& chunk, const Chunk& other) {
+	if (!chunk.bits.empty() && !other.bits.empty()) {
+		chunk.count = 0;
+		for (size_t w = 0; w < BITMAP_WORDS; w++) {
+			chunk.bits[w] &= other.bits[w];
+			chunk.count += bitCount(chunk.bits[w]);
+		}
+		if (chunk.count <= ARRAY_MAX) toArray(chunk);
+		return;
+	}
+
+	std::vector<unsigned short> array;
+	if (chunk.bits.empty() && other.bits.empty()) {
+		std::set_intersection(chunk.array.begin(), chunk.array.end(), other.array.begin(), other.array.end(),
+				std::back_inserter(array));
+	} else {
+		// keep the array entries set on the bitmap
+		const Chunk& arrayChunk = chunk.bits.empty() ? chunk : other;
+		const Chunk& bitsChunk = chunk.bits.empty() ? other : chunk;
+		for (size_t k = 0; k < arrayChunk.array.size(); k++) {
+			unsigned short low = arrayChunk.array[k];
+			if ((bitsChunk.bits[low >> 6] >> (low & 63)) & 1) array.push_back(low);
+		}
+	}
+	chunk.array.swap(array);
+	std::vector<uint64_t>().swap(chunk.bits);
+	chunk.count = chunk.array.size();
+}
+
+void SlotBitmap::unite(Chunk& chunk, const Chunk& other) {
+	if (chunk.bits.empty() && other.bits.empty()) {
+		std::vector<unsigned short> array;
+		array.reserve(chunk.array.size() + other.array.size());
+		std::set_union(chunk.array.begin(), chunk.array.end(), other.array.begin(), other.array.end(),
+				std::back_inserter(array));
+		chunk.array.swap(array);
+		chunk.count = chunk.array.size();
+		if (chunk.count > ARRAY_MAX) toBits(chunk);
+		return;
+	}
+
+	if (chunk.bits.empty()) toBits(chunk);
+	if (other.bits.empty()) {
+		for (size_t k = 0; k < other.array.size(); k++) {
+			chunk.bits[other.array[k] >> 6] |= (uint64_t) 1 << (other.array[k] & 63);
+		}
+	} else {
+		for (size_t w = 0; w < BITMAP_WORDS; w++) chunk.bits[w] |= other.bits[w];
+	}
+	chunk.count = 0;
+	for (size_t w = 0; w < BITMAP_WORDS; w++) chunk.count += bitCount(chunk.bits[w]);
+}
+
+void SlotBitmap::moveChunk(Chunk& chunk, std::vector<Chunk>& to) {
+	to.push_back(Chunk());
+	to.back().key = chunk.key;
+	to.back().count = chunk.count;
+	to.back().array.swap(chunk.array);
+	to.back().bits.swap(chunk.bits);
+}
+
+SlotBitmap& SlotBitmap::operator&=(const SlotBitmap& other) {
+	std::vector<Chunk> result;
+	size_t j = 0;
+	count = 0;
+	for (size_t k = 0; k < chunks.size(); k++) {
+		while (j < other.chunks.size() && other.chunks[j].key < chunks[k].key) j++;
+		if (j == other.chunks.size()) break;
+		if (other.chunks[j].key != chunks[k].key) continue;
+		intersect(chunks[k], other.chunks[j]);
+		if (!chunks[k].count) continue;
+		count += chunks[k].count;
+		moveChunk(chunks[k], result);
+	}
+	chunks.swap(result);
+	return *this;
+}
+
+SlotBitmap& SlotBitmap::operator|=(const SlotBitmap& other) {
+	std::vector<Chunk> result;
+	result.reserve(chunks.size() + other.chunks.size());
+	size_t k = 0, j = 0;
+	count = 0;
+	while (k < chunks.size() || j < other.chunks.size()) {
+		if (j == other.chunks.size() || (k < chunks.size() && chunks[k].key < other.chunks[j].key)) {
+			moveChunk(chunks[k], result);
+			k++;
+		} else if (k == chunks.size() || other.chunks[j].key < chunks[k].key) {
+			result.push_back(other.chunks[j]);
+			j++;
+		} else {
+			unite(chunks[k], other.chunks[j]);
+			moveChunk(chunks[k], result);
+			k++;
+			j++;
+		}
+		count += result.back().count;
+	}
+	chunks.swap(result);
+	return *this;
+}
+
+void SlotBitmap::clear() {
+	std::vector<Chunk>().swap(chunks);
+	count = 0;
+}
+
+size_t SlotBitmap::memoryUsage() const {
+	size_t res = chunks.capacity() * sizeof(Chunk);
+	for (size_t c = 0; c < chunks.size(); c++) {
+		res += chunks[c].array.capacity() * sizeof(unsigned short) + chunks[c].bits.capacity() * sizeof(uint64_t);
+	}
+	return res;
+}
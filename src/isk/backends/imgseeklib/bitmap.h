@@ -0,0 +1,131 @@
+/***************************************************************************
+    imgSeek ::  Compressed bitmaps of signature slots
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef BITMAP_H
+#define BITMAP_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <vector>
+
+#include "postings.h"
+
+/* Set of signature slots, e.g. the images of a db space having a keyword.
+
+   Slots are split in chunks of 65536 by their high 16 bits. A chunk holding
+   few slots keeps their low 16 bits on a sorted array, 2 bytes a slot; a
+   fuller one is a plain bitmap of 8KB. So a set takes about 2 bytes per slot
+   however the slots are spread, and no more than a bit per slot of the
+   space. Intersections and unions work chunk by chunk, a word at a time on
+   bitmap chunks.
+ */
+class SlotBitmap {
+public:
+	SlotBitmap(): count(0) {}
+
+	/* Returns false if slot was there already */
+	bool add(const sigSlot slot);
+	/* Returns false if slot was not there */
+	bool remove(const sigSlot slot);
+	bool contains(const sigSlot slot) const;
+	/* Moves slot to the lowest slot of the set not below it. Returns false
+	   if there is none */
+	bool next(sigSlot& slot) const;
+
+	size_t size() const {
+		return count;
+	}
+
+	bool empty() const {
+		return !count;
+	}
+
+	/* Calls visitor(slot) for every slot of the set, in order */
+	template <class Visitor>
+	void forEach(Visitor& visitor) const {
+		for (size_t c = 0; c < chunks.size(); c++) {
+			const Chunk& chunk = chunks[c];
+			const sigSlot high = (sigSlot) chunk.key << 16;
+			if (chunk.bits.empty()) {
+				for (size_t k = 0; k < chunk.array.size(); k++) visitor(high | chunk.array[k]);
+				continue;
+			}
+			for (size_t w = 0; w < BITMAP_WORDS; w++) {
+				for (uint64_t word = chunk.bits[w]; word; word &= word - 1) {
+					visitor(high | (sigSlot) (w * 64 + lowestBit(word)));
+				}
+			}
+		}
+	}
+
+	/* Position of the lowest bit set on a non zero word */
+	static int lowestBit(uint64_t word) {
+#ifdef __GNUC__
+		return __builtin_ctzll(word);
+#else
+		int n = 0;
+		while (!(word & 1)) {
+			word >>= 1;
+			n++;
+		}
+		return n;
+#endif
+	}
+
+	/* Keeps the slots also on other */
+	SlotBitmap& operator&=(const SlotBitmap& other);
+	/* Adds the slots of other */
+	SlotBitmap& operator|=(const SlotBitmap& other);
+
+	void clear();
+
+	/* Heap bytes held */
+	size_t memoryUsage() const;
+
+private:
+	static const size_t BITMAP_WORDS = 65536 / 64;
+	/* chunks holding more slots than this are bitmaps */
+	static const size_t ARRAY_MAX = 4096;
+
+	struct Chunk {
+		unsigned int key;		/* high 16 bits of its slots */
+		unsigned int count;
+		std::vector<unsigned short> array;	/* low 16 bits of its slots, sorted */
+		std::vector<uint64_t> bits;	/* BITMAP_WORDS words, array is unused then */
+	};
+
+	static unsigned int bitCount(uint64_t word);
+	// array chunks become bitmap chunks and back as they grow and shrink
+	static void toBits(Chunk& chunk);
+	static void toArray(Chunk& chunk);
+	static void intersect(Chunk& chunk, const Chunk& other);
+	static void unite(Chunk& chunk, const Chunk& other);
+	// appends chunk to to, without copying its slots
+	static void moveChunk(Chunk& chunk, std::vector<Chunk>& to);
+
+	// the chunk of key, NULL if none
+	Chunk* findChunk(const unsigned int key);
+	const Chunk* findChunk(const unsigned int key) const;
+
+	std::vector<Chunk> chunks;	/* by key */
+	size_t count;
+};
+
+#endif
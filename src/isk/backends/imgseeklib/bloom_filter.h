@@ -131,6 +131,18 @@ public:
 
    std::size_t size() { return table_size; }
 
+   /* raw bit table, e.g. for saving it along with the elements inserted */
+   const unsigned char* table() const { return hash_table; }
+   std::size_t table_bytes() const { return table_size / char_size; }
+
+   /* sets the bit table to one saved from a filter with the same parameters */
+   bool load_table(const unsigned char* table, const std::size_t bytes)
+   {
+      if (bytes != table_bytes()) return false;
+      std::copy(table, table + bytes, hash_table);
+      return true;
+   }
+
    bloom_filter& operator&=(const bloom_filter& filter);
    bloom_filter& operator|=(const bloom_filter& filter);
    bloom_filter& operator^=(const bloom_filter& filter);
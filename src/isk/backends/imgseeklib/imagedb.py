@@ -22,12 +22,17 @@
 #
 ###############################################################################
 
+import itertools
 import logging
 import os
+import threading
 import time
-from typing import Sequence, List, Tuple, Iterable
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Sequence, List, Tuple, Iterable, Iterator
 
 from isk import utils
+from isk.exceptions import ImageDBException
 
 try:
     from isk.backends.imgseeklib import imgdb
@@ -39,8 +44,25 @@ except ImportError:
     )
     raise
 
+from isk.backends.imgseeklib.indexing import DirIndexing
+from isk.backends.imgseeklib.signatures import ImageSignature, SignaturePool, blob_signature, path_signature
+
+try:
+    import numpy
+except ImportError:  # only needed for the vectorized helpers, see ImgDB.avgl_distances()
+    numpy = None
+
 logger = logging.getLogger(__name__)
 
+# db spaces are checkpointed to this directory next to the database file, one file each
+SPACES_DIR_SUFFIX = ".spaces"
+
+# images added in bulk per db space write lock hold, see ImgDB.add_images()
+ADD_BATCH_SIZE = 1024
+
+# add_dir() calls listed by ImgDB.get_dir_indexings()
+DIR_INDEXINGS_KEPT = 16
+
 # to help determining img format from extension
 SUPPORTED_IMG_EXTS = {
     'jpeg', 'jpg', 'gif', 'png', 'rgb', 'jpe', 'pbm', 'pgm', 'ppm', 'tiff', 'tif', 'rast', 'xbm', 'bmp'
@@ -52,7 +74,7 @@ class DBSpace(object):
     INFO_ATTRS = (
         "id", "query_count", "last_query_per_min", "query_min_count", "query_min_cur", "last_add_per_min",
         "add_min_count", "add_min_cur", "add_count", "add_since_last_save", "last_id", "last_save_time",
-        "file_name",
+        "file_name", "compaction_done", "compaction_total", "last_compaction_time", "loaded", "last_access_time",
     )
 
     def __init__(self, id):
@@ -63,7 +85,11 @@ class DBSpace(object):
         # Overload some of them
         self.id = id
         self.last_id = 1
+        self.lastId = 1  # next id handed out to images added without one, see reserve_image_id()
         self.file_name = "not yet saved"  # currently loaded data file
+        self.loaded = True  # False while it is only on its file, see ImgDB.using_db_space()
+        self.users = 0  # calls using it right now
+        self.load_lock = threading.Lock()  # held while loaded from or evicted to its file
 
         if not imgdb.isValidDB(id):  # only init if needed
             logger.debug("New dbSpace requires init: %d" % id)
@@ -73,6 +99,13 @@ class DBSpace(object):
         data = {
             name: getattr(self, name) for name in self.INFO_ATTRS
         }
+        if self.loaded:
+            # removed images still waiting for ImgDB.compact_db()
+            data["dead_count"] = imgdb.getDeadCount(self.id)
+            # counted by the engine, any change counts, not only adds
+            data["add_since_last_save"] = imgdb.getUnsavedChanges(self.id)
+        else:
+            data["dead_count"] = 0  # saved compacted
         return data
 
     def __str__(self):
@@ -106,6 +139,21 @@ def safe_str(obj):
     #     return unicode(obj).encode('unicode_escape')
 
 
+_image_ids_lock = threading.Lock()
+
+
+def reserve_image_id(db_space: DBSpace, image_id: int = None) -> int:
+    """
+    Return ``image_id``, or the next unused one of the db space when not given.
+    Api calls run on many threads, so concurrent adds must never get the same id.
+    """
+    with _image_ids_lock:
+        if not image_id:
+            image_id = db_space.lastId
+        db_space.lastId = max(db_space.lastId, image_id + 1)
+        return image_id
+
+
 def add_count(db_space: DBSpace) -> None:
     # add per minutes counting
     db_space.add_count += 1
@@ -126,12 +174,19 @@ def count_query(db_space: DBSpace) -> None:
 
 
 class ImgDB(object):
-    def __init__(self, automatic_save, save_interval):
+    def __init__(self, automatic_save, save_interval, pack_postings=False):
         self.db_spaces = {}
         self.globalFileName = 'global-imgdb-not-saved-yet'
         # global statistics
         self._automatic_save = automatic_save
         self._save_interval = save_interval
+        # compress bucket postings of freshly loaded (cold) db spaces
+        self._pack_postings = pack_postings
+        self._log_open = False
+        self._saving = threading.Lock()  # held while an automatic save runs
+        self._users_lock = threading.Lock()  # guards DBSpace.users and DBSpace.loaded
+        self._signatures = SignaturePool()  # computes signatures of the images added in bulk
+        self._dir_indexings = deque(maxlen=DIR_INDEXINGS_KEPT)
 
     @property
     def supported_image_extensions(self) -> set:
@@ -170,6 +225,11 @@ class ImgDB(object):
             logger.error("Error loading image database")
             del self.db_spaces[db_id]
             return None
+        if self._pack_postings:
+            self.pack_postings(db_id)
+        if self._log_open:
+            # loads are not logged
+            self.checkpoint()
         # adjust last added image id
         logger.info('| Database loaded: ' + str(dbSpace))
         dbSpace.last_id = self.get_img_count(dbSpace.id) + 1
@@ -198,20 +258,223 @@ class ImgDB(object):
     def loadalldbs(self, fname) -> int:
         try:
             dbCount = imgdb.loadalldbs(fname)
-            for dbid in self.get_db_list():
-                self.db_spaces[dbid] = DBSpace(dbid)
-                self.db_spaces[dbid].lastId = self.get_img_count(dbid) + 1
+            self._load_db_spaces()
             logger.debug('| Database (%s) loaded with %d spaces' % (fname, dbCount))
             self.globalFileName = fname
+            if self._log_open:
+                # loads are not logged
+                self.checkpoint()
             return dbCount
         except RuntimeError as e:
             logger.error(e)
             return 0
 
+    @utils.dump_args
+    def load_database(self, fname: str, threads: int = 1, lazy: bool = False) -> int:
+        """
+        Load the db spaces checkpointed next to the database file ``fname``, each from its own file in
+        the ``fname + SPACES_DIR_SUFFIX`` directory, ``threads`` files at a time. Databases saved by older
+        versions are loaded from ``fname`` itself instead, and moved to the directory by the next
+        checkpoint().
+
+        When ``lazy``, the directory is only listed: each db space is loaded on its first use instead, see
+        using_db_space().
+
+        :return: number of db spaces loaded (or found, when ``lazy``)
+        """
+        self.globalFileName = fname
+        if not os.path.isdir(self.spaces_path):
+            return self.loadalldbs(fname)
+        if lazy:
+            dbCount = imgdb.opendbsdir(self.spaces_path)
+            for dbid in self.get_db_list():
+                if not imgdb.isLoadedDB(dbid):
+                    self.db_spaces[dbid] = DBSpace(dbid)
+                    self.db_spaces[dbid].loaded = False
+                    self.db_spaces[dbid].file_name = self.spaces_path
+            logger.debug('| Database (%s) opened with %d spaces' % (self.spaces_path, dbCount))
+            return dbCount
+        dbCount = imgdb.loaddbsdir(self.spaces_path, threads)
+        self._load_db_spaces()
+        logger.debug('| Database (%s) loaded with %d spaces' % (self.spaces_path, dbCount))
+        return dbCount
+
+    @property
+    def spaces_path(self) -> str:
+        """Directory the db spaces are checkpointed to, see checkpoint()"""
+        return self.globalFileName + SPACES_DIR_SUFFIX
+
+    def _load_db_spaces(self) -> None:
+        for dbid in self.get_db_list():
+            self.db_spaces[dbid] = DBSpace(dbid)
+            # failed to load, kept on its file
+            self.db_spaces[dbid].loaded = imgdb.isLoadedDB(dbid)
+            if self.db_spaces[dbid].loaded:
+                self.db_spaces[dbid].lastId = self.get_img_count(dbid) + 1
+                if self._pack_postings:
+                    self.pack_postings(dbid)
+
+    @contextmanager
+    def using_db_space(self, db_id: int):
+        """
+        Keep db space ``db_id`` loaded while the block runs, loading it from its file first if it is not
+        (see load_database() and evict_idle_db_spaces()). Other db spaces are used meanwhile.
+        """
+        db_space = self.db_spaces[db_id]
+        with self._users_lock:
+            db_space.users += 1
+            db_space.last_access_time = time.time()
+        try:
+            if not db_space.loaded:
+                with db_space.load_lock:
+                    if not db_space.loaded:
+                        self._load_db_space(db_space)
+            yield db_space
+        finally:
+            with self._users_lock:
+                db_space.users -= 1
+
+    def _load_db_space(self, db_space: DBSpace) -> None:
+        started = time.time()
+        if not imgdb.loadSpace(db_space.id):
+            raise ImageDBException("Unable to load database id=%d from its file" % db_space.id)
+        db_space.loaded = True
+        db_space.lastId = max(db_space.lastId, imgdb.getImgCount(db_space.id) + 1)
+        if self._pack_postings:
+            self.pack_postings(db_space.id)
+        logger.info('| Database id=%s loaded in %.2fs', db_space.id, time.time() - started)
+
+    def evict_idle_db_spaces(self, max_idle: float) -> int:
+        """
+        Free the memory of the db spaces unused for the last ``max_idle`` seconds. They stay on their file,
+        to be loaded again on their next use. Changed ones are checkpointed first.
+
+        :return: number of db spaces evicted
+        """
+        deadline = time.time() - max_idle
+        idle = [
+            db_space for db_space in list(self.db_spaces.values())
+            if db_space.loaded and not db_space.users and db_space.last_access_time <= deadline
+        ]
+        if not idle:
+            return 0
+        if any(imgdb.getUnsavedChanges(db_space.id) for db_space in idle):
+            self.checkpoint()
+
+        evicted = 0
+        for db_space in idle:
+            with self._users_lock:
+                # used again meanwhile, or being loaded
+                if db_space.users or db_space.last_access_time > deadline:
+                    continue
+                if not db_space.load_lock.acquire(blocking=False):
+                    continue
+                db_space.loaded = False
+            try:
+                if imgdb.unloadSpace(db_space.id, self.spaces_path):
+                    evicted += 1
+                else:  # changed since the checkpoint
+                    db_space.loaded = True
+            finally:
+                db_space.load_lock.release()
+        if evicted:
+            logger.info('| %d idle database spaces evicted', evicted)
+        return evicted
+
+    @utils.require_known_db_id
+    @utils.dump_args
+    def pack_postings(self, db_id) -> bool:
+        before = imgdb.getPostingsMemory(db_id)
+        if not imgdb.packPostings(db_id):
+            return False
+        logger.info('| Postings of database id=%s packed: %d -> %d bytes',
+                    db_id, before, imgdb.getPostingsMemory(db_id))
+        return True
+
+    @utils.dump_args
+    def set_query_threads(self, threads: int) -> int:
+        """Split each query on a big enough db space across this many threads"""
+        return imgdb.setQueryThreads(threads)
+
+    @utils.dump_args
+    def set_signature_workers(self, workers: int) -> None:
+        """Compute the signatures of images added in bulk on this many processes (0 computes them inline)"""
+        self._signatures.shutdown()
+        self._signatures = SignaturePool(workers)
+
+    @utils.dump_args
+    def open_log(self, prefix: str, sync_interval: int = 0) -> int:
+        """
+        Replay the write ahead log ``prefix`` on top of the db spaces loaded by load_database(), then log
+        every change to it: added and removed images and keywords, created, reset and removed db spaces.
+
+        With ``sync_interval`` 0 a change is on disk before its call returns, and changes made at the same
+        time share a sync. Otherwise the log is synced every ``sync_interval`` ms and a crash loses the
+        changes of the last interval. Either way, db space files are only rewritten by checkpoint().
+
+        :return: number of changes replayed, -1 on failure
+        """
+        replayed = imgdb.openLog(prefix, sync_interval)
+        if replayed < 0:
+            logger.error('Error opening write ahead log "%s"' % prefix)
+            return replayed
+        self._log_open = True
+        # replayed changes may have created or removed db spaces
+        db_ids = self.get_db_list()
+        for db_id in db_ids:
+            if db_id not in self.db_spaces:
+                self.db_spaces[db_id] = DBSpace(db_id)
+        for db_id in set(self.db_spaces) - set(db_ids):
+            del self.db_spaces[db_id]
+        for db_space in self.db_spaces.values():
+            if not db_space.loaded and imgdb.isLoadedDB(db_space.id):  # loaded to replay its changes
+                self._load_db_space(db_space)
+        logger.info('| Write ahead log "%s" opened, %d changes replayed' % (prefix, replayed))
+        return replayed
+
+    @utils.dump_args
+    def close_log(self) -> None:
+        imgdb.closeLog()
+        self._log_open = False
+
+    def checkpoint(self, min_log_size: int = 0) -> int:
+        """
+        Save each db space changed since its last save to its own file in spaces_path, and drop the write
+        ahead log those files now cover. Unchanged db spaces are not rewritten. Changes go on meanwhile,
+        to a new log.
+
+        Skipped until the log holds ``min_log_size`` bytes, when a log is open. Never skipped once the log
+        failed to take a change: changes are refused until this saves the ones made before.
+
+        :return: number of db spaces saved, 0 if skipped, -1 on failure
+        """
+        if self._log_open and imgdb.getLogSize() < min_log_size and not imgdb.isLogBroken():
+            return 0
+        dirty = [
+            db_space for db_space in list(self.db_spaces.values())
+            if db_space.loaded and imgdb.getUnsavedChanges(db_space.id)
+        ]
+        res = imgdb.checkpointdbs(self.spaces_path)
+        if res < 0:
+            logger.error("Error saving image database")
+            return res
+        now = time.time()
+        for db_space in dirty:
+            db_space.last_save_time = now
+            db_space.file_name = self.spaces_path
+        logger.info('| Checkpoint of %d database spaces saved at "%s"' % (res, self.spaces_path))
+        return res
+
     @utils.dump_args
     def savealldbs(self, fname=None) -> int:
         if not fname:
             fname = self.globalFileName
+        if fname == self.globalFileName:
+            return max(self.checkpoint(), 0)
+        # every db space goes to the file, loaded or not
+        for db_id in list(self.db_spaces):
+            with self.using_db_space(db_id):
+                pass
         res = imgdb.savealldbs(fname)
         if not res:
             logger.error("Error saving image database")
@@ -221,38 +484,103 @@ class ImgDB(object):
 
     @utils.require_known_db_id
     @utils.dump_args
-    def add_dir(self, dbId, path, recurse, fname_as_id=False):
-
+    def add_dir(self, dbId, path, recurse, fname_as_id=False, checkpoint: str = None):
+        """
+        Add the image files on directory ``path``, see add_images(). Progress is listed by get_dir_indexings().
+
+        :param checkpoint: File saving how far adding went, so calling again with the same file after a crash or
+            restart resumes adding where it stopped. Removed once the whole directory is added. It is saved after
+            each batch of ADD_BATCH_SIZE images is added, a crash in between adds that batch again.
+        :return: Number of images added
+        """
         path = safe_str(path)
-        addedCount = 0
-        dbSpace = self.db_spaces[dbId]
         if not os.path.isdir(path):
             logger.error("'%s' does not exist or is not a directory" % path)
             return 0
-        for fil in os.listdir(path):
-            fil = safe_str(fil)
-            fil = path + os.sep + fil
-            if len(fil) > 4 and fil.split('.')[-1].lower() in SUPPORTED_IMG_EXTS:
-                file_name = os.path.splitext(os.path.basename(fil))[0]
-                image_id = dbSpace.lastId
-
-                # If ``fname_as_id`` is True, try to retrieve image id from filename.
-                if fname_as_id:
-                    try:
-                        image_id = int(file_name)
-                    except ValueError:
-                        logger.warning("Can not get id from filename {}. Skipping".format(file_name))
-                        continue
-
-                # Add image to db
-                try:
-                    addedCount += self.add_image(dbId, fil, image_id)
-                except RuntimeError as e:
-                    logger.error(e)
-
-            elif recurse and os.path.isdir(fil):
-                addedCount += self.add_dir(dbId, fil, recurse, fname_as_id)
-        return addedCount
+        indexing = DirIndexing(dbId, path, recurse, fname_as_id, SUPPORTED_IMG_EXTS, checkpoint)
+        self._dir_indexings.append(indexing)
+        for results in self._add_signatures(dbId, path_signature, indexing.images()):
+            indexing.done(results)
+        indexing.finish()
+        logger.info("| %d images added from %s, %d failed", indexing.added, path, indexing.failed)
+        return indexing.added
+
+    def get_dir_indexings(self) -> List[dict]:
+        """Progress of the add_dir() calls running and the last ones finished"""
+        return [indexing.get_progress() for indexing in list(self._dir_indexings)]
+
+    @utils.require_known_db_id
+    def add_images(self, db_id: int, images: Iterable[Tuple[str, int]]) -> List[int]:
+        """
+        Add the image files on ``images``, pairs of a path and an image id (0 for the next free one).
+        Signatures are computed on the signature workers (see set_signature_workers()) while this thread
+        adds the ones done, many at once, so decoding runs on every core and the db space is seldom locked.
+
+        :return: Ids the images were added with, in order, 0 for the ones that failed.
+        """
+        return [image_id for results in self._add_signatures(db_id, path_signature, images)
+                for _, image_id in results]
+
+    @utils.require_known_db_id
+    def add_image_blobs(self, db_id: int, images: Iterable[Tuple[bytes, int]], window: int = 0) -> List[int]:
+        """
+        Same as add_images() for images given by their file data. Blobs are taken from ``images`` as they
+        are added, holding at most ``window`` at once (see SignaturePool.map()), so it can be a generator
+        reading them from a stream.
+        """
+        return [image_id for results in self._add_signatures(db_id, blob_signature, images, window)
+                for _, image_id in results]
+
+    def _add_signatures(self, db_id: int, signature_func, images: Iterable[Tuple[Any, int]], window: int = 0) \
+            -> Iterator[List[Tuple[str, int]]]:
+        """
+        Add ``images``, pairs of image data (for ``signature_func``) and id, see add_images().
+
+        :return: ``(name, image id)`` of the images once added, in order, a batch at a time. Names are paths, or
+            the positions of blobs.
+        """
+        db_space = self.db_spaces[db_id]
+        requested_ids = deque()  # of the images taken by map() and not yielded yet
+        results = []
+        batch = []  # (index on results, signature)
+
+        def named(images):
+            for i, (data, image_id) in enumerate(images):
+                requested_ids.append(image_id)
+                yield (data if isinstance(data, str) else "blob #%d" % i), data
+
+        def add_batch():
+            ids = [results[i][1] for i, _ in batch]
+            added = imgdb.addImageSignatures(
+                db_id, ids,
+                [c for _, sig in batch for c in itertools.chain(sig.sig1, sig.sig2, sig.sig3)],
+                [a for _, sig in batch for a in sig.avgl],
+                [x for _, sig in batch for x in (sig.width, sig.height)],
+            )
+            for (i, _), image_id, ok in zip(batch, ids, added):
+                results[i] = (results[i][0], image_id if ok else 0)
+                add_count(db_space)
+            batch.clear()
+            self._automatic_save_check(db_space)
+
+        # map() yields images in the order it takes them
+        for name, signature in self._signatures.map(signature_func, named(images), window):
+            # taken in order, failed images too, so ids are the ones adding one image at a time gives
+            image_id = reserve_image_id(db_space, requested_ids.popleft())
+            if signature is None:
+                logger.error("Unable to add image %s", name)
+                results.append((name, 0))
+                continue
+            batch.append((len(results), signature))
+            results.append((name, image_id))
+            if len(batch) >= ADD_BATCH_SIZE:
+                add_batch()
+                yield results
+                results = []
+        if batch:
+            add_batch()
+        if results:
+            yield results
 
     @utils.require_known_db_id
     @utils.dump_args
@@ -267,21 +595,13 @@ class ImgDB(object):
     def add_image_blob(self, dbId, data, newid=None):
         dbSpace = self.db_spaces[dbId]
 
-        if not newid:
-            newid = dbSpace.lastId
-
-        newid = newid
+        newid = reserve_image_id(dbSpace, newid)
         add_count(dbSpace)
         # call imgdb
         res = imgdb.addImageBlob(dbId, newid, data)
 
         if res != 0:  # add successful
-            dbSpace.lastId = newid + 1
-            # time to save automatically ?
-            # TODO this should be a reactor timer
-            if self._automatic_save and time.time() - dbSpace.lastSaveTime > self._save_interval:
-                dbSpace.lastSaveTime = time.time()
-                self.savealldbs()
+            self._automatic_save_check(dbSpace)
         return res
 
     @utils.require_known_db_id
@@ -289,28 +609,114 @@ class ImgDB(object):
     def add_image(self, db_id, fname, newid=None) -> bool:
         dbSpace = self.db_spaces[db_id]
 
-        if not newid:
-            newid = dbSpace.lastId
-
-        newid = newid
+        newid = reserve_image_id(dbSpace, newid)
         add_count(dbSpace)
         # call imgdb
         res = imgdb.addImage(db_id, newid, fname)
 
         if res != 0:  # add successful
-            dbSpace.lastId = newid + 1
-            # time to save automatically ?            
-            if self._automatic_save and time.time() - dbSpace.lastSaveTime > self._save_interval:
-                dbSpace.lastSaveTime = time.time()
-                self.savealldbs()
+            self._automatic_save_check(dbSpace)
+        return bool(res)
+
+    @utils.require_known_db_id
+    def add_image_signature(self, db_id: int, signature: ImageSignature, newid: int = None) -> bool:
+        """
+        Add an image with its signature, computed beforehand by signatures.path_signature() or
+        signatures.blob_signature(), possibly on another process
+        """
+        db_space = self.db_spaces[db_id]
+        return self._add_signature(db_space, signature, reserve_image_id(db_space, newid))
+
+    def _add_signature(self, db_space: DBSpace, signature: ImageSignature, image_id: int) -> bool:
+        add_count(db_space)
+        res = imgdb.addImageSignature(db_space.id, image_id, *signature)
+
+        if res != 0:  # add successful
+            self._automatic_save_check(db_space)
         return bool(res)
 
+    def _automatic_save_check(self, db_space: DBSpace) -> None:
+        """
+        Save all db spaces if automatic saves are on and the last one is old enough. The save runs on
+        a thread of its own, so the add that triggered it returns at once.
+        """
+        if not self._automatic_save or time.time() - db_space.last_save_time <= self._save_interval:
+            return
+        if not self._saving.acquire(blocking=False):  # one is running already
+            return
+        db_space.last_save_time = time.time()
+
+        def save():
+            try:
+                self.checkpoint()
+            finally:
+                self._saving.release()
+
+        threading.Thread(target=save, name="isk-automatic-save", daemon=True).start()
+
     @utils.require_known_db_id
     @utils.dump_args
     def remove_img(self, db_id, id) -> bool:
         # TODO should also call the code that saves db after a number of ops
         return bool(imgdb.removeID(db_id, id))
 
+    @utils.require_known_db_id
+    def remove_img_bulk(self, db_id: int, image_ids: Sequence[int]) -> int:
+        """
+        Remove every image of ``image_ids`` from the db space at once, which is much faster
+        than removing them one by one.
+
+        :return: number of images removed. Ids not on the db space are skipped.
+        """
+        return imgdb.removeIDs(db_id, [int(image_id) for image_id in image_ids])
+
+    @utils.require_known_db_id
+    def get_dead_count(self, db_id: int) -> int:
+        """Number of removed images of the db space still on its posting lists"""
+        return imgdb.getDeadCount(db_id)
+
+    @utils.require_known_db_id
+    def compact_db(self, db_id: int, step: int = 256) -> int:
+        """
+        Take removed images out of the posting lists of the db space and free their memory.
+
+        Removals only mark images dead, so they are cheap and don't stall queries. Compaction
+        rewrites the posting lists in steps of ``step`` images, holding the db space write lock
+        for one step at a time so queries go on in between. Progress is kept on the
+        ``compaction_done`` and ``compaction_total`` stats of the db space.
+
+        :return: number of images compacted
+        """
+        db_space = self.db_spaces[db_id]
+        total = imgdb.getDeadCount(db_id)
+        db_space.compaction_done = 0
+        db_space.compaction_total = total
+        started = time.time()
+        left = total
+        while left:
+            left = imgdb.compactDbSpace(db_id, step)
+            # removals going on meanwhile add to the total
+            db_space.compaction_total = max(db_space.compaction_total, db_space.compaction_done + left)
+            db_space.compaction_done = db_space.compaction_total - left
+            logger.debug('| Compacting database id=%s: %d/%d', db_id,
+                         db_space.compaction_done, db_space.compaction_total)
+        db_space.last_compaction_time = time.time()
+        if db_space.compaction_done:
+            logger.info('| Database id=%s compacted: %d removed images freed in %.2fs',
+                        db_id, db_space.compaction_done, db_space.last_compaction_time - started)
+        return db_space.compaction_done
+
+    def compact_dbs(self, min_dead: int, step: int = 256) -> int:
+        """
+        Compact every db space with at least ``min_dead`` removed images, see compact_db().
+
+        :return: number of images compacted
+        """
+        return sum(
+            self.compact_db(db_id, step) for db_id, db_space in list(self.db_spaces.items())
+            if db_space.loaded and imgdb.getDeadCount(db_id) >= max(min_dead, 1)
+        )
+
     def get_db_detailed_list(self) -> dict:
         db_id_list = self.get_db_list()
         detlist = {
@@ -338,6 +744,25 @@ class ImgDB(object):
     def get_image_avgl(self, dbId, id):
         return imgdb.getImageAvgl(dbId, id)
 
+    @utils.require_known_db_id
+    def avgl_distances(self, db_id: int, avgl: Sequence[float], sketch: int = 0) -> Tuple:
+        """
+        Average luminance distance of every image on the db space to ``avgl``, i.e. the
+        scores of a ``fast`` query, computed by the engine kernels straight into NumPy arrays.
+
+        :return: ``(ids, distances)`` arrays, in no particular order.
+        """
+        if numpy is None:
+            raise RuntimeError("avgl_distances() requires numpy")
+        size = imgdb.getImgCount(db_id)
+        while True:
+            ids = numpy.empty(size, dtype=numpy.int_)
+            distances = numpy.empty(size, dtype=numpy.float64)
+            count = imgdb.getAvglDistances(db_id, avgl[0], avgl[1], avgl[2], sketch, ids, distances)
+            if count <= size:
+                return ids[:count], distances[:count]
+            size = count  # images were added meanwhile
+
     @utils.require_known_db_id
     def getIdsBloomFilter(self, dbId):
         return imgdb.getIdsBloomFilter(dbId)
@@ -398,6 +823,19 @@ class ImgDB(object):
     def get_all_imgs_by_keywords(self, db_id, numres, kw_join_type, keywords) -> list:
         return imgdb.getAllImgsByKeywords(db_id, numres, kw_join_type, keywords)
 
+    @utils.require_known_db_id
+    def get_imgs_by_keywords_page(self, db_id: int, kw_join_type: int, keywords: Sequence[int], cursor: int,
+                                  limit: int) -> Tuple[List[int], int]:
+        """
+        Up to ``limit`` ids of the images having the keywords, in the order they are stored, starting
+        at ``cursor``, and the cursor of the next page, 0 after the last one. Found by seeking the
+        keyword postings, so a page costs as much as its images, not the whole db space.
+        """
+        page = imgdb.getImgsByKeywordsPage(db_id, kw_join_type, keywords, cursor, limit)
+        if not page:
+            return [], 0
+        return list(page[:-1]), page[-1]
+
     @utils.require_known_db_id
     def query_img_id_fast_keywords(self, dbId, imgId, numres, kwJoinType, keywords):
         return imgdb.queryImgIDFastKeywords(dbId, imgId, numres, kwJoinType, keywords)
@@ -498,6 +936,75 @@ class ImgDB(object):
         logger.debug("queryImgID() ret=" + str(res))
         return res
 
+    @utils.require_known_db_id
+    def query_img_ids_batch(self, db_id: int, image_ids: Sequence[int], numres: int, sketch=0,
+                            fast: bool = False) -> List[list]:
+        """
+        Same as calling :meth:`query_img_id` for every id of ``image_ids``, but the engine
+        scores the queries together, sharing its scans of the db space among them.
+
+        :return: list with the results of every query, in the order of ``image_ids``. Ids not
+            on the db space get no results.
+        """
+        db_space = self.db_spaces[db_id]
+
+        # update internal counters
+        numres = int(numres) + 1
+        for _ in image_ids:
+            count_query(db_space)
+
+        # do query
+        results = imgdb.queryImgIDsBatch(db_id, [int(image_id) for image_id in image_ids], numres, sketch, fast)
+        return self._split_batch_results(results)
+
+    @utils.require_known_db_id
+    def query_img_blobs_batch(self, db_id: int, blobs: Sequence[bytes], numres: int, sketch=0,
+                              fast: bool = False) -> List[list]:
+        """
+        Batch version of :meth:`query_img_blob`, see :meth:`query_img_ids_batch`.
+        Images which can't be read get no results.
+        """
+        db_space = self.db_spaces[db_id]
+
+        # update internal counters
+        numres = int(numres) + 1
+        for _ in blobs:
+            count_query(db_space)
+
+        # do query
+        results = imgdb.queryImgBlobsBatch(db_id, b''.join(blobs), [len(blob) for blob in blobs], numres, sketch, fast)
+        return self._split_batch_results(results)
+
+    @utils.require_known_db_id
+    def query_img_paths_batch(self, db_id: int, paths: Sequence[str], numres: int, sketch=0,
+                              fast: bool = False) -> List[list]:
+        """
+        Batch version of :meth:`query_img_path`, see :meth:`query_img_ids_batch`.
+        Images which can't be read get no results.
+        """
+        db_space = self.db_spaces[db_id]
+
+        # update internal counters
+        numres = int(numres) + 1
+        for _ in paths:
+            count_query(db_space)
+
+        # do query
+        results = imgdb.queryImgPathsBatch(db_id, [str(path) for path in paths], numres, sketch, fast)
+        return self._split_batch_results(results)
+
+    def _split_batch_results(self, results: tuple) -> List[list]:
+        """Split the results of a batch query, a count of (id, score) pairs followed by the
+        pairs for every query, into the normalized results of each query"""
+        res = []
+        pos = 0
+        while pos < len(results):
+            count = int(results[pos])
+            query_results = results[pos + 1:pos + 1 + 2 * count]
+            res.append(list(self._normalize_results(query_results)))
+            pos += 1 + 2 * count
+        return res
+
     def _pairgen(self, results: tuple) -> Iterable:
         results_iter = reversed(results)
         for rsc in results_iter:
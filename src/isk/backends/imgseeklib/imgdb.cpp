@@ -31,13 +31,22 @@ Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 
 /* C Includes */
 #include <ctime>
+#include <errno.h>
+#include <limits.h>
 #include <math.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <time.h>
+#include <dirent.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#ifndef _WINDOWS
+#include <sys/wait.h>
+#endif
 
 /* STL Includes */
+#include <algorithm>
 #include <fstream>
 #include <iostream>
 
@@ -50,12 +59,126 @@ using namespace std;
 /* Database */
 #include "bloom_filter.h"
 #include "imgdb.h"
+#include "rawio.h"
+#include "threadpool.h"
+#include "wal.h"
 
 //TODO reactivate fast jpeg loader: http://trac.xapian.org/browser/branches/imgseek/xapian-extras/imgseek
 
 // Globals
 dbSpaceMapType dbSpace;
-keywordsMapType globalKwdsMap;
+/* db spaces known from their file only, loaded on first use by loadSpace().
+An id is never both here and on dbSpace */
+std::map<int, std::string> coldSpaces;
+
+/* Locking:
+dbSpaceLock guards the dbSpace and coldSpaces maps. It is held for reading while a db space
+is used and for writing while db spaces are created, reset, removed or loaded.
+Each db space has its own lock for its contents, keywords and keyword
+postings included (see dbSpaceStruct::lock).
+Locks are always taken in the order dbSpaceLock, dbSpaceStruct::lock.
+Exported functions take the locks they need; helpers say what their caller
+must hold.
+ */
+RWLock dbSpaceLock;
+
+/* Write ahead log:
+Every change to the db spaces (created, reset or removed, images added or
+removed, keywords added or removed) appends a record to mutationLog right
+before it is made, with the db space locked for writing, so the records of a
+db space are in the order its changes were made. A change the log fails to
+take is not made. The caller then waits for its records to be durable, after
+releasing its locks (see LogSync).
+openLog() replays the log on top of the last checkpoint (the database file
+loaded before) and checkpointdbs() writes a new checkpoint and drops the log
+segments it covers. Loading db spaces from files is not logged.
+logLock serializes opening, closing and checkpointing the log. It is taken
+before dbSpaceLock.
+ */
+WriteAheadLog mutationLog;
+std::string mutationLogPrefix;
+unsigned long mutationLogSegment = 0;	/* segment appended to */
+RWLock logLock;
+
+/* Log record types. A record holds its type and db space id, then: */
+enum LogRecordType {
+	LOG_CREATE_DB = 1,		/* nothing */
+	LOG_RESET_DB,			/* nothing */
+	LOG_REMOVE_DB,			/* nothing */
+	LOG_ADD_SIG_V011,		/* [sigStructV011] signature, written before SRZ_V0_12_0 */
+	LOG_REMOVE_IDS,			/* [unsigned long] count, [long int] image ids */
+	LOG_ADD_KEYWORDS,		/* [long int] image id, [unsigned long] count, [int] keywords */
+	LOG_REMOVE_KEYWORD,		/* [long int] image id, [int] keyword */
+	LOG_REMOVE_ALL_KEYWORDS,	/* [long int] image id */
+	LOG_ADD_SIG			/* [DiskSigStruct] signature */
+};
+
+/* A log record being built */
+class LogRecord {
+public:
+	LogRecord(int type, int dbId) {
+		put(type);
+		put(dbId);
+	}
+
+	template <class T> void put(const T& value) {
+		data.append((const char*) &value, sizeof(T));
+	}
+
+	template <class T> void putArray(const T* values, unsigned long n) {
+		put(n);
+		if (n) data.append((const char*) values, n * sizeof(T));
+	}
+
+	std::string data;
+};
+
+/* Reads back the fields of a log record, in the order they were put */
+class LogRecordReader {
+public:
+	LogRecordReader(const std::string& data): data(data), pos(0) {}
+
+	template <class T> bool get(T& value) {
+		if (data.size() - pos < sizeof(T)) return false;
+		memcpy(&value, data.data() + pos, sizeof(T));
+		pos += sizeof(T);
+		return true;
+	}
+
+	template <class T> bool getArray(std::vector<T>& values) {
+		unsigned long n;
+		if (!get(n) || (data.size() - pos) / sizeof(T) < n) return false;
+		values.resize(n);
+		if (n) memcpy(&values[0], data.data() + pos, n * sizeof(T));
+		pos += n * sizeof(T);
+		return true;
+	}
+
+private:
+	const std::string& data;
+	size_t pos;
+};
+
+/* Appends records to the log and waits, on leaving the enclosing scope, for
+them to be durable. Declared before the lockers of a function, so the wait
+comes after they release their locks and holds up nobody else.
+A change is logged before it is made: append() returns false if the log
+failed, and the change must not be made then */
+class LogSync {
+public:
+	LogSync(): position(0) {}
+	~LogSync() { mutationLog.sync(position); }
+
+	bool append(const LogRecord& record) {
+		unsigned long long end;
+		if (!mutationLog.append(record.data.data(), record.data.size(), end)) return false;
+		if (end) position = end;
+		return true;
+	}
+
+private:
+	unsigned long long position;
+};
 
 /* Fixed weight mask for pixel positions (i,j).
 Each entry x = i*NUM_PIXELS + j, gets value max(i,j) saturated at 5.
@@ -66,7 +189,7 @@ int imgBinInited = 0;
 
 // Macros
 #define validate_dbid(dbId) (dbSpace.count(dbId))
-#define validate_imgid(dbId, imgId) (dbSpace.count(dbId) && (dbSpace[dbId]->sigs.count(imgId)))
+#define validate_imgid(dbId, imgId) (dbSpace.count(dbId) && (dbSpace[dbId]->idSlots.count(imgId)))
 
 void initImgBin()
 {
@@ -99,78 +222,249 @@ void initImgBin()
 
 }
 
-void initDbase(const int dbId) {
-	/* should be called before adding images */
+/* creates db space dbId. Returns false if it exists already.
+Caller must hold dbSpaceLock for writing */
+bool initDbSpace(const int dbId) {
 	if (!imgBinInited) initImgBin();
 
 	if (dbSpace.count(dbId))  { // db id already used?
 		cerr << "ERROR: dbId already in use" << endl;
-		return;
+		return false;
 	}
+	// a new db space replaces the one on its file, if any
+	coldSpaces.erase(dbId);
+	dbSpace[dbId] = new dbSpaceStruct();
+	dbSpace[dbId]->changes = 1;
+	return true;
+}
+
+unsigned long nextSpaceSerial() {
+	static unsigned long last = 0;
+	// db spaces are loaded on many threads at once
+	return __sync_add_and_fetch(&last, 1);
+}
+
+/* empties db space dbId. Caller must hold dbSpaceLock for writing */
+void resetDbSpace(const int dbId) {
+	// deallocate buckets, sigs and ids filter together with the db space itself
+	delete dbSpace[dbId];
+
+ 	// finally the reset itself, to be saved over its file
 	dbSpace[dbId] = new dbSpaceStruct();
+	dbSpace[dbId]->changes = 1;
+}
+
+void initDbase(const int dbId) {
+	/* should be called before adding images */
+	LogSync logSync;
+	WriteLocker dbsLocker(dbSpaceLock);
+	// one in use is refused by initDbSpace(), unlogged
+	if (!dbSpace.count(dbId) && !logSync.append(LogRecord(LOG_CREATE_DB, dbId))) return;
+	initDbSpace(dbId);
 }
 
 void closeDbase() {
 	/* should be called before exiting app */
+	WriteLocker dbsLocker(dbSpaceLock);
 	for (dpspaceIterator it = dbSpace.begin(); it != dbSpace.end(); it++) {
-		resetdb((*it).first);
         delete (*it).second;
 	}
+	dbSpace.clear();
+	coldSpaces.clear();
 }
 
 int getImageWidth(const int dbId, long int id) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return 0;};
-	return dbSpace[dbId]->sigs[id]->width;
+	return dbSpace[dbId]->getSig(id)->width;
 }
 
 bool isImageOnDB(const int dbId, long int id) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return false;}
-	return dbSpace[dbId]->sigs.count(id) > 0;
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+	return dbSpace[dbId]->idSlots.count(id) > 0;
 }
 
 int getImageHeight(const int dbId, long int id) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return 0;};
-	return dbSpace[dbId]->sigs[id]->height;
+	return dbSpace[dbId]->getSig(id)->height;
 }
 
 double_vector getImageAvgl(const int dbId, long int id) {
 	double_vector res;
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return res; }
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
 
-	if (!dbSpace[dbId]->sigs.count(id))
+	DiskSigStruct* sig = dbSpace[dbId]->getSig(id);
+	if (!sig)
 		return res;
 	for(int i=0;i<3; i++) {
-		res.push_back(dbSpace[dbId]->sigs[id]->avgl[i]);
+		res.push_back(sig->avgl[i]);
 	}
 	return res;
 }
 
-int addImageFromImage(const int dbId, const long int id, Image * image ) {
+/* Bucket visitors, see PostingList::forEach */
+
+// subtracts a coefficient weight from the score of every slot visited
+struct ScoreUpdate {
+	double* scores;
+	double w;
+	ScoreUpdate(double* scores, double w): scores(scores), w(w) {}
+	void operator()(const sigSlot slot) { scores[slot] -= w; }
+};
+
+// same as ScoreUpdate, restricted to the slots of a candidate set
+struct FilteredScoreUpdate {
+	double* scores;
+	double w;
+	sigSlot_hashset* tslots;
+	FilteredScoreUpdate(double* scores, double w, sigSlot_hashset* tslots): scores(scores), w(w), tslots(tslots) {}
+	void operator()(const sigSlot slot) { if (tslots->count(slot)) scores[slot] -= w; }
+};
+
+// counts the live slots of a bucket, dead ones are not persisted
+struct BucketLiveCounter {
+	std::vector<bool>& liveSlots;
+	unsigned long count;
+	BucketLiveCounter(std::vector<bool>& liveSlots): liveSlots(liveSlots), count(0) {}
+	void operator()(const sigSlot slot) { if (liveSlots[slot]) count++; }
+};
+
+// arrays saving a db space, which may run on a snapshot child (see rawio.h)
+typedef std::vector<sigSlot, PageAllocator<sigSlot> > SaveSlots;
+
+// collects the slots a bucket gets on a saved db space (see savedbtostream)
+struct BucketSlotRenumberer {
+	SaveSlots& newSlots;
+	SaveSlots& out;
+	BucketSlotRenumberer(SaveSlots& newSlots, SaveSlots& out): newSlots(newSlots), out(out) {}
+	void operator()(const sigSlot slot) { if (newSlots[slot] != NO_SLOT) out.push_back(newSlots[slot]); }
+};
+
+/* Stores sig on a free slot of the db space (or a new one at the end of the
+dense store) and adds the slot to the buckets of its coefficients.
+Caller must make sure sig.id is not on the db space yet.
+ */
+sigSlot insertSig(dbSpaceStruct* space, const SigStruct& sig) {
+	sigSlot slot;
+
+	if (space->freeSlots.size()) {
+		slot = space->freeSlots.back();
+		space->freeSlots.pop_back();
+		space->sigs[slot] = sig;
+		space->liveSlots[slot] = true;
+		for (int c = 0; c < 3; c++) space->avglCols[c][slot] = sig.avgl[c];
+	} else {
+		slot = space->sigs.size();
+		space->sigs.push_back(sig);
+		space->liveSlots.push_back(true);
+		for (int c = 0; c < 3; c++) space->avglCols[c].push_back(sig.avgl[c]);
+	}
+	space->idSlots.set(sig.id, slot);
+	space->changes++;
+	// insert into ids bloom filter
+	space->imgIdsFilter->insert(sig.id);
 
-	/* id is a unique image identifier
-	filename is the image location
-	thname is the thumbnail location for this image
-	doThumb should be set to 1 if you want to save the thumbnail on thname
-	Images with a dimension smaller than ignDim are ignored
-	 */
-	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0; }
+	for (int i = 0; i < NUM_COEFS; i++) {	// populate buckets
+		if (sig.sig1[i]>0) space->imgbuckets[0][0][sig.sig1[i]].push_back(slot);
+		if (sig.sig1[i]<0) space->imgbuckets[0][1][-sig.sig1[i]].push_back(slot);
 
-	if (dbSpace[dbId]->sigs.count(id)) {
-		cerr << "ERROR: imgId already in use" << endl;
-		return 0;
+		if (sig.sig2[i]>0) space->imgbuckets[1][0][sig.sig2[i]].push_back(slot);
+		if (sig.sig2[i]<0) space->imgbuckets[1][1][-sig.sig2[i]].push_back(slot);
+
+		if (sig.sig3[i]>0) space->imgbuckets[2][0][sig.sig3[i]].push_back(slot);
+		if (sig.sig3[i]<0) space->imgbuckets[2][1][-sig.sig3[i]].push_back(slot);
 	}
+	return slot;
+}
 
-    if (image == (Image *) NULL) {
-    	cerr << "ERROR: unable to add null image" << endl;
-    	return 0;
-    }
+/* Fills buckets with the buckets holding the slot of sig, one for each of its
+non zero coefficients (the ones insertSig adds it to). Returns how many */
+int sigBuckets(dbSpaceStruct* space, const DiskSigStruct& sig, PostingList** buckets) {
+	const SigIdx *coefs[3] = { sig.sig1, sig.sig2, sig.sig3 };
+	int n = 0;
+	for (int c = 0; c < 3; c++) {
+		for (int i = 0; i < NUM_COEFS; i++) {
+			if (coefs[c][i] > 0) buckets[n++] = &space->imgbuckets[c][0][coefs[c][i]];
+			if (coefs[c][i] < 0) buckets[n++] = &space->imgbuckets[c][1][-coefs[c][i]];
+		}
+	}
+	return n;
+}
+
+/* Adds keyword to the image on slot and slot to the postings of keyword.
+Returns false if the image had it already */
+bool addSlotKeyword(dbSpaceStruct* space, sigSlot slot, int keyword) {
+	if (!space->slotKeywords.add(slot, keyword)) return false;
+	space->kwdPostings[keyword].add(slot);
+	return true;
+}
+
+// takes slot out of the postings of keyword, dropping them once empty
+static void removeKeywordPosting(dbSpaceStruct* space, sigSlot slot, int keyword) {
+	std::map<int, SlotBitmap>::iterator it = space->kwdPostings.find(keyword);
+	if (it == space->kwdPostings.end()) return;
+	it->second.remove(slot);
+	if (it->second.empty()) space->kwdPostings.erase(it);
+}
+
+/* Removes keyword from the image on slot and slot from the postings of
+keyword. Returns false if the image didn't have it */
+bool removeSlotKeyword(dbSpaceStruct* space, sigSlot slot, int keyword) {
+	if (!space->slotKeywords.remove(slot, keyword)) return false;
+	removeKeywordPosting(space, slot, keyword);
+	return true;
+}
+
+/* Removes every keyword of the image on slot, see removeSlotKeyword().
+Returns false if it had none */
+bool removeSlotKeywords(dbSpaceStruct* space, sigSlot slot) {
+	std::vector<int> keywords;
+	space->slotKeywords.get(slot, keywords);
+	if (!space->slotKeywords.removeAll(slot)) return false;
+	for (size_t k = 0; k < keywords.size(); k++) removeKeywordPosting(space, slot, keywords[k]);
+	return true;
+}
+
+/* Removes the image on slot from the db space. The slot is only marked dead:
+it stays on its buckets, skipped by queries, until compactDbSpace() frees it.
+Its keywords go right away, so keyword postings only hold live slots.
+ */
+void killSlot(dbSpaceStruct* space, sigSlot slot) {
+	removeSlotKeywords(space, slot);
+	space->idSlots.erase(space->sigs[slot].id);
+	space->liveSlots[slot] = false;
+	space->deadSlots.push_back(slot);
+	space->changes++;
+}
 
-	// Made static for speed; only used locally
-	static Unit cdata1[16384];
-	static Unit cdata2[16384];
-	static Unit cdata3[16384];
-	int i;
-	int width, height;
+/* Makes a dead slot already taken out of its buckets free for reuse */
+void freeSlot(dbSpaceStruct* space, sigSlot slot) {
+	memset(&space->sigs[slot], 0, sizeof(DiskSigStruct));
+	for (int c = 0; c < 3; c++) space->avglCols[c][slot] = 0;
+	space->freeSlots.push_back(slot);
+}
+
+/* Computes the signature of image into sig: its Haar coefficients, average
+luminance and dimensions. image is destroyed. Returns 0 on failure.
+Thread safe, so it is called without holding any lock.
+ */
+int imageSignature(Image * image, SigStruct& sig) {
+
+	// coefficient buffers, too big for a thread stack
+	std::vector<Unit> cdata1(16384);
+	std::vector<Unit> cdata2(16384);
+	std::vector<Unit> cdata3(16384);
 
 	ExceptionInfo exception;
 
@@ -181,8 +475,8 @@ int addImageFromImage(const int dbId, const long int id, Image * image ) {
 	 */
 	GetExceptionInfo(&exception);
 
-	width = (int)image->columns;
-	height = (int)image->rows;
+	sig.width = (int)image->columns;
+	sig.height = (int)image->rows;
 
 	resize_image = SampleImage(image, 128, 128, &exception);
 
@@ -213,67 +507,163 @@ int addImageFromImage(const int dbId, const long int id, Image * image ) {
 
 	DestroyImage(resize_image);
 
-	transformChar(rchan, gchan, bchan, cdata1, cdata2, cdata3);
+	transformChar(rchan, gchan, bchan, &cdata1[0], &cdata2[0], &cdata3[0]);
 
 	DestroyExceptionInfo(&exception);
 
-	SigStruct *nsig = new SigStruct();
-	nsig->id = id;
-	nsig->width = width;
-	nsig->height = height;
+	Idx sig1[NUM_COEFS], sig2[NUM_COEFS], sig3[NUM_COEFS];
+	double avgl[3];
+	calcHaar(&cdata1[0], &cdata2[0], &cdata3[0], sig1, sig2, sig3, avgl);
+	sig.setCoefs(sig1, sig2, sig3, avgl);
 
-	// insert into sigmap
-	dbSpace[dbId]->sigs[id] = nsig;
-	// insert into ids bloom filter
-	dbSpace[dbId]->imgIdsFilter->insert(id);
-
-	calcHaar(cdata1, cdata2, cdata3,
-			nsig->sig1, nsig->sig2, nsig->sig3, nsig->avgl);
+	return 1;
+}
 
-	for (i = 0; i < NUM_COEFS; i++) {	// populate buckets
+/* Adds the image nsig.id with its signature nsig, computed beforehand, to
+space, which the caller holds locked for writing. Returns 0 if the id is in
+use.
+ */
+static int insertNewSig(dbSpaceStruct* space, const int dbId, const SigStruct& nsig, LogSync& logSync) {
+	// may have been added while computing the signature
+	if (space->idSlots.count(nsig.id)) {
+		cerr << "ERROR: imgId already in use" << endl;
+		return 0;
+	}
 
+	LogRecord record(LOG_ADD_SIG, dbId);
+	record.put<DiskSigStruct>(nsig);
+	if (!logSync.append(record)) return 0;
+	insertSig(space, nsig);
 
-#ifdef FAST_POW_GEERT
-		int x, t;
-		// sig[i] never 0
-		int x, t;
+	return 1;
+}
 
-		x = nsig->sig1[i];
-		t = (x < 0);		/* t = 1 if x neg else 0 */
-		/* x - 0 ^ 0 = x; i - 1 ^ 0b111..1111 = 2-compl(x) = -x */
-		x = (x - t) ^ -t;
-		dbSpace[dbId]->imgbuckets[0][t][x].push_back(id);
+/* Same as insertNewSig() for the db space dbId, locking it. Returns 0 if the
+db space is gone too.
+ */
+int addSig(const int dbId, const SigStruct& nsig) {
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0; }
+	dbSpaceStruct* space = dbSpace[dbId];
+	WriteLocker spaceLocker(space->lock);
 
-		x = nsig->sig2[i];
-		t = (x < 0);
-		x = (x - t) ^ -t;
-		dbSpace[dbId]->imgbuckets[1][t][x].push_back(id);
+	return insertNewSig(space, dbId, nsig, logSync);
+}
 
-		x = nsig->sig3[i];
-		t = (x < 0);
-		x = (x - t) ^ -t;
-		dbSpace[dbId]->imgbuckets[2][t][x].push_back(id);
+int addImageFromImage(const int dbId, const long int id, Image * image ) {
 
-		should not fail
+	/* id is a unique image identifier
+	filename is the image location
+	thname is the thumbnail location for this image
+	doThumb should be set to 1 if you want to save the thumbnail on thname
+	Images with a dimension smaller than ignDim are ignored
+	 */
+	{
+		ReadLocker dbsLocker(dbSpaceLock);
+		if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0; }
+		ReadLocker spaceLocker(dbSpace[dbId]->lock);
 
-#else //FAST_POW_GEERT
-		//long_array3 imgbuckets = dbSpace[dbId]->imgbuckets;
-		if (nsig->sig1[i]>0) dbSpace[dbId]->imgbuckets[0][0][nsig->sig1[i]].push_back(id);
-		if (nsig->sig1[i]<0) dbSpace[dbId]->imgbuckets[0][1][-nsig->sig1[i]].push_back(id);
+		if (dbSpace[dbId]->idSlots.count(id)) {
+			cerr << "ERROR: imgId already in use" << endl;
+			return 0;
+		}
+	}
 
-		if (nsig->sig2[i]>0) dbSpace[dbId]->imgbuckets[1][0][nsig->sig2[i]].push_back(id);
-		if (nsig->sig2[i]<0) dbSpace[dbId]->imgbuckets[1][1][-nsig->sig2[i]].push_back(id);
+    if (image == (Image *) NULL) {
+    	cerr << "ERROR: unable to add null image" << endl;
+    	return 0;
+    }
 
-		if (nsig->sig3[i]>0) dbSpace[dbId]->imgbuckets[2][0][nsig->sig3[i]].push_back(id);
-		if (nsig->sig3[i]<0) dbSpace[dbId]->imgbuckets[2][1][-nsig->sig3[i]].push_back(id);
+	// the expensive part runs unlocked, so queries and other adds go on meanwhile
+	SigStruct nsig;
+	nsig.id = id;
+	if (!imageSignature(image, nsig)) return 0;
 
-#endif //FAST_POW_GEERT
+	return addSig(dbId, nsig);
+}
 
+/* Fills nsig with a signature computed elsewhere, see addImageSignature().
+Returns 0 if it is malformed.
+ */
+static int signatureFromData(SigStruct& nsig, const long int id, const int* sig1, const int* sig2, const int* sig3,
+		const double* avgl, int width, int height) {
+	const int* coefs[3] = { sig1, sig2, sig3 };
+	for (int c = 0; c < 3; c++) {
+		int positions[NUM_COEFS];
+		for (int i = 0; i < NUM_COEFS; i++) {
+			// coefficients index the buckets
+			if (abs(coefs[c][i]) >= NUM_PIXELS_SQUARED) { cerr << "ERROR: signature coefficient out of range" << endl; return 0; }
+			positions[i] = abs(coefs[c][i]);
+		}
+		// like calcHaar() output: distinct positions, none of them the average (0). An image must be on a
+		// bucket once at most, queries and batchChunkBuckets() rely on it.
+		std::sort(positions, positions + NUM_COEFS);
+		if (positions[0] == 0) { cerr << "ERROR: signature coefficient out of range" << endl; return 0; }
+		if (std::adjacent_find(positions, positions + NUM_COEFS) != positions + NUM_COEFS) {
+			cerr << "ERROR: signature coefficients repeated" << endl;
+			return 0;
+		}
 	}
 
-	// success after all
+	nsig.id = id;
+	nsig.setCoefs(sig1, sig2, sig3, avgl);
+	nsig.width = width;
+	nsig.height = height;
 	return 1;
+}
+
+/* Adds image id with the signature computed elsewhere by imageSignatureFromPath()
+or imageSignatureFromBlob(), so images can be decoded in other processes
+and only inserted here. Returns 0 if the signature is malformed, see addSig()
+otherwise.
+ */
+int addImageSignature(const int dbId, const long int id, std::vector<int> sig1, std::vector<int> sig2, std::vector<int> sig3,
+		std::vector<double> avgl, int width, int height) {
+	if (sig1.size() != NUM_COEFS || sig2.size() != NUM_COEFS || sig3.size() != NUM_COEFS) {
+		cerr << "ERROR: signature must have " << NUM_COEFS << " coefficients per channel" << endl;
+		return 0;
+	}
+	if (avgl.size() != 3) { cerr << "ERROR: signature must have 3 average luminance values" << endl; return 0; }
+
+	SigStruct nsig;
+	if (!signatureFromData(nsig, id, &sig1[0], &sig2[0], &sig3[0], &avgl[0], width, height)) return 0;
+	return addSig(dbId, nsig);
+}
+
+/* Adds images ids with their signatures, like addImageSignature() but under a
+single lock. Signature j is sig1, sig2 and sig3 on coefs[3*NUM_COEFS*j...],
+avgl on avgls[3*j...], width and height on sizes[2*j...].
+Returns 1 for each image added, 0 for the ones that failed.
+ */
+std::vector<int> addImageSignatures(const int dbId, std::vector<long int> ids, std::vector<int> coefs,
+		std::vector<double> avgls, std::vector<int> sizes) {
+	size_t n = ids.size();
+	std::vector<int> added(n, 0);
+	if (coefs.size() != 3 * NUM_COEFS * n || avgls.size() != 3 * n || sizes.size() != 2 * n) {
+		cerr << "ERROR: signatures must have " << 3 * NUM_COEFS << " coefficients, 3 average luminance values and 2 sizes each" << endl;
+		return added;
+	}
 
+	// checked before locking, to hold the lock for the inserts only
+	std::vector<SigStruct> sigs(n);
+	std::vector<char> valid(n);
+	for (size_t j = 0; j < n; j++) {
+		const int* sig = &coefs[3 * NUM_COEFS * j];
+		valid[j] = signatureFromData(sigs[j], ids[j], sig, sig + NUM_COEFS, sig + 2 * NUM_COEFS, &avgls[3 * j],
+				sizes[2 * j], sizes[2 * j + 1]);
+	}
+
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return added; }
+	dbSpaceStruct* space = dbSpace[dbId];
+	WriteLocker spaceLocker(space->lock);
+
+	for (size_t j = 0; j < n; j++) {
+		if (valid[j]) added[j] = insertNewSig(space, dbId, sigs[j], logSync);
+	}
+	return added;
 }
 
 int addImageBlob(const int dbId, const long int id, const char *blob, const long length) {
@@ -318,17 +708,17 @@ int addImage(const int dbId, const long int id, char *filename) {
 	return addImageFromImage(dbId, id, image);
 }
 
+/* Caller must hold dbSpaceLock for writing */
 int loaddbfromstream(const int dbId, std::ifstream& f, srzMetaDataStruct& md) {
 
 	if (!dbSpace.count(dbId))  { // haven't been inited yet
-		initDbase(dbId);
+		initDbSpace(dbId);
 	} else { // already exists, so reset first
-		resetdb(dbId);
+		resetDbSpace(dbId);
 	}
 
-	long int id;
 	int sz;
-	// read buckets
+	// skip buckets, they are rebuilt from the signatures coefficients below
 	for (int c = 0; c < 3; c++)
 		for (int pn = 0; pn < 2; pn++)
 			for (int i = 0; i < 16384; i++) {
@@ -336,50 +726,48 @@ int loaddbfromstream(const int dbId, std::ifstream& f, srzMetaDataStruct& md) {
 				if (!f.good()) {
 					continue;
 				}
-				for (int k = 0; k < sz; k++) {
-					f.read((char *) &(id), sizeof(long int));
-					if (!f.good()) {
-						cerr << "ERROR bad file while reading id" << endl;
-						continue;
-					}
-					dbSpace[dbId]->imgbuckets[c][pn][i].push_back(id);
-				}
+				f.seekg(sz * sizeof(long int), ios::cur);
 			}
 
 	// read sigs
-	sigMap::size_type szt;
-	f.read((char *) &(szt), sizeof(sigMap::size_type));
+	size_t szt;
+	f.read((char *) &(szt), sizeof(size_t));
 	if (!f.good()) {
 		cerr << "ERROR bad file while reading sigs size" << endl;
 		return 0;
 	}
 
+	dbSpaceStruct* space = dbSpace[dbId];
+	// not saved on its own file yet, even if empty
+	space->changes++;
+	space->sigs.reserve(szt);
+	for (int c = 0; c < 3; c++) space->avglCols[c].reserve(szt);
+
 	if (md.iskVersion < SRZ_V0_6_0) {
 		cout << "INFO migrating database from a version prior to 0.6" << endl;
 		// read sigs
+		sigStructV06 nsig06;
 		for (int k = 0; k < szt; k++) {
-			sigStructV06* nsig06 = new sigStructV06();
-			f.read((char *) nsig06, sizeof(sigStructV06));
-			SigStruct* nsig = new SigStruct(nsig06);
-			dbSpace[dbId]->sigs[nsig->id]=nsig;
+			f.read((char *) &nsig06, sizeof(sigStructV06));
+			SigStruct nsig(&nsig06);
+			insertSig(space, nsig);
 		}
 		return 1;
 
-	} else { // current version
+	} else { // 0.6 up to the mapped index file
 
-		DiskSigStruct* ndsig = new DiskSigStruct();
+		// signatures are narrowed to 16 bit coefficients and float avgl here
+		sigStructV011* ndsig = new sigStructV011();
 		for (int k = 0; k < szt; k++) {
 
-			f.read((char *) ndsig, sizeof(DiskSigStruct));
+			f.read((char *) ndsig, sizeof(sigStructV011));
 			if (!f.good()) {
 				cerr << "ERROR bad file while reading diskSigStruct" << endl;
+				delete ndsig;
 				return 0;
 			}
-			SigStruct* nsig = new SigStruct(ndsig);
 			// insert new sig
-			dbSpace[dbId]->sigs[nsig->id]=nsig;
-			// insert into ids bloom filter
-			dbSpace[dbId]->imgIdsFilter->insert(nsig->id);
+			sigSlot slot = insertSig(space, SigStruct(ndsig));
 			// read kwds
 			int kwid;
 			int szk;
@@ -395,16 +783,207 @@ int loaddbfromstream(const int dbId, std::ifstream& f, srzMetaDataStruct& md) {
 					cerr << "ERROR bad file while reading kwd id" << endl;
 					return 0;
 				}
-				nsig->keywords.insert(kwid);
-				// populate keyword postings
-				getKwdPostings(kwid)->imgIdsFilter->insert(nsig->id);
+				addSlotKeyword(space, slot, kwid);
 			}
 		}
 		delete ndsig;
+		space->slotKeywords.compact();
 		return 1;
 	}
 }
 
+// adds each slot to the postings of its keywords
+struct KeywordPostingsAdder {
+	dbSpaceStruct* space;
+	KeywordPostingsAdder(dbSpaceStruct* space): space(space) {}
+	void operator()(const sigSlot slot, const int keyword) {
+		if (space->liveSlots[slot]) space->kwdPostings[keyword].add(slot);
+	}
+};
+
+/* Builds the keyword postings of space from the keywords of its slots */
+void addKeywordPostings(dbSpaceStruct* space) {
+	KeywordPostingsAdder adder(space);
+	space->slotKeywords.forEach(adder);
+}
+
+/* db spaces start at multiples of this on a mapped index file, so each one
+can be mapped on its own whatever the page size */
+#define MAPPED_SPACE_ALIGN 65536
+
+/* arrays start at multiples of this inside a db space */
+#define MAPPED_ARRAY_ALIGN 64
+
+// tells whether count items of size bytes at offset are inside the db space
+static bool mappedArrayFits(const MappedSpaceHeader& header, unsigned long offset, unsigned long count, unsigned long size) {
+	return offset >= sizeof(MappedSpaceHeader) && offset <= header.length && offset % MAPPED_ARRAY_ALIGN == 0
+			&& count <= (header.length - offset) / size;
+}
+
+/* Maps the db space of a mapped index file starting at offset into space, a
+new db space nobody else uses yet. Its signatures, columns, buckets and ids
+are used in place, only the keyword postings are built (see
+addKeywordPostings()). Needs no lock, so db spaces of many files can be
+mapped at once.
+Files older than iskVersion SRZ_V0_12_0 have their signatures and columns
+converted onto the heap instead, and the db space is marked changed so the
+next checkpoint rewrites it.
+Returns the bytes the db space takes on the file, 0 on failure.
+ */
+unsigned long mapSpace(dbSpaceStruct* space, const char* filename, const MappedSpaceHeader& header, unsigned long offset, int iskVersion) {
+	const unsigned long numBuckets = 3 * 2 * 16384;
+	const unsigned long n = header.count;
+	const bool compact = iskVersion >= SRZ_V0_12_0;
+	const unsigned long sigSize = compact ? sizeof(DiskSigStruct) : sizeof(sigStructV011);
+	const unsigned long avglSize = compact ? sizeof(float) : sizeof(double);
+
+	if (!mappedArrayFits(header, header.sigs, n, sigSize)
+			|| !mappedArrayFits(header, header.avgl[0], n, avglSize)
+			|| !mappedArrayFits(header, header.avgl[1], n, avglSize)
+			|| !mappedArrayFits(header, header.avgl[2], n, avglSize)
+			|| !mappedArrayFits(header, header.bucketStarts, numBuckets + 1, sizeof(unsigned long))
+			|| !mappedArrayFits(header, header.bucketSlots, 0, sizeof(sigSlot))
+			|| !mappedArrayFits(header, header.ids, n, sizeof(IdSlot))
+			|| !mappedArrayFits(header, header.keywordStarts, n + 1, sizeof(unsigned long))
+			|| !mappedArrayFits(header, header.keywords, 0, sizeof(int))
+			|| !mappedArrayFits(header, header.idsFilter, header.idsFilterBytes, 1)) {
+		cerr << "ERROR bad file while reading db space layout" << endl;
+		return 0;
+	}
+
+	if (!space->mapping.map(filename, offset, header.length)) {
+		cerr << "ERROR: unable to map file:" << filename << endl;
+		return 0;
+	}
+	char* base = space->mapping.data();
+
+	const unsigned long* bucketStarts = (unsigned long*) (base + header.bucketStarts);
+	const unsigned long* keywordStarts = (unsigned long*) (base + header.keywordStarts);
+	bool sorted = bucketStarts[0] == 0 && keywordStarts[0] == 0;
+	for (unsigned long k = 0; k < numBuckets; k++) {
+		if (bucketStarts[k] > bucketStarts[k + 1]) sorted = false;
+	}
+	for (unsigned long k = 0; k < n; k++) {
+		if (keywordStarts[k] > keywordStarts[k + 1]) sorted = false;
+	}
+	if (!sorted
+			|| !mappedArrayFits(header, header.bucketSlots, bucketStarts[numBuckets], sizeof(sigSlot))
+			|| !mappedArrayFits(header, header.keywords, keywordStarts[n], sizeof(int))) {
+		cerr << "ERROR bad file while reading db space layout" << endl;
+		return 0;
+	}
+
+	// queries and the id index trust the arrays: a corrupt file must fail here, not read out of bounds later
+	const sigSlot* bucketSlots = (sigSlot*) (base + header.bucketSlots);
+	const IdSlot* ids = (IdSlot*) (base + header.ids);
+	bool valid = true;
+	for (unsigned long k = 0; k < numBuckets && valid; k++) {
+		for (unsigned long j = bucketStarts[k]; j < bucketStarts[k + 1]; j++) {
+			// buckets are sorted, with every slot once
+			if (bucketSlots[j] >= n || (j > bucketStarts[k] && bucketSlots[j] <= bucketSlots[j - 1])) valid = false;
+		}
+	}
+	for (unsigned long k = 0; k < n && valid; k++) {
+		// sorted by id for IdIndex::find()
+		if (ids[k].slot >= n || (k && !(ids[k - 1] < ids[k]))) valid = false;
+	}
+	if (!valid) {
+		cerr << "ERROR bad file while reading db space contents" << endl;
+		return 0;
+	}
+
+	if (compact) {
+		space->sigs.borrow((DiskSigStruct*) (base + header.sigs), n);
+		for (int c = 0; c < 3; c++) space->avglCols[c].borrow((float*) (base + header.avgl[c]), n);
+	} else {
+		const sigStructV011* oldSigs = (sigStructV011*) (base + header.sigs);
+		space->sigs.reserve(n);
+		for (unsigned long k = 0; k < n; k++) {
+			DiskSigStruct sig;
+			sig.id = oldSigs[k].id;
+			sig.setCoefs(oldSigs[k].sig1, oldSigs[k].sig2, oldSigs[k].sig3, oldSigs[k].avgl);
+			sig.width = oldSigs[k].width;
+			sig.height = oldSigs[k].height;
+			space->sigs.push_back(sig);
+		}
+		for (int c = 0; c < 3; c++) {
+			const double* column = (double*) (base + header.avgl[c]);
+			space->avglCols[c].reserve(n);
+			for (unsigned long k = 0; k < n; k++) space->avglCols[c].push_back(column[k]);
+		}
+		space->changes = 1;
+	}
+	for (unsigned long k = 0; k < n && valid; k++) {
+		// coefficients index the buckets
+		const DiskSigStruct& sig = space->sigs[k];
+		const SigIdx* coefs[3] = { sig.sig1, sig.sig2, sig.sig3 };
+		for (int c = 0; c < 3; c++) {
+			for (int i = 0; i < NUM_COEFS; i++) {
+				if (!coefs[c][i] || abs(coefs[c][i]) >= NUM_PIXELS_SQUARED) valid = false;
+			}
+		}
+		if (space->sigs[ids[k].slot].id != ids[k].id) valid = false;
+	}
+	if (!valid) {
+		cerr << "ERROR bad file while reading db space contents" << endl;
+		return 0;
+	}
+	space->liveSlots.assign(n, true);
+
+	unsigned long k = 0;
+	for (int c = 0; c < 3; c++)
+		for (int pn = 0; pn < 2; pn++)
+			for (int i = 0; i < 16384; i++, k++)
+				space->imgbuckets[c][pn][i].borrow((sigSlot*) bucketSlots + bucketStarts[k], bucketStarts[k + 1] - bucketStarts[k]);
+
+	space->idSlots.borrow(ids, n);
+	if (!space->imgIdsFilter->load_table((unsigned char*) (base + header.idsFilter), header.idsFilterBytes)) {
+		for (k = 0; k < n; k++) space->imgIdsFilter->insert(ids[k].id);
+	}
+
+	space->slotKeywords.borrow(keywordStarts, (int*) (base + header.keywords), n);
+	addKeywordPostings(space);
+
+	return header.length;
+}
+
+/* Makes space db space dbId, replacing the one there.
+Caller must hold dbSpaceLock for writing */
+void setDbSpace(const int dbId, dbSpaceStruct* space) {
+	if (!imgBinInited) initImgBin();
+	if (dbSpace.count(dbId)) delete dbSpace[dbId];
+	coldSpaces.erase(dbId);
+	dbSpace[dbId] = space;
+}
+
+/* Maps the db space of a mapped index file starting at offset as db space
+dbId, see mapSpace(). Caller must hold dbSpaceLock for writing.
+Returns the bytes the db space takes on the file, 0 on failure.
+ */
+unsigned long loadMappedSpace(const int dbId, char* filename, const MappedSpaceHeader& header, unsigned long offset, int iskVersion) {
+	dbSpaceStruct* space = new dbSpaceStruct();
+	unsigned long length = mapSpace(space, filename, header, offset, iskVersion);
+	if (!length) {
+		delete space;
+		return 0;
+	}
+	setDbSpace(dbId, space);
+	// not saved on its own file yet
+	space->changes = 1;
+	return length;
+}
+
+// reads the header of the db space at offset of a mapped index file
+bool readMappedSpaceHeader(std::ifstream& f, unsigned long offset, MappedSpaceHeader& header) {
+	f.seekg(offset);
+	f.read((char *) &header, sizeof(MappedSpaceHeader));
+	if (!f.good() || header.length < sizeof(MappedSpaceHeader)) {
+		cerr << "ERROR bad file while reading db space header" << endl;
+		return false;
+	}
+	return true;
+}
+
 srzMetaDataStruct loadGlobalSerializationMetadata(std::ifstream& f) {
 
 	srzMetaDataStruct md;
@@ -465,6 +1044,15 @@ int loaddb(const int dbId, char *filename) {
 		md = loadGlobalSerializationMetadata(f);
 	}
 
+	if (md.isValidMetadata && md.iskVersion >= SRZ_V0_11_0) {
+		// the first db space of the file
+		MappedSpaceHeader header;
+		if (!readMappedSpaceHeader(f, MAPPED_SPACE_ALIGN, header)) return 0;
+		WriteLocker dbsLocker(dbSpaceLock);
+		return loadMappedSpace(dbId, filename, header, MAPPED_SPACE_ALIGN, md.iskVersion) ? 1 : 0;
+	}
+
+	WriteLocker dbsLocker(dbSpaceLock);
 	int res = loaddbfromstream(dbId, f, md);
 
 	f.close();
@@ -507,6 +1095,25 @@ int loadalldbs(char* filename) {
 		return 0;
 	}
 
+	WriteLocker dbsLocker(dbSpaceLock);
+
+	if (md.isValidMetadata && md.iskVersion >= SRZ_V0_11_0) {
+		// db spaces follow one another, each aligned to MAPPED_SPACE_ALIGN
+		unsigned long offset = MAPPED_SPACE_ALIGN;
+		for (int k = 0; k < sz; k++) {
+			MappedSpaceHeader header;
+			if (!readMappedSpaceHeader(f, offset, header)) return res;
+			if (!loadMappedSpace(header.dbId, filename, header, offset, md.iskVersion)) return res;
+			res++;
+			offset += (header.length + MAPPED_SPACE_ALIGN - 1) / MAPPED_SPACE_ALIGN * MAPPED_SPACE_ALIGN;
+		}
+		return res;
+	}
+
+	if (md.isValidMetadata && md.iskVersion < SRZ_CUR_VERSION) {
+		cout << "INFO migrating database to the mapped index format on next save" << endl;
+	}
+
 	for (int k = 0; k < sz; k++) { // for each db
 		f.read((char *) &(dbId), sizeof(int)); // db id
 		if (!f.good()) {
@@ -520,75 +1127,153 @@ int loadalldbs(char* filename) {
 	return res;
 }
 
-int savedbtostream(const int dbId, std::ofstream& f) {
+// pads f with zeros up to a multiple of align bytes from start
+static void padStream(RawFileWriter& f, unsigned long start, unsigned long align) {
+	static const char zeros[MAPPED_SPACE_ALIGN] = { 0 };
+	unsigned long at = f.tell() - start;
+	f.write(zeros, (align - at % align) % align);
+}
+
+/* Caller must hold dbSpaceLock and the db space lock for reading.
+f must be at a multiple of MAPPED_SPACE_ALIGN. Takes no lock and allocates
+with PageAllocator only, see rawio.h */
+int savedbtostream(const int dbId, RawFileWriter& f) {
 	/*
-	Serialization order:
+	Serialization order (see MappedSpaceHeader):
+	[MappedSpaceHeader]
+	the images of the db space take slots 0 to count-1, in the order of their
+	current slots, so buckets stay sorted:
+	for each slot:
+	[DiskSigStruct] signature
 	for each color {0,1,2}:
-	for {positive,negative}:
-	for each 128x128 coefficient {0-16384}:
-	[int] bucket size (size of list of ids)
-	for each id:
-	[long int] image id
-	[int] number of images (signatures)
-	for each image:
-	[long id] image id
-	for each sig coef {0-39}:  (the NUM_COEFS greatest coefs)
-	for each color {0,1,2}:
-	[int] coef index (signed)
+	for each slot:
+	[float] average luminance
 	for each color {0,1,2}:
-	[double] average luminance
-	[int] image width
-	[int] image height
-
+	for {positive,negative}:
+	for each 128x128 coefficient {0-16384}, and once more:
+	[unsigned long] start of the bucket on the bucket slots
+	for each bucket:
+	for each slot on it:
+	[sigSlot] slot
+	for each image, sorted by id:
+	[IdSlot] image id and slot
+	for each slot, and once more:
+	[unsigned long] start of its keywords
+	for each slot:
+	for each of its keywords:
+	[int] keyword id
+	[unsigned char] bit table of the image ids bloom filter
+
+	Every array starts at a multiple of MAPPED_ARRAY_ALIGN bytes from the
+	header, and the db space takes a multiple of MAPPED_SPACE_ALIGN bytes.
 	 */
-	unsigned long sz;
-	long int id;
+	if (!validate_dbid(dbId)) { rawError("ERROR: database space not found"); return 0;}
+
+	dbSpaceStruct* space = dbSpace.find(dbId)->second;
+	unsigned long start = f.tell();
+	MappedSpaceHeader header;
+	memset(&header, 0, sizeof(MappedSpaceHeader));
+	header.dbId = dbId;
+	header.count = space->idSlots.size();
+	f.write((char *) &header, sizeof(MappedSpaceHeader));
+
+	// saved slot of each live slot
+	SaveSlots newSlots(space->slotCount(), NO_SLOT);
+	SaveSlots slots;
+	slots.reserve(header.count);
+	for (sigSlot slot = 0; slot < space->slotCount(); slot++) {
+		if (!space->liveSlots[slot]) continue;
+		newSlots[slot] = slots.size();
+		slots.push_back(slot);
+	}
 
-	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	// save sigs
+	padStream(f, start, MAPPED_ARRAY_ALIGN);
+	header.sigs = f.tell() - start;
+	for (size_t j = 0; j < slots.size(); j++) {
+		f.write((char *) &space->sigs[slots[j]], sizeof(DiskSigStruct));
+	}
 
-	// save buckets
+	std::vector<float, PageAllocator<float> > column(slots.size());
 	for (int c = 0; c < 3; c++) {
-		for (int pn = 0; pn < 2; pn++) {
+		padStream(f, start, MAPPED_ARRAY_ALIGN);
+		header.avgl[c] = f.tell() - start;
+		for (size_t j = 0; j < slots.size(); j++) column[j] = space->avglCols[c][slots[j]];
+		if (column.size()) f.write((char *) &column[0], column.size() * sizeof(float));
+	}
+
+	// save buckets
+	std::vector<unsigned long, PageAllocator<unsigned long> > starts(1, 0);
+	starts.reserve(3 * 2 * 16384 + 1);
+	for (int c = 0; c < 3; c++)
+		for (int pn = 0; pn < 2; pn++)
 			for (int i = 0; i < 16384; i++) {
-				sz = dbSpace[dbId]->imgbuckets[c][pn][i].size();
+				BucketLiveCounter counter(space->liveSlots);
+				space->imgbuckets[c][pn][i].forEach(counter);
+				starts.push_back(starts.back() + counter.count);
+			}
+	padStream(f, start, MAPPED_ARRAY_ALIGN);
+	header.bucketStarts = f.tell() - start;
+	f.write((char *) &starts[0], starts.size() * sizeof(unsigned long));
 
-				f.write((char *) &(sz), sizeof(int));
-				long_listIterator end = dbSpace[dbId]->imgbuckets[c][pn][i].end();
-				for (long_listIterator it = dbSpace[dbId]->imgbuckets[c][pn][i].begin(); it != end; it++) {
-					f.write((char *) &((*it)), sizeof(long int));
-				}
+	padStream(f, start, MAPPED_ARRAY_ALIGN);
+	header.bucketSlots = f.tell() - start;
+	SaveSlots bucketSlots;
+	for (int c = 0; c < 3; c++)
+		for (int pn = 0; pn < 2; pn++)
+			for (int i = 0; i < 16384; i++) {
+				bucketSlots.clear();
+				BucketSlotRenumberer renumberer(newSlots, bucketSlots);
+				space->imgbuckets[c][pn][i].forEach(renumberer);
+				// packed or mapped slots come before newer ones, which may reuse lower slots
+				std::sort(bucketSlots.begin(), bucketSlots.end());
+				if (bucketSlots.size()) f.write((char *) &bucketSlots[0], bucketSlots.size() * sizeof(sigSlot));
 			}
-		}
-	}
 
-	// save sigs
-	sigMap::size_type szt = dbSpace[dbId]->sigs.size();
-
-	f.write((char *) &(szt), sizeof(sigMap::size_type));
-
-	for (sigIterator it = dbSpace[dbId]->sigs.begin(); it != dbSpace[dbId]->sigs.end(); it++) {
-		id = (*it).first;
-		SigStruct* sig = (SigStruct*) (it->second);
-		DiskSigStruct dsig(*sig);
-		f.write((char *) (&dsig), sizeof(DiskSigStruct));
-
-		//// keywords
-		int_hashset& kwds = sig->keywords;
-		sz = kwds.size();
-		// number of keywords
-		f.write((char *) &(sz), sizeof(int));
-		// dump keywds
-		int kwid;
-		for (int_hashset::iterator itkw = kwds.begin(); itkw != kwds.end(); itkw++) {
-			kwid = *itkw;
-			f.write((char *) &(kwid), sizeof(int));
-		}
+	// save ids
+	std::vector<IdSlot, PageAllocator<IdSlot> > ids(slots.size());
+	for (size_t j = 0; j < slots.size(); j++) {
+		ids[j].id = space->sigs[slots[j]].id;
+		ids[j].slot = j;
+		ids[j].unused = 0;
 	}
-
-	return 1;
+	std::sort(ids.begin(), ids.end());
+	padStream(f, start, MAPPED_ARRAY_ALIGN);
+	header.ids = f.tell() - start;
+	if (ids.size()) f.write((char *) &ids[0], ids.size() * sizeof(IdSlot));
+
+	// save keywords
+	std::vector<int, PageAllocator<int> > keywords;
+	starts.assign(1, 0);
+	for (size_t j = 0; j < slots.size(); j++) {
+		space->slotKeywords.get(slots[j], keywords);
+		starts.push_back(keywords.size());
+	}
+	padStream(f, start, MAPPED_ARRAY_ALIGN);
+	header.keywordStarts = f.tell() - start;
+	f.write((char *) &starts[0], starts.size() * sizeof(unsigned long));
+
+	padStream(f, start, MAPPED_ARRAY_ALIGN);
+	header.keywords = f.tell() - start;
+	if (keywords.size()) f.write((char *) &keywords[0], keywords.size() * sizeof(int));
+
+	// save ids filter, so loading doesn't hash every id again
+	padStream(f, start, MAPPED_ARRAY_ALIGN);
+	header.idsFilter = f.tell() - start;
+	header.idsFilterBytes = space->imgIdsFilter->table_bytes();
+	f.write((char *) space->imgIdsFilter->table(), header.idsFilterBytes);
+
+	// now that the layout is known
+	header.length = f.tell() - start;
+	f.seek(start);
+	f.write((char *) &header, sizeof(MappedSpaceHeader));
+	f.seek(start + header.length);
+	padStream(f, start, MAPPED_SPACE_ALIGN);
+
+	return f.good();
 }
 
-void saveGlobalSerializationMetadata(std::ofstream& f) {
+void saveGlobalSerializationMetadata(RawFileWriter& f) {
 
 	int wval;
 
@@ -619,135 +1304,951 @@ void saveGlobalSerializationMetadata(std::ofstream& f) {
 #endif
 }
 
-int savedb(const int dbId, char *filename) {
-	std::ofstream f(filename, ios::binary);
-	if (!f.is_open()) {
-		cerr << "ERROR: error opening file for write ops" << endl;
-		return 0;
-
-
+/* Writes the db spaces of dbIds as a mapped index file. The file is written
+aside, synced and then renamed over filename, so db spaces mapped from the
+previous one keep using it. Returns the number of db spaces written, -1 on
+failure. Caller must hold dbSpaceLock and the locks of the db spaces for
+reading, see startSnapshot() */
+int savedbstofile(const std::vector<int>& dbIds, const char* filename) {
+	char tmpname[PATH_MAX];
+	if (strlen(filename) + 5 > sizeof(tmpname)) {
+		rawError("ERROR: file name too long:", filename);
+		return -1;
 	}
-
-	saveGlobalSerializationMetadata(f);
-
-	int res = savedbtostream( dbId, f);
-	f.close();
-	return res;
-}
-
-int savealldbs(char* filename) {
-	std::ofstream f(filename, ios::binary);
-	if (!f.is_open()) {
-		cerr << "ERROR: error opening file for write ops" << endl;
-		return 0;
+	strcpy(tmpname, filename);
+	strcat(tmpname, ".tmp");
+	RawFileWriter f;
+	if (!f.open(tmpname)) {
+		rawError("ERROR: error opening file for write ops:", tmpname);
+		return -1;
 	}
 
+	unsigned long start = f.tell();
 	saveGlobalSerializationMetadata(f);
-
-	int res = 0;
-	unsigned long sz = dbSpace.size();
+	int sz = dbIds.size();
 	f.write((char *) &(sz), sizeof(int)); // num dbs
-	int dbId;
+	padStream(f, start, MAPPED_SPACE_ALIGN);
 
-	for (dpspaceIterator it = dbSpace.begin(); it != dbSpace.end(); it++) {
-		dbId = (*it).first;
-		f.write((char *) &(dbId), sizeof(int)); // db id
-		res += savedbtostream( dbId, f);
+	int res = 0;
+	for (size_t k = 0; k < dbIds.size(); k++) {
+		res += savedbtostream(dbIds[k], f);
 	}
 
-	f.close();
+	bool ok = f.close();
+	// the log may be dropped once the file is renamed, it must be on disk by then
+	if (res != sz || !ok || !syncFile(tmpname) || rename(tmpname, filename) || !syncFile(filename)) {
+		rawError("ERROR: error writing file:", filename);
+		unlink(tmpname);
+		return -1;
+	}
 	return res;
 }
 
-std::vector<double> queryImgDataFiltered(const int dbId, Idx * sig1, Idx * sig2, Idx * sig3, double *avgl, int numres, int sketch, bloom_filter* bfilter, bool colorOnly) {
-	int idx, c;
-	int pn;
-	Idx *sig[3] = { sig1, sig2, sig3 };
-
-	if (bfilter) { // make sure images not on filter are penalized
-		for (sigIterator sit = dbSpace[dbId]->sigs.begin(); sit != dbSpace[dbId]->sigs.end(); sit++) {
-
-			if (!bfilter->contains((*sit).first)) { // image doesnt have keyword, just give it a terrible score
-				(*sit).second->score = 99999999;
-			} else { // ok, image content should be taken into account
-				(*sit).second->score = 0;
-				for (c = 0; c < 3; c++) {
-					(*sit).second->score += weights[sketch][0][c] * fabs((*sit).second->avgl[c] - avgl[c]);
-				}
-			}
+/* A snapshot of db spaces, see startSnapshot() */
+struct Snapshot {
+	std::vector<char> written;	/* whether each file was written, once finished */
+	std::vector<int> dbIds;		/* db spaces written */
+	std::vector<size_t> files;	/* file each of them goes to */
+	std::vector<unsigned long> serials;	/* their dbSpaceStruct::serial */
+	std::vector<unsigned long> changes;	/* their dbSpaceStruct::changes at that time */
+	pid_t pid;			/* child writing the files, 0 if none */
+	int results;			/* pipe the child tells how each file went on */
+	Snapshot(): pid(0), results(-1) {}
+};
+
+/* Starts writing db spaces to files as they are at the time of the call,
+while queries and changes go on: files[k] gets the db spaces of groups[k]. The
+db spaces are locked only long enough to fork a child process: its copy of
+the memory is a point in time view of them, which it writes out while the
+caller waits in finishSnapshot(), holding no lock. The child has the forking
+thread only, so it writes with system calls alone, see rawio.h. Without
+fork() the db spaces stay locked for reading while written here, so only
+changes wait.
+Caller must hold dbSpaceLock for reading */
+void startSnapshot(const std::vector<std::vector<int> >& groups, const std::vector<std::string>& files,
+		Snapshot& snapshot) {
+	snapshot.written.assign(groups.size(), 0);
+
+	// no change is halfway once these are held
+	std::vector<RWLock*> locks;
+	for (size_t k = 0; k < groups.size(); k++) {
+		for (size_t j = 0; j < groups[k].size(); j++) {
+			if (!validate_dbid(groups[k][j])) continue;
+			dbSpaceStruct* space = dbSpace[groups[k][j]];
+			locks.push_back(&space->lock);
+			snapshot.dbIds.push_back(groups[k][j]);
+			snapshot.files.push_back(k);
 		}
-		delete bfilter;
+	}
+	if (groups.empty()) return;
+	for (size_t k = 0; k < locks.size(); k++) locks[k]->readLock();
+	for (size_t k = 0; k < snapshot.dbIds.size(); k++) {
+		dbSpaceStruct* space = dbSpace[snapshot.dbIds[k]];
+		snapshot.serials.push_back(space->serial);
+		snapshot.changes.push_back(space->changes);
+	}
 
-	} else { // search all images
-		for (sigIterator sit = dbSpace[dbId]->sigs.begin(); sit != dbSpace[dbId]->sigs.end(); sit++) {
-			(*sit).second->score = 0;
-			for (c = 0; c < 3; c++) {
-				(*sit).second->score += weights[sketch][0][c] * fabs((*sit).second->avgl[c] - avgl[c]);
-			}
+#ifndef _WINDOWS
+	// the child tells how each file went, one byte per file
+	int results[2];
+	bool piped = !pipe(results);
+	pid_t pid = piped ? fork() : -1;
+	if (pid == 0) {
+		// only this thread lives on in the child: locks other threads held stay held, so from here on
+		// nothing may take one, malloc() and iostreams included (see rawio.h)
+		close(results[0]);
+		for (size_t k = 0; k < groups.size(); k++) {
+			char ok = savedbstofile(groups[k], files[k].c_str()) >= 0;
+			if (write(results[1], &ok, 1) != 1) break;
 		}
+		_exit(0);
 	}
-    if (!colorOnly) {
-        for (int b = 0; b < NUM_COEFS; b++) {	// for every coef on a sig
-            for (c = 0; c < 3; c++) {
-                //TODO see if FAST_POW_GEERT gives the same results
-#ifdef FAST_POW_GEERT
-                pn  = sig[c][b] < 0;
-                idx = (sig[c][b] - pn) ^ -pn;
-#else
-                pn = 0;
-                if (sig[c][b]>0) {
-                    pn = 0;
-                    idx = sig[c][b];
-                } else {
-                    pn = 1;
-                    idx = -sig[c][b];
-                }
+	if (pid > 0) {
+		for (size_t k = 0; k < locks.size(); k++) locks[k]->unlock();
+		close(results[1]);
+		snapshot.pid = pid;
+		snapshot.results = results[0];
+		return;
+	}
+	if (piped) {
+		close(results[0]);
+		close(results[1]);
+	}
+	cerr << "WARNING: unable to fork, changes wait while saving" << endl;
 #endif
 
-                // update the score of every image which has this coef
-                long_listIterator end = dbSpace[dbId]->imgbuckets[c][pn][idx].end();
-                for (long_listIterator uit = dbSpace[dbId]->imgbuckets[c][pn][idx].begin();
-                uit != end; uit++) {
-                    //TODO in each iteration search in tree (std::map) is performed. i think the better way to link by pointers.
-                    dbSpace[dbId]->sigs[(*uit)]->score -= weights[sketch][imgBin[idx]][c];
-                }
-            }
-        }
-    }
+	for (size_t k = 0; k < groups.size(); k++) {
+		snapshot.written[k] = savedbstofile(groups[k], files[k].c_str()) >= 0;
+	}
+	for (size_t k = 0; k < locks.size(); k++) locks[k]->unlock();
+}
 
-	sigPriorityQueue pqResults;		/* results priority queue; largest at top */
+/* Waits until the files of snapshot are written. Needs no lock */
+void finishSnapshot(Snapshot& snapshot) {
+	if (!snapshot.pid) return;
+	// a child dying halfway leaves the files it didn't get to unwritten
+	std::vector<char>& written = snapshot.written;
+	size_t got = 0;
+	while (got < written.size()) {
+		ssize_t n = read(snapshot.results, &written[got], written.size() - got);
+		if (n < 0 && errno == EINTR) continue;
+		if (n <= 0) break;
+		got += n;
+	}
+	close(snapshot.results);
+	int status;
+	while (waitpid(snapshot.pid, &status, 0) < 0 && errno == EINTR) {}
+	snapshot.pid = 0;
+	snapshot.results = -1;
+}
 
-	sigIterator sit = dbSpace[dbId]->sigs.begin();
+int savedb(const int dbId, char *filename) {
+	Snapshot snapshot;
+	{
+		ReadLocker dbsLocker(dbSpaceLock);
+		startSnapshot(std::vector<std::vector<int> >(1, std::vector<int>(1, dbId)),
+				std::vector<std::string>(1, filename), snapshot);
+	}
+	finishSnapshot(snapshot);
+	return snapshot.written[0] ? 1 : 0;
+}
 
-	vector<double> V;
+int savealldbs(char* filename) {
+	Snapshot snapshot;
+	std::vector<int> dbIds;
+	{
+		ReadLocker dbsLocker(dbSpaceLock);
+		for (dpspaceIterator it = dbSpace.begin(); it != dbSpace.end(); it++) {
+			dbIds.push_back((*it).first);
+		}
+		startSnapshot(std::vector<std::vector<int> >(1, dbIds), std::vector<std::string>(1, filename), snapshot);
+	}
+	finishSnapshot(snapshot);
+	return snapshot.written[0] ? dbIds.size() : 0;
+}
+
+// file of db space dbId on a db space directory, see checkpointdbs()
+static std::string spaceFileName(const std::string& dirname, const int dbId) {
+	char name[32];
+	snprintf(name, sizeof(name), "/space-%d.isk", dbId);
+	return dirname + name;
+}
+
+// ids of the db spaces having a file on directory dirname
+static std::vector<int> spaceFiles(const std::string& dirname) {
+	std::vector<int> dbIds;
+	DIR* d = opendir(dirname.c_str());
+	if (!d) return dbIds;
+	while (struct dirent* entry = readdir(d)) {
+		if (strncmp(entry->d_name, "space-", 6)) continue;
+		char* end;
+		long dbId = strtol(entry->d_name + 6, &end, 10);
+		if (end != entry->d_name + 6 && !strcmp(end, ".isk")) dbIds.push_back(dbId);
+	}
+	closedir(d);
+	std::sort(dbIds.begin(), dbIds.end());
+	return dbIds;
+}
+
+/* Maps a db space file written by checkpointdbs() into a new db space, see
+mapSpace(). Returns 0 on failure */
+static dbSpaceStruct* loadSpaceFile(const char* filename) {
+	std::ifstream f(filename, ios::binary);
+	if (!f.is_open()) {
+		cerr << "ERROR: unable to open file for read ops:" << filename << endl;
+		return 0;
+	}
+
+	int isMetadata = 0;
+	f.read((char *) &(isMetadata), sizeof(int));
+	srzMetaDataStruct md;
+	md.isValidMetadata = 0;
+	if (f.good() && isMetadata == SRZ_VERSIONED) md = loadGlobalSerializationMetadata(f);
+
+	MappedSpaceHeader header;
+	if (!md.isValidMetadata || md.iskVersion < SRZ_V0_11_0 || !readMappedSpaceHeader(f, MAPPED_SPACE_ALIGN, header)) {
+		cerr << "ERROR: not a db space file:" << filename << endl;
+		return 0;
+	}
+	dbSpaceStruct* space = new dbSpaceStruct();
+	if (!mapSpace(space, filename, header, MAPPED_SPACE_ALIGN, md.iskVersion)) {
+		delete space;
+		return 0;
+	}
+	return space;
+}
+
+/* Loads the db space files handed out to it by as many threads as run() it */
+class SpaceFilesLoader {
+public:
+	SpaceFilesLoader(const std::vector<std::string>& files, std::vector<dbSpaceStruct*>& spaces):
+			files(files), spaces(spaces), next(0) {
+		pthread_mutex_init(&mutex, 0);
+	}
+	~SpaceFilesLoader() { pthread_mutex_destroy(&mutex); }
+
+	void run() {
+		for (;;) {
+			pthread_mutex_lock(&mutex);
+			size_t k = next++;
+			pthread_mutex_unlock(&mutex);
+			if (k >= files.size()) return;
+			spaces[k] = loadSpaceFile(files[k].c_str());
+		}
+	}
+
+	static void* worker(void* loader) {
+		((SpaceFilesLoader*) loader)->run();
+		return 0;
+	}
+
+private:
+	const std::vector<std::string>& files;
+	std::vector<dbSpaceStruct*>& spaces;
+	size_t next;
+	pthread_mutex_t mutex;
+};
+
+int loaddbsdir(char* dirname, int threads) {
+	/* loads every db space file of directory dirname, written by
+	checkpointdbs(), using up to threads threads. The files are mapped
+	independently: one failing to load is reported and skipped.
+	Returns the number of db spaces loaded.
+	 */
+	std::vector<int> dbIds = spaceFiles(dirname);
+	std::vector<std::string> files;
+	for (size_t k = 0; k < dbIds.size(); k++) files.push_back(spaceFileName(dirname, dbIds[k]));
+
+	// loaded without locks, as nobody sees the new db spaces yet
+	std::vector<dbSpaceStruct*> spaces(files.size(), (dbSpaceStruct*) 0);
+	SpaceFilesLoader loader(files, spaces);
+	std::vector<pthread_t> workers;
+	for (int t = 1; t < threads && (size_t) t < files.size(); t++) {
+		pthread_t worker;
+		if (pthread_create(&worker, 0, SpaceFilesLoader::worker, &loader)) break;
+		workers.push_back(worker);
+	}
+	loader.run();
+	for (size_t t = 0; t < workers.size(); t++) pthread_join(workers[t], 0);
+
+	WriteLocker dbsLocker(dbSpaceLock);
+	int res = 0;
+	for (size_t k = 0; k < spaces.size(); k++) {
+		if (!spaces[k]) {
+			cerr << "ERROR: skipping db space " << dbIds[k] << ", unable to load file:" << files[k] << endl;
+			// kept on its file, loadSpace() tries again
+			if (!dbSpace.count(dbIds[k])) coldSpaces[dbIds[k]] = files[k];
+			continue;
+		}
+		setDbSpace(dbIds[k], spaces[k]);
+		res++;
+	}
+	return res;
+}
+
+int opendbsdir(char* dirname) {
+	/* like loaddbsdir(), but only takes note of the db space files of
+	directory dirname: each one is loaded by loadSpace() when first used.
+	Returns the number of db spaces found.
+	 */
+	std::vector<int> dbIds = spaceFiles(dirname);
+	WriteLocker dbsLocker(dbSpaceLock);
+	for (size_t k = 0; k < dbIds.size(); k++) {
+		if (!dbSpace.count(dbIds[k])) coldSpaces[dbIds[k]] = spaceFileName(dirname, dbIds[k]);
+	}
+	return dbIds.size();
+}
+
+/* Loads db space dbId from its file if it is not loaded yet. Returns false if
+the file fails to load, it is left alone then.
+Caller must hold dbSpaceLock for writing */
+static bool loadColdSpace(const int dbId) {
+	std::map<int, std::string>::iterator it = coldSpaces.find(dbId);
+	if (it == coldSpaces.end()) return true;
+	dbSpaceStruct* space = loadSpaceFile(it->second.c_str());
+	if (!space) return false;
+	setDbSpace(dbId, space);
+	return true;
+}
+
+int loadSpace(const int dbId) {
+	/* makes sure db space dbId is loaded, loading it from its file if
+	opendbsdir() or unloadSpace() left it there. Queries and changes on other
+	db spaces go on while the file is read.
+	Returns 1 once loaded, 0 for an unknown db space or a file failing to load.
+	 */
+	std::string filename;
+	{
+		ReadLocker dbsLocker(dbSpaceLock);
+		if (dbSpace.count(dbId)) return 1;
+		if (!coldSpaces.count(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+		filename = coldSpaces[dbId];
+	}
 
-	pqResults.push(*(*sit).second);
-	sit++;
-
-	// Fill up the numres-bounded priority queue (largest at top):
-	for (; sit != dbSpace[dbId]->sigs.end(); sit++) {
-		// only consider if not ignored due to keywords and if is a better match than the current worst match
-		if ((*sit).second->score < 99999) {
-			// Make room by dropping largest entry:
-			if (pqResults.size() >= numres) pqResults.pop();
-			// Insert new entry:
-			pqResults.push(*(*sit).second);
+	dbSpaceStruct* space = loadSpaceFile(filename.c_str());
+
+	WriteLocker dbsLocker(dbSpaceLock);
+	std::map<int, std::string>::iterator it = coldSpaces.find(dbId);
+	if (!space || it == coldSpaces.end() || it->second != filename) {
+		// someone else loaded, reset or removed it meanwhile
+		delete space;
+		return dbSpace.count(dbId) ? 1 : 0;
+	}
+	setDbSpace(dbId, space);
+	return 1;
+}
+
+int unloadSpace(const int dbId, char* dirname) {
+	/* frees the memory of db space dbId, leaving it on its file on directory
+	dirname for loadSpace() to load again. Only done if every change to it
+	is saved on that file, see checkpointdbs().
+	Returns 1 if unloaded, 0 otherwise.
+	 */
+	WriteLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) return 0;
+
+	dbSpaceStruct* space = dbSpace[dbId];
+	std::string filename = spaceFileName(dirname, dbId);
+	// the write lock on dbSpaceLock keeps everybody else off the db space
+	if (space->changes || access(filename.c_str(), F_OK)) return 0;
+	delete space;
+	dbSpace.erase(dbId);
+	// its keywords are on the file, loadSpace() rebuilds the keyword postings from them
+	coldSpaces[dbId] = filename;
+	return 1;
+}
+
+/* Applies a log record. Records the db spaces already reflect, like the ones
+logged while the checkpoint they were loaded from was written, change nothing
+or get undone by the records after them, as every change is logged.
+Returns false for a malformed record.
+Caller must hold dbSpaceLock for writing */
+static bool applyLogRecord(const std::string& data) {
+	LogRecordReader reader(data);
+	int type, dbId;
+	if (!reader.get(type) || !reader.get(dbId)) return false;
+
+	switch (type) {
+	case LOG_RESET_DB:
+		if (coldSpaces.erase(dbId)) initDbSpace(dbId);
+		else if (dbSpace.count(dbId)) resetDbSpace(dbId);
+		return true;
+	case LOG_REMOVE_DB:
+		coldSpaces.erase(dbId);
+		if (dbSpace.count(dbId)) {
+			delete dbSpace[dbId];
+			dbSpace.erase(dbId);
+		}
+		return true;
+	}
+
+	// the rest are applied on top of the db space file
+	if (!loadColdSpace(dbId)) {
+		cerr << "ERROR: skipping change to db space " << dbId << ", unable to load its file" << endl;
+		return true;
+	}
+	if (type == LOG_CREATE_DB) {
+		if (!dbSpace.count(dbId)) initDbSpace(dbId);
+		return true;
+	}
+
+	// the rest change a db space removed later on
+	if (!dbSpace.count(dbId)) return true;
+	dbSpaceStruct* space = dbSpace[dbId];
+
+	switch (type) {
+	case LOG_ADD_SIG: {
+		DiskSigStruct sig;
+		if (!reader.get(sig)) return false;
+		if (!space->idSlots.count(sig.id)) insertSig(space, SigStruct(&sig));
+		return true;
+	}
+	case LOG_ADD_SIG_V011: {
+		sigStructV011 sig;
+		if (!reader.get(sig)) return false;
+		if (!space->idSlots.count(sig.id)) insertSig(space, SigStruct(&sig));
+		return true;
+	}
+	case LOG_REMOVE_IDS: {
+		std::vector<long int> ids;
+		if (!reader.getArray(ids)) return false;
+		for (size_t j = 0; j < ids.size(); j++) {
+			sigSlot slot = space->idSlots.find(ids[j]);
+			if (slot != NO_SLOT) killSlot(space, slot);
+		}
+		return true;
+	}
+	case LOG_ADD_KEYWORDS: {
+		long int id;
+		std::vector<int> hashes;
+		if (!reader.get(id) || !reader.getArray(hashes)) return false;
+		if (!space->idSlots.count(id)) return true;
+		sigSlot slot = space->idSlots.find(id);
+		for (size_t j = 0; j < hashes.size(); j++) addSlotKeyword(space, slot, hashes[j]);
+		space->changes++;
+		return true;
+	}
+	case LOG_REMOVE_KEYWORD: {
+		long int id;
+		int hash;
+		if (!reader.get(id) || !reader.get(hash)) return false;
+		if (removeSlotKeyword(space, space->idSlots.find(id), hash)) space->changes++;
+		return true;
+	}
+	case LOG_REMOVE_ALL_KEYWORDS: {
+		long int id;
+		if (!reader.get(id)) return false;
+		if (removeSlotKeywords(space, space->idSlots.find(id))) space->changes++;
+		return true;
+	}
+	}
+	return false;
+}
+
+int openLog(char* prefix, int syncMs) {
+	/* replays the segments of log prefix on top of the db spaces loaded from
+	the last checkpoint, then logs every change to a new segment. syncMs is
+	the log sync interval, see WriteAheadLog::open().
+	Returns the number of records replayed, -1 on failure.
+	 */
+	WriteLocker logLocker(logLock);
+	if (mutationLog.isOpen()) { cerr << "ERROR: log already open" << endl; return -1; }
+
+	std::vector<unsigned long> segments = walSegments(prefix);
+	int replayed = 0;
+	{
+		WriteLocker dbsLocker(dbSpaceLock);
+		std::string record;
+		for (size_t k = 0; k < segments.size(); k++) {
+			std::string name = walSegmentName(prefix, segments[k]);
+			WalReader reader;
+			if (!reader.open(name.c_str())) {
+				cerr << "ERROR: unable to open file for read ops:" << name << endl;
+				return -1;
+			}
+			// a crash may have torn the last record, the ones before it are good
+			while (reader.next(record)) {
+				if (!applyLogRecord(record)) {
+					cerr << "ERROR: bad record on log file:" << name << endl;
+					break;
+				}
+				replayed++;
+			}
 		}
 	}
 
-	SigStruct curResTmp;            /* current result waiting to be returned */
-	while (pqResults.size()) {
-		curResTmp = pqResults.top();
-		pqResults.pop();
-		if (curResTmp.score < 99999) {
-			V.insert(V.end(), curResTmp.id);
-			V.insert(V.end(), curResTmp.score);
+	// never append to a segment that may end with a torn record
+	mutationLogPrefix = prefix;
+	mutationLogSegment = segments.size() ? segments.back() + 1 : 1;
+	if (!mutationLog.open(walSegmentName(prefix, mutationLogSegment).c_str(), syncMs)) return -1;
+	return replayed;
+}
+
+void closeLog() {
+	WriteLocker logLocker(logLock);
+	mutationLog.close();
+}
+
+int checkpointdbs(char* dirname) {
+	/* saves the db spaces changed since their last save to directory
+	dirname, each on a file of its own, see loaddbsdir(). Files of removed
+	db spaces are deleted. Then drops the log segments the directory covers.
+	Changes go on meanwhile, logged to a new segment that is replayed on top
+	of the directory, see applyLogRecord(). The first checkpoint writes the
+	directory aside and renames it into place, so it is never found half done.
+	A broken log, see isLogBroken(), is whole again once this succeeds.
+	Returns the number of db spaces saved, -1 on failure.
+	 */
+	WriteLocker logLocker(logLock);
+	bool logging = mutationLog.isOpen();
+	// changes made since the log broke are only saved by this checkpoint
+	bool broken = logging && mutationLog.isBroken();
+	unsigned long covered = mutationLogSegment;
+	if (logging) {
+		if (!mutationLog.open(walSegmentName(mutationLogPrefix, covered + 1).c_str(), mutationLog.syncInterval())) return -1;
+		mutationLogSegment = covered + 1;
+	}
+
+	std::string dir = dirname;
+	struct stat st;
+	bool fresh = stat(dirname, &st) || !S_ISDIR(st.st_mode);
+	std::string target = fresh ? dir + ".tmp" : dir;
+	if (fresh) {
+		// left over by a first checkpoint that failed
+		std::vector<int> stale = spaceFiles(target);
+		for (size_t k = 0; k < stale.size(); k++) remove(spaceFileName(target, stale[k]).c_str());
+		if (mkdir(target.c_str(), 0755) && errno != EEXIST) {
+			cerr << "ERROR: unable to create directory:" << target << endl;
+			if (broken) mutationLog.setBroken();
+			return -1;
 		}
 	}
 
+	Snapshot snapshot;
+	{
+		ReadLocker dbsLocker(dbSpaceLock);
+		std::vector<std::vector<int> > groups;
+		std::vector<std::string> files;
+		for (dpspaceIterator it = dbSpace.begin(); it != dbSpace.end(); it++) {
+			std::string name = spaceFileName(target, it->first);
+			// changes logged to the old segments are done once their lock is free
+			ReadLocker spaceLocker(it->second->lock);
+			if (fresh || it->second->changes || access(name.c_str(), F_OK)) {
+				groups.push_back(std::vector<int>(1, it->first));
+				files.push_back(name);
+			}
+		}
+		startSnapshot(groups, files, snapshot);
+	}
+	// db spaces get created, removed and loaded meanwhile
+	finishSnapshot(snapshot);
+
+	int res = 0;
+	bool ok = true;
+	for (size_t k = 0; k < snapshot.written.size(); k++) {
+		if (snapshot.written[k]) res++;
+		else ok = false;
+	}
+	{
+		ReadLocker dbsLocker(dbSpaceLock);
+		for (size_t k = 0; k < snapshot.dbIds.size(); k++) {
+			dpspaceIterator it = dbSpace.find(snapshot.dbIds[k]);
+			// one reset or removed meanwhile is not the db space saved
+			if (!snapshot.written[snapshot.files[k]] || it == dbSpace.end() || it->second->serial != snapshot.serials[k]) {
+				continue;
+			}
+			// changes made while saving stay to be saved
+			dbSpaceStruct* space = it->second;
+			WriteLocker spaceLocker(space->lock);
+			space->changes -= snapshot.changes[k];
+			space->slotKeywords.compactIfOverflowing();
+		}
+
+		std::vector<int> onDisk = spaceFiles(target);
+		for (size_t k = 0; k < onDisk.size(); k++) {
+			if (!dbSpace.count(onDisk[k]) && !coldSpaces.count(onDisk[k])) remove(spaceFileName(target, onDisk[k]).c_str());
+		}
+	}
+
+	if (!ok || !syncFile(target.c_str()) || (fresh && (rename(target.c_str(), dirname) || !syncFile(dirname)))) {
+		cerr << "ERROR: error writing directory:" << dirname << endl;
+		if (broken) mutationLog.setBroken();
+		return -1;
+	}
+
+	if (logging) {
+		std::vector<unsigned long> segments = walSegments(mutationLogPrefix);
+		for (size_t k = 0; k < segments.size() && segments[k] <= covered; k++) {
+			remove(walSegmentName(mutationLogPrefix, segments[k]).c_str());
+		}
+	}
+	return res;
+}
+
+long int getUnsavedChanges(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
+	return space->changes;
+}
+
+long int getLogSize() {
+	return mutationLog.segmentSize();
+}
+
+bool isLogBroken() {
+	/* whether the log failed to take a change. Changes are refused then, until
+	checkpointdbs() saves the ones that made it and opens a new log segment.
+	 */
+	return mutationLog.isBroken();
+}
+
+/* Offers every signature on slots [lo, hi) to results, skipping the ones
+ignored due to keywords */
+void selectResults(dbSpaceStruct* space, const double* scores, sigSlot lo, sigSlot hi,
+		ResultHeap& results) {
+	for (sigSlot slot = lo; slot < hi; slot++) {
+		if (!space->liveSlots[slot] || scores[slot] >= 99999) continue;
+		results.offer(scores[slot], slot);
+	}
+}
+
+/* Scoring of the signatures on slots [lo, hi) of the db space for a query.
+A query is split into parts over disjoint slot ranges which can run on
+different threads: each writes only its own range of the shared scores
+buffer and selects its own best results.
+ */
+class QueryPart: public PoolTask {
+public:
+	dbSpaceStruct* space;
+	const SigIdx* const* sig;
+	const double* avgl;
+	int numres;
+	int sketch;
+	const SlotBitmap* filter;	/* slots to keep, any if NULL */
+	bool colorOnly;
+	double* scores;
+	sigSlot lo;
+	sigSlot hi;
+	ResultHeap results;	/* best results of the part */
+
+	void run() {
+		int idx, c;
+		int pn;
+
+		if (hi == lo) return;
+
+		// image content: average luminance (free slots get a score too, never selected)
+		space->slotAvglDistances(lo, hi - lo, avgl, weights[sketch][0], scores + lo);
+
+		if (filter) {
+			for (sigSlot slot = lo; slot < hi; slot++) {
+				if (space->liveSlots[slot] && !filter->contains(slot)) { // image doesnt have keyword, just give it a terrible score
+					scores[slot] = 99999999;
+				}
+			}
+		}
+
+		if (!colorOnly) {
+			for (int b = 0; b < NUM_COEFS; b++) {	// for every coef on a sig
+				for (c = 0; c < 3; c++) {
+					//TODO see if FAST_POW_GEERT gives the same results
+#ifdef FAST_POW_GEERT
+					pn  = sig[c][b] < 0;
+					idx = (sig[c][b] - pn) ^ -pn;
+#else
+					pn = 0;
+					if (sig[c][b]>0) {
+						pn = 0;
+						idx = sig[c][b];
+					} else {
+						pn = 1;
+						idx = -sig[c][b];
+					}
+#endif
+
+					// update the score of every image of this part which has this coef, walking only
+					// the slots of the bucket in [lo, hi)
+					const PostingList& bucket = space->imgbuckets[c][pn][idx];
+					PostingCursor cursor;
+					bucket.seek(cursor, lo);
+					ScoreUpdate update(scores, weights[sketch][imgBin[idx]][c]);
+					bucket.forEachBelow(cursor, hi, update);
+				}
+			}
+		}
+
+		results.reset(numres, hi - lo);
+		selectResults(space, scores, lo, hi, results);
+	}
+};
+
+/* Coefficients of a query signature by value, for scoring candidates one at
+a time (see CandidateQueryPart). Entry v + NUM_PIXELS_SQUARED of a channel is
+1 + the order QueryPart visits the bucket of coefficient v in, 0 if the query
+lacks v.
+ */
+struct QueryCoefTable {
+	std::vector<unsigned char> order[3];
+	double w[3 * NUM_COEFS];	/* weight of each coefficient of the query, by order */
+
+	QueryCoefTable(const SigIdx* const* sig, int sketch) {
+		for (int c = 0; c < 3; c++) order[c].assign(2 * NUM_PIXELS_SQUARED, 0);
+		for (int b = 0; b < NUM_COEFS; b++) {
+			for (int c = 0; c < 3; c++) {
+				// 0 is on no bucket, so no signature shares it
+				if (sig[c][b]) order[c][sig[c][b] + NUM_PIXELS_SQUARED] = 3 * b + c + 1;
+				w[3 * b + c] = weights[sketch][imgBin[abs(sig[c][b])]][c];
+			}
+		}
+	}
+};
+
+/* Scoring of the candidates [first, last) of a query, when they are few
+enough to score each on its own instead of walking the buckets of the query
+(see queryImgDataFiltered). Scores are the same as QueryPart's, bit for bit:
+coefficient weights are subtracted in the order QueryPart visits the buckets.
+ */
+class CandidateQueryPart: public PoolTask {
+public:
+	dbSpaceStruct* space;
+	const double* avgl;
+	int sketch;
+	const QueryCoefTable* coefs;	/* NULL for colorOnly queries */
+	int numres;
+	const sigSlot* first;
+	const sigSlot* last;
+	ResultHeap results;	/* best results of the part */
+
+	void run() {
+		size_t n = last - first;
+		results.reset(numres, n);
+		if (!n) return;
+
+		// image content: average luminance, gathered to be computed in one go
+		std::vector<float> cols[3];
+		for (int c = 0; c < 3; c++) {
+			cols[c].resize(n);
+			for (size_t k = 0; k < n; k++) cols[c][k] = space->avglCols[c][first[k]];
+		}
+		std::vector<double> scores(n);
+		avglDistances(&cols[0][0], &cols[1][0], &cols[2][0], avgl, weights[sketch][0], &scores[0], n);
+
+		for (size_t k = 0; k < n; k++) {
+			double score = scores[k];
+			if (coefs) {
+				const DiskSigStruct& csig = space->sigs[first[k]];
+				const SigIdx* cand[3] = { csig.sig1, csig.sig2, csig.sig3 };
+				// coefficients of the query the candidate has too, by order
+				uint64_t shared[2] = { 0, 0 };
+				for (int c = 0; c < 3; c++) {
+					const unsigned char* order = &coefs->order[c][NUM_PIXELS_SQUARED];
+					for (int b = 0; b < NUM_COEFS; b++) {
+						unsigned int o = order[cand[c][b]];
+						if (o--) shared[o >> 6] |= (uint64_t) 1 << (o & 63);
+					}
+				}
+				for (int h = 0; h < 2; h++) {
+					for (uint64_t word = shared[h]; word; word &= word - 1) {
+						score -= coefs->w[h * 64 + SlotBitmap::lowestBit(word)];
+					}
+				}
+			}
+			results.offer(score, first[k]);
+		}
+	}
+};
+
+// collects the slots of a candidates bitmap
+struct SlotCollector {
+	std::vector<sigSlot>& slots;
+	SlotCollector(std::vector<sigSlot>& slots): slots(slots) {}
+	void operator()(const sigSlot slot) { slots.push_back(slot); }
+};
+
+/* Threads a single query is split across. 1 runs queries on the calling thread only */
+int queryThreads = 1;
+ThreadPool* queryPool = new ThreadPool();
+
+long int getAvglDistances(const int dbId, double y, double i, double q, int sketch,
+		char* ids, long idsSize, char* dists, long distsSize) {
+	/* fills ids (as long int) and dists (as double) with the average luminance
+	distance of every image on the db space to (y, i, q), i.e., the score of a
+	colorOnly query. Returns the number of images, which may be more than what
+	fits on the buffers.
+	 */
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return -1;}
+
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
+
+	long int count = space->idSlots.size();
+	long int capacity = min<long int>(idsSize / sizeof(long int), distsSize / sizeof(double));
+	if (count > capacity || !count) return count;
+
+	sigSlot slotCount = space->slotCount();
+	std::vector<double> scores(slotCount);
+	double avgl[3] = { y, i, q };
+	space->slotAvglDistances(0, slotCount, avgl, weights[sketch][0], &scores[0]);
+
+	long int* outIds = (long int*) ids;
+	double* outDists = (double*) dists;
+	for (sigSlot slot = 0; slot < slotCount; slot++) {
+		if (!space->liveSlots[slot]) continue;
+		*outIds++ = space->sigs[slot].id;
+		*outDists++ = scores[slot];
+	}
+	return count;
+}
+
+int setQueryThreads(int threads) {
+	if (threads < 1) threads = 1;
+	queryThreads = threads;
+	// the thread running the query does its share
+	queryPool->resize(threads - 1);
+	return queryThreads;
+}
+
+int getQueryThreads() {
+	return queryThreads;
+}
+
+/* Runs the parts of a query, on the query pool if more than one */
+template <class Part>
+static void runQueryParts(std::vector<Part>& parts) {
+	if (parts.size() == 1) {
+		parts[0].run();
+		return;
+	}
+	std::vector<PoolTask*> tasks;
+	for (size_t k = 0; k < parts.size(); k++) tasks.push_back(&parts[k]);
+	queryPool->runAll(tasks);
+}
+
+/* Merges the best results of every part of a query into (image id, score)
+pairs, worst first */
+template <class Part>
+static std::vector<double> queryPartsResults(dbSpaceStruct* space, std::vector<Part>& parts) {
+	ResultHeap& results = parts[0].results;
+	for (size_t k = 1; k < parts.size(); k++) {
+		std::vector<slotScore>& partResults = parts[k].results.heap;
+		for (size_t i = 0; i < partResults.size(); i++) {
+			results.offer(partResults[i].first, partResults[i].second);
+		}
+	}
+
+	std::vector<slotScore>& best = results.sorted();
+	vector<double> V;
+	V.reserve(2 * best.size());
+	for (std::vector<slotScore>::reverse_iterator it = best.rbegin(); it != best.rend(); it++) {
+		V.push_back(space->sigs[it->second].id);
+		V.push_back(it->first);
+	}
 	return V;
 }
 
+/* Scores only the slots of candidates, see CandidateQueryPart */
+static std::vector<double> queryCandidates(dbSpaceStruct* space, const DiskSigStruct& qsig, int numres, int sketch,
+		const SlotBitmap& candidates, bool colorOnly) {
+	const SigIdx *sig[3] = { qsig.sig1, qsig.sig2, qsig.sig3 };
+	double avgl[3] = { qsig.avgl[0], qsig.avgl[1], qsig.avgl[2] };
+
+	std::vector<sigSlot> slots;
+	slots.reserve(candidates.size());
+	SlotCollector collector(slots);
+	candidates.forEach(collector);
+	QueryCoefTable* coefs = colorOnly ? 0 : new QueryCoefTable(sig, sketch);
+
+	int numParts = min<size_t>(queryThreads, slots.size() / MIN_CANDIDATES_PER_QUERY_PART);
+	if (numParts < 1) numParts = 1;
+
+	std::vector<CandidateQueryPart> parts(numParts);
+	const sigSlot* base = slots.empty() ? 0 : &slots[0];
+	for (int k = 0; k < numParts; k++) {
+		CandidateQueryPart& part = parts[k];
+		part.space = space;
+		part.avgl = avgl;
+		part.sketch = sketch;
+		part.coefs = coefs;
+		part.numres = numres;
+		part.first = base + slots.size() * k / numParts;
+		part.last = base + slots.size() * (k + 1) / numParts;
+	}
+	runQueryParts(parts);
+	delete coefs;
+
+	return queryPartsResults(space, parts);
+}
+
+/* Caller must hold dbSpaceLock and the lock of the db space for reading.
+Scores are kept on a buffer private to the query, so any number of queries
+may run at once.
+With a filter, only the slots on it are results. Few enough of them are
+scored each on its own (see CandidateQueryPart); otherwise every slot is
+scored walking the buckets of the query, and the ones off the filter are
+dropped. filter is deleted.
+ */
+std::vector<double> queryImgDataFiltered(const int dbId, const DiskSigStruct& qsig, int numres, int sketch, SlotBitmap* filter, bool colorOnly) {
+	const SigIdx *sig[3] = { qsig.sig1, qsig.sig2, qsig.sig3 };
+	double avgl[3] = { qsig.avgl[0], qsig.avgl[1], qsig.avgl[2] };
+	dbSpaceStruct* space = dbSpace[dbId];
+	sigSlot slotCount = space->slotCount();
+
+	if (filter) {
+		// a walk over the buckets costs a visit per slot, plus one per posting on them.
+		// Without buckets to walk, candidates cost about a visit each, so they always win
+		unsigned long bucketCost = slotCount;
+		if (!colorOnly) {
+			PostingList* buckets[3 * NUM_COEFS];
+			int n = sigBuckets(space, qsig, buckets);
+			for (int k = 0; k < n; k++) bucketCost += buckets[k]->size();
+		}
+		if (colorOnly || filter->size() * CANDIDATE_SCORE_COST < bucketCost) {
+			std::vector<double> V = queryCandidates(space, qsig, numres, sketch, *filter, colorOnly);
+			delete filter;
+			return V;
+		}
+	}
+
+	/* scores of this query, indexed by signature slot */
+	std::vector<double> scores(slotCount);
+
+	// small spaces aren't worth waking up other threads
+	int numParts = min<sigSlot>(queryThreads, slotCount / MIN_SLOTS_PER_QUERY_PART);
+	if (numParts < 1) numParts = 1;
+
+	std::vector<QueryPart> parts(numParts);
+	for (int k = 0; k < numParts; k++) {
+		QueryPart& part = parts[k];
+		part.space = space;
+		part.sig = sig;
+		part.avgl = avgl;
+		part.numres = numres;
+		part.sketch = sketch;
+		part.filter = filter;
+		part.colorOnly = colorOnly;
+		part.scores = slotCount ? &scores[0] : 0;
+		part.lo = (sigSlot) ((unsigned long) slotCount * k / numParts);
+		part.hi = (sigSlot) ((unsigned long) slotCount * (k + 1) / numParts);
+	}
+	runQueryParts(parts);
+	delete filter;
+
+	return queryPartsResults(space, parts);
+}
+
+
+/* Queries the db space for the images most like sig, see queryImgData() */
+std::vector<double> querySigData(const int dbId, const DiskSigStruct& sig, int numres, int sketch, bool colorOnly) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<double>();}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
+	return queryImgDataFiltered(dbId, sig, numres, sketch, 0, colorOnly);
+}
 
 /* sig1,2,3 are int arrays of length NUM_COEFS
 avgl is the average luminance
@@ -755,18 +2256,20 @@ numres is the max number of results
 sketch (0 or 1) tells which set of weights to use
  */
 std::vector<double> queryImgData(const int dbId, Idx * sig1, Idx * sig2, Idx * sig3, double *avgl, int numres, int sketch, bool colorOnly) {
-	return queryImgDataFiltered(dbId, sig1, sig2, sig3, avgl, numres, sketch, 0, colorOnly);
-
+	// narrowed the way stored signatures are, so they rank alike
+	DiskSigStruct nsig;
+	nsig.setCoefs(sig1, sig2, sig3, avgl);
+	return querySigData(dbId, nsig, numres, sketch, colorOnly);
 }
 
 /* sig1,2,3 are int arrays of lenght NUM_COEFS
 avgl is the average luminance
 thresd is the limit similarity threshold. Only images with score > thresd will be a result
 `sketch' tells which set of weights to use
-sigs is the source to query on (map of signatures)
-every search result is removed from sigs. (right now this functn is only used by clusterSim)
+tslots is the source to query on (set of signature slots of the db space)
+every search result is removed from tslots. (right now this functn is only used by clusterSim)
  */
-long_list queryImgDataForThres(const int dbId, sigMap * tsigs,
+long_list queryImgDataForThres(const int dbId, sigSlot_hashset * tslots,
 		Idx * sig1, Idx * sig2, Idx * sig3,
 		double *avgl, float thresd, int sketch) {
 	int idx, c;
@@ -774,14 +2277,16 @@ long_list queryImgDataForThres(const int dbId, sigMap * tsigs,
 	long_list res;
 	Idx *sig[3] = { sig1, sig2, sig3 };
 
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return res;}
 
-	for (sigIterator sit = (*tsigs).begin(); sit != (*tsigs).end(); sit++) {
-		(*sit).second->score = 0;
-		for (c = 0; c < 3; c++)
-			(*sit).second->score += weights[sketch][0][c]
-			                                           * fabs((*sit).second->avgl[c] - avgl[c]);
-	}
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
+	if (!space->slotCount()) return res;
+
+	// streaming over every slot is cheaper than visiting the candidates one by one
+	std::vector<double> scores(space->slotCount());
+	space->slotAvglDistances(0, space->slotCount(), avgl, weights[sketch][0], &scores[0]);
 	for (int b = 0; b < NUM_COEFS; b++) {	// for every coef on a sig
 		for (c = 0; c < 3; c++) {
 #ifdef FAST_POW_GEERT  //TODO is it faster? same results? remove this code?
@@ -798,46 +2303,52 @@ long_list queryImgDataForThres(const int dbId, sigMap * tsigs,
 			}
 #endif
 			// update the score of every image which has this coef
-			//TODO in each iteration search in tree (std::map) is performed. i think the better way to link by pointers.
-			long_listIterator end = dbSpace[dbId]->imgbuckets[c][pn][idx].end();
-			for (long_listIterator uit = dbSpace[dbId]->imgbuckets[c][pn][idx].begin();
-			uit != end; uit++) {
-				if ((*tsigs).count((*uit)))
-					// this is an ugly line
-					(*tsigs)[(*uit)]->score -=
-						weights[sketch][imgBin[idx]][c];
-			}
+			FilteredScoreUpdate update(&scores[0], weights[sketch][imgBin[idx]][c], tslots);
+			space->imgbuckets[c][pn][idx].forEach(update);
 		}
 	}
-	for (sigIterator sit = (*tsigs).begin(); sit != (*tsigs).end(); sit++) {
-		if ((*sit).second->score < thresd) {
-			res.push_back((*sit).second->id);
-			(*tsigs).erase((*sit).second->id);
+	for (sigSlot_hashset::iterator sit = (*tslots).begin(); sit != (*tslots).end(); ) {
+		if (scores[*sit] < thresd) {
+			res.push_back(space->sigs[*sit].id);
+			(*tslots).erase(sit++);
+		} else {
+			sit++;
 		}
 	}
 	return res;
 }
 
-long_list queryImgDataForThresFast(sigMap * tsigs, double *avgl, float thresd, int sketch) {
+long_list queryImgDataForThresFast(const int dbId, sigSlot_hashset * tslots, double *avgl, float thresd, int sketch) {
 
 	// will only look for average luminance
 	long_list res;
 
-	for (sigIterator sit = (*tsigs).begin(); sit != (*tsigs).end(); sit++) {
-		(*sit).second->score = 0;
-		for (int c = 0; c < 3; c++)
-			(*sit).second->score += weights[sketch][0][c]
-			                                           * fabs((*sit).second->avgl[c] - avgl[c]);
-		if ((*sit).second->score < thresd) {
-			res.push_back((*sit).second->id);
-			(*tsigs).erase((*sit).second->id);
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return res;}
+
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
+	if (!space->slotCount()) return res;
+
+	// streaming over every slot is cheaper than visiting the candidates one by one
+	std::vector<double> scores(space->slotCount());
+	space->slotAvglDistances(0, space->slotCount(), avgl, weights[sketch][0], &scores[0]);
+
+	for (sigSlot_hashset::iterator sit = (*tslots).begin(); sit != (*tslots).end(); ) {
+		if (scores[*sit] < thresd) {
+			res.push_back(space->sigs[*sit].id);
+			(*tslots).erase(sit++);
+		} else {
+			sit++;
 		}
 	}
 	return res;
 }
 
 //TODO some places are using double_vector others std::vector. Decide!
-std::vector<double>  queryImgBlob(const int dbId, const char* data,const long length, int numres,int sketch, bool colorOnly) {
+/* Computes the signature of the image encoded on data into sig. Returns 0 on
+failure. Called without holding any lock. */
+int blobSignature(const char* data, const long length, SigStruct& sig) {
 	ExceptionInfo exception;
 	GetExceptionInfo(&exception);
 
@@ -849,68 +2360,24 @@ std::vector<double>  queryImgBlob(const int dbId, const char* data,const long le
 
 	DestroyImageInfo(image_info);
 
-	// Made static for speed; only used locally
-	static Unit cdata1[16384];
-	static Unit cdata2[16384];
-	static Unit cdata3[16384];
-
-	Image *resize_image;
-
-	/*
-	Initialize the image info structure and read an image.
-	 */
-	GetExceptionInfo(&exception);
-
-	resize_image = SampleImage(image, 128, 128, &exception);
-
-	DestroyImage(image);
-
-	DestroyExceptionInfo(&exception);
-
-	if (resize_image == (Image *) NULL) {
-		cerr << "ERROR: unable to resize image" << endl;
-    	return vector<double>();
-	}
-
-    // store color value for basic channels
-	unsigned char rchan[16384];
-	unsigned char gchan[16384];
-	unsigned char bchan[16384];
-
-	GetExceptionInfo(&exception);
-
-	const PixelPacket *pixel_cache = GetVirtualPixels(resize_image, 0, 0, 128, 128, &exception);
-
-	for (int idx = 0; idx < 16384; idx++) {
-		rchan[idx] = pixel_cache->red;
-		gchan[idx] = pixel_cache->green;
-		bchan[idx] = pixel_cache->blue;
-		pixel_cache++;
-	}
-
-    DestroyImage(resize_image);
-
-	transformChar(rchan, gchan, bchan, cdata1, cdata2, cdata3);
-
-	DestroyExceptionInfo(&exception);
-
-	SigStruct *nsig = new SigStruct();
-    //TODO leaking nsig?
-	calcHaar(cdata1, cdata2, cdata3,
-			nsig->sig1, nsig->sig2, nsig->sig3, nsig->avgl);
+	if (image == (Image *) NULL) {
+    	cerr << "ERROR: unable to read image" << endl;
+    	return 0;
+    }
 
-	return queryImgData(dbId, nsig->sig1, nsig->sig2, nsig->sig3,
-			nsig->avgl, numres, sketch, colorOnly);
+	return imageSignature(image, sig);
 }
 
-std::vector<double> queryImgPath(const int dbId, char* path,int numres,int sketch, bool colorOnly) {
+/* Computes the signature of the image file on path into sig. Returns 0 on
+failure. Called without holding any lock. */
+int pathSignature(const char* path, SigStruct& sig) {
 
 	ExceptionInfo exception;
 	GetExceptionInfo(&exception);
 
 	ImageInfo *image_info;
 	image_info = CloneImageInfo((ImageInfo *) NULL);
-	(void) strcpy(image_info->filename, path);
+	(void) strncpy(image_info->filename, path, sizeof(image_info->filename) - 1);
 	Image *image = ReadImage(image_info, &exception);
 	if (exception.severity != UndefinedException) CatchException(&exception);
 	DestroyImageInfo(image_info);
@@ -918,63 +2385,326 @@ std::vector<double> queryImgPath(const int dbId, char* path,int numres,int sketc
 
 	if (image == (Image *) NULL) {
     	cerr << "ERROR: unable to read image" << endl;
-    	return vector<double>();
+    	return 0;
     }
 
-	// Made static for speed; only used locally
-	static Unit cdata1[16384];
-	static Unit cdata2[16384];
-	static Unit cdata3[16384];
+	return imageSignature(image, sig);
+}
 
-	Image *resize_image;
+/* sig as sig1, sig2, sig3 (NUM_COEFS each), avgl (3), width, height */
+static std::vector<double> signatureData(const SigStruct& sig) {
+	std::vector<double> V;
+	V.reserve(3 * NUM_COEFS + 5);
+	V.insert(V.end(), sig.sig1, sig.sig1 + NUM_COEFS);
+	V.insert(V.end(), sig.sig2, sig.sig2 + NUM_COEFS);
+	V.insert(V.end(), sig.sig3, sig.sig3 + NUM_COEFS);
+	V.insert(V.end(), sig.avgl, sig.avgl + 3);
+	V.push_back(sig.width);
+	V.push_back(sig.height);
+	return V;
+}
 
-	/*
-	Initialize the image info structure and read an image.
-	 */
-	GetExceptionInfo(&exception);
+/* Signature of the image file on path, for addImageSignature(): sig1, sig2,
+sig3 (NUM_COEFS each), avgl (3), width and height. Empty if the image can't
+be read. Needs no db space, so it can run on worker processes.
+ */
+std::vector<double> imageSignatureFromPath(char* path) {
+	SigStruct nsig;
+	if (!pathSignature(path, nsig)) return vector<double>();
+	return signatureData(nsig);
+}
 
-	resize_image = SampleImage(image, 128, 128, &exception);
+/* Same as imageSignatureFromPath() for the image encoded on data */
+std::vector<double> imageSignatureFromBlob(const char* data, const long length) {
+	SigStruct nsig;
+	if (!blobSignature(data, length, nsig)) return vector<double>();
+	return signatureData(nsig);
+}
 
-	DestroyImage(image);
+std::vector<double>  queryImgBlob(const int dbId, const char* data,const long length, int numres,int sketch, bool colorOnly) {
+	SigStruct nsig;
+	if (!blobSignature(data, length, nsig)) return vector<double>();
 
-	DestroyExceptionInfo(&exception);
+	return querySigData(dbId, nsig, numres, sketch, colorOnly);
+}
 
-	if (resize_image == (Image *) NULL) {
-		cerr << "ERROR: unable to resize image" << endl;
-    	return vector<double>();
+std::vector<double> queryImgPath(const int dbId, char* path,int numres,int sketch, bool colorOnly) {
+	SigStruct nsig;
+	if (!pathSignature(path, nsig)) return vector<double>();
+
+	return querySigData(dbId, nsig, numres, sketch, colorOnly);
+}
+
+/* Batch queries */
+
+/* A bucket holding coefficients of queries of a batch chunk: which queries of
+the chunk have it and the weight each of them gives to it */
+struct BatchBucket {
+	PostingList* bucket;
+	int numQueries;
+	int queries[BATCH_WIDTH];
+	double w[BATCH_WIDTH];
+};
+
+// subtracts the weights of a bucket from the scores of every slot on it, for
+// all the queries of the chunk having its coefficient. scores holds a row of
+// BATCH_WIDTH scores per slot, starting with slot base
+struct BatchScoreUpdate {
+	double* scores;
+	const BatchBucket& bucket;
+	sigSlot base;
+	BatchScoreUpdate(double* scores, const BatchBucket& bucket, sigSlot base): scores(scores), bucket(bucket), base(base) {}
+	void operator()(const sigSlot slot) {
+		double* row = scores + (size_t) (slot - base) * BATCH_WIDTH;
+		for (int k = 0; k < bucket.numQueries; k++) row[bucket.queries[k]] -= bucket.w[k];
 	}
+};
+
+/* Slots of a batch chunk scored at once. Their scores for every query of the
+chunk stay in cache while the buckets are traversed */
+#define BATCH_BLOCK_SLOTS 4096
+
+/* Up to BATCH_WIDTH queries of a batch, scored together */
+struct BatchChunk {
+	std::vector<DiskSigStruct*> sigs;
+	std::vector<BatchBucket> buckets;	/* buckets of every query of the chunk */
+};
+
+/* Scoring of the signatures on slots [lo, hi) of the db space for a batch
+chunk. Works like QueryPart, but every bucket is traversed once for all the
+queries of the chunk having its coefficient, a block of slots at a time, and
+the scores of the block are the only ones kept.
+ */
+class BatchQueryPart: public PoolTask {
+public:
+	dbSpaceStruct* space;
+	BatchChunk* chunk;
+	int numres;
+	int sketch;
+	sigSlot lo;
+	sigSlot hi;
+	std::vector<ResultHeap> results;	/* best results of the part, per query */
+
+	void run() {
+		std::vector<DiskSigStruct*>& sigs = chunk->sigs;
+		std::vector<BatchBucket>& buckets = chunk->buckets;
+
+		results.resize(sigs.size());
+		for (size_t j = 0; j < sigs.size(); j++) results[j].reset(numres, hi - lo);
+		if (hi == lo) return;
+
+		// where the traversal of every bucket is
+		std::vector<PostingCursor> cursors(buckets.size());
+		for (size_t k = 0; k < buckets.size(); k++) {
+			buckets[k].bucket->seek(cursors[k], lo);
+		}
 
-    // store color value for basic channels
-	unsigned char rchan[16384];
-	unsigned char gchan[16384];
-	unsigned char bchan[16384];
+		/* scores of a block of slots, a row of BATCH_WIDTH per slot */
+		std::vector<double> scores(BATCH_BLOCK_SLOTS * BATCH_WIDTH);
+		std::vector<double> dists(BATCH_BLOCK_SLOTS);
 
-	GetExceptionInfo(&exception);
+		for (sigSlot block = lo; block < hi; block += BATCH_BLOCK_SLOTS) {
+			sigSlot n = hi - block < BATCH_BLOCK_SLOTS ? hi - block : BATCH_BLOCK_SLOTS;
 
-	const PixelPacket *pixel_cache = GetVirtualPixels(resize_image, 0, 0, 128, 128, &exception);
+			// image content: average luminance
+			for (size_t j = 0; j < sigs.size(); j++) {
+				double avgl[3] = { sigs[j]->avgl[0], sigs[j]->avgl[1], sigs[j]->avgl[2] };
+				space->slotAvglDistances(block, n, avgl, weights[sketch][0], &dists[0]);
+				for (sigSlot i = 0; i < n; i++) scores[i * BATCH_WIDTH + j] = dists[i];
+			}
 
-	for (int idx = 0; idx < 16384; idx++) {
-		rchan[idx] = pixel_cache->red;
-		gchan[idx] = pixel_cache->green;
-		bchan[idx] = pixel_cache->blue;
-		pixel_cache++;
+			for (size_t k = 0; k < buckets.size(); k++) {
+				BatchScoreUpdate update(&scores[0], buckets[k], block);
+				buckets[k].bucket->forEachBelow(cursors[k], block + n, update);
+			}
+
+			for (size_t j = 0; j < sigs.size(); j++) {
+				ResultHeap& heap = results[j];
+				for (sigSlot i = 0; i < n; i++) {
+					if (!space->liveSlots[block + i]) continue;
+					heap.offer(scores[i * BATCH_WIDTH + j], block + i);
+				}
+			}
+		}
+	}
+};
+
+/* A coefficient of a query of a batch chunk, see BatchBucket */
+struct BatchCoef {
+	PostingList* bucket;
+	int query;
+	double w;
+	bool operator< (const BatchCoef& right) const { return bucket < right.bucket; }
+};
+
+/* Groups the coefficients of the queries of chunk by bucket */
+void batchChunkBuckets(dbSpaceStruct* space, BatchChunk& chunk, int sketch) {
+	std::vector<BatchCoef> coefs;
+	coefs.reserve(chunk.sigs.size() * 3 * NUM_COEFS);
+	for (size_t j = 0; j < chunk.sigs.size(); j++) {
+		const SigIdx *sig[3] = { chunk.sigs[j]->sig1, chunk.sigs[j]->sig2, chunk.sigs[j]->sig3 };
+		for (int b = 0; b < NUM_COEFS; b++) {
+			for (int c = 0; c < 3; c++) {
+				int pn = sig[c][b] > 0 ? 0 : 1;
+				int idx = pn ? -sig[c][b] : sig[c][b];
+				BatchCoef coef;
+				coef.bucket = &space->imgbuckets[c][pn][idx];
+				coef.query = j;
+				coef.w = weights[sketch][imgBin[idx]][c];
+				coefs.push_back(coef);
+			}
+		}
 	}
+	std::sort(coefs.begin(), coefs.end());
+
+	for (size_t k = 0; k < coefs.size(); k++) {
+		if (!k || coefs[k].bucket != coefs[k - 1].bucket) {
+			BatchBucket bucket;
+			bucket.bucket = coefs[k].bucket;
+			bucket.numQueries = 0;
+			chunk.buckets.push_back(bucket);
+		}
+		BatchBucket& bucket = chunk.buckets.back();
+		bucket.queries[bucket.numQueries] = coefs[k].query;
+		bucket.w[bucket.numQueries++] = coefs[k].w;
+	}
+}
 
-    DestroyImage(resize_image);
+/* Runs every query of sigs against the db space, as queryImgData would, but
+sharing the scans of the db space among them. A NULL signature gets no
+results. Caller must hold dbSpaceLock and the lock of the db space for reading.
 
-	transformChar(rchan, gchan, bchan, cdata1, cdata2, cdata3);
+Queries are scored BATCH_WIDTH at a time, and the chunks of a batch run on
+the query threads alongside each other.
 
-	DestroyExceptionInfo(&exception);
+Returns, for every query and in the same order, the number of results
+followed by that many (image id, score) pairs, worst first.
+ */
+std::vector<double> queryImgDataBatch(const int dbId, std::vector<DiskSigStruct*>& sigs, int numres, int sketch, bool colorOnly) {
+	dbSpaceStruct* space = dbSpace[dbId];
+	sigSlot slotCount = space->slotCount();
+
+	std::vector<BatchChunk> chunks;
+	for (size_t j = 0; j < sigs.size(); j++) {
+		if (!sigs[j]) continue;
+		if (chunks.empty() || chunks.back().sigs.size() == BATCH_WIDTH) chunks.push_back(BatchChunk());
+		chunks.back().sigs.push_back(sigs[j]);
+	}
+	if (!colorOnly) {
+		for (size_t c = 0; c < chunks.size(); c++) batchChunkBuckets(space, chunks[c], sketch);
+	}
 
-	SigStruct *nsig = new SigStruct();
+	// chunks keep the threads busy already, so they are split only when there are few
+	int numParts = min<sigSlot>(queryThreads / (chunks.size() ? chunks.size() : 1), slotCount / MIN_SLOTS_PER_QUERY_PART);
+	if (numParts < 1) numParts = 1;
+
+	std::vector<BatchQueryPart> parts(chunks.size() * numParts);
+	std::vector<PoolTask*> tasks;
+	for (size_t c = 0; c < chunks.size(); c++) {
+		for (int k = 0; k < numParts; k++) {
+			BatchQueryPart& part = parts[c * numParts + k];
+			part.space = space;
+			part.chunk = &chunks[c];
+			part.numres = numres;
+			part.sketch = sketch;
+			part.lo = (sigSlot) ((unsigned long) slotCount * k / numParts);
+			part.hi = (sigSlot) ((unsigned long) slotCount * (k + 1) / numParts);
+			tasks.push_back(&part);
+		}
+	}
+
+	if (tasks.size() == 1) {
+		parts[0].run();
+	} else {
+		queryPool->runAll(tasks);
+	}
 
-	calcHaar(cdata1, cdata2, cdata3,
-			nsig->sig1, nsig->sig2, nsig->sig3, nsig->avgl);
+	std::vector<double> V;
+	size_t scored = 0;	/* queries with a signature so far */
+	for (size_t j = 0; j < sigs.size(); j++) {
+		if (!sigs[j]) {
+			V.push_back(0);
+			continue;
+		}
+
+		// merge best results of every part
+		size_t c = scored / BATCH_WIDTH;
+		size_t q = scored % BATCH_WIDTH;
+		scored++;
+		ResultHeap& results = parts[c * numParts].results[q];
+		for (int k = 1; k < numParts; k++) {
+			std::vector<slotScore>& partResults = parts[c * numParts + k].results[q].heap;
+			for (size_t i = 0; i < partResults.size(); i++) {
+				results.offer(partResults[i].first, partResults[i].second);
+			}
+		}
 
-	return queryImgData(dbId, nsig->sig1, nsig->sig2, nsig->sig3,
-			nsig->avgl, numres, sketch, colorOnly);
+		// results are returned worst first
+		std::vector<slotScore>& best = results.sorted();
+		V.push_back(best.size());
+		for (std::vector<slotScore>::reverse_iterator it = best.rbegin(); it != best.rend(); it++) {
+			V.push_back(space->sigs[it->second].id);
+			V.push_back(it->first);
+		}
+	}
+	return V;
+}
+
+/* Same as queryImgDataBatch, taking the locks */
+std::vector<double> queryImgDataBatchLocked(const int dbId, std::vector<DiskSigStruct*>& sigs, int numres, int sketch, bool colorOnly) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<double>();}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
+	return queryImgDataBatch(dbId, sigs, numres, sketch, colorOnly);
 }
 
+std::vector<double> queryImgIDsBatch(const int dbId, std::vector<long int> ids, int numres, int sketch, bool colorOnly) {
+	/* query for images similar to each of the ones with these ids, see
+	queryImgDataBatch. Ids not on the db space get no results.
+	 */
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<double>();}
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
+
+	std::vector<DiskSigStruct*> sigs(ids.size());
+	for (size_t j = 0; j < ids.size(); j++) {
+		sigs[j] = space->getSig(ids[j]);
+		if (!sigs[j]) cerr << "ERROR: image id (" << ids[j] << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl;
+	}
+	return queryImgDataBatch(dbId, sigs, numres, sketch, colorOnly);
+}
+
+std::vector<double> queryImgBlobsBatch(const int dbId, const char* data, const long length, std::vector<long int> sizes, int numres, int sketch, bool colorOnly) {
+	/* data holds the images to query for one after the other, sizes their
+	lengths. See queryImgDataBatch. Images which can't be read get no results.
+	 */
+	std::vector<SigStruct> computed(sizes.size());
+	std::vector<DiskSigStruct*> sigs(sizes.size());
+	long offset = 0;
+	for (size_t j = 0; j < sizes.size(); j++) {
+		if (sizes[j] < 0 || sizes[j] > length - offset) {
+			cerr << "ERROR: image sizes exceed the data given" << endl;
+			return std::vector<double>();
+		}
+		if (blobSignature(data + offset, sizes[j], computed[j])) sigs[j] = &computed[j];
+		offset += sizes[j];
+	}
+	return queryImgDataBatchLocked(dbId, sigs, numres, sketch, colorOnly);
+}
+
+std::vector<double> queryImgPathsBatch(const int dbId, std::vector<std::string> paths, int numres, int sketch, bool colorOnly) {
+	/* query for images similar to each of the image files on paths, see
+	queryImgDataBatch. Images which can't be read get no results.
+	 */
+	std::vector<SigStruct> computed(paths.size());
+	std::vector<DiskSigStruct*> sigs(paths.size());
+	for (size_t j = 0; j < paths.size(); j++) {
+		if (pathSignature(paths[j].c_str(), computed[j])) sigs[j] = &computed[j];
+	}
+	return queryImgDataBatchLocked(dbId, sigs, numres, sketch, colorOnly);
+}
 
 //TODO add parm for query tweaking (sketch?)
 std::vector<double> queryImgID(const int dbId, long int id, int numres, int sketch, bool colorOnly) {
@@ -982,26 +2712,22 @@ std::vector<double> queryImgID(const int dbId, long int id, int numres, int sket
 	numres is the maximum number of results
 	 */
 
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<double>();}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
 	if (id == -1) { // query random images
 		vector<double> Vres;
-		if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return Vres;}
-		long int sz = dbSpace[dbId]->sigs.size();
-		int_hashset includedIds;
-		sigIterator it = dbSpace[dbId]->sigs.begin();
+		dbSpaceStruct* space = dbSpace[dbId];
+		long int sz = space->idSlots.size();
+		sigSlot_hashset includedSlots;
 		for (int var = 0; var < min<unsigned long>(sz, numres); ) { // var goes from 0 to numres
-			long int rint = rand()%(sz);
-			for(int pqp =0; pqp < rint; pqp++) {
-				it ++;
-				if (it == dbSpace[dbId]->sigs.end()) {
-					it = dbSpace[dbId]->sigs.begin();
-					continue;
-				}
-			}
-
-			if ( includedIds.count((const int)(*it).first) == 0 ) { // havent added this random result yet
-				Vres.insert(Vres.end(), (*it).first );
+			sigSlot slot = rand() % space->slotCount();
+			if (!space->liveSlots[slot]) continue;
+			if ( includedSlots.count(slot) == 0 ) { // havent added this random result yet
+				Vres.insert(Vres.end(), space->sigs[slot].id );
 				Vres.insert(Vres.end(), 0 );
-				includedIds.insert((const int)(*it).first);
+				includedSlots.insert(slot);
 				++var;
 			}
 		}
@@ -1010,47 +2736,161 @@ std::vector<double> queryImgID(const int dbId, long int id, int numres, int sket
 
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return std::vector<double>();};
 
-	return queryImgData(dbId, dbSpace[dbId]->sigs[id]->sig1, dbSpace[dbId]->sigs[id]->sig2, dbSpace[dbId]->sigs[id]->sig3,
-			dbSpace[dbId]->sigs[id]->avgl, numres, sketch, colorOnly);
+	DiskSigStruct* sig = dbSpace[dbId]->getSig(id);
+	return queryImgDataFiltered(dbId, *sig, numres, sketch, 0, colorOnly);
 }
 
-std::vector<double> queryImgIDFiltered(const int dbId, long int id, int numres, bloom_filter* bf, bool colorOnly) {
+std::vector<double> queryImgIDFiltered(const int dbId, long int id, int numres, SlotBitmap* filter, bool colorOnly) {
 	/*query for images similar to the one that has this id
 	numres is the maximum number of results
+	Caller must hold dbSpaceLock and the lock of the db space for reading.
 	 */
 
-	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return std::vector<double>();};
-	return queryImgDataFiltered(dbId, dbSpace[dbId]->sigs[id]->sig1, dbSpace[dbId]->sigs[id]->sig2, dbSpace[dbId]->sigs[id]->sig3,
-			dbSpace[dbId]->sigs[id]->avgl, numres, 0, bf, colorOnly);
+	if (!validate_imgid(dbId, id)) {
+		cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl;
+		delete filter;
+		return std::vector<double>();
+	}
+	DiskSigStruct* sig = dbSpace[dbId]->getSig(id);
+	return queryImgDataFiltered(dbId, *sig, numres, 0, filter, colorOnly);
 }
 
 int removeID(const int dbId, long int id) {
 
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	WriteLocker spaceLocker(dbSpace[dbId]->lock);
+
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return 0;};
 
-	delete dbSpace[dbId]->sigs[id];
-	dbSpace[dbId]->sigs.erase(id);
-	// remove id from each bucket it could be in
-	for (int c = 0; c < 3; c++)
-		for (int pn = 0; pn < 2; pn++)
-			for (int i = 0; i < 16384; i++)
-				dbSpace[dbId]->imgbuckets[c][pn][i].remove(id);
+	LogRecord record(LOG_REMOVE_IDS, dbId);
+	record.putArray(&id, 1);
+	if (!logSync.append(record)) return 0;
+	dbSpaceStruct* space = dbSpace[dbId];
+	killSlot(space, space->idSlots.find(id));
 	return 1;
 }
 
-double calcAvglDiff(const int dbId, long int id1, long int id2) {
+long int removeIDs(const int dbId, std::vector<long int> ids) {
+	/* removes every image of ids found on the db space, under a single lock.
+	Returns the number of images removed.
+	 */
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	dbSpaceStruct* space = dbSpace[dbId];
+	WriteLocker spaceLocker(space->lock);
+
+	std::vector<sigSlot> slots;
+	for (size_t j = 0; j < ids.size(); j++) {
+		sigSlot slot = space->idSlots.find(ids[j]);
+		if (slot == NO_SLOT) {
+			cerr << "ERROR: image id (" << ids[j] << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl;
+			continue;
+		}
+		slots.push_back(slot);
+	}
+	// ids listed twice go once
+	std::sort(slots.begin(), slots.end());
+	slots.erase(std::unique(slots.begin(), slots.end()), slots.end());
+	if (slots.empty()) return 0;
+
+	std::vector<long int> removed(slots.size());
+	for (size_t j = 0; j < slots.size(); j++) removed[j] = space->sigs[slots[j]].id;
+
+	LogRecord record(LOG_REMOVE_IDS, dbId);
+	record.putArray(&removed[0], removed.size());
+	if (!logSync.append(record)) return 0;
+	for (size_t j = 0; j < slots.size(); j++) killSlot(space, slots[j]);
+	return removed.size();
+}
+
+/* A slot to take out of a bucket, see compactDbSpace */
+struct BucketSlot {
+	PostingList* bucket;
+	sigSlot slot;
+	bool operator< (const BucketSlot& right) const {
+		return bucket < right.bucket || (bucket == right.bucket && slot < right.slot);
+	}
+};
+
+long int compactDbSpace(const int dbId, long int maxSlots) {
+	/* takes up to maxSlots dead slots out of their buckets and frees them for
+	reuse, along with their signatures. Buckets shared by many of them are
+	rewritten once, and keywords changed since are merged back into the
+	arrays of the db space once there are many. The write lock is held for this step only, so callers
+	bound how long queries wait by calling it repeatedly with a small maxSlots.
+	Returns the number of dead slots left.
+	 */
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	dbSpaceStruct* space = dbSpace[dbId];
+	WriteLocker spaceLocker(space->lock);
+
+	std::vector<sigSlot>& dead = space->deadSlots;
+	size_t n = maxSlots > 0 && (size_t) maxSlots < dead.size() ? maxSlots : dead.size();
+	std::vector<sigSlot> slots(dead.end() - n, dead.end());
+	dead.resize(dead.size() - n);
+
+	// group the slots to take out by bucket
+	std::vector<BucketSlot> removals;
+	removals.reserve(slots.size() * 3 * NUM_COEFS);
+	PostingList* buckets[3 * NUM_COEFS];
+	for (size_t j = 0; j < slots.size(); j++) {
+		int n = sigBuckets(space, space->sigs[slots[j]], buckets);
+		for (int k = 0; k < n; k++) {
+			BucketSlot removal;
+			removal.bucket = buckets[k];
+			removal.slot = slots[j];
+			removals.push_back(removal);
+		}
+	}
+	std::sort(removals.begin(), removals.end());
+
+	std::vector<sigSlot> bucketSlots;
+	for (size_t first = 0, last; first < removals.size(); first = last) {
+		bucketSlots.clear();
+		for (last = first; last < removals.size() && removals[last].bucket == removals[first].bucket; last++) {
+			bucketSlots.push_back(removals[last].slot);
+		}
+		removals[first].bucket->removeAll(&bucketSlots[0], &bucketSlots[0] + bucketSlots.size());
+	}
 
-	sigMap sigs = dbSpace[dbId]->sigs;
+	for (size_t j = 0; j < slots.size(); j++) freeSlot(space, slots[j]);
+	// keywords changed at runtime pile up on the overflow map until merged
+	space->slotKeywords.compactIfOverflowing();
+	return dead.size();
+}
+
+long int getDeadCount(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
+	return space->deadSlots.size();
+}
+
+double avglDiff(DiskSigStruct* sig1, DiskSigStruct* sig2) {
+	return fabs((double) sig1->avgl[0] - sig2->avgl[0])
+	+ fabs((double) sig1->avgl[1] - sig2->avgl[1])
+	+ fabs((double) sig1->avgl[2] - sig2->avgl[2]);
+}
+
+double calcAvglDiff(const int dbId, long int id1, long int id2) {
 
 	/* return the average luminance difference */
 
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
 	// are images on db ?
 	if (!validate_imgid(dbId, id1)) { cerr << "ERROR: image id (" << id1 << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return 0;};
 	if (!validate_imgid(dbId, id2)) { cerr << "ERROR: image id (" << id2 << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return 0;};
 
-	return fabs(sigs[id1]->avgl[0] - sigs[id2]->avgl[0])
-	+ fabs(sigs[id1]->avgl[1] - sigs[id2]->avgl[1])
-	+ fabs(sigs[id1]->avgl[2] - sigs[id2]->avgl[2]);
+	return avglDiff(dbSpace[dbId]->getSig(id1), dbSpace[dbId]->getSig(id2));
 }
 
 double calcDiff(const int dbId, long int id1, long int id2)
@@ -1058,19 +2898,21 @@ double calcDiff(const int dbId, long int id1, long int id2)
 	/* use it to tell the content-based difference between two images
 	 */
 
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
 
-	if (!isImageOnDB(dbId,id1) ||
-			!isImageOnDB(dbId,id2)) {
+	DiskSigStruct* s1 = dbSpace[dbId]->getSig(id1);
+	DiskSigStruct* s2 = dbSpace[dbId]->getSig(id2);
+
+	if (!s1 || !s2) {
 		cerr << "ERROR: image ids not found" << endl;
 		return 0;
 	}
 
-	sigMap sigs = dbSpace[dbId]->sigs;
-
-	double diff = calcAvglDiff(dbId, id1, id2);
-	Idx *sig1[3] = { sigs[id1]->sig1, sigs[id1]->sig2, sigs[id1]->sig3 };
-	Idx *sig2[3] = { sigs[id2]->sig1, sigs[id2]->sig2, sigs[id2]->sig3 };
+	double diff = avglDiff(s1, s2);
+	const SigIdx *sig1[3] = { s1->sig1, s1->sig2, s1->sig3 };
+	const SigIdx *sig2[3] = { s2->sig1, s2->sig2, s2->sig3 };
 
 	for (int b = 0; b < NUM_COEFS; b++)
 		for (int c = 0; c < 3; c++)
@@ -1082,6 +2924,7 @@ double calcDiff(const int dbId, long int id1, long int id2)
 }
 
 int destroydb(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
 	throw string("not yet implemented");
 	return 1;
@@ -1089,187 +2932,304 @@ int destroydb(const int dbId) {
 
 int resetdb(const int dbId) {
 
-	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
-    // first deallocate db memory
-
-	// deallocate all buckets
-
-    for (int c = 0; c < 3; c++)
-        for (int pn = 0; pn < 2; pn++)
-            for (int i = 0; i < 16384; i++) {
-                if (dbSpace[dbId])
-                    dbSpace[dbId]->imgbuckets[c][pn][i].clear();
-            }
-
-    //delete sigs
-    for (sigIterator it = dbSpace[dbId]->sigs.begin(); it != dbSpace[dbId]->sigs.end(); it++) {
-        delete (*it).second;
-    }
+	LogSync logSync;
+	WriteLocker dbsLocker(dbSpaceLock);
+	bool cold = coldSpaces.count(dbId);
+	if (!cold && !validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
+	if (!logSync.append(LogRecord(LOG_RESET_DB, dbId))) return 0;
+
+	if (cold) {
+		// no need to load a db space to empty it
+		initDbSpace(dbId);
+	} else {
+		resetDbSpace(dbId);
+	}
+	return 1;
+}
 
-	//TODO must also clear other stuff, like ids filter
+int packPostings(const int dbId) {
 
-    dbSpace[dbId]->sigs.clear(); // this is making windows choke
-    // dbSpace[dbId]->sigs = sigMap();
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
 
-	//delete dbSpace[dbId];
- 	//dbSpace.erase(dbId);
+	dbSpaceStruct* space = dbSpace[dbId];
+	WriteLocker spaceLocker(space->lock);
+	for (int c = 0; c < 3; c++)
+		for (int pn = 0; pn < 2; pn++)
+			for (int i = 0; i < 16384; i++)
+				space->imgbuckets[c][pn][i].pack();
+	space->slotKeywords.compact();
+	return 1;
+}
 
- 	// finally the reset itself
-	dbSpace[dbId] = new dbSpaceStruct();
+long int getPostingsMemory(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
 
-	return 1;
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
+	long int total = 0;
+	for (int c = 0; c < 3; c++)
+		for (int pn = 0; pn < 2; pn++)
+			for (int i = 0; i < 16384; i++)
+				total += space->imgbuckets[c][pn][i].memoryUsage();
+	total += space->slotKeywords.memoryUsage();
+	for (std::map<int, SlotBitmap>::iterator it = space->kwdPostings.begin(); it != space->kwdPostings.end(); it++) {
+		total += it->second.memoryUsage();
+	}
+	return total;
 }
 
 long int getImgCount(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
-	return dbSpace[dbId]->sigs.size();
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+	return dbSpace[dbId]->idSlots.size();
 }
 
 bloom_filter* getIdsBloomFilter(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
 	return dbSpace[dbId]->imgIdsFilter;
 }
 
 std::vector<int> getDBList() {
+	/* db spaces loaded or not */
 	vector<int> ids;
+	ReadLocker dbsLocker(dbSpaceLock);
 	for (dpspaceIterator it = dbSpace.begin(); it != dbSpace.end(); it++) {
 		ids.push_back((*it).first);
 	}
+	for (std::map<int, std::string>::iterator it = coldSpaces.begin(); it != coldSpaces.end(); it++) {
+		ids.push_back(it->first);
+	}
+	std::sort(ids.begin(), ids.end());
 	return ids;
 }
 
 std::vector<long int> getImgIdList(const int dbId) {
 	vector<long int> ids;
 
-	// TODO is there a faster way for getting a maps key list and returning a vector from it ?
-	for (sigIterator it = dbSpace[dbId]->sigs.begin(); it != dbSpace[dbId]->sigs.end(); it++) {
-		ids.push_back((*it).first);
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return ids;}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
+	dbSpaceStruct* space = dbSpace[dbId];
+	ids.reserve(space->idSlots.size());
+	for (sigSlot slot = 0; slot < space->slotCount(); slot++) {
+		if (space->liveSlots[slot]) ids.push_back(space->sigs[slot].id);
 	}
+	std::sort(ids.begin(), ids.end());
 
 	return ids;
 }
 
 bool isValidDB(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	return dbSpace.count(dbId) || coldSpaces.count(dbId);
+}
+
+bool isLoadedDB(const int dbId) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	return dbSpace.count(dbId);
 }
 
 bool removedb(const int dbId) {
-	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return false;}
-
-	if (resetdb(dbId)) {
-		dbSpace.erase(dbId);
+	LogSync logSync;
+	WriteLocker dbsLocker(dbSpaceLock);
+	bool cold = coldSpaces.count(dbId);
+	if (!cold && !validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return false;}
+	if (!logSync.append(LogRecord(LOG_REMOVE_DB, dbId))) return false;
+
+	if (cold) {
+		coldSpaces.erase(dbId);
 		return 1;
 	}
-	return 0;
+	delete dbSpace[dbId];
+	dbSpace.erase(dbId);
+	return 1;
 }
 
-// return structure containing filter with all image ids that have this keyword
-keywordStruct* getKwdPostings(int hash) {
-	keywordStruct* nks;
-	if (!globalKwdsMap.count(hash)) { // never seen this keyword, create new postings list
-		nks = new keywordStruct();
-		globalKwdsMap[hash] = nks;
-	} else { // already know about it just fetch then
-		nks = globalKwdsMap[hash];
+/* New bitmap of the slots of the db space having all (kwJoinType set) or
+any of the given keywords. keywords must not be empty. Caller deletes it.
+Caller must hold the lock of the db space for reading.
+ */
+SlotBitmap* keywordsBitmap(dbSpaceStruct* space, int kwJoinType, int_vector& keywords) {
+	SlotBitmap* res = 0;
+	for (intVectorIterator it = keywords.begin(); it != keywords.end(); it++) {
+		std::map<int, SlotBitmap>::iterator postings = space->kwdPostings.find(*it);
+		if (postings == space->kwdPostings.end()) {
+			// nobody has this keyword
+			if (kwJoinType) {
+				delete res;
+				return new SlotBitmap();
+			}
+			continue;
+		}
+		if (!res) {
+			res = new SlotBitmap(postings->second);
+		} else if (kwJoinType) { // and'd
+			(*res) &= postings->second;
+		} else { // or'd
+			(*res) |= postings->second;
+		}
 	}
-	return nks;
+	return res ? res : new SlotBitmap();
 }
 
 // keywords in images
 bool addKeywordImg(const int dbId, const int id, const int hash) {
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return false;}
+	WriteLocker spaceLocker(dbSpace[dbId]->lock);
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return false;};
 
-	// populate keyword postings
-	getKwdPostings(hash)->imgIdsFilter->insert(id);
+	LogRecord record(LOG_ADD_KEYWORDS, dbId);
+	record.put<long int>(id);
+	record.putArray(&hash, 1);
+	if (!logSync.append(record)) return false;
+	dbSpace[dbId]->changes++;
 
-	// populate image kwds
-	return dbSpace[dbId]->sigs[id]->keywords.insert(hash).second;
+	// populate image kwds and keyword postings
+	return addSlotKeyword(dbSpace[dbId], dbSpace[dbId]->idSlots.find(id), hash);
 }
 
 bool addKeywordsImg(const int dbId, const int id, int_vector hashes){
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return false;}
+	WriteLocker spaceLocker(dbSpace[dbId]->lock);
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return false;};
 
-	// populate keyword postings
+	LogRecord record(LOG_ADD_KEYWORDS, dbId);
+	record.put<long int>(id);
+	record.putArray(hashes.size() ? &hashes[0] : (int*) 0, hashes.size());
+	if (!logSync.append(record)) return false;
+	dbSpace[dbId]->changes++;
+
+	// populate image kwds and keyword postings
+	sigSlot slot = dbSpace[dbId]->idSlots.find(id);
 	for (intVectorIterator it = hashes.begin(); it != hashes.end(); it++) {
-		getKwdPostings(*it)->imgIdsFilter->insert(id);
+		addSlotKeyword(dbSpace[dbId], slot, *it);
 	}
-
-	// populate image kwds
-	int_hashset& imgKwds = dbSpace[dbId]->sigs[id]->keywords;
-	imgKwds.insert(hashes.begin(),hashes.end());
 	return true;
 }
 
 bool removeKeywordImg(const int dbId, const int id, const int hash){
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return false;}
+	WriteLocker spaceLocker(dbSpace[dbId]->lock);
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return false;};
 
-	//TODO remove from kwd postings, maybe creating an API method for regenerating kwdpostings filters or
-	// calling it internally after a number of kwd removes
-	return dbSpace[dbId]->sigs[id]->keywords.erase(hash);
+	dbSpaceStruct* space = dbSpace[dbId];
+	sigSlot slot = space->idSlots.find(id);
+	if (!space->slotKeywords.contains(slot, hash)) return false;
+
+	LogRecord record(LOG_REMOVE_KEYWORD, dbId);
+	record.put<long int>(id);
+	record.put(hash);
+	if (!logSync.append(record)) return false;
+	removeSlotKeyword(space, slot, hash);
+	space->changes++;
+	return true;
 }
 
 bool removeAllKeywordImg(const int dbId, const int id){
+	LogSync logSync;
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return false;}
+	WriteLocker spaceLocker(dbSpace[dbId]->lock);
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return false;};
-	//TODO remove from kwd postings
-	dbSpace[dbId]->sigs[id]->keywords.clear();
+
+	LogRecord record(LOG_REMOVE_ALL_KEYWORDS, dbId);
+	record.put<long int>(id);
+	if (!logSync.append(record)) return false;
+	removeSlotKeywords(dbSpace[dbId], dbSpace[dbId]->idSlots.find(id));
+	dbSpace[dbId]->changes++;
 	return true;
 }
 
 std::vector<int> getKeywordsImg(const int dbId, const int id){
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<int>();}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
 	if (!validate_imgid(dbId, id)) { cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ; return std::vector<int>();};
-	int_hashset& imgKwds = dbSpace[dbId]->sigs[id]->keywords;
 	int_vector ret;
-	ret.insert(ret.end(),imgKwds.begin(),imgKwds.end());
+	dbSpace[dbId]->slotKeywords.get(dbSpace[dbId]->idSlots.find(id), ret);
 	return ret;
 }
 
-std::vector<int> mostPopularKeywords(const int dbId, std::vector<long int> imgs, std::vector<int> excludedKwds, int count, int mode) {
-
-	kwdFreqMap freqMap = kwdFreqMap();
-
-	for (longintVectorIterator it = imgs.begin(); it != imgs.end(); it++) {
-		int_hashset imgKwds = dbSpace[dbId]->sigs[*it]->keywords;
+// most frequent first, then lowest keyword id
+static bool moreFrequent(const kwdFrequency& a, const kwdFrequency& b) {
+	return a.second != b.second ? a.second > b.second : a.first < b.first;
+}
 
-		for (int_hashset::iterator itkw = imgKwds.begin(); itkw != imgKwds.end(); itkw++) {
-			if (freqMap.count(*itkw) == 0) {
-				freqMap[*itkw] = 1;
-			} else {
-				freqMap[*itkw]++;
-			}
-		}
+/* The count most frequent of freqs as keyword, frequency, ..., most frequent first */
+static std::vector<int> topKeywords(std::vector<kwdFrequency>& freqs, int count) {
+	size_t n = min<size_t>(max(count, 0), freqs.size());
+	std::partial_sort(freqs.begin(), freqs.begin() + n, freqs.end(), moreFrequent);
+	std::vector<int> res;
+	res.reserve(2 * n);
+	for (size_t k = 0; k < n; k++) {
+		res.push_back(freqs[k].first);
+		res.push_back((int) freqs[k].second);
 	}
+	return res;
+}
 
-	kwdFreqPriorityQueue pqKwds;
-
-	int_hashset setExcludedKwds = int_hashset();
-
-	for (intVectorIterator uit = excludedKwds.begin(); uit != excludedKwds.end(); uit++) {
-		setExcludedKwds.insert(*uit);
-	}
+std::vector<int> mostPopularKeywords(const int dbId, std::vector<long int> imgs, std::vector<int> excludedKwds, int count, int mode) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<int>();}
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
 
-	for (kwdFreqMap::iterator it = freqMap.begin(); it != freqMap.end(); it++) {
-		int id = it->first;
-		long int freq = it->second;
-		if (setExcludedKwds.count(id) > 0) continue; // skip excluded kwds
-		pqKwds.push(KwdFrequencyStruct(id,freq));
+	// images of each keyword, then only the top ones get sorted
+	kwdCountMap counts;
+	int_vector kwds;
+	for (longintVectorIterator it = imgs.begin(); it != imgs.end(); it++) {
+		sigSlot slot = space->idSlots.find(*it);
+		if (slot == NO_SLOT) continue;
+		kwds.clear();
+		space->slotKeywords.get(slot, kwds);
+		for (size_t k = 0; k < kwds.size(); k++) counts[kwds[k]]++;
 	}
+	for (size_t k = 0; k < excludedKwds.size(); k++) counts.erase(excludedKwds[k]);
 
-	int_vector res = int_vector();
+	std::vector<kwdFrequency> freqs(counts.begin(), counts.end());
+	return topKeywords(freqs, count);
+}
 
-	while (count >0 && !pqKwds.empty()) {
-		KwdFrequencyStruct kf = pqKwds.top();
-		pqKwds.pop();
-		res.push_back(kf.kwdId);
-		res.push_back((const int)kf.freq);
-		count--;
+// collects the image ids of the slots of a keywords bitmap, up to limit
+struct SlotIdCollector {
+	dbSpaceStruct* space;
+	std::vector<long int>& ids;
+	size_t limit;
+	SlotIdCollector(dbSpaceStruct* space, std::vector<long int>& ids, size_t limit): space(space), ids(ids), limit(limit) {}
+	void operator()(const sigSlot slot) {
+		if (ids.size() < limit) ids.push_back(space->sigs[slot].id);
 	}
-
-	return res;
-}
+};
+
+// collects (image id, 0) pairs to pick random results from, while there are no more than limit values
+struct RandomCandidateCollector {
+	dbSpaceStruct* space;
+	std::vector<double>& V;
+	size_t limit;
+	RandomCandidateCollector(dbSpaceStruct* space, std::vector<double>& V, size_t limit): space(space), V(V), limit(limit) {}
+	void operator()(const sigSlot slot) {
+		if (V.size() > limit) return;
+		V.push_back(space->sigs[slot].id);
+		V.push_back(0);
+	}
+};
 
 // query by keywords
 std::vector<double> queryImgIDKeywords(const int dbId, long int id, int numres, int kwJoinType, int_vector keywords, bool colorOnly){
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<double>();}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
 
 	if ((id != 0) && !validate_imgid(dbId, id)) { // not search random and image doesnt exist
 		cerr << "ERROR: image id (" << id << ") not found on given dbid (" << dbId << ") or dbid not existant" << endl ;
@@ -1282,32 +3242,15 @@ std::vector<double> queryImgIDKeywords(const int dbId, long int id, int numres,
 	} 
 
 	// populate filter
-	intVectorIterator it = keywords.begin();
-	bloom_filter* bf = 0;
-
-    // OR or AND each kwd postings filter to get final filter
-    // start with the first one
-    bf = new bloom_filter(*(getKwdPostings(*it)->imgIdsFilter));
-    it++;
-    for (; it != keywords.end(); it++) { // iterate the rest
-        if (kwJoinType) { // and'd
-            (*bf) &= *(getKwdPostings(*it)->imgIdsFilter);
-        } else { // or'd
-            (*bf) |= *(getKwdPostings(*it)->imgIdsFilter);
-        }
-    }
+	dbSpaceStruct* space = dbSpace[dbId];
+	SlotBitmap* filter = keywordsBitmap(space, kwJoinType, keywords);
 
 	if (id == 0) { // random images with these kwds
 
 		vector<double> V; // select all images with the desired keywords
-		for (sigIterator sit = dbSpace[dbId]->sigs.begin(); sit != dbSpace[dbId]->sigs.end(); sit++) {
-			if (V.size() > 20*numres) break;
-
-			if ((bf == 0) || (bf->contains((*sit).first))) { // image has desired keyword or we're querying random
-				V.insert(V.end(), (*sit).first);
-				V.insert(V.end(), 0);
-			}
-		}
+		RandomCandidateCollector collector(space, V, 20*numres);
+		filter->forEach(collector);
+		delete filter;
 
 		vector<double> Vres;
 
@@ -1324,12 +3267,14 @@ std::vector<double> queryImgIDKeywords(const int dbId, long int id, int numres,
 
 		return Vres;
 	}
-	return queryImgIDFiltered(dbId, id, numres, bf, colorOnly);
+	return queryImgIDFiltered(dbId, id, numres, filter, colorOnly);
 
 }
 
 std::vector<long int> getAllImgsByKeywords(const int dbId, const int numres, int kwJoinType, std::vector<int> keywords){
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<long int>();}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
 
 	std::vector<long int> res; // holds result of img lists
 
@@ -1339,47 +3284,121 @@ std::vector<long int> getAllImgsByKeywords(const int dbId, const int numres, int
 	}
 
 	// populate filter
-	intVectorIterator it = keywords.begin();
-
-	// OR or AND each kwd postings filter to get final filter
-	// start with the first one
-	bloom_filter* bf = new bloom_filter(*(getKwdPostings(*it)->imgIdsFilter));
-	it++;
-	for (; it != keywords.end(); it++) { // iterate the rest
-		if (kwJoinType) { // and'd
-			(*bf) &= *(getKwdPostings(*it)->imgIdsFilter);
-		} else { // or'd
-			(*bf) |= *(getKwdPostings(*it)->imgIdsFilter);
+	dbSpaceStruct* space = dbSpace[dbId];
+	SlotBitmap* filter = keywordsBitmap(space, kwJoinType, keywords);
+
+	SlotIdCollector collector(space, res, numres);
+	filter->forEach(collector);
+	delete filter;
+	return res;
+}
+
+/* Moves slot to the lowest slot from it on having all (kwJoinType set) or any
+of postings. Returns false if there is none.
+ */
+static bool nextKeywordsSlot(std::vector<const SlotBitmap*>& postings, int kwJoinType, sigSlot& slot) {
+	if (!kwJoinType) { // or'd: the lowest next slot of any
+		bool found = false;
+		sigSlot lowest = 0;
+		for (size_t k = 0; k < postings.size(); k++) {
+			sigSlot next = slot;
+			if (!postings[k]->next(next) || (found && next >= lowest)) continue;
+			lowest = next;
+			found = true;
+		}
+		if (found) slot = lowest;
+		return found;
+	}
+	// and'd: each one in turn moves slot to its next one, until all of them have it
+	for (size_t k = 0, agreed = 0; agreed < postings.size(); k = (k + 1) % postings.size()) {
+		sigSlot next = slot;
+		if (!postings[k]->next(next)) return false;
+		if (next == slot) {
+			agreed++;
+		} else {
+			slot = next;
+			agreed = 1;
+		}
+	}
+	return true;
+}
+
+/* Up to limit ids of the images having all (kwJoinType set) or any of the
+keywords, in slot order from slot cursor on, then the cursor of the next page,
+0 after the last one. 0 starts from the first image. Each image is looked up
+in the keyword postings, so a page costs as much as its images, wherever it
+starts.
+ */
+std::vector<long int> getImgsByKeywordsPage(const int dbId, int kwJoinType, std::vector<int> keywords, long int cursor, const int limit) {
+	ReadLocker dbsLocker(dbSpaceLock);
+	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<long int>();}
+	ReadLocker spaceLocker(dbSpace[dbId]->lock);
+
+	if (keywords.size() < 1) {
+		cerr << "ERROR: keywords list must have at least one hash" << endl;
+		return std::vector<long int>();
+	}
+	if (limit < 1 || cursor < 0) return std::vector<long int>();
+
+	dbSpaceStruct* space = dbSpace[dbId];
+	std::vector<const SlotBitmap*> postings;
+	for (intVectorIterator it = keywords.begin(); it != keywords.end(); it++) {
+		std::map<int, SlotBitmap>::iterator found = space->kwdPostings.find(*it);
+		if (found != space->kwdPostings.end()) {
+			postings.push_back(&found->second);
+		} else if (kwJoinType) { // nobody has this keyword
+			postings.clear();
+			break;
 		}
 	}
 
-	for (sigIterator sit = dbSpace[dbId]->sigs.begin(); sit != dbSpace[dbId]->sigs.end(); sit++) {
-		if (bf->contains((*sit).first)) res.push_back((*sit).first);
-		if 	(res.size() >= numres) break; // ok, got enough
+	std::vector<long int> res;
+	sigSlot slot = (sigSlot) cursor;
+	bool more = cursor < (long int) space->sigs.size() && postings.size() && nextKeywordsSlot(postings, kwJoinType, slot);
+	while (more && res.size() < (size_t) limit) {
+		res.push_back(space->sigs[slot].id);
+		slot++;
+		more = nextKeywordsSlot(postings, kwJoinType, slot);
 	}
-	delete bf;
+	res.push_back(more ? slot : 0);
 	return res;
 }
+
 double getKeywordsVisualDistance(const int dbId, int distanceType, std::vector<int> keywords){
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return 0;}
 
 	throw string("not yet implemented");
 }
 
 // keywords
+/* The numres keywords most images of the db space have, as keyword,
+frequency, ..., most frequent first. The postings of a keyword keep count of
+its images, so this reads no image.
+ */
 std::vector<int> getKeywordsPopular(const int dbId, const int numres) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<int>();}
+	dbSpaceStruct* space = dbSpace[dbId];
+	ReadLocker spaceLocker(space->lock);
 
-	throw string("not yet implemented");
+	std::vector<kwdFrequency> freqs;
+	freqs.reserve(space->kwdPostings.size());
+	for (std::map<int, SlotBitmap>::iterator it = space->kwdPostings.begin(); it != space->kwdPostings.end(); it++) {
+		freqs.push_back(kwdFrequency(it->first, it->second.size()));
+	}
+	return topKeywords(freqs, numres);
 }
 
 // clustering
 
 std::vector<clustersStruct> getClusterDb(const int dbId, const int numClusters) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<clustersStruct>();}
 	throw string("not yet implemented");
 }
 std::vector<clustersStruct> getClusterKeywords(const int dbId, const int numClusters,std::vector<int> keywords) {
+	ReadLocker dbsLocker(dbSpaceLock);
 	if (!validate_dbid(dbId)) { cerr << "ERROR: database space not found (" << dbId << ")" << endl; return std::vector<clustersStruct>();}
 	throw string("not yet implemented");
 }
@@ -32,7 +32,13 @@
 #include <string.h>
 #include <time.h>
 
+#include "bitmap.h"
 #include "haar.h"
+#include "keywords.h"
+#include "mapped.h"
+#include "postings.h"
+#include "rwlock.h"
+#include "avgl.h"
 
 // Weights for the Haar coefficients.
 // Straight from the referenced paper:
@@ -58,14 +64,19 @@ const float weights[2][6][3]={
 
 // STL includes
 
+#include <algorithm>
 #include <map>
 #include <queue>
 #include <list>
+#include <string>
+#include <vector>
 
 #ifdef LinuxBuild
     #include <ext/hash_set>
+    #include <ext/hash_map>
 #else
     #include <hash_set>
+    #include <hash_map>
 #endif
 
 // Global typedefs
@@ -82,22 +93,32 @@ typedef imageId_list::iterator imageId_listIterator;
 #ifdef LinuxBuild
     using namespace __gnu_cxx;
     typedef __gnu_cxx::hash_set<int> int_hashset;
+    typedef __gnu_cxx::hash_set<sigSlot> sigSlot_hashset;
+    typedef __gnu_cxx::hash_map<long int, sigSlot> sigSlotMap;
+    typedef __gnu_cxx::hash_map<int, long int> kwdCountMap;
 #else
     using namespace stdext;
     typedef stdext::hash_set<int> int_hashset;
+    typedef stdext::hash_set<sigSlot> sigSlot_hashset;
+    typedef stdext::hash_map<long int, sigSlot> sigSlotMap;
+    typedef stdext::hash_map<int, long int> kwdCountMap;
 #endif
 
 class SigStruct;
 
-/* persisted signature structure */
+/* Coefficient position as kept on signatures. Positions are below 128*128
+   in magnitude, so they fit in 16 bits */
+typedef short SigIdx;
+
+/* persisted signature structure (SRZ_V0_12_0 on), 272 bytes */
 class DiskSigStruct {
 public:
 
 	imageId id;			/* picture id */
-	Idx sig1[NUM_COEFS];		/* Y positions with largest magnitude */
-	Idx sig2[NUM_COEFS];		/* I positions with largest magnitude */
-	Idx sig3[NUM_COEFS];		/* Q positions with largest magnitude */
-	double avgl[3];		/* YIQ for position [0,0] */
+	SigIdx sig1[NUM_COEFS];		/* Y positions with largest magnitude */
+	SigIdx sig2[NUM_COEFS];		/* I positions with largest magnitude */
+	SigIdx sig3[NUM_COEFS];		/* Q positions with largest magnitude */
+	float avgl[3];		/* YIQ for position [0,0], single precision is plenty for ranking */
 	/* image properties extracted when opened for the first time */
 	int width;			/* in pixels */
 	int height;			/* in pixels */
@@ -107,6 +128,17 @@ public:
 	{
 
 	}
+
+	/* Sets the coefficients and average luminance from full width ones, as
+	   calcHaar() and queries give them */
+	void setCoefs(const Idx* s1, const Idx* s2, const Idx* s3, const double* a) {
+		for (int i = 0; i < NUM_COEFS; i++) {
+			sig1[i] = s1[i];
+			sig2[i] = s2[i];
+			sig3[i] = s3[i];
+		}
+		for (int c = 0; c < 3; c++) avgl[c] = a[c];
+	}
 };
 
 /* older versions of it signature structure */
@@ -126,12 +158,20 @@ typedef struct sigStructV06_{
 	}
 } sigStructV06;
 
-/* in memory signature structure */
+typedef struct sigStructV011_{
+	imageId id;			/* picture id */
+	Idx sig1[NUM_COEFS];		/* Y positions with largest magnitude */
+	Idx sig2[NUM_COEFS];		/* I positions with largest magnitude */
+	Idx sig3[NUM_COEFS];		/* Q positions with largest magnitude */
+	double avgl[3];		/* YIQ for position [0,0] */
+	/* image properties extracted when opened for the first time */
+	int width;			/* in pixels */
+	int height;			/* in pixels */
+} sigStructV011;
+
+/* in memory signature structure. Keywords are kept apart, see KeywordStore */
 class SigStruct: public DiskSigStruct {
 public:
-	double score;			/* used when doing queries */
-	int_hashset keywords;
-
 	SigStruct(DiskSigStruct* ds) {
 		id = ds->id;
 
@@ -148,58 +188,40 @@ public:
 	SigStruct(sigStructV06* ds) {
 		id = ds->id;
 
-		memcpy(sig1,ds->sig1,sizeof(sig1));
-		memcpy(sig2,ds->sig2,sizeof(sig2));
-		memcpy(sig3,ds->sig3,sizeof(sig3));
-		memcpy(avgl,ds->avgl,sizeof(avgl));
+		setCoefs(ds->sig1, ds->sig2, ds->sig3, ds->avgl);
 
 		width=ds->width;
 		height=ds->height;
 
 	}
 
+	SigStruct(sigStructV011* ds) {
+		id = ds->id;
 
-	SigStruct() {
-	}
+		setCoefs(ds->sig1, ds->sig2, ds->sig3, ds->avgl);
 
-	~SigStruct()
-	{
-	}
+		width=ds->width;
+		height=ds->height;
 
-	bool operator< (const SigStruct & right) const {
-		return score < (right.score);
 	}
 
-};
 
-struct cmpf
-{
-	bool operator()(const long int s1, const long int s2) const
-	{
-		return s1<s2;
+	SigStruct() {
 	}
-};
 
-// used for calculating most popular keywords
-class KwdFrequencyStruct {
-public:
-	int kwdId;
-	long int freq;	
-
-	KwdFrequencyStruct(int kwdId, long int freq): kwdId(kwdId),freq(freq) {}
-
-	bool operator< (const KwdFrequencyStruct & right) const {
-		return freq > (right.freq);
+	~SigStruct()
+	{
 	}
+
 };
 
+// used for calculating most popular keywords
 // typedefs
-typedef std::map<const long int, SigStruct*, cmpf>::iterator sigIterator;
-typedef std::priority_queue < SigStruct > sigPriorityQueue;
-typedef std::priority_queue < KwdFrequencyStruct > kwdFreqPriorityQueue;
+typedef MappedVector<DiskSigStruct> sigVector;
+typedef sigSlotMap::iterator sigSlotMapIterator;
+typedef std::pair<double, sigSlot> slotScore;	/* query score of a signature slot */
 typedef long int (*long_array3)[1][1];
-typedef std::map<const long int, SigStruct*, cmpf> sigMap;
-typedef std::map<const int, long int> kwdFreqMap;
+typedef std::pair<int, long int> kwdFrequency;	/* keyword id and how many images have it */
 typedef std::vector<double> double_vector;
 typedef std::vector<int> int_vector;
 typedef int_vector::iterator intVectorIterator;
@@ -215,15 +237,163 @@ typedef struct srzMetaDataStruct_{
 	int compilePlat;
 } srzMetaDataStruct;
 
+/* Entry of the image id index of a mapped index file */
+struct IdSlot {
+	imageId id;
+	sigSlot slot;
+	sigSlot unused;		/* 0, so the file has no padding bytes */
+	bool operator< (const IdSlot& right) const {
+		return id < right.id;
+	}
+};
+
+/* Layout of a db space on a mapped index file (SRZ_V0_12_0). Every array is
+   used in place, see MappedVector. Offsets are in bytes from the start of the
+   db space, which is page aligned on the file. SRZ_V0_11_0 files hold
+   sigStructV011s and doubles instead, converted when loaded.
+ */
+struct MappedSpaceHeader {
+	long int dbId;
+	unsigned long count;		/* signatures, on slots 0 to count-1 */
+	unsigned long length;		/* bytes of the db space, this header included */
+	unsigned long sigs;		/* count DiskSigStructs, by slot */
+	unsigned long avgl[3];		/* count floats each, see dbSpaceStruct::avglCols */
+	unsigned long bucketStarts;	/* 3*2*16384+1 unsigned longs: where each bucket starts on bucketSlots */
+	unsigned long bucketSlots;	/* sigSlots of every bucket, each sorted */
+	unsigned long ids;		/* count IdSlots, sorted by image id */
+	unsigned long keywordStarts;	/* count+1 unsigned longs: where the keywords of each slot start on keywords */
+	unsigned long keywords;		/* ints */
+	unsigned long idsFilter;	/* bytes of the bit table of dbSpaceStruct::imgIdsFilter */
+	unsigned long idsFilterBytes;
+};
+
+/* slot of an image id not on a db space */
+#define NO_SLOT ((sigSlot) -1)
+
+/* Image id -> slot of a db space.
+
+   The ids of a mapped index file are looked up in place, on its sorted id
+   array. Changes since go to a hash map on top of it, where a removed id of
+   the array maps to NO_SLOT.
+ */
+class IdIndex {
+public:
+	IdIndex(): mapped(0), mappedCount(0), live(0) {}
+
+	sigSlot find(const imageId id) const {
+		sigSlotMap::const_iterator it = overlay.find(id);
+		if (it != overlay.end()) return it->second;
+		return findMapped(id);
+	}
+
+	size_t count(const imageId id) const {
+		return find(id) != NO_SLOT;
+	}
+
+	size_t size() const {
+		return live;
+	}
+
+	void set(const imageId id, const sigSlot slot) {
+		if (find(id) == NO_SLOT) live++;
+		overlay[id] = slot;
+	}
+
+	void erase(const imageId id) {
+		if (find(id) == NO_SLOT) return;
+		live--;
+		if (findMapped(id) != NO_SLOT) overlay[id] = NO_SLOT;
+		else overlay.erase(id);
+	}
+
+	/* Uses the n sorted entries at ids as the index, in place */
+	void borrow(const IdSlot* ids, size_t n) {
+		overlay.clear();
+		mapped = ids;
+		mappedCount = n;
+		live = n;
+	}
+
+private:
+	sigSlot findMapped(const imageId id) const {
+		IdSlot key;
+		key.id = id;
+		const IdSlot* it = std::lower_bound(mapped, mapped + mappedCount, key);
+		if (it == mapped + mappedCount || it->id != id) return NO_SLOT;
+		return it->slot;
+	}
+
+	const IdSlot* mapped;
+	size_t mappedCount;
+	sigSlotMap overlay;
+	size_t live;
+};
+
 /* Bloom filter globals */
 #define random_bloom_seed  0
 
+/* Best query results seen so far: the numres lowest scored slots, kept as a
+   max-heap so the worst of them is in front and is the one a better
+   candidate replaces. Storage is reserved once, so offering a candidate
+   never allocates.
+ */
+class ResultHeap {
+public:
+	ResultHeap(): limit(0) {}
+
+	/* numres < 0 keeps every result. maxCandidates only sizes the storage */
+	void reset(int numres, size_t maxCandidates) {
+		limit = numres < 0 ? (size_t) -1 : (size_t) numres;
+		heap.clear();
+		heap.reserve(limit < maxCandidates ? limit : maxCandidates);
+	}
+
+	void offer(const double score, const sigSlot slot) {
+		if (heap.size() < limit) {
+			heap.push_back(slotScore(score, slot));
+			std::push_heap(heap.begin(), heap.end());
+		} else if (limit && score < heap.front().first) { // better than the worst kept
+			std::pop_heap(heap.begin(), heap.end());
+			heap.back() = slotScore(score, slot);
+			std::push_heap(heap.begin(), heap.end());
+		}
+	}
+
+	/* Sorts the results, best first. Offering more afterwards is not allowed */
+	std::vector<slotScore>& sorted() {
+		std::sort_heap(heap.begin(), heap.end());
+		return heap;
+	}
+
+	std::vector<slotScore> heap;
+
+private:
+	size_t limit;
+};
+
+/* queries on db spaces with fewer slots per thread than this run on a single thread */
+#define MIN_SLOTS_PER_QUERY_PART 65536
+
+/* filtered queries with fewer candidates per thread than this run on a single thread */
+#define MIN_CANDIDATES_PER_QUERY_PART 4096
+
+/* a candidate of a filtered query scored on its own costs about as much as
+this many slots or postings visited walking the buckets of the query, see
+queryImgDataFiltered */
+#define CANDIDATE_SCORE_COST 200
+
+/* queries of a batch scored together. A slot gets a row of this many scores */
+#define BATCH_WIDTH 16
+
 /* signature structure */
 #define AVG_IMGS_PER_DBSPACE 20000 // just a guess
 
+/* A serial number never returned before */
+unsigned long nextSpaceSerial();
+
 class dbSpaceStruct {
 public:
-	dbSpaceStruct() {
+	dbSpaceStruct(): changes(0), serial(nextSpaceSerial()) {
 		imgIdsFilter = new bloom_filter(AVG_IMGS_PER_DBSPACE, 1.0/(100.0 * AVG_IMGS_PER_DBSPACE),random_bloom_seed);
 	}
 
@@ -232,14 +402,74 @@ public:
 		delete imgIdsFilter;
 	}
 
-	sigMap sigs;
+	/* Index file the arrays below may be borrowed from, see loadMappedSpace() */
+	MappedFile mapping;
 
-	/* Lists of picture ids, indexed by [color-channel][sign][position], i.e.,
+	/* Dense signature store. A signature keeps its slot for as long as it is
+	   in the db space, so postings and query score buffers address it by slot.
+	   Removals only mark the slot dead: it stays on its buckets, skipped by
+	   scoring, until compactDbSpace() takes it out of them and frees it for
+	   reuse by later adds.
+	 */
+	sigVector sigs;
+	std::vector<bool> liveSlots;	/* slot currently holds a signature */
+	std::vector<sigSlot> deadSlots;	/* removed, but still on their buckets */
+	std::vector<sigSlot> freeSlots;
+	IdIndex idSlots;		/* image id -> slot */
+	KeywordStore slotKeywords;	/* keywords by slot */
+	/* Live slots having each keyword, built from slotKeywords when loaded.
+	   Keywords nobody has aren't on it */
+	std::map<int, SlotBitmap> kwdPostings;
+
+	/* Average luminance of the signatures, one column per YIQ channel and
+	   indexed by slot, so the avgl scoring pass streams through memory (see
+	   slotAvglDistances()). Free slots hold 0.
+	 */
+	MappedVector<float> avglCols[3];
+
+	/* Posting lists of signature slots, indexed by [color-channel][sign][position], i.e.,
 	   R=0/G=1/B=2, pos=0/neg=1, (i*NUM_PIXELS+j)
 	 */
-	imageId_list imgbuckets[3][2][16384];
+	PostingList imgbuckets[3][2][16384];
 	bloom_filter* imgIdsFilter;
-	//std::vector<long int> imgIds;	/* img list */
+
+	/* Queries hold it for reading, anything changing sigs, buckets or
+	   keywords of the db space holds it for writing
+	 */
+	RWLock lock;
+
+	/* Images added or removed and keyword changes since the db space was
+	   last saved on its own file, see checkpointdbs() */
+	unsigned long changes;
+
+	/* Tells db spaces apart over time: one reset, removed and created again
+	   or loaded again from its file gets a new serial */
+	const unsigned long serial;
+
+	// returns signature of image id or NULL if it is not on this db space
+	DiskSigStruct* getSig(const long int id) {
+		sigSlot slot = idSlots.find(id);
+		if (slot == NO_SLOT) return 0;
+		return &sigs[slot];
+	}
+
+	/* dists[i] = distance of the average luminance of slot lo+i to avgl, for
+	   n slots, see avglDistances() */
+	void slotAvglDistances(sigSlot lo, size_t n, const double* avgl, const float* w, double* dists) {
+		while (n) {
+			size_t run = avglCols[0].contiguous(lo);
+			if (run > n) run = n;
+			avglDistances(&avglCols[0][lo], &avglCols[1][lo], &avglCols[2][lo], avgl, w, dists, run);
+			lo += run;
+			dists += run;
+			n -= run;
+		}
+	}
+
+	// number of slots, including free ones. Per-query buffers are sized by it
+	sigSlot slotCount() {
+		return sigs.size();
+	}
 } ;
 
 
@@ -253,7 +483,9 @@ typedef std::map<const int, dbSpaceStruct*>::iterator  dpspaceIterator;
 #define	SRZ_V0_5_1				1
 #define	SRZ_V0_6_0				2
 #define	SRZ_V0_7_0				3
-#define	SRZ_CUR_VERSION			3
+#define	SRZ_V0_11_0				4	/* mapped index file */
+#define	SRZ_V0_12_0				5	/* 16 bit coefficients, single precision avgl */
+#define	SRZ_CUR_VERSION			5
 #define	SRZ_SINGLE_DBSPACE		1
 #define	SRZ_MULTIPLE_DBSPACE	2
 #define	SRZ_TRIAL_VERSION		1
@@ -270,16 +502,43 @@ typedef std::map<const int, dbSpaceStruct*>::iterator  dpspaceIterator;
 double_vector queryImgID(const int dbId, long int id,int numres,int sketch, bool colorOnly);
 double_vector queryImgBlob(const int dbId, const char* data,const long length, int numres,int sketch, bool colorOnly);
 double_vector queryImgPath(const int dbId, char* path,int numres,int sketch, bool colorOnly);
+double_vector queryImgIDsBatch(const int dbId, std::vector<long int> ids, int numres, int sketch, bool colorOnly);
+double_vector queryImgBlobsBatch(const int dbId, const char* data, const long length, std::vector<long int> sizes, int numres, int sketch, bool colorOnly);
+double_vector queryImgPathsBatch(const int dbId, std::vector<std::string> paths, int numres, int sketch, bool colorOnly);
 double_vector queryImgData(const int dbId, Idx * sig1, Idx * sig2, Idx * sig3, double *avgl, int numres, int sketch, bool colorOnly);
-long_list queryImgDataForThresFast(sigMap * tsigs, double *avgl, float thresd, int sketch); 
+long_list queryImgDataForThresFast(const int dbId, sigSlot_hashset * tslots, double *avgl, float thresd, int sketch);
 
 int addImage(const int dbId, const long int id, char* filename);
+int addImageSignature(const int dbId, const long int id, std::vector<int> sig1, std::vector<int> sig2, std::vector<int> sig3,
+		std::vector<double> avgl, int width, int height);
+std::vector<int> addImageSignatures(const int dbId, std::vector<long int> ids, std::vector<int> coefs,
+		std::vector<double> avgls, std::vector<int> sizes);
+std::vector<double> imageSignatureFromPath(char* path);
+std::vector<double> imageSignatureFromBlob(const char* data, const long length);
 int savedb(const int dbId, char* filename);
 int loaddb(const int dbId, char* filename);
 int savealldbs(char* filename);
 int loadalldbs(char* filename);
+int loaddbsdir(char* dirname, int threads);
+int opendbsdir(char* dirname);
+int loadSpace(const int dbId);
+int unloadSpace(const int dbId, char* dirname);
+int openLog(char* prefix, int syncMs);
+void closeLog();
+int checkpointdbs(char* filename);
+long int getLogSize();
+bool isLogBroken();
 int removeID(const int dbId, long int id);
+long int removeIDs(const int dbId, std::vector<long int> ids);
+long int compactDbSpace(const int dbId, long int maxSlots);
+long int getDeadCount(const int dbId);
+long int getUnsavedChanges(const int dbId);
 int resetdb(const int dbId);
+int packPostings(const int dbId);
+long int getPostingsMemory(const int dbId);
+long int getAvglDistances(const int dbId, double y, double i, double q, int sketch, char* ids, long idsSize, char* dists, long distsSize);
+int setQueryThreads(int threads);
+int getQueryThreads();
 void initDbase(const int dbId);
 void closeDbase();
 long int getImgCount(const int dbId);
@@ -293,6 +552,7 @@ int addImageBlob(const int dbId, const long int id, const char *blob, const long
 std::vector<int> getDBList();
 std::vector<long int> getImgIdList(const int dbId);
 bool isValidDB(const int dbId);
+bool isLoadedDB(const int dbId);
 int destroydb(const int dbId);
 bool removedb(const int dbId);
 
@@ -306,32 +566,13 @@ std::vector<int> getKeywordsImg(const int dbId, const int id);
 // query by keywords
 std::vector<double> queryImgIDKeywords(const int dbId, long int id, int numres, int kwJoinType, std::vector<int> keywords, bool colorOnly);
 std::vector<long int> getAllImgsByKeywords(const int dbId, const int numres, int kwJoinType, std::vector<int> keywords);
+std::vector<long int> getImgsByKeywordsPage(const int dbId, int kwJoinType, std::vector<int> keywords, long int cursor, const int limit);
 double getKeywordsVisualDistance(const int dbId, int distanceType, std::vector<int> keywords);
 std::vector<int> mostPopularKeywords(const int dbId, std::vector<long int> imgs, std::vector<int> excludedKwds, int count, int mode);
 
 // keywords
 std::vector<int> getKeywordsPopular(const int dbId, const int numres);
 
-/* keyword postings structure */
-#define AVG_IMGS_PER_KWD 1000
-
-class keywordStruct {
-	//std::vector<long int> imgIds;	/* img list */
-public:
-	keywordStruct() {
-		imgIdsFilter = new bloom_filter(AVG_IMGS_PER_KWD, 1.0/(100.0 * AVG_IMGS_PER_KWD),random_bloom_seed);
-	}
-	bloom_filter* imgIdsFilter;
-
-	~keywordStruct()
-	{
-		delete imgIdsFilter;
-	}
-} ;
-
-typedef std::map<const int, keywordStruct*> keywordsMapType;
-typedef std::map<const int, keywordStruct*>::iterator  keywordsMapIterator;
-
 // clustering
 /* cluster list structure */
 typedef struct clustersStruct_{
@@ -349,7 +590,4 @@ std::vector<clustersStruct> getClusterKeywords(const int dbId, const int numClus
 // summaries
 bloom_filter* getIdsBloomFilter(const int dbId);
 
-// util
-keywordStruct* getKwdPostings(int hash);
-
 #endif
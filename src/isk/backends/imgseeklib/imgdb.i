@@ -1,6 +1,11 @@
-%module imgdb
+%module(threads="1") imgdb
+
+// The GIL is released around every engine call (%thread), as they run long or wait for db space locks
+// held by other threads meanwhile. The engine locks db spaces itself, so these can run from many Python threads.
+%nothread;
 
 %include "std_vector.i"
+%include "std_string.i"
 %{
 #define SWIG_FILE_WITH_INIT
 #include "bloom_filter.h"
@@ -12,27 +17,60 @@ namespace std {
    %template(IntVector) vector<int>;
    %template(LongIntVector) vector<long int>;
    %template(DoubleVector) vector<double>;   
+   %template(StringVector) vector<std::string>;
 }
 
 // query
 %pybuffer_binary(const char *data, const long length);
+%thread;
 std::vector<double> queryImgData(const int dbId, int * sig1, int * sig2, int * sig3, double *avgl, int numres, int sketch, bool colorOnly);
 std::vector<double> queryImgID(const int dbId, long int id,int numres,int sketch, bool colorOnly);
 std::vector<double> queryImgBlob(const int dbId, const char* data,const long length, int numres,int sketch, bool colorOnly);
 std::vector<double> queryImgPath(const int dbId, char* path,int numres,int sketch, bool colorOnly);
-long_list queryImgDataForThresFast(sigMap * tsigs, double *avgl, float thresd, int sketch); 
+std::vector<double> queryImgIDsBatch(const int dbId, std::vector<long int> ids, int numres, int sketch, bool colorOnly);
+std::vector<double> queryImgBlobsBatch(const int dbId, const char* data, const long length, std::vector<long int> sizes, int numres, int sketch, bool colorOnly);
+std::vector<double> queryImgPathsBatch(const int dbId, std::vector<std::string> paths, int numres, int sketch, bool colorOnly);
+long_list queryImgDataForThresFast(const int dbId, sigSlot_hashset * tslots, double *avgl, float thresd, int sketch);
 // add
 int addImage(const int dbId, const long int id, char* filename);  //TODO should be long long int?
 int addImageBlob(const int dbId, const long int id, const char *data, const long length);
+int addImageSignature(const int dbId, const long int id, std::vector<int> sig1, std::vector<int> sig2, std::vector<int> sig3,
+		std::vector<double> avgl, int width, int height);
+std::vector<int> addImageSignatures(const int dbId, std::vector<long int> ids, std::vector<int> coefs,
+		std::vector<double> avgls, std::vector<int> sizes);
+std::vector<double> imageSignatureFromPath(char* path);
+std::vector<double> imageSignatureFromBlob(const char* data, const long length);
 
 // db ops
 int savedb(const int dbId, char* filename);
 int loaddb(const int dbId, char* filename);
 int savealldbs(char* filename);
 int loadalldbs(char* filename);
+int loaddbsdir(char* dirname, int threads);
+int opendbsdir(char* dirname);
+int loadSpace(const int dbId);
+int unloadSpace(const int dbId, char* dirname);
 int removeID(const int dbId, long int id);
+long int removeIDs(const int dbId, std::vector<long int> ids);
+long int compactDbSpace(const int dbId, long int maxSlots);
+int openLog(char* prefix, int syncMs);
+void closeLog();
+int checkpointdbs(char* filename);
+// changes wait for the log to sync
 int resetdb(const int dbId);
 void initDbase(const int dbId);
+bool removedb(const int dbId);
+long int getLogSize();
+bool isLogBroken();
+int packPostings(const int dbId);
+long int getPostingsMemory(const int dbId);
+long int getDeadCount(const int dbId);
+long int getUnsavedChanges(const int dbId);
+%pybuffer_mutable_binary(char* ids, long idsSize);
+%pybuffer_mutable_binary(char* dists, long distsSize);
+long int getAvglDistances(const int dbId, double y, double i, double q, int sketch, char* ids, long idsSize, char* dists, long distsSize);
+int setQueryThreads(int threads);
+int getQueryThreads();
 void closeDbase();
 long int getImgCount(const int dbId);
 bool isImageOnDB(const int dbId, long int id);
@@ -46,8 +84,8 @@ std::vector<double> getImageAvgl(const int dbId, long int id1);
 std::vector<int> getDBList();
 std::vector<long int> getImgIdList(const int dbId);
 bool isValidDB(const int dbId);
+bool isLoadedDB(const int dbId);
 int destroydb(const int dbId);
-bool removedb(const int dbId);
 
 // keywords in images
 bool addKeywordImg(const int dbId, const int id, const int hash);
@@ -59,14 +97,16 @@ std::vector<int> getKeywordsImg(const int dbId, const int id);
 // query by keywords
 std::vector<double> queryImgIDKeywords(const int dbId, long int id, int numres, int kwJoinType, std::vector<int> keywords, bool colorOnly);
 std::vector<long int> getAllImgsByKeywords(const int dbId, const int numres, int kwJoinType, std::vector<int> keywords);
+std::vector<long int> getImgsByKeywordsPage(const int dbId, int kwJoinType, std::vector<int> keywords, long int cursor, const int limit);
 double getKeywordsVisualDistance(const int dbId, int distanceType, std::vector<int> keywords);
-// std::vector<int> mostPopularKeywords(const int dbId, std::vector<long int> imgs, std::vector<int> excludedKwds, int count, int mode);
 
 // keywords
+std::vector<int> mostPopularKeywords(const int dbId, std::vector<long int> imgs, std::vector<int> excludedKwds, int count, int mode);
 std::vector<int> getKeywordsPopular(const int dbId, const int numres);
 
 // clustering
 
+%nothread;
 /* cluster list structure */
 typedef struct clustersStruct_{
   imageId id;   /* representative image id */
@@ -77,6 +117,7 @@ typedef struct clustersStruct_{
 namespace std {
    %template(ClusterVector) vector<clustersStruct>;
 }
+%thread;
 
 std::vector<clustersStruct> getClusterDb(const int dbId, const int numClusters);
 std::vector<clustersStruct> getClusterKeywords(const int dbId, const int numClusters,std::vector<int> keywords);
@@ -84,6 +125,7 @@ std::vector<clustersStruct> getClusterKeywords(const int dbId, const int numClus
 // summaries
 
 bloom_filter* getIdsBloomFilter(const int dbId);
+%nothread;
 
 %{
 #include "bloom_filter.h"
@@ -1,15 +1,22 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 3.0.5
+# Version 3.0.12
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
 
-
-
-
-
-from sys import version_info
-if version_info >= (2, 6, 0):
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info >= (2, 7, 0):
+    def swig_import_helper():
+        import importlib
+        pkg = __name__.rpartition('.')[0]
+        mname = '.'.join((pkg, '_imgdb')).lstrip('.')
+        try:
+            return importlib.import_module(mname)
+        except ImportError:
+            return importlib.import_module('_imgdb')
+    _imgdb = swig_import_helper()
+    del swig_import_helper
+elif _swig_python_version_info >= (2, 6, 0):
     def swig_import_helper():
         from os.path import dirname
         import imp
@@ -19,22 +26,27 @@ if version_info >= (2, 6, 0):
         except ImportError:
             import _imgdb
             return _imgdb
-        if fp is not None:
-            try:
-                _mod = imp.load_module('_imgdb', fp, pathname, description)
-            finally:
+        try:
+            _mod = imp.load_module('_imgdb', fp, pathname, description)
+        finally:
+            if fp is not None:
                 fp.close()
-            return _mod
+        return _mod
     _imgdb = swig_import_helper()
     del swig_import_helper
 else:
     import _imgdb
-del version_info
+del _swig_python_version_info
+
 try:
     _swig_property = property
 except NameError:
     pass  # Python < 2.2 doesn't have 'property'.
 
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
 
 def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
     if (name == "thisown"):
@@ -59,37 +71,30 @@ def _swig_setattr(self, class_type, name, value):
     return _swig_setattr_nondynamic(self, class_type, name, value, 0)
 
 
-def _swig_getattr_nondynamic(self, class_type, name, static=1):
+def _swig_getattr(self, class_type, name):
     if (name == "thisown"):
         return self.this.own()
     method = class_type.__swig_getmethods__.get(name, None)
     if method:
         return method(self)
-    if (not static):
-        return object.__getattr__(self, name)
-    else:
-        raise AttributeError(name)
-
-def _swig_getattr(self, class_type, name):
-    return _swig_getattr_nondynamic(self, class_type, name, 0)
+    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
 
 
 def _swig_repr(self):
     try:
         strthis = "proxy of " + self.this.__repr__()
-    except:
+    except __builtin__.Exception:
         strthis = ""
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
 try:
     _object = object
     _newclass = 1
-except AttributeError:
+except __builtin__.Exception:
     class _object:
         pass
     _newclass = 0
 
-
 class SwigPyIterator(_object):
     __swig_setmethods__ = {}
     __setattr__ = lambda self, name, value: _swig_setattr(self, SwigPyIterator, name, value)
@@ -175,9 +180,6 @@ class IntVector(_object):
     def __len__(self):
         return _imgdb.IntVector___len__(self)
 
-    def pop(self):
-        return _imgdb.IntVector_pop(self)
-
     def __getslice__(self, i, j):
         return _imgdb.IntVector___getslice__(self, i, j)
 
@@ -196,6 +198,9 @@ class IntVector(_object):
     def __setitem__(self, *args):
         return _imgdb.IntVector___setitem__(self, *args)
 
+    def pop(self):
+        return _imgdb.IntVector_pop(self)
+
     def append(self, x):
         return _imgdb.IntVector_append(self, x)
 
@@ -205,15 +210,9 @@ class IntVector(_object):
     def size(self):
         return _imgdb.IntVector_size(self)
 
-    def clear(self):
-        return _imgdb.IntVector_clear(self)
-
     def swap(self, v):
         return _imgdb.IntVector_swap(self, v)
 
-    def get_allocator(self):
-        return _imgdb.IntVector_get_allocator(self)
-
     def begin(self):
         return _imgdb.IntVector_begin(self)
 
@@ -226,6 +225,12 @@ class IntVector(_object):
     def rend(self):
         return _imgdb.IntVector_rend(self)
 
+    def clear(self):
+        return _imgdb.IntVector_clear(self)
+
+    def get_allocator(self):
+        return _imgdb.IntVector_get_allocator(self)
+
     def pop_back(self):
         return _imgdb.IntVector_pop_back(self)
 
@@ -236,7 +241,7 @@ class IntVector(_object):
         this = _imgdb.new_IntVector(*args)
         try:
             self.this.append(this)
-        except:
+        except __builtin__.Exception:
             self.this = this
 
     def push_back(self, x):
@@ -288,9 +293,6 @@ class LongIntVector(_object):
     def __len__(self):
         return _imgdb.LongIntVector___len__(self)
 
-    def pop(self):
-        return _imgdb.LongIntVector_pop(self)
-
     def __getslice__(self, i, j):
         return _imgdb.LongIntVector___getslice__(self, i, j)
 
@@ -309,6 +311,9 @@ class LongIntVector(_object):
     def __setitem__(self, *args):
         return _imgdb.LongIntVector___setitem__(self, *args)
 
+    def pop(self):
+        return _imgdb.LongIntVector_pop(self)
+
     def append(self, x):
         return _imgdb.LongIntVector_append(self, x)
 
@@ -318,15 +323,9 @@ class LongIntVector(_object):
     def size(self):
         return _imgdb.LongIntVector_size(self)
 
-    def clear(self):
-        return _imgdb.LongIntVector_clear(self)
-
     def swap(self, v):
         return _imgdb.LongIntVector_swap(self, v)
 
-    def get_allocator(self):
-        return _imgdb.LongIntVector_get_allocator(self)
-
     def begin(self):
         return _imgdb.LongIntVector_begin(self)
 
@@ -339,6 +338,12 @@ class LongIntVector(_object):
     def rend(self):
         return _imgdb.LongIntVector_rend(self)
 
+    def clear(self):
+        return _imgdb.LongIntVector_clear(self)
+
+    def get_allocator(self):
+        return _imgdb.LongIntVector_get_allocator(self)
+
     def pop_back(self):
         return _imgdb.LongIntVector_pop_back(self)
 
@@ -349,7 +354,7 @@ class LongIntVector(_object):
         this = _imgdb.new_LongIntVector(*args)
         try:
             self.this.append(this)
-        except:
+        except __builtin__.Exception:
             self.this = this
 
     def push_back(self, x):
@@ -401,9 +406,6 @@ class DoubleVector(_object):
     def __len__(self):
         return _imgdb.DoubleVector___len__(self)
 
-    def pop(self):
-        return _imgdb.DoubleVector_pop(self)
-
     def __getslice__(self, i, j):
         return _imgdb.DoubleVector___getslice__(self, i, j)
 
@@ -422,6 +424,9 @@ class DoubleVector(_object):
     def __setitem__(self, *args):
         return _imgdb.DoubleVector___setitem__(self, *args)
 
+    def pop(self):
+        return _imgdb.DoubleVector_pop(self)
+
     def append(self, x):
         return _imgdb.DoubleVector_append(self, x)
 
@@ -431,15 +436,9 @@ class DoubleVector(_object):
     def size(self):
         return _imgdb.DoubleVector_size(self)
 
-    def clear(self):
-        return _imgdb.DoubleVector_clear(self)
-
     def swap(self, v):
         return _imgdb.DoubleVector_swap(self, v)
 
-    def get_allocator(self):
-        return _imgdb.DoubleVector_get_allocator(self)
-
     def begin(self):
         return _imgdb.DoubleVector_begin(self)
 
@@ -452,6 +451,12 @@ class DoubleVector(_object):
     def rend(self):
         return _imgdb.DoubleVector_rend(self)
 
+    def clear(self):
+        return _imgdb.DoubleVector_clear(self)
+
+    def get_allocator(self):
+        return _imgdb.DoubleVector_get_allocator(self)
+
     def pop_back(self):
         return _imgdb.DoubleVector_pop_back(self)
 
@@ -462,7 +467,7 @@ class DoubleVector(_object):
         this = _imgdb.new_DoubleVector(*args)
         try:
             self.this.append(this)
-        except:
+        except __builtin__.Exception:
             self.this = this
 
     def push_back(self, x):
@@ -493,6 +498,119 @@ class DoubleVector(_object):
 DoubleVector_swigregister = _imgdb.DoubleVector_swigregister
 DoubleVector_swigregister(DoubleVector)
 
+class StringVector(_object):
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, StringVector, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, StringVector, name)
+    __repr__ = _swig_repr
+
+    def iterator(self):
+        return _imgdb.StringVector_iterator(self)
+    def __iter__(self):
+        return self.iterator()
+
+    def __nonzero__(self):
+        return _imgdb.StringVector___nonzero__(self)
+
+    def __bool__(self):
+        return _imgdb.StringVector___bool__(self)
+
+    def __len__(self):
+        return _imgdb.StringVector___len__(self)
+
+    def __getslice__(self, i, j):
+        return _imgdb.StringVector___getslice__(self, i, j)
+
+    def __setslice__(self, *args):
+        return _imgdb.StringVector___setslice__(self, *args)
+
+    def __delslice__(self, i, j):
+        return _imgdb.StringVector___delslice__(self, i, j)
+
+    def __delitem__(self, *args):
+        return _imgdb.StringVector___delitem__(self, *args)
+
+    def __getitem__(self, *args):
+        return _imgdb.StringVector___getitem__(self, *args)
+
+    def __setitem__(self, *args):
+        return _imgdb.StringVector___setitem__(self, *args)
+
+    def pop(self):
+        return _imgdb.StringVector_pop(self)
+
+    def append(self, x):
+        return _imgdb.StringVector_append(self, x)
+
+    def empty(self):
+        return _imgdb.StringVector_empty(self)
+
+    def size(self):
+        return _imgdb.StringVector_size(self)
+
+    def swap(self, v):
+        return _imgdb.StringVector_swap(self, v)
+
+    def begin(self):
+        return _imgdb.StringVector_begin(self)
+
+    def end(self):
+        return _imgdb.StringVector_end(self)
+
+    def rbegin(self):
+        return _imgdb.StringVector_rbegin(self)
+
+    def rend(self):
+        return _imgdb.StringVector_rend(self)
+
+    def clear(self):
+        return _imgdb.StringVector_clear(self)
+
+    def get_allocator(self):
+        return _imgdb.StringVector_get_allocator(self)
+
+    def pop_back(self):
+        return _imgdb.StringVector_pop_back(self)
+
+    def erase(self, *args):
+        return _imgdb.StringVector_erase(self, *args)
+
+    def __init__(self, *args):
+        this = _imgdb.new_StringVector(*args)
+        try:
+            self.this.append(this)
+        except __builtin__.Exception:
+            self.this = this
+
+    def push_back(self, x):
+        return _imgdb.StringVector_push_back(self, x)
+
+    def front(self):
+        return _imgdb.StringVector_front(self)
+
+    def back(self):
+        return _imgdb.StringVector_back(self)
+
+    def assign(self, n, x):
+        return _imgdb.StringVector_assign(self, n, x)
+
+    def resize(self, *args):
+        return _imgdb.StringVector_resize(self, *args)
+
+    def insert(self, *args):
+        return _imgdb.StringVector_insert(self, *args)
+
+    def reserve(self, n):
+        return _imgdb.StringVector_reserve(self, n)
+
+    def capacity(self):
+        return _imgdb.StringVector_capacity(self)
+    __swig_destroy__ = _imgdb.delete_StringVector
+    __del__ = lambda self: None
+StringVector_swigregister = _imgdb.StringVector_swigregister
+StringVector_swigregister(StringVector)
+
 
 def queryImgData(dbId, sig1, sig2, sig3, avgl, numres, sketch, colorOnly):
     return _imgdb.queryImgData(dbId, sig1, sig2, sig3, avgl, numres, sketch, colorOnly)
@@ -510,8 +628,20 @@ def queryImgPath(dbId, path, numres, sketch, colorOnly):
     return _imgdb.queryImgPath(dbId, path, numres, sketch, colorOnly)
 queryImgPath = _imgdb.queryImgPath
 
-def queryImgDataForThresFast(tsigs, avgl, thresd, sketch):
-    return _imgdb.queryImgDataForThresFast(tsigs, avgl, thresd, sketch)
+def queryImgIDsBatch(dbId, ids, numres, sketch, colorOnly):
+    return _imgdb.queryImgIDsBatch(dbId, ids, numres, sketch, colorOnly)
+queryImgIDsBatch = _imgdb.queryImgIDsBatch
+
+def queryImgBlobsBatch(dbId, data, sizes, numres, sketch, colorOnly):
+    return _imgdb.queryImgBlobsBatch(dbId, data, sizes, numres, sketch, colorOnly)
+queryImgBlobsBatch = _imgdb.queryImgBlobsBatch
+
+def queryImgPathsBatch(dbId, paths, numres, sketch, colorOnly):
+    return _imgdb.queryImgPathsBatch(dbId, paths, numres, sketch, colorOnly)
+queryImgPathsBatch = _imgdb.queryImgPathsBatch
+
+def queryImgDataForThresFast(dbId, tslots, avgl, thresd, sketch):
+    return _imgdb.queryImgDataForThresFast(dbId, tslots, avgl, thresd, sketch)
 queryImgDataForThresFast = _imgdb.queryImgDataForThresFast
 
 def addImage(dbId, id, filename):
@@ -522,6 +652,22 @@ def addImageBlob(dbId, id, data):
     return _imgdb.addImageBlob(dbId, id, data)
 addImageBlob = _imgdb.addImageBlob
 
+def addImageSignature(dbId, id, sig1, sig2, sig3, avgl, width, height):
+    return _imgdb.addImageSignature(dbId, id, sig1, sig2, sig3, avgl, width, height)
+addImageSignature = _imgdb.addImageSignature
+
+def addImageSignatures(dbId, ids, coefs, avgls, sizes):
+    return _imgdb.addImageSignatures(dbId, ids, coefs, avgls, sizes)
+addImageSignatures = _imgdb.addImageSignatures
+
+def imageSignatureFromPath(path):
+    return _imgdb.imageSignatureFromPath(path)
+imageSignatureFromPath = _imgdb.imageSignatureFromPath
+
+def imageSignatureFromBlob(data):
+    return _imgdb.imageSignatureFromBlob(data)
+imageSignatureFromBlob = _imgdb.imageSignatureFromBlob
+
 def savedb(dbId, filename):
     return _imgdb.savedb(dbId, filename)
 savedb = _imgdb.savedb
@@ -538,10 +684,46 @@ def loadalldbs(filename):
     return _imgdb.loadalldbs(filename)
 loadalldbs = _imgdb.loadalldbs
 
+def loaddbsdir(dirname, threads):
+    return _imgdb.loaddbsdir(dirname, threads)
+loaddbsdir = _imgdb.loaddbsdir
+
+def opendbsdir(dirname):
+    return _imgdb.opendbsdir(dirname)
+opendbsdir = _imgdb.opendbsdir
+
+def loadSpace(dbId):
+    return _imgdb.loadSpace(dbId)
+loadSpace = _imgdb.loadSpace
+
+def unloadSpace(dbId, dirname):
+    return _imgdb.unloadSpace(dbId, dirname)
+unloadSpace = _imgdb.unloadSpace
+
 def removeID(dbId, id):
     return _imgdb.removeID(dbId, id)
 removeID = _imgdb.removeID
 
+def removeIDs(dbId, ids):
+    return _imgdb.removeIDs(dbId, ids)
+removeIDs = _imgdb.removeIDs
+
+def compactDbSpace(dbId, maxSlots):
+    return _imgdb.compactDbSpace(dbId, maxSlots)
+compactDbSpace = _imgdb.compactDbSpace
+
+def openLog(prefix, syncMs):
+    return _imgdb.openLog(prefix, syncMs)
+openLog = _imgdb.openLog
+
+def closeLog():
+    return _imgdb.closeLog()
+closeLog = _imgdb.closeLog
+
+def checkpointdbs(filename):
+    return _imgdb.checkpointdbs(filename)
+checkpointdbs = _imgdb.checkpointdbs
+
 def resetdb(dbId):
     return _imgdb.resetdb(dbId)
 resetdb = _imgdb.resetdb
@@ -550,6 +732,46 @@ def initDbase(dbId):
     return _imgdb.initDbase(dbId)
 initDbase = _imgdb.initDbase
 
+def removedb(dbId):
+    return _imgdb.removedb(dbId)
+removedb = _imgdb.removedb
+
+def getLogSize():
+    return _imgdb.getLogSize()
+getLogSize = _imgdb.getLogSize
+
+def isLogBroken():
+    return _imgdb.isLogBroken()
+isLogBroken = _imgdb.isLogBroken
+
+def packPostings(dbId):
+    return _imgdb.packPostings(dbId)
+packPostings = _imgdb.packPostings
+
+def getPostingsMemory(dbId):
+    return _imgdb.getPostingsMemory(dbId)
+getPostingsMemory = _imgdb.getPostingsMemory
+
+def getDeadCount(dbId):
+    return _imgdb.getDeadCount(dbId)
+getDeadCount = _imgdb.getDeadCount
+
+def getUnsavedChanges(dbId):
+    return _imgdb.getUnsavedChanges(dbId)
+getUnsavedChanges = _imgdb.getUnsavedChanges
+
+def getAvglDistances(dbId, y, i, q, sketch, ids, dists):
+    return _imgdb.getAvglDistances(dbId, y, i, q, sketch, ids, dists)
+getAvglDistances = _imgdb.getAvglDistances
+
+def setQueryThreads(threads):
+    return _imgdb.setQueryThreads(threads)
+setQueryThreads = _imgdb.setQueryThreads
+
+def getQueryThreads():
+    return _imgdb.getQueryThreads()
+getQueryThreads = _imgdb.getQueryThreads
+
 def closeDbase():
     return _imgdb.closeDbase()
 closeDbase = _imgdb.closeDbase
@@ -594,14 +816,14 @@ def isValidDB(dbId):
     return _imgdb.isValidDB(dbId)
 isValidDB = _imgdb.isValidDB
 
+def isLoadedDB(dbId):
+    return _imgdb.isLoadedDB(dbId)
+isLoadedDB = _imgdb.isLoadedDB
+
 def destroydb(dbId):
     return _imgdb.destroydb(dbId)
 destroydb = _imgdb.destroydb
 
-def removedb(dbId):
-    return _imgdb.removedb(dbId)
-removedb = _imgdb.removedb
-
 def addKeywordImg(dbId, id, hash):
     return _imgdb.addKeywordImg(dbId, id, hash)
 addKeywordImg = _imgdb.addKeywordImg
@@ -630,10 +852,18 @@ def getAllImgsByKeywords(dbId, numres, kwJoinType, keywords):
     return _imgdb.getAllImgsByKeywords(dbId, numres, kwJoinType, keywords)
 getAllImgsByKeywords = _imgdb.getAllImgsByKeywords
 
+def getImgsByKeywordsPage(dbId, kwJoinType, keywords, cursor, limit):
+    return _imgdb.getImgsByKeywordsPage(dbId, kwJoinType, keywords, cursor, limit)
+getImgsByKeywordsPage = _imgdb.getImgsByKeywordsPage
+
 def getKeywordsVisualDistance(dbId, distanceType, keywords):
     return _imgdb.getKeywordsVisualDistance(dbId, distanceType, keywords)
 getKeywordsVisualDistance = _imgdb.getKeywordsVisualDistance
 
+def mostPopularKeywords(dbId, imgs, excludedKwds, count, mode):
+    return _imgdb.mostPopularKeywords(dbId, imgs, excludedKwds, count, mode)
+mostPopularKeywords = _imgdb.mostPopularKeywords
+
 def getKeywordsPopular(dbId, numres):
     return _imgdb.getKeywordsPopular(dbId, numres)
 getKeywordsPopular = _imgdb.getKeywordsPopular
@@ -660,7 +890,7 @@ class clustersStruct(_object):
         this = _imgdb.new_clustersStruct()
         try:
             self.this.append(this)
-        except:
+        except __builtin__.Exception:
             self.this = this
     __swig_destroy__ = _imgdb.delete_clustersStruct
     __del__ = lambda self: None
@@ -688,9 +918,6 @@ class ClusterVector(_object):
     def __len__(self):
         return _imgdb.ClusterVector___len__(self)
 
-    def pop(self):
-        return _imgdb.ClusterVector_pop(self)
-
     def __getslice__(self, i, j):
         return _imgdb.ClusterVector___getslice__(self, i, j)
 
@@ -709,6 +936,9 @@ class ClusterVector(_object):
     def __setitem__(self, *args):
         return _imgdb.ClusterVector___setitem__(self, *args)
 
+    def pop(self):
+        return _imgdb.ClusterVector_pop(self)
+
     def append(self, x):
         return _imgdb.ClusterVector_append(self, x)
 
@@ -718,15 +948,9 @@ class ClusterVector(_object):
     def size(self):
         return _imgdb.ClusterVector_size(self)
 
-    def clear(self):
-        return _imgdb.ClusterVector_clear(self)
-
     def swap(self, v):
         return _imgdb.ClusterVector_swap(self, v)
 
-    def get_allocator(self):
-        return _imgdb.ClusterVector_get_allocator(self)
-
     def begin(self):
         return _imgdb.ClusterVector_begin(self)
 
@@ -739,6 +963,12 @@ class ClusterVector(_object):
     def rend(self):
         return _imgdb.ClusterVector_rend(self)
 
+    def clear(self):
+        return _imgdb.ClusterVector_clear(self)
+
+    def get_allocator(self):
+        return _imgdb.ClusterVector_get_allocator(self)
+
     def pop_back(self):
         return _imgdb.ClusterVector_pop_back(self)
 
@@ -749,7 +979,7 @@ class ClusterVector(_object):
         this = _imgdb.new_ClusterVector(*args)
         try:
             self.this.append(this)
-        except:
+        except __builtin__.Exception:
             self.this = this
 
     def push_back(self, x):
@@ -803,7 +1033,7 @@ class bloom_filter(_object):
         this = _imgdb.new_bloom_filter(*args)
         try:
             self.this.append(this)
-        except:
+        except __builtin__.Exception:
             self.this = this
     __swig_destroy__ = _imgdb.delete_bloom_filter
     __del__ = lambda self: None
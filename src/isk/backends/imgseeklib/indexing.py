@@ -0,0 +1,131 @@
+"""
+Directory indexings, see ImgDB.add_dir().
+
+Directory trees are walked in a fixed order, sorted by name, and images are added in that same order. So the
+last image done tells every image done, and an indexing is resumed from it after a crash or restart, without
+keeping the (possibly millions of) paths done anywhere.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Iterator, List, Sequence, Tuple
+
+from isk.exceptions import ImageDBException
+
+
+logger = logging.getLogger(__name__)
+
+
+class DirIndexing(object):
+    """
+    Adding the images of a directory tree to a db space. Counts its progress, and saves it to the
+    ``checkpoint`` file when given, resuming from it if the file exists already.
+    """
+
+    def __init__(self, db_id: int, path: str, recurse: bool, fname_as_id: bool, extensions: set,
+                 checkpoint: str = None):
+        self.db_id = db_id
+        self.path = path
+        self.recurse = recurse
+        self.fname_as_id = fname_as_id
+        self.extensions = extensions
+        self.checkpoint = checkpoint
+        self.seen = 0  # image files found, not counting the ones done by the run resumed
+        self.added = 0
+        self.failed = 0
+        self.started = time.time()
+        self.finished = None
+        self.last_done = ()  # path of the last image done, split, relative to path
+        if checkpoint and os.path.exists(checkpoint):
+            self._load_checkpoint()
+
+    def _load_checkpoint(self) -> None:
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+        if state["db_id"] != self.db_id or state["path"] != self.path:
+            raise ImageDBException(
+                "Checkpoint %s is of adding %s to database id %d" % (self.checkpoint, state["path"], state["db_id"])
+            )
+        self.last_done = tuple(state["last_done"])
+        logger.info("| Resuming adding %s to database id %d after %s",
+                    self.path, self.db_id, os.path.join(*self.last_done) if self.last_done else "nothing")
+
+    def _save_checkpoint(self) -> None:
+        state = {"db_id": self.db_id, "path": self.path, "last_done": self.last_done}
+        tmp_name = self.checkpoint + ".tmp"
+        with open(tmp_name, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_name, self.checkpoint)
+
+    def images(self) -> Iterator[Tuple[str, int]]:
+        """Image files to add, with their ids (0 for the next free one), skipping the ones done already"""
+        return self._walk(self.path, (), self.last_done)
+
+    def _walk(self, path: str, parts: Tuple[str, ...], last_done: Sequence[str]) -> Iterator[Tuple[str, int]]:
+        """
+        Image files under directory ``path`` (split as ``parts``), sorted by name. Images with paths up to
+        ``last_done`` are skipped: tuples of names compare as the walk orders them.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.error("Unable to list directory %s: %s", path, e)
+            return
+        for entry in entries:
+            entry_parts = parts + (entry.name,)
+            if entry.is_dir():
+                if not self.recurse:
+                    continue
+                done = last_done[:len(entry_parts)]
+                if entry_parts < done:  # every image under it is done
+                    continue
+                yield from self._walk(entry.path, entry_parts, last_done if entry_parts == done else ())
+                continue
+
+            name, extension = os.path.splitext(entry.name)
+            if extension[1:].lower() not in self.extensions or entry_parts <= tuple(last_done):
+                continue
+            image_id = 0  # next free id
+
+            # If ``fname_as_id`` is True, try to retrieve image id from filename.
+            if self.fname_as_id:
+                try:
+                    image_id = int(name)
+                except ValueError:
+                    logger.warning("Can not get id from filename {}. Skipping".format(name))
+                    continue
+
+            self.seen += 1
+            yield entry.path, image_id
+
+    def done(self, results: List[Tuple[str, int]]) -> None:
+        """Count ``(path, image id)`` results of images() as added (or failed with id 0), and checkpoint them"""
+        added = sum(1 for _, image_id in results if image_id)
+        self.added += added
+        self.failed += len(results) - added
+        if results:
+            self.last_done = tuple(os.path.relpath(results[-1][0], self.path).split(os.sep))
+            if self.checkpoint:
+                self._save_checkpoint()
+
+    def finish(self) -> None:
+        """The whole tree is done: a later run with the same checkpoint starts over"""
+        self.finished = time.time()
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+    def get_progress(self) -> dict:
+        elapsed = (self.finished or time.time()) - self.started
+        return {
+            "db_id": self.db_id,
+            "path": self.path,
+            "seen": self.seen,
+            "added": self.added,
+            "failed": self.failed,
+            "rate": (self.added + self.failed) / elapsed if elapsed > 0 else 0.0,  # images done per second
+            "elapsed": elapsed,
+            "finished": self.finished is not None,
+        }
@@ -0,0 +1,136 @@
+/***************************************************************************
+    imgSeek ::  Keywords of the images of a db space
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include <algorithm>
+
+#include "keywords.h"
+
+void KeywordStore::borrow(const unsigned long* mappedStarts, const int* mappedKeywords, size_t n) {
+	clear();
+	starts = mappedStarts;
+	keywords = mappedKeywords;
+	csrCount = n;
+}
+
+void KeywordStore::range(const sigSlot slot, const int*& begin, const int*& end) const {
+	OverflowMap::const_iterator it = overflow.find(slot);
+	if (it != overflow.end()) {
+		begin = it->second.empty() ? 0 : &it->second[0];
+		end = begin + it->second.size();
+	} else if (slot < csrCount) {
+		begin = keywords + starts[slot];
+		end = keywords + starts[slot + 1];
+	} else {
+		begin = end = 0;
+	}
+}
+
+bool KeywordStore::contains(const sigSlot slot, const int keyword) const {
+	const int* begin;
+	const int* end;
+	range(slot, begin, end);
+	return std::find(begin, end, keyword) != end;
+}
+
+std::vector<int>& KeywordStore::overflowEntry(const sigSlot slot) {
+	OverflowMap::iterator it = overflow.find(slot);
+	if (it != overflow.end()) return it->second;
+	std::vector<int>& kwds = overflow[slot];
+	if (slot < csrCount) kwds.assign(keywords + starts[slot], keywords + starts[slot + 1]);
+	return kwds;
+}
+
+bool KeywordStore::add(const sigSlot slot, const int keyword) {
+	if (contains(slot, keyword)) return false;
+	overflowEntry(slot).push_back(keyword);
+	return true;
+}
+
+bool KeywordStore::remove(const sigSlot slot, const int keyword) {
+	if (!contains(slot, keyword)) return false;
+	std::vector<int>& kwds = overflowEntry(slot);
+	kwds.erase(std::find(kwds.begin(), kwds.end(), keyword));
+	return true;
+}
+
+bool KeywordStore::removeAll(const sigSlot slot) {
+	const int* begin;
+	const int* end;
+	range(slot, begin, end);
+	if (begin == end) return false;
+	if (slot < csrCount && starts[slot] != starts[slot + 1]) {
+		// an empty entry hides the arrays one
+		overflow[slot].clear();
+	} else {
+		overflow.erase(slot);
+	}
+	return true;
+}
+
+// appends every keyword to new arrays
+struct KeywordCompacter {
+	std::vector<unsigned long>& starts;
+	std::vector<int>& keywords;
+	KeywordCompacter(std::vector<unsigned long>& starts, std::vector<int>& keywords): starts(starts), keywords(keywords) {}
+	void operator()(const sigSlot slot, const int keyword) {
+		while (starts.size() <= slot) starts.push_back(keywords.size());
+		keywords.push_back(keyword);
+	}
+};
+
+void KeywordStore::compact() {
+	std::vector<unsigned long> newStarts;
+	std::vector<int> newKeywords;
+	KeywordCompacter compacter(newStarts, newKeywords);
+	forEach(compacter);
+	newStarts.push_back(newKeywords.size());
+
+	clear();
+	ownStarts.swap(newStarts);
+	ownKeywords.swap(newKeywords);
+	starts = &ownStarts[0];
+	keywords = ownKeywords.empty() ? 0 : &ownKeywords[0];
+	csrCount = ownStarts.size() - 1;
+}
+
+bool KeywordStore::compactIfOverflowing() {
+	if (overflow.size() <= KEYWORD_OVERFLOW_MIN || overflow.size() * 8 <= csrCount) return false;
+	compact();
+	return true;
+}
+
+void KeywordStore::clear() {
+	std::vector<unsigned long>().swap(ownStarts);
+	std::vector<int>().swap(ownKeywords);
+	overflow.clear();
+	starts = 0;
+	keywords = 0;
+	csrCount = 0;
+}
+
+size_t KeywordStore::memoryUsage() const {
+	// a map node holds its key, its vector and about 4 pointers
+	size_t res = ownStarts.capacity() * sizeof(unsigned long) + ownKeywords.capacity() * sizeof(int)
+			+ overflow.size() * (sizeof(OverflowMap::value_type) + 4 * sizeof(void*));
+	for (OverflowMap::const_iterator it = overflow.begin(); it != overflow.end(); it++) {
+		res += it->second.capacity() * sizeof(int);
+	}
+	return res;
+}
@@ -0,0 +1,126 @@
+/***************************************************************************
+    imgSeek ::  Keywords of the images of a db space
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef KEYWORDS_H
+#define KEYWORDS_H
+
+#include <stddef.h>
+#include <map>
+#include <vector>
+
+#include "postings.h"
+
+/* Slots the overflow map of a KeywordStore holds at least before
+   compactIfOverflowing() merges it */
+#define KEYWORD_OVERFLOW_MIN 4096
+
+/* Keywords of the images of a db space, by slot.
+
+   Most images have no keyword or a single one, so keywords are kept as CSR
+   arrays rather than a set per image: the keywords of slot k are
+   keywords[starts[k]] up to keywords[starts[k + 1]]. The arrays of a db
+   space loaded from a mapped index file are borrowed from it.
+   Slots whose keywords changed since the arrays were built, and slots past
+   them, keep theirs on an overflow map instead, which hides what the arrays
+   hold for them. compact() merges the overflow map back into the arrays.
+ */
+class KeywordStore {
+public:
+	KeywordStore(): starts(0), keywords(0), csrCount(0) {}
+
+	/* Uses the arrays of n slots at mappedStarts (n + 1 starts) and
+	   mappedKeywords, on a mapped index file, as the keywords of slots 0 to
+	   n - 1. Drops any other keywords */
+	void borrow(const unsigned long* mappedStarts, const int* mappedKeywords, size_t n);
+
+	/* Appends the keywords of slot to out, a vector of int */
+	template <class Vector>
+	void get(const sigSlot slot, Vector& out) const {
+		const int* begin;
+		const int* end;
+		range(slot, begin, end);
+		out.insert(out.end(), begin, end);
+	}
+
+	bool contains(const sigSlot slot, const int keyword) const;
+
+	/* Calls visitor(slot, keyword) for every keyword of every slot, in slot order */
+	template <class Visitor>
+	void forEach(Visitor& visitor) const {
+		OverflowMap::const_iterator it = overflow.begin();
+		for (sigSlot slot = 0; slot < csrCount; slot++) {
+			const int* begin = keywords + starts[slot];
+			const int* end = keywords + starts[slot + 1];
+			if (it != overflow.end() && it->first == slot) {
+				begin = it->second.empty() ? 0 : &it->second[0];
+				end = begin + it->second.size();
+				it++;
+			}
+			for (; begin != end; begin++) visitor(slot, *begin);
+		}
+		for (; it != overflow.end(); it++) {
+			for (size_t k = 0; k < it->second.size(); k++) visitor(it->first, it->second[k]);
+		}
+	}
+
+	/* Adds keyword to slot. Returns false if it had it already */
+	bool add(const sigSlot slot, const int keyword);
+
+	/* Removes keyword from slot. Returns false if it didn't have it */
+	bool remove(const sigSlot slot, const int keyword);
+
+	/* Removes every keyword of slot. Returns false if it had none */
+	bool removeAll(const sigSlot slot);
+
+	/* Moves every keyword to arrays of its own, leaving the overflow map
+	   empty and the mapped arrays unused */
+	void compact();
+
+	/* compact() once the overflow map holds more than KEYWORD_OVERFLOW_MIN
+	   slots and an eighth of the slots on the arrays, so compacting takes
+	   time in proportion to the changes it merges. Returns true if it did */
+	bool compactIfOverflowing();
+
+	void clear();
+
+	/* Heap bytes held, borrowed arrays take none */
+	size_t memoryUsage() const;
+
+private:
+	typedef std::map<sigSlot, std::vector<int> > OverflowMap;
+
+	// [begin, end) gets the keywords of slot
+	void range(const sigSlot slot, const int*& begin, const int*& end) const;
+	// the overflow entry of slot, made from its arrays entry if missing
+	std::vector<int>& overflowEntry(const sigSlot slot);
+
+	const unsigned long* starts;	/* csrCount + 1 starts on keywords */
+	const int* keywords;
+	size_t csrCount;		/* slots on the arrays */
+	std::vector<unsigned long> ownStarts;	/* the arrays once compacted */
+	std::vector<int> ownKeywords;
+	OverflowMap overflow;		/* slots changed since, sorted by slot */
+
+	// not copyable
+	KeywordStore(const KeywordStore&);
+	KeywordStore& operator=(const KeywordStore&);
+};
+
+#endif
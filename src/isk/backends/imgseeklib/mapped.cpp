@@ -0,0 +1,55 @@
+/***************************************************************************
+    imgSeek ::  Db space storage usable in place from a mapped index file
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include "mapped.h"
+
+bool MappedFile::map(const char* filename, size_t offset, size_t length) {
+	unmap();
+
+	int fd = open(filename, O_RDONLY);
+	if (fd < 0) return false;
+
+	// touching a page past the end of the file would kill the process
+	struct stat st;
+	if (fstat(fd, &st) || (size_t) st.st_size < offset || (size_t) st.st_size - offset < length) {
+		close(fd);
+		return false;
+	}
+
+	void* p = length ? mmap(0, length, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, offset) : 0;
+	// the mapping keeps the file alive, even once it is replaced or unlinked
+	close(fd);
+	if (p == MAP_FAILED) return false;
+
+	base = (char*) p;
+	this->length = length;
+	return true;
+}
+
+void MappedFile::unmap() {
+	if (base) munmap(base, length);
+	base = 0;
+	length = 0;
+}
@@ -0,0 +1,123 @@
+/***************************************************************************
+    imgSeek ::  Db space storage usable in place from a mapped index file
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef MAPPED_H
+#define MAPPED_H
+
+#include <stddef.h>
+#include <vector>
+
+/* A private, writable mapping of a range of a file.
+
+   Pages nobody writes to stay shared with the page cache (and with any other
+   process mapping the same file); a page written to gets a private copy, so
+   the file itself never changes.
+ */
+class MappedFile {
+public:
+	MappedFile(): base(0), length(0) {}
+	~MappedFile() { unmap(); }
+
+	/* Maps length bytes of filename from offset on, which must be a multiple
+	   of the page size. Returns false if the file is shorter than that */
+	bool map(const char* filename, size_t offset, size_t length);
+	void unmap();
+
+	char* data() const { return base; }
+	size_t size() const { return length; }
+
+private:
+	char* base;
+	size_t length;
+
+	// not copyable
+	MappedFile(const MappedFile&);
+	MappedFile& operator=(const MappedFile&);
+};
+
+/* Growable array of plain data items, which may start out with items
+   borrowed from a MappedFile.
+
+   Borrowed items are used in place: reading them costs nothing up front, and
+   writing to them only copies the pages touched. Items added later go to a
+   heap array after them, so growing never copies the borrowed ones. Whoever
+   owns the mapping must keep it alive until the array is cleared or
+   destroyed.
+ */
+template <class T>
+class MappedVector {
+public:
+	MappedVector(): mapped(0), mappedCount(0) {}
+
+	/* Drops the current items and uses the n items at mappedItems instead */
+	void borrow(T* mappedItems, size_t n) {
+		clear();
+		mapped = mappedItems;
+		mappedCount = n;
+	}
+
+	size_t size() const {
+		return mappedCount + heap.size();
+	}
+
+	T& operator[](size_t k) {
+		return k < mappedCount ? mapped[k] : heap[k - mappedCount];
+	}
+
+	const T& operator[](size_t k) const {
+		return k < mappedCount ? mapped[k] : heap[k - mappedCount];
+	}
+
+	/* How many items from k on are contiguous with &(*this)[k] */
+	size_t contiguous(size_t k) const {
+		return k < mappedCount ? mappedCount - k : size() - k;
+	}
+
+	void reserve(size_t n) {
+		if (n > mappedCount) heap.reserve(n - mappedCount);
+	}
+
+	void push_back(const T& item) {
+		heap.push_back(item);
+	}
+
+	/* Drops every item and gives back the heap memory */
+	void clear() {
+		std::vector<T>().swap(heap);
+		mapped = 0;
+		mappedCount = 0;
+	}
+
+	/* Heap bytes held, borrowed items take none */
+	size_t memoryUsage() const {
+		return heap.capacity() * sizeof(T);
+	}
+
+private:
+	T* mapped;
+	size_t mappedCount;
+	std::vector<T> heap;	/* items after the mapped ones */
+
+	// not copyable
+	MappedVector(const MappedVector&);
+	MappedVector& operator=(const MappedVector&);
+};
+
+#endif
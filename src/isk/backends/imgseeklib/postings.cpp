@@ -0,0 +1,189 @@
+/***************************************************************************
+    imgSeek ::  Compact posting lists for the coefficient buckets
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include <algorithm>
+
+#include "postings.h"
+
+// collects slots of a list while decoding it
+struct SlotCollector {
+	std::vector<sigSlot>& out;
+	SlotCollector(std::vector<sigSlot>& out): out(out) {}
+	void operator()(const sigSlot slot) { out.push_back(slot); }
+};
+
+// tells whether a slot is on a list while decoding it
+struct SlotFinder {
+	sigSlot slot;
+	bool found;
+	SlotFinder(sigSlot slot): slot(slot), found(false) {}
+	void operator()(const sigSlot s) { if (s == slot) found = true; }
+};
+
+// skips slots while seeking a cursor
+struct SlotSkipper {
+	void operator()(const sigSlot) {}
+};
+
+bool PostingList::remove(const sigSlot slot) {
+	std::vector<sigSlot>::iterator it = std::lower_bound(slots.begin(), slots.end(), slot);
+	if (it != slots.end() && *it == slot) {
+		slots.erase(it);
+		return true;
+	}
+	sigSlot* m = std::lower_bound(mapped, mapped + mappedCount, slot);
+	if (m != mapped + mappedCount && *m == slot) {
+		std::copy(m + 1, mapped + mappedCount, m);
+		mappedCount--;
+		return true;
+	}
+	if (!packedCount) return false;
+
+	// only decode and repack lists actually holding the slot
+	SlotFinder finder(slot);
+	forEach(finder);
+	if (!finder.found) return false;
+
+	unpack();
+	slots.erase(std::lower_bound(slots.begin(), slots.end(), slot));
+	pack();
+	return true;
+}
+
+size_t PostingList::removeAll(const sigSlot* first, const sigSlot* last) {
+	if (first == last) return 0;
+	if (last - first == 1) return remove(*first) ? 1 : 0;
+
+	bool wasPacked = isPacked();
+	if (wasPacked) unpack();
+
+	size_t removed = 0;
+	if (mappedCount) {
+		sigSlot* out = removeSorted(mapped, mapped + mappedCount, first, last);
+		removed += mapped + mappedCount - out;
+		mappedCount = out - mapped;
+	}
+	if (slots.size()) {
+		sigSlot* out = removeSorted(&slots[0], &slots[0] + slots.size(), first, last);
+		removed += &slots[0] + slots.size() - out;
+		slots.resize(out - &slots[0]);
+	}
+
+	if (wasPacked) pack();
+	return removed;
+}
+
+sigSlot* PostingList::removeSorted(sigSlot* begin, sigSlot* end, const sigSlot* first, const sigSlot* last) {
+	// both are sorted: keep the slots not found walking the removed ones
+	sigSlot* out = begin;
+	const sigSlot* r = first;
+	for (sigSlot* it = begin; it != end; it++) {
+		while (r != last && *r < *it) r++;
+		if (r != last && *r == *it) continue;
+		*out++ = *it;
+	}
+	return out;
+}
+
+// orders skip entries by their last slot, see PostingList::seek
+struct SkipBefore {
+	template <class Skip>
+	bool operator()(const Skip& skip, const sigSlot slot) const { return skip.last < slot; }
+};
+
+void PostingList::seek(PostingCursor& cursor, const sigSlot start) const {
+	cursor.plain = std::lower_bound(slots.begin(), slots.end(), start) - slots.begin();
+	cursor.mapped = std::lower_bound(mapped, mapped + mappedCount, start) - mapped;
+
+	// resume decoding after the last entry point whose slots are all below start
+	size_t k = std::lower_bound(skips.begin(), skips.end(), start, SkipBefore()) - skips.begin();
+	if (k > 0 && cursor.packedDecoded < k * PACKED_SKIP_INTERVAL) {
+		cursor.packedByte = skips[k - 1].byte;
+		cursor.packedSlot = skips[k - 1].last;
+		cursor.packedDecoded = k * PACKED_SKIP_INTERVAL;
+		cursor.pending = false;
+	}
+	SlotSkipper skipper;
+	forEachBelow(cursor, start, skipper);
+}
+
+void PostingList::unpack() {
+	if (!packedCount && !mappedCount) return;
+
+	std::vector<sigSlot> all;
+	all.reserve(size());
+	SlotCollector collector(all);
+	forEach(collector);
+
+	// packed or mapped slots come first, then the plain ones: both runs are sorted
+	std::inplace_merge(all.begin(), all.begin() + packedCount + mappedCount, all.end());
+
+	slots.swap(all);
+	std::vector<unsigned char>().swap(packed);
+	std::vector<PackedSkip>().swap(skips);
+	packedCount = 0;
+	mapped = 0;
+	mappedCount = 0;
+}
+
+void PostingList::pack() {
+	unpack();
+	if (slots.empty()) return;
+
+	std::vector<unsigned char> out;
+	out.reserve(slots.size() * 2);
+	std::vector<PackedSkip> outSkips;
+	outSkips.reserve(slots.size() / PACKED_SKIP_INTERVAL);
+	sigSlot prev = 0;
+	for (size_t k = 0; k < slots.size(); k++) {
+		sigSlot delta = slots[k] - prev;
+		prev = slots[k];
+		while (delta >= 0x80) {
+			out.push_back((unsigned char)(delta | 0x80));
+			delta >>= 7;
+		}
+		out.push_back((unsigned char)delta);
+		if ((k + 1) % PACKED_SKIP_INTERVAL == 0) {
+			PackedSkip skip = { out.size(), slots[k] };
+			outSkips.push_back(skip);
+		}
+	}
+
+	// fit the arrays to their contents
+	std::vector<unsigned char>(out.begin(), out.end()).swap(packed);
+	skips.swap(outSkips);
+	packedCount = slots.size();
+	std::vector<sigSlot>().swap(slots);
+}
+
+void PostingList::borrow(sigSlot* mappedSlots, size_t n) {
+	clear();
+	mapped = mappedSlots;
+	mappedCount = n;
+}
+
+void PostingList::clear() {
+	std::vector<sigSlot>().swap(slots);
+	std::vector<unsigned char>().swap(packed);
+	std::vector<PackedSkip>().swap(skips);
+	packedCount = 0;
+	mapped = 0;
+	mappedCount = 0;
+}
@@ -0,0 +1,182 @@
+/***************************************************************************
+    imgSeek ::  Compact posting lists for the coefficient buckets
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef POSTINGS_H
+#define POSTINGS_H
+
+#include <stddef.h>
+#include <algorithm>
+#include <vector>
+
+// Position of a signature inside the dense store of its db space
+typedef unsigned int sigSlot;
+
+// packed slots between two seek() entry points of a PostingList
+#define PACKED_SKIP_INTERVAL 256
+
+/* Where a traversal of a PostingList in slot order stopped, see forEachBelow */
+struct PostingCursor {
+	PostingCursor(): plain(0), mapped(0), packedByte(0), packedDecoded(0), packedSlot(0), pending(false) {}
+	size_t plain;		/* next position on the plain array */
+	size_t mapped;		/* next position on the mapped array */
+	size_t packedByte;	/* next byte to decode on the packed array */
+	size_t packedDecoded;	/* packed slots decoded so far */
+	sigSlot packedSlot;	/* last packed slot decoded */
+	bool pending;		/* packedSlot was decoded but not visited yet */
+};
+
+/* List of signature slots having one coefficient (one bucket).
+
+   Slots are kept sorted on a contiguous array. New slots are usually the
+   highest ones, so appending is cheap; a reused slot is inserted in place.
+   A list can also be packed: its slots are stored as varint encoded deltas,
+   which takes 1-3 bytes per slot instead of 4. Packing is meant for cold
+   buckets, e.g. right after a db space is loaded. Slots added to a packed
+   list go to the plain array again, so adding stays cheap and the next
+   pack() merges them in.
+   Likewise, the slots of a list loaded from a mapped index file stay on the
+   file (see MappedFile) and new ones go to the plain array. Removing slots
+   from the mapped array only copies the pages it touches.
+ */
+class PostingList {
+public:
+	PostingList(): mapped(0), mappedCount(0), packedCount(0) {}
+
+	void push_back(const sigSlot slot) {
+		if (slots.empty() || slots.back() < slot) {
+			slots.push_back(slot);
+		} else {
+			slots.insert(std::upper_bound(slots.begin(), slots.end(), slot), slot);
+		}
+	}
+
+	size_t size() const {
+		return packedCount + mappedCount + slots.size();
+	}
+
+	bool isPacked() const {
+		return packedCount > 0;
+	}
+
+	/* Calls visitor(slot) for every slot of the list */
+	template <class Visitor>
+	void forEach(Visitor& visitor) const {
+		if (packedCount) {
+			const unsigned char* p = &packed[0];
+			sigSlot slot = 0;
+			for (size_t k = 0; k < packedCount; k++) {
+				slot += decodeDelta(p);
+				visitor(slot);
+			}
+		}
+		for (size_t k = 0; k < mappedCount; k++) {
+			visitor(mapped[k]);
+		}
+		const size_t sz = slots.size();
+		const sigSlot* s = sz ? &slots[0] : 0;
+		for (size_t k = 0; k < sz; k++) {
+			visitor(s[k]);
+		}
+	}
+
+	/* Calls visitor(slot) for the slots of the list lower than end which
+	   weren't visited through cursor yet. Successive calls with a growing
+	   end walk the list one slot range after the other. */
+	template <class Visitor>
+	void forEachBelow(PostingCursor& cursor, const sigSlot end, Visitor& visitor) const {
+		while (cursor.pending || cursor.packedDecoded < packedCount) {
+			if (!cursor.pending) {
+				const unsigned char* p = &packed[cursor.packedByte];
+				cursor.packedSlot += decodeDelta(p);
+				cursor.packedByte = p - &packed[0];
+				cursor.packedDecoded++;
+				cursor.pending = true;
+			}
+			if (cursor.packedSlot >= end) break;
+			visitor(cursor.packedSlot);
+			cursor.pending = false;
+		}
+		while (cursor.mapped < mappedCount && mapped[cursor.mapped] < end) {
+			visitor(mapped[cursor.mapped++]);
+		}
+		const size_t sz = slots.size();
+		while (cursor.plain < sz && slots[cursor.plain] < end) {
+			visitor(slots[cursor.plain++]);
+		}
+	}
+
+	/* Moves cursor past the slots lower than start, without visiting them */
+	void seek(PostingCursor& cursor, const sigSlot start) const;
+
+	/* Removes slot from the list. Returns false if it was not there */
+	bool remove(const sigSlot slot);
+
+	/* Removes every slot of the sorted range [first, last) from the list in
+	   a single pass. Returns how many were on it */
+	size_t removeAll(const sigSlot* first, const sigSlot* last);
+
+	/* Uses the n sorted slots at mappedSlots, on a mapped index file, as the list */
+	void borrow(sigSlot* mappedSlots, size_t n);
+
+	/* Varint encodes every slot of the list */
+	void pack();
+
+	/* Moves every slot of the list to the plain array, decoding packed ones */
+	void unpack();
+
+	void clear();
+
+	/* Heap bytes held by this list, mapped slots take none */
+	size_t memoryUsage() const {
+		return slots.capacity() * sizeof(sigSlot) + packed.capacity() + skips.capacity() * sizeof(PackedSkip);
+	}
+
+private:
+	static sigSlot decodeDelta(const unsigned char*& p) {
+		sigSlot delta = 0;
+		int shift = 0;
+		unsigned char b;
+		do {
+			b = *p++;
+			delta |= (sigSlot)(b & 0x7f) << shift;
+			shift += 7;
+		} while (b & 0x80);
+		return delta;
+	}
+
+	static sigSlot* removeSorted(sigSlot* begin, sigSlot* end, const sigSlot* first, const sigSlot* last);
+
+	std::vector<sigSlot> slots;		/* plain slots, sorted */
+	sigSlot* mapped;			/* slots on a mapped index file, sorted */
+	size_t mappedCount;
+	std::vector<unsigned char> packed;	/* varint deltas of sorted slots, never along with mapped ones */
+	size_t packedCount;
+
+	/* Where decoding the packed array stands after every PACKED_SKIP_INTERVAL
+	   slots, so seek() jumps close to its slot instead of decoding from the
+	   start: entry k is after slot (k + 1) * PACKED_SKIP_INTERVAL - 1 */
+	struct PackedSkip {
+		size_t byte;	/* next byte to decode */
+		sigSlot last;	/* last slot decoded */
+	};
+	std::vector<PackedSkip> skips;
+};
+
+#endif
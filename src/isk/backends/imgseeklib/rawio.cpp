@@ -0,0 +1,103 @@
+/***************************************************************************
+    imgSeek ::  Files written without stdio, iostreams or malloc
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include <errno.h>
+#include <fcntl.h>
+#include <string.h>
+#include <unistd.h>
+
+#include "rawio.h"
+
+// bytes buffered before writing them out
+#define RAW_BUFFER_SIZE (1 << 20)
+
+bool RawFileWriter::open(const char* filename) {
+	close();
+	failed = false;
+	used = 0;
+	offset = 0;
+	fd = ::open(filename, O_WRONLY | O_CREAT | O_TRUNC, 0644);
+	if (fd < 0) {
+		failed = true;
+		return false;
+	}
+	void* p = mmap(0, RAW_BUFFER_SIZE, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+	if (p == MAP_FAILED) {
+		::close(fd);
+		fd = -1;
+		failed = true;
+		return false;
+	}
+	buffer = (char*) p;
+	return true;
+}
+
+void RawFileWriter::write(const char* data, size_t n) {
+	if (fd < 0) {
+		failed = true;
+		return;
+	}
+	while (n) {
+		if (used == RAW_BUFFER_SIZE) flush();
+		size_t chunk = RAW_BUFFER_SIZE - used < n ? RAW_BUFFER_SIZE - used : n;
+		memcpy(buffer + used, data, chunk);
+		used += chunk;
+		data += chunk;
+		n -= chunk;
+	}
+}
+
+void RawFileWriter::seek(unsigned long to) {
+	flush();
+	offset = to;
+}
+
+void RawFileWriter::flush() {
+	size_t done = 0;
+	while (done < used && !failed) {
+		ssize_t n = pwrite(fd, buffer + done, used - done, offset + done);
+		if (n < 0 && errno == EINTR) continue;
+		if (n <= 0) failed = true;
+		else done += n;
+	}
+	offset += used;
+	used = 0;
+}
+
+bool RawFileWriter::close() {
+	if (fd >= 0) {
+		flush();
+		if (::close(fd)) failed = true;
+		fd = -1;
+	}
+	if (buffer) {
+		munmap(buffer, RAW_BUFFER_SIZE);
+		buffer = 0;
+	}
+	return !failed;
+}
+
+void rawError(const char* message, const char* name) {
+	// a failed write to stderr has nowhere to be told
+	ssize_t ignored = ::write(2, message, strlen(message));
+	if (name) ignored = ::write(2, name, strlen(name));
+	ignored = ::write(2, "\n", 1);
+	(void) ignored;
+}
@@ -0,0 +1,118 @@
+/***************************************************************************
+    imgSeek ::  Files written without stdio, iostreams or malloc
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef RAWIO_H
+#define RAWIO_H
+
+#include <stddef.h>
+#include <new>
+#include <sys/mman.h>
+
+/* Snapshots are written by a child forked from a process running many
+   threads (see snapshotdbs()). Only the forking thread lives on in the
+   child, so any lock another thread held at that time, like the ones of
+   malloc or of stdio and iostreams, stays held forever there. What the child
+   runs goes through system calls only: these classes.
+ */
+
+/* Allocator taking memory from the kernel with mmap(), for containers used
+   on a forked child. Each allocation takes whole pages, so it suits few big
+   arrays.
+ */
+template <class T>
+class PageAllocator {
+public:
+	typedef T value_type;
+	typedef T* pointer;
+	typedef const T* const_pointer;
+	typedef T& reference;
+	typedef const T& const_reference;
+	typedef size_t size_type;
+	typedef ptrdiff_t difference_type;
+	template <class U> struct rebind { typedef PageAllocator<U> other; };
+
+	PageAllocator() {}
+	template <class U> PageAllocator(const PageAllocator<U>&) {}
+
+	pointer allocate(size_type n, const void* = 0) {
+		void* p = mmap(0, bytes(n), PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+		if (p == MAP_FAILED) throw std::bad_alloc();
+		return (pointer) p;
+	}
+	void deallocate(pointer p, size_type n) { munmap(p, bytes(n)); }
+
+	size_type max_size() const { return (size_type) -1 / sizeof(T); }
+	pointer address(reference x) const { return &x; }
+	const_pointer address(const_reference x) const { return &x; }
+	void construct(pointer p, const T& value) { new ((void*) p) T(value); }
+	void destroy(pointer p) { p->~T(); }
+
+private:
+	static size_t bytes(size_type n) { return n ? n * sizeof(T) : 1; }
+};
+
+template <class T, class U>
+bool operator==(const PageAllocator<T>&, const PageAllocator<U>&) { return true; }
+template <class T, class U>
+bool operator!=(const PageAllocator<T>&, const PageAllocator<U>&) { return false; }
+
+/* File written through a buffer of its own, with write(2) only. Errors are
+   remembered: good() tells whether everything written so far made it to the
+   file.
+ */
+class RawFileWriter {
+public:
+	RawFileWriter(): fd(-1), buffer(0), used(0), offset(0), failed(false) {}
+	~RawFileWriter() { close(); }
+
+	/* Creates filename, or truncates it. Returns false on failure */
+	bool open(const char* filename);
+
+	void write(const char* data, size_t n);
+
+	/* Offset the next write goes to */
+	unsigned long tell() const { return offset + used; }
+
+	/* Moves the next write to offset to */
+	void seek(unsigned long to);
+
+	/* Writes out what is buffered and closes the file. Returns good() */
+	bool close();
+
+	bool good() const { return !failed; }
+
+private:
+	void flush();
+
+	int fd;
+	char* buffer;
+	size_t used;			/* bytes on buffer */
+	unsigned long offset;	/* file offset of buffer */
+	bool failed;
+
+	// not copyable
+	RawFileWriter(const RawFileWriter&);
+	RawFileWriter& operator=(const RawFileWriter&);
+};
+
+/* Writes message and the name that goes with it (if any) to stderr */
+void rawError(const char* message, const char* name = 0);
+
+#endif
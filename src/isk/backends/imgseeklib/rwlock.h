@@ -0,0 +1,74 @@
+/***************************************************************************
+    imgSeek ::  Reader/writer locks for the db spaces
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef RWLOCK_H
+#define RWLOCK_H
+
+#include <pthread.h>
+
+/* Many readers or a single writer. Not recursive: a thread holding it
+   must not lock it again. Waiting writers go before new readers, so a
+   steady stream of queries can't hold back adds and removals forever.
+ */
+class RWLock {
+public:
+	RWLock() {
+		pthread_rwlockattr_t attr;
+		pthread_rwlockattr_init(&attr);
+#ifdef __GLIBC__
+		// glibc prefers readers by default
+		pthread_rwlockattr_setkind_np(&attr, PTHREAD_RWLOCK_PREFER_WRITER_NONRECURSIVE_NP);
+#endif
+		pthread_rwlock_init(&lock, &attr);
+		pthread_rwlockattr_destroy(&attr);
+	}
+	~RWLock() { pthread_rwlock_destroy(&lock); }
+
+	void readLock() { pthread_rwlock_rdlock(&lock); }
+	void writeLock() { pthread_rwlock_wrlock(&lock); }
+	void unlock() { pthread_rwlock_unlock(&lock); }
+
+private:
+	pthread_rwlock_t lock;
+
+	// not copyable
+	RWLock(const RWLock&);
+	RWLock& operator=(const RWLock&);
+};
+
+/* Holds a read lock until the end of the enclosing scope */
+class ReadLocker {
+public:
+	ReadLocker(RWLock& lock): lock(lock) { lock.readLock(); }
+	~ReadLocker() { lock.unlock(); }
+private:
+	RWLock& lock;
+};
+
+/* Holds a write lock until the end of the enclosing scope */
+class WriteLocker {
+public:
+	WriteLocker(RWLock& lock): lock(lock) { lock.writeLock(); }
+	~WriteLocker() { lock.unlock(); }
+private:
+	RWLock& lock;
+};
+
+#endif
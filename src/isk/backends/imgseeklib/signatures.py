@@ -0,0 +1,143 @@
+"""
+Image signatures computed apart from the db spaces.
+
+Reading an image and computing its signature takes far longer than adding the signature to a db space,
+and needs no db space at all. So ingestions compute signatures on the worker processes of a
+:class:`SignaturePool`, using every core, while a single thread adds them with
+``ImgDB.add_image_signature()``.
+"""
+
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import itertools
+import logging
+import multiprocessing
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from isk.backends.imgseeklib import imgdb
+
+
+logger = logging.getLogger(__name__)
+
+NUM_COEFS = 40  # coefficients per color channel, see haar.h
+
+ImageSignature = namedtuple("ImageSignature", ("sig1", "sig2", "sig3", "avgl", "width", "height"))
+
+
+def _signature(data) -> Optional[ImageSignature]:
+    """Split engine signature data (see imageSignatureFromPath()) into an :class:`ImageSignature`"""
+    if not data:
+        return None
+    n = NUM_COEFS
+    coefs = [int(x) for x in data[:3 * n]]
+    return ImageSignature(
+        coefs[:n], coefs[n:2 * n], coefs[2 * n:], list(data[3 * n:3 * n + 3]), int(data[3 * n + 3]), int(data[3 * n + 4])
+    )
+
+
+def path_signature(path: str) -> Optional[ImageSignature]:
+    """Signature of the image file on ``path``, None if it can't be read"""
+    return _signature(imgdb.imageSignatureFromPath(path))
+
+
+def blob_signature(data: bytes) -> Optional[ImageSignature]:
+    """Signature of the image encoded on ``data``, None if it can't be read"""
+    return _signature(imgdb.imageSignatureFromBlob(data))
+
+
+class SignaturePool(object):
+    """
+    Computes image signatures on worker processes, started on first use.
+
+    With no workers, signatures are computed on the calling thread instead. The engine releases the GIL
+    meanwhile, so that still runs alongside other api calls.
+    """
+
+    def __init__(self, workers: int = 0):
+        self.workers = max(int(workers), 0)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # workers are forked from a clean process: forking this one would copy engine threads
+                # and the locks they hold
+                context = multiprocessing.get_context("forkserver")
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=context)
+                logger.info("| %d signature worker processes started", self.workers)
+            return self._executor
+
+    def map(self, func: Callable[[Any], Optional[ImageSignature]], items: Iterable[Tuple[Any, Any]],
+            window: int = 0) -> Iterator[Tuple[Any, Optional[ImageSignature]]]:
+        """
+        Compute ``func(arg)`` for ``(tag, arg)`` pairs on ``items``, in order. ``func`` must be a module level
+        function, like :func:`path_signature` or :func:`blob_signature`.
+
+        :param window: Most items being computed at once, 4 per worker when not given. Items are taken from
+            ``items`` as results are yielded, so memory stays bounded however many there are.
+        :return: ``(tag, signature)`` pairs, signature None for the images that failed.
+        """
+        if not self.workers:
+            for tag, arg in items:
+                yield tag, func(arg)
+            return
+
+        window = window or 4 * self.workers
+        pending, futures = deque(), deque()  # (tag, arg) items and their futures, once submitted
+        items = iter(items)
+        executor = self._get_executor()
+        while True:
+            try:
+                for item in itertools.islice(items, window - len(pending)):
+                    pending.append(item)
+                    futures.append(executor.submit(func, item[1]))
+                if not pending:
+                    return
+                result = self._result(futures[0], pending[0][0])
+            except BrokenProcessPool:
+                # a worker died (e.g. the decoder crashed on a malformed image) taking every pending item with
+                # it. Those are computed again one at a time, so only the image that kills workers fails.
+                self._drop_executor(executor)
+                while pending:
+                    tag, arg = pending[0]
+                    executor = self._get_executor()
+                    try:
+                        result = self._result(executor.submit(func, arg), tag)
+                    except BrokenProcessPool:
+                        logger.error("Signature workers died computing %s", tag)
+                        self._drop_executor(executor)
+                        result = None
+                    pending.popleft()
+                    yield tag, result
+                futures.clear()
+                executor = self._get_executor()
+                continue
+            futures.popleft()
+            yield pending.popleft()[0], result
+
+    @staticmethod
+    def _result(future, tag) -> Optional[ImageSignature]:
+        """Result of ``future``, None if it raised (but for BrokenProcessPool, see map())"""
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            raise
+        except Exception:
+            logger.error("Error computing signature of %s", tag, exc_info=True)
+            return None
+
+    def _drop_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Forget a broken executor, so the next _get_executor() starts a new one"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,108 @@
+/***************************************************************************
+    imgSeek ::  Worker threads splitting a query across cores
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include "threadpool.h"
+
+ThreadPool::ThreadPool(): wanted(0), running(0) {
+	pthread_mutex_init(&mutex, 0);
+	pthread_cond_init(&work, 0);
+}
+
+void ThreadPool::resize(int threads) {
+	pthread_mutex_lock(&mutex);
+	wanted = threads < 0 ? 0 : threads;
+	while (running < wanted) {
+		pthread_t thread;
+		if (pthread_create(&thread, 0, worker, this)) break;
+		pthread_detach(thread);
+		running++;
+	}
+	// extra workers quit when they wake up
+	pthread_cond_broadcast(&work);
+	pthread_mutex_unlock(&mutex);
+}
+
+int ThreadPool::size() {
+	pthread_mutex_lock(&mutex);
+	int res = wanted;
+	pthread_mutex_unlock(&mutex);
+	return res;
+}
+
+// Both below must be called with mutex held
+
+PoolTask* ThreadPool::take(Batch* batch) {
+	PoolTask* task = (*batch->tasks)[batch->next++];
+	if (batch->next == batch->tasks->size()) batches.remove(batch);
+	return task;
+}
+
+void ThreadPool::finish(Batch* batch) {
+	if (--batch->pending == 0) pthread_cond_signal(&batch->done);
+}
+
+void ThreadPool::runAll(std::vector<PoolTask*>& tasks) {
+	if (tasks.empty()) return;
+
+	Batch batch;
+	batch.tasks = &tasks;
+	batch.next = 0;
+	batch.pending = tasks.size();
+	pthread_cond_init(&batch.done, 0);
+
+	pthread_mutex_lock(&mutex);
+	batches.push_back(&batch);
+	pthread_cond_broadcast(&work);
+
+	// help with our own batch
+	while (batch.next < tasks.size()) {
+		PoolTask* task = take(&batch);
+		pthread_mutex_unlock(&mutex);
+		task->run();
+		pthread_mutex_lock(&mutex);
+		finish(&batch);
+	}
+	while (batch.pending) pthread_cond_wait(&batch.done, &mutex);
+	pthread_mutex_unlock(&mutex);
+
+	pthread_cond_destroy(&batch.done);
+}
+
+void ThreadPool::workerLoop() {
+	pthread_mutex_lock(&mutex);
+	for (;;) {
+		while (batches.empty() && running <= wanted) pthread_cond_wait(&work, &mutex);
+		if (running > wanted) break;
+
+		Batch* batch = batches.front();
+		PoolTask* task = take(batch);
+		pthread_mutex_unlock(&mutex);
+		task->run();
+		pthread_mutex_lock(&mutex);
+		finish(batch);
+	}
+	running--;
+	pthread_mutex_unlock(&mutex);
+}
+
+void* ThreadPool::worker(void* pool) {
+	((ThreadPool*) pool)->workerLoop();
+	return 0;
+}
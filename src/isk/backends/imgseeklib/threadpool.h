@@ -0,0 +1,77 @@
+/***************************************************************************
+    imgSeek ::  Worker threads splitting a query across cores
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef THREADPOOL_H
+#define THREADPOOL_H
+
+#include <pthread.h>
+#include <stddef.h>
+#include <list>
+#include <vector>
+
+/* A piece of work run by the pool */
+class PoolTask {
+public:
+	virtual ~PoolTask() {}
+	virtual void run() = 0;
+};
+
+/* Fixed set of worker threads shared by all queries.
+
+   runAll() hands a batch of tasks to the workers and returns once every
+   task of the batch is done. The calling thread runs tasks of its own batch
+   too, so a batch always makes progress even when every worker is busy with
+   other queries. Tasks of a batch must not depend on each other.
+ */
+class ThreadPool {
+public:
+	ThreadPool();
+
+	/* Number of worker threads. 0 runs every task on the calling thread */
+	void resize(int threads);
+	int size();
+
+	void runAll(std::vector<PoolTask*>& tasks);
+
+private:
+	struct Batch {
+		std::vector<PoolTask*>* tasks;
+		size_t next;		/* first task nobody took yet */
+		size_t pending;		/* tasks not finished yet */
+		pthread_cond_t done;
+	};
+
+	pthread_mutex_t mutex;
+	pthread_cond_t work;
+	std::list<Batch*> batches;	/* batches with tasks nobody took yet */
+	int wanted;
+	int running;
+
+	PoolTask* take(Batch* batch);
+	void finish(Batch* batch);
+	void workerLoop();
+	static void* worker(void* pool);
+
+	// not copyable
+	ThreadPool(const ThreadPool&);
+	ThreadPool& operator=(const ThreadPool&);
+};
+
+#endif
@@ -0,0 +1,330 @@
+/***************************************************************************
+    imgSeek ::  Write ahead log of db space changes
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#include <dirent.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <limits.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/time.h>
+#include <sys/uio.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <iostream>
+
+#include "wal.h"
+
+// records larger than this are taken for garbage
+#define WAL_MAX_RECORD (1 << 30)
+
+/* Each record is preceded by its length and checksum */
+struct WalRecordHeader {
+	unsigned int length;
+	unsigned int checksum;
+};
+
+// FNV-1a
+static unsigned int walChecksum(const char* data, size_t length) {
+	unsigned int h = 2166136261u;
+	for (size_t i = 0; i < length; i++) {
+		h ^= (unsigned char) data[i];
+		h *= 16777619u;
+	}
+	return h;
+}
+
+WriteAheadLog::WriteAheadLog(): fd(-1), syncMs(0), written(0), durable(0), segmentStart(0),
+		syncing(false), broken(false), flusherRunning(false), stopping(false) {
+	pthread_mutex_init(&mutex, 0);
+	pthread_cond_init(&synced, 0);
+	pthread_cond_init(&wakeup, 0);
+}
+
+WriteAheadLog::~WriteAheadLog() {
+	close();
+	pthread_cond_destroy(&wakeup);
+	pthread_cond_destroy(&synced);
+	pthread_mutex_destroy(&mutex);
+}
+
+bool WriteAheadLog::open(const char* filename, int syncMs) {
+	int nfd = ::open(filename, O_WRONLY | O_CREAT | O_APPEND, 0644);
+	// sync its directory entry too, or a crash could lose the whole segment
+	if (nfd < 0 || !syncFile(filename)) {
+		std::cerr << "ERROR: unable to open log file for write ops:" << filename << std::endl;
+		if (nfd >= 0) ::close(nfd);
+		return false;
+	}
+
+	pthread_mutex_lock(&mutex);
+	finishSegment();
+	fd = nfd;
+	segmentStart = written;
+	broken = false;
+	this->syncMs = syncMs < 0 ? 0 : syncMs;
+	if (this->syncMs && !flusherRunning) {
+		stopping = false;
+		flusherRunning = !pthread_create(&flusher, 0, flusherMain, this);
+	}
+	pthread_cond_broadcast(&wakeup);
+	pthread_mutex_unlock(&mutex);
+	return true;
+}
+
+void WriteAheadLog::close() {
+	pthread_mutex_lock(&mutex);
+	finishSegment();
+	bool join = flusherRunning;
+	flusherRunning = false;
+	stopping = true;
+	pthread_cond_broadcast(&wakeup);
+	pthread_mutex_unlock(&mutex);
+	if (join) pthread_join(flusher, 0);
+}
+
+bool WriteAheadLog::isOpen() {
+	pthread_mutex_lock(&mutex);
+	bool res = fd >= 0;
+	pthread_mutex_unlock(&mutex);
+	return res;
+}
+
+bool WriteAheadLog::append(const char* data, size_t length, unsigned long long& position) {
+	WalRecordHeader header;
+	header.length = length;
+	header.checksum = walChecksum(data, length);
+
+	position = 0;
+	pthread_mutex_lock(&mutex);
+	if (fd < 0) {
+		pthread_mutex_unlock(&mutex);
+		return true;
+	}
+	if (broken) {
+		std::cerr << "ERROR: log file failed, no change is taken until the next checkpoint" << std::endl;
+		pthread_mutex_unlock(&mutex);
+		return false;
+	}
+	// a single write, so records of concurrent writers never interleave
+	struct iovec iov[2];
+	iov[0].iov_base = &header;
+	iov[0].iov_len = sizeof(WalRecordHeader);
+	iov[1].iov_base = (void*) data;
+	iov[1].iov_len = length;
+	ssize_t res = writev(fd, iov, 2);
+	if (res != (ssize_t) (sizeof(WalRecordHeader) + length)) {
+		std::cerr << "ERROR: error writing log file: " << strerror(res < 0 ? errno : ENOSPC) << std::endl;
+		// a record written in part ends the log for replay
+		broken = true;
+		pthread_mutex_unlock(&mutex);
+		return false;
+	}
+	written += res;
+	position = written;
+	pthread_mutex_unlock(&mutex);
+	return true;
+}
+
+void WriteAheadLog::sync(unsigned long long position) {
+	if (!position) return;
+	pthread_mutex_lock(&mutex);
+	while (!syncMs && durable < position && fd >= 0) {
+		// whoever syncs covers every record appended so far, ours included
+		if (syncing) pthread_cond_wait(&synced, &mutex);
+		else syncLocked();
+	}
+	pthread_mutex_unlock(&mutex);
+}
+
+unsigned long long WriteAheadLog::segmentSize() {
+	pthread_mutex_lock(&mutex);
+	unsigned long long res = written - segmentStart;
+	pthread_mutex_unlock(&mutex);
+	return res;
+}
+
+bool WriteAheadLog::isBroken() {
+	pthread_mutex_lock(&mutex);
+	bool res = broken;
+	pthread_mutex_unlock(&mutex);
+	return res;
+}
+
+void WriteAheadLog::setBroken() {
+	pthread_mutex_lock(&mutex);
+	broken = true;
+	pthread_mutex_unlock(&mutex);
+}
+
+int WriteAheadLog::syncInterval() {
+	pthread_mutex_lock(&mutex);
+	int res = syncMs;
+	pthread_mutex_unlock(&mutex);
+	return res;
+}
+
+// The three below must be called with mutex held
+
+/* Syncs every record appended so far. Releases the mutex meanwhile, so
+   writers keep appending while the disk works */
+void WriteAheadLog::syncLocked() {
+	syncing = true;
+	unsigned long long target = written;
+	int syncFd = fd;
+	pthread_mutex_unlock(&mutex);
+	int res = fdatasync(syncFd);
+	pthread_mutex_lock(&mutex);
+	syncing = false;
+	// retrying a failed sync doesn't bring the lost pages back, so don't
+	if (res) {
+		std::cerr << "ERROR: error syncing log file: " << strerror(errno) << std::endl;
+		broken = true;
+	}
+	if (target > durable) durable = target;
+	pthread_cond_broadcast(&synced);
+}
+
+void WriteAheadLog::finishSegment() {
+	while (syncing) pthread_cond_wait(&synced, &mutex);
+	if (fd < 0) return;
+	if (durable < written) syncLocked();
+	::close(fd);
+	fd = -1;
+}
+
+void WriteAheadLog::flusherLoop() {
+	pthread_mutex_lock(&mutex);
+	while (!stopping) {
+		if (syncMs) {
+			struct timeval now;
+			gettimeofday(&now, 0);
+			unsigned long long usec = now.tv_usec + syncMs * 1000ULL;
+			struct timespec until;
+			until.tv_sec = now.tv_sec + usec / 1000000;
+			until.tv_nsec = usec % 1000000 * 1000;
+			pthread_cond_timedwait(&wakeup, &mutex, &until);
+		} else {
+			pthread_cond_wait(&wakeup, &mutex);
+		}
+		if (!stopping && fd >= 0 && !syncing && durable < written) syncLocked();
+	}
+	pthread_mutex_unlock(&mutex);
+}
+
+void* WriteAheadLog::flusherMain(void* log) {
+	((WriteAheadLog*) log)->flusherLoop();
+	return 0;
+}
+
+bool WalReader::open(const char* filename) {
+	close();
+	fd = ::open(filename, O_RDONLY);
+	buffer.clear();
+	pos = 0;
+	return fd >= 0;
+}
+
+void WalReader::close() {
+	if (fd >= 0) ::close(fd);
+	fd = -1;
+}
+
+/* Makes sure n bytes from pos on are buffered */
+bool WalReader::fill(size_t n) {
+	if (buffer.size() - pos >= n) return true;
+	buffer.erase(0, pos);
+	pos = 0;
+	char chunk[65536];
+	while (buffer.size() < n) {
+		ssize_t got = read(fd, chunk, sizeof(chunk));
+		if (got <= 0) return false;
+		buffer.append(chunk, got);
+	}
+	return true;
+}
+
+bool WalReader::next(std::string& record) {
+	if (fd < 0 || !fill(sizeof(WalRecordHeader))) return false;
+	WalRecordHeader header;
+	memcpy(&header, buffer.data() + pos, sizeof(WalRecordHeader));
+	if (header.length > WAL_MAX_RECORD || !fill(sizeof(WalRecordHeader) + header.length)) return false;
+	const char* data = buffer.data() + pos + sizeof(WalRecordHeader);
+	if (walChecksum(data, header.length) != header.checksum) return false;
+	record.assign(data, header.length);
+	pos += sizeof(WalRecordHeader) + header.length;
+	return true;
+}
+
+// splits a path into its directory and file name
+static void splitPath(const std::string& path, std::string& dir, std::string& name) {
+	size_t slash = path.rfind('/');
+	dir = slash == std::string::npos ? "." : (slash ? path.substr(0, slash) : "/");
+	name = slash == std::string::npos ? path : path.substr(slash + 1);
+}
+
+std::string walSegmentName(const std::string& prefix, unsigned long number) {
+	char suffix[32];
+	snprintf(suffix, sizeof(suffix), ".%lu", number);
+	return prefix + suffix;
+}
+
+std::vector<unsigned long> walSegments(const std::string& prefix) {
+	std::vector<unsigned long> numbers;
+	std::string dir, name;
+	splitPath(prefix, dir, name);
+	name += ".";
+
+	DIR* d = opendir(dir.c_str());
+	if (!d) return numbers;
+	while (struct dirent* entry = readdir(d)) {
+		const char* s = entry->d_name;
+		if (strncmp(s, name.c_str(), name.size())) continue;
+		s += name.size();
+		char* end;
+		unsigned long number = strtoul(s, &end, 10);
+		if (*s >= '0' && *s <= '9' && !*end) numbers.push_back(number);
+	}
+	closedir(d);
+	std::sort(numbers.begin(), numbers.end());
+	return numbers;
+}
+
+bool syncFile(const char* filename) {
+	int fd = ::open(filename, O_RDONLY);
+	if (fd < 0) return false;
+	bool res = !fsync(fd);
+	::close(fd);
+
+	// no allocation, snapshot children call this (see rawio.h)
+	char dir[PATH_MAX];
+	const char* slash = strrchr(filename, '/');
+	size_t n = slash ? (slash == filename ? 1 : slash - filename) : 0;
+	if (n >= sizeof(dir)) return false;
+	memcpy(dir, filename, n);
+	dir[n] = 0;
+	fd = ::open(n ? dir : ".", O_RDONLY | O_DIRECTORY);
+	if (fd < 0) return false;
+	res = !fsync(fd) && res;
+	::close(fd);
+	return res;
+}
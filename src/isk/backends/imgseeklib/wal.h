@@ -0,0 +1,132 @@
+/***************************************************************************
+    imgSeek ::  Write ahead log of db space changes
+                             -------------------
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+ ***************************************************************************
+ */
+
+#ifndef WAL_H
+#define WAL_H
+
+#include <pthread.h>
+#include <stddef.h>
+#include <string>
+#include <vector>
+
+/* Append-only file of records, made durable in batches.
+
+   A log is split in segments, files named <prefix>.<number>; records are
+   appended to the last one. Each record is framed with its length and a
+   checksum, so a record torn by a crash is told apart from a complete one.
+
+   Durability is batched one of two ways, see open(): either every writer
+   waits for its records to reach the disk and a single fdatasync() covers
+   the records of all writers waiting meanwhile, or a background thread
+   syncs the log every few milliseconds and writers don't wait at all.
+ */
+class WriteAheadLog {
+public:
+	WriteAheadLog();
+	~WriteAheadLog();
+
+	/* Starts appending to a new segment file, syncing and closing the current
+	   one if open. With syncMs 0 sync() waits for the disk, otherwise the
+	   log is synced every syncMs milliseconds. A broken log is whole again
+	   on the new segment. Returns false if the file can't be created, the
+	   current segment is kept then */
+	bool open(const char* filename, int syncMs);
+	/* Syncs and closes the current segment */
+	void close();
+	bool isOpen();
+
+	/* Appends a record, setting position to the log position right after
+	   it, to pass to sync(), or to 0 if the log is not open. Returns false
+	   if the record can't be written: the log is broken then */
+	bool append(const char* data, size_t length, unsigned long long& position);
+
+	/* Returns once the log is durable up to position (see open()). A failed
+	   sync breaks the log */
+	void sync(unsigned long long position);
+
+	/* Whether a record failed to be written or synced, see append(). Records
+	   appended after it would be lost with it on replay, so a broken log
+	   takes no more until a new segment is opened */
+	bool isBroken();
+	void setBroken();
+
+	/* Bytes appended to the current segment */
+	unsigned long long segmentSize();
+	int syncInterval();
+
+private:
+	pthread_mutex_t mutex;
+	pthread_cond_t synced;		/* signaled when a sync ends */
+	pthread_cond_t wakeup;		/* wakes the background sync thread */
+	int fd;
+	int syncMs;
+	unsigned long long written;	/* log position after the last record */
+	unsigned long long durable;	/* position the log is synced up to */
+	unsigned long long segmentStart;	/* position the current segment starts at */
+	bool syncing;			/* a sync runs without the mutex held */
+	bool broken;
+	bool flusherRunning;
+	bool stopping;
+	pthread_t flusher;
+
+	void syncLocked();
+	void finishSegment();
+	void flusherLoop();
+	static void* flusherMain(void* log);
+
+	// not copyable
+	WriteAheadLog(const WriteAheadLog&);
+	WriteAheadLog& operator=(const WriteAheadLog&);
+};
+
+/* Reads back the records of a log segment, in order. Stops at the first
+   torn or corrupt record, which is where a crash interrupted the log */
+class WalReader {
+public:
+	WalReader(): fd(-1) {}
+	~WalReader() { close(); }
+
+	bool open(const char* filename);
+	void close();
+	/* Next record into record. Returns false at the end of the segment */
+	bool next(std::string& record);
+
+private:
+	int fd;
+	std::string buffer;
+	size_t pos;
+
+	bool fill(size_t n);
+
+	// not copyable
+	WalReader(const WalReader&);
+	WalReader& operator=(const WalReader&);
+};
+
+/* File name of segment number of the log prefix */
+std::string walSegmentName(const std::string& prefix, unsigned long number);
+/* Numbers of the segments of the log prefix found on disk, in order */
+std::vector<unsigned long> walSegments(const std::string& prefix);
+
+/* Flushes filename to the disk, along with its directory entry. Returns
+   false on failure */
+bool syncFile(const char* filename);
+
+#endif
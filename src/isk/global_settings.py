@@ -61,13 +61,28 @@ HOST = "0.0.0.0"
 PORT = 31128
 DEBUG = True
 SAVE_ALL_ON_SHUTDOWN = True
-DATABASE_PATH = "~/isk-db"
+DATABASE_PATH = "~/isk-db"  # db spaces are saved to DATABASE_PATH.spaces/, one file each, read from DATABASE_PATH if missing
 SAVE_INTERVAL = 120
 AUTOMATIC_SAVE = False
+PACK_COLD_POSTINGS = False  # varint-compress bucket postings of loaded databases (less memory, slower removals, no longer shared with the page cache)
 BIND_HOSTNAME = "isk1host"
 LOG_PATH = "isk-daemon.log"
 LOG_DEBUG = False
 URL_DOWNLOADER_TIMEOUT = 10
+ISK_API_WORKERS = os.cpu_count() or 1  # threads running isk api calls in parallel
+QUERY_THREADS = 1  # threads a single query on a very large database is split across (1 disables it)
+SIGNATURE_WORKERS = os.cpu_count() or 1  # processes decoding images added in bulk, e.g. by add_dir (0 decodes inline)
+MAX_UPLOAD_SIZE = 32 * 1024 * 1024  # bytes of a form posted to the dropbox or query endpoints, bigger ones are refused
+DROPBOX_ARCHIVE_WINDOW = 0  # images of an uploaded archive held in memory while added (0 for 4 per signature worker)
+DROPBOX_ARCHIVE_UPLOADS = 2  # archives added at once, each holding an api thread while its client sends it
+COMPACTION_MIN_DEAD = 1000  # removed images a database collects before its posting lists are compacted
+COMPACTION_STEP = 256  # removed images compacted per db space write lock hold
+WRITE_AHEAD_LOG = True  # log changes to DATABASE_PATH.wal.<n> files, so db space files are only rewritten by checkpoints
+WAL_SYNC_INTERVAL = 0  # ms between log syncs (0 syncs before each change returns, concurrent changes share a sync)
+CHECKPOINT_LOG_SIZE = 64 * 1024 * 1024  # log bytes after which the periodic save rewrites the changed db space files
+LOAD_THREADS = os.cpu_count() or 1  # db space files loaded in parallel at startup
+LAZY_LOAD = True  # only list the db space files at startup, loading each one on its first use
+EVICT_IDLE_AFTER = 0  # seconds a db space may go unused before it is dropped from memory, to its file (0 never)
 
 DEBUG_AUTORELOAD_APP = True
 TMP_DIR = tempfile.gettempdir()
@@ -112,6 +127,8 @@ LOGGING = {
 }
 
 PERIODIC_DB_SAVE_CRONTAB = "* * * * *"
+PERIODIC_COMPACTION_CRONTAB = "* * * * *"
+PERIODIC_EVICTION_CRONTAB = "* * * * *"
 
 # dictConfig(LOGGING)
 #
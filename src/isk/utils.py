@@ -66,14 +66,18 @@ def dump_args(func):
 
 
 def require_known_db_id(func):
-    """Checks if the 1st parameter (which should be a dbId is valid (has an internal dbSpace entry)"""
+    """
+    Checks if the 1st parameter (which should be a dbId is valid (has an internal dbSpace entry), and keeps the
+    db space loaded while the call runs (see ImgDB.using_db_space())
+    """
     def _wrapper(imgdb_instance, db_id, *args, **kwargs):
         if db_id not in imgdb_instance.db_spaces:
             raise ImageDBException(
                 "Attempt to call %s with unknown dbid %d. "
                 "Have you created it first with createdb() or loaddb()?" % (func.__name__, db_id)
             )
-        return func(imgdb_instance, db_id, *args, **kwargs)
+        with imgdb_instance.using_db_space(db_id):
+            return func(imgdb_instance, db_id, *args, **kwargs)
     return _wrapper
 
 
@@ -35,7 +35,7 @@ urlconf = (
 
     # Querying
     ("GET", "/db/{db_id}/query/", query.SimilarImagesQuery),
-    ("POST", "/db/{db_id}/query/", NotImplementedView),
+    ("POST", "/db/{db_id}/query/", query.SimilarImagesQuery),
 
     # Keywords management
     ("GET", "/db/{db_id}/keywords/", keywords.KeywordsListView),
@@ -3,14 +3,14 @@ Image dropbox - adding images to DB in numerous ways.
 """
 
 from abc import ABCMeta, abstractmethod
+import asyncio
 import logging
 import os
 import tarfile
-import tempfile
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Tuple
 from urllib.parse import urlsplit
 
-from aiohttp import web_exceptions
+from aiohttp import StreamReader, web_exceptions
 
 from sunhead.conf import settings
 
@@ -24,10 +24,6 @@ logger = logging.getLogger(__name__)
 
 class ImagesDropbox(BaseDBView, metaclass=ABCMeta):
 
-    CHUNK = 2048
-    EOF_MARKER = b''
-
-
     @abstractmethod
     async def add_image(self):
         pass
@@ -49,14 +45,7 @@ class ImagesDropbox(BaseDBView, metaclass=ABCMeta):
         except (AssertionError, ValueError):
             logger.error("No image id provided in field 'image_id'", exc_info=True)
             return
-
-    async def _body_to_file(self, filename: str) -> None:
-        with open(filename, 'wb') as f:
-            while True:
-                chunk = await self.request.content.readany()
-                f.write(chunk)
-                if chunk is self.EOF_MARKER:
-                    break
+        return image_id
 
 
 class ImagesDropboxUrl(ImagesDropbox):
@@ -81,48 +70,72 @@ class ImagesDropboxUrl(ImagesDropbox):
 class ImagesDropboxFile(ImagesDropbox):
 
     async def add_image(self):
-        data = await self.request.post()  # FIXME: Do not read whole file into memory, use resp.content
-        image_field = data["image"]
+        data = await self._read_multipart(("image", "image_id"), settings.MAX_UPLOAD_SIZE)
+        if not data.get("image"):
+            logger.error("No image provided in field 'image'")
+            raise web_exceptions.HTTPBadRequest
         image_id = self._get_image_id_from_post_data(data)
-        logger.debug("Adding from image filename=%s", image_field.filename)
-        local_path = os.path.join(settings.TMP_DIR, image_field.filename)
-        with open(local_path, 'wb') as f:
-            for l in image_field.file:
-                f.write(l)
+        logger.debug("Adding uploaded image of %d bytes", len(data["image"]))
 
-        result = await self._hit_api(images_api.add_img, self.requested_db_id, image_id, local_path)
+        result = await self._hit_api(images_api.add_img_blob, self.requested_db_id, image_id or 0, data["image"])
         assert result
         logger.debug("Added id=%s", image_id)
 
 
 class ImagesDropboxArchive(ImagesDropbox, metaclass=ABCMeta):
 
-    TMP_FILE_NAME = "archive.tgz"
+    # Archives are read on an api thread, which stays blocked as long as the client takes to send the body.
+    # Limiting the uploads added at once keeps slow clients from taking every thread of isk_api_executor:
+    # the others wait here, on the event loop.
+    _uploads = None
+
+    @staticmethod
+    def _get_uploads_semaphore() -> asyncio.Semaphore:
+        if ImagesDropboxArchive._uploads is None:
+            ImagesDropboxArchive._uploads = asyncio.Semaphore(settings.DROPBOX_ARCHIVE_UPLOADS)
+        return ImagesDropboxArchive._uploads
 
     async def add_image(self):
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            tmppath = os.path.join(tmpdirname, self.TMP_FILE_NAME)
-            await self._body_to_file(tmppath)
-            await self._unarchive(tmppath, cleanup=True)
-            added = await self._hit_api(images_api.add_dir, self.requested_db_id, tmpdirname, True, True)
-            logger.info("Added %s file(s) from uploaded archive", added)
+        with (await self._get_uploads_semaphore()):
+            body = _BodyReader(self.request.content, self._loop)
+            added = await self._hit_api(self._add_archive, body)
+        logger.info("Added %s file(s) from uploaded archive", added)
         await self._hit_api(db_api.save_all_dbs)
 
+    def _add_archive(self, body: "_BodyReader") -> int:
+        """Add the images of the archive read from ``body``, on an api thread"""
+        image_ids = images_api.add_img_blob_bulk(
+            self.requested_db_id, self._archive_images(body), settings.DROPBOX_ARCHIVE_WINDOW
+        )
+        return sum(1 for image_id in image_ids if image_id)
+
     @abstractmethod
-    async def _unarchive(self, archive_path: str, cleanup: bool = True) -> None:
+    def _archive_images(self, body: "_BodyReader") -> Iterator[Tuple[int, bytes]]:
+        """``(image id, data)`` of the images in the archive, read as they arrive"""
         pass
 
 
 class ImagesDropboxTgz(ImagesDropboxArchive):
 
-    async def _unarchive(self, archive_path: str, cleanup: bool = True) -> None:
-        dest = os.path.dirname(archive_path)
-        with tarfile.open(archive_path) as tar:
-            tar.extractall(path=dest, members=self._unarchive_members(tar))
-        if cleanup:
-            os.remove(archive_path)
-
-    def _unarchive_members(self, members: Sequence) -> Iterable:
+    def _archive_images(self, body: "_BodyReader") -> Iterator[Tuple[int, bytes]]:
+        try:
+            # stream mode reads members in order, as the body arrives, never seeking back
+            with tarfile.open(fileobj=body, mode="r|gz") as tar:
+                for tarinfo in self._unarchive_members(tar):
+                    if tarinfo.size > settings.MAX_UPLOAD_SIZE:
+                        # read whole, so it must not take more than an uploaded image may
+                        logger.error("Skipping %s of uploaded archive: %d bytes, more than MAX_UPLOAD_SIZE",
+                                     tarinfo.name, tarinfo.size)
+                        continue
+                    f = tar.extractfile(tarinfo)
+                    if f is None:  # not a regular file
+                        continue
+                    yield int(os.path.splitext(tarinfo.name)[0]), f.read()
+        except (tarfile.TarError, EOFError, OSError):
+            # the images read so far are still added
+            logger.error("Unable to read uploaded archive", exc_info=True)
+
+    def _unarchive_members(self, members: Iterable) -> Iterable:
         for tarinfo in members:
             try:
                 name, ext = os.path.splitext(tarinfo.name)
@@ -133,3 +146,17 @@ class ImagesDropboxTgz(ImagesDropboxArchive):
             except (ValueError, IndexError, AssertionError):
                 pass
                 # Unsupported file
+
+
+class _BodyReader(object):
+    """
+    Blocking file object reading a request body, for code running on api threads. The event loop keeps
+    receiving the body meanwhile, and only the data asked for is buffered.
+    """
+
+    def __init__(self, content: StreamReader, loop: asyncio.AbstractEventLoop):
+        self._content = content
+        self._loop = loop
+
+    def read(self, size: int = -1) -> bytes:
+        return asyncio.run_coroutine_threadsafe(self._content.read(size), self._loop).result()
@@ -5,14 +5,18 @@ from abc import ABCMeta, abstractmethod
 import asyncio
 from datetime import datetime
 from functools import partial
-from typing import Callable, Any
+from typing import Any, Callable, Iterable
 
+from aiohttp import web_exceptions
 from sunhead.rest.views import JSONView
 
 from isk.api import db as db_api
 from isk.api.executor import isk_api_executor
 
 
+UPLOAD_CHUNK = 64 * 1024  # bytes read at once from uploads, see BaseDBView._read_multipart()
+
+
 def time_taken(f):
     """
     Adds "time_taken" key to the dict, returned by wrapped function.
@@ -81,6 +85,37 @@ class BaseDBView(JSONView, metaclass=ABCMeta):
         result = await self._loop.run_in_executor(isk_api_executor, fetcher)
         return result
 
+    async def _read_multipart(self, fields: Iterable[str], max_size: int) -> dict:
+        """
+        Read the posted multipart form a chunk at a time, keeping ``fields`` only, each straight into a buffer.
+        Nothing is written to disk or read twice. Other fields are read past, and forms over ``max_size`` bytes
+        in all, counting those too, are refused: ``request.multipart()`` doesn't check ``client_max_size``.
+
+        :return: Values of ``fields`` found by name, bytearray for files and str for the others.
+        """
+        fields = set(fields)
+        form = {}
+        total = 0
+        reader = await self.request.multipart()
+        while True:
+            part = await reader.next()
+            if part is None:
+                break
+            keep = part.name in fields
+            data = bytearray()
+            while True:
+                chunk = await part.read_chunk(UPLOAD_CHUNK)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if total > max_size:
+                    raise web_exceptions.HTTPRequestEntityTooLarge
+                if keep:
+                    data.extend(chunk)
+            if keep:
+                form[part.name] = data if part.filename else data.decode(part.get_charset("utf-8"))
+        return form
+
     @time_taken
     async def _get_context_data(self) -> dict:
         fs = self._get_default_context_futures() + self._get_context_futures()
@@ -40,9 +40,30 @@ class KeywordsListView(BaseKeywordsView):
 
 class ImagesByKeyword(BaseKeywordsView):
 
-    IMAGES_LIMIT = 100000
+    DEFAULT_LIMIT = 1000
+    MAX_LIMIT = 10000
     AND_OP = 1
 
+    @property
+    def requested_cursor(self):
+        """Cursor of the requested page, the next_cursor of the previous one"""
+        return int(self.request.GET.get("cursor", 0))
+
+    @property
+    def requested_limit(self):
+        limit = int(self.request.GET.get("limit", self.DEFAULT_LIMIT))
+        return max(1, min(limit, self.MAX_LIMIT))
+
+    async def _get_default_context_data(self):
+        data = await super()._get_default_context_data()
+        data.get("requested", {}).update(
+            {
+                "cursor": self.requested_cursor,
+                "limit": self.requested_limit,
+            }
+        )
+        return data
+
     def _get_context_futures(self):
         fs = [
             self.get_images_by_keyword(),
@@ -50,14 +71,16 @@ class ImagesByKeyword(BaseKeywordsView):
         return fs
 
     async def get_images_by_keyword(self):
-        image_list = await self._hit_api(
-            images_api.get_all_imgs_by_keywords,
+        page = await self._hit_api(
+            images_api.get_imgs_by_keywords_page,
             self.requested_db_id,
-            self.IMAGES_LIMIT,
+            (self.requested_keyword_id,),
             self.AND_OP,
-            (self.requested_keyword_id,)
+            self.requested_cursor,
+            self.requested_limit
         )
         data = {
-            "image_list": image_list,
+            "image_list": page["image_ids"],
+            "next_cursor": page["next_cursor"],
         }
         return data
@@ -6,6 +6,8 @@ from abc import ABCMeta
 
 from aiohttp import web_exceptions
 
+from sunhead.conf import settings
+
 from isk.api import images as images_api
 from isk.web.rest.views.db import BaseDBView
 
@@ -36,6 +38,8 @@ class BaseQueryView(BaseDBView, metaclass=ABCMeta):
 
 class SimilarImagesQuery(BaseQueryView):
 
+    _image_data = None  # uploaded image to query with, see post()
+
     def _get_context_futures(self):
         fs = [
             self.get_similar_images(),
@@ -43,7 +47,14 @@ class SimilarImagesQuery(BaseQueryView):
         return fs
 
     async def get_similar_images(self):
-        if self.requested_image_id:
+        if self._image_data is not None:
+            images_list = await self._hit_api(
+                images_api.query_img_blob,
+                self.requested_db_id,
+                self._image_data,
+                self.requested_results
+            )
+        elif self.requested_image_id:
             images_list = await self._hit_api(
                 images_api.query_img_id,
                 self.requested_db_id,
@@ -59,4 +70,9 @@ class SimilarImagesQuery(BaseQueryView):
         return data
 
     async def post(self):
-        raise NotImplementedError
+        """Same as get(), for the image uploaded in field 'image' instead of one on the db"""
+        data = await self._read_multipart(("image",), settings.MAX_UPLOAD_SIZE)
+        if not data.get("image"):
+            raise web_exceptions.HTTPBadRequest
+        self._image_data = data["image"]
+        return await self.get()
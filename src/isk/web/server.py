@@ -2,6 +2,7 @@
 Web server worker implementation. Based on SunHead framework, which is in turn based on aiohttp web server.
 """
 
+import asyncio
 import logging
 import os
 
@@ -11,7 +12,8 @@ from sunhead.cli import banners
 from sunhead.conf import settings
 from sunhead.workers.http.server import Server
 
-from isk.api.db import save_all_dbs
+from isk.api.db import checkpoint_dbs, compact_dbs, evict_idle_dbs, save_all_dbs
+from isk.api.executor import isk_api_executor
 from isk.web.jsonrpc import get_jsonrpc_dispatcher
 from isk.web.rest.urls import urlconf as rest_urlconf
 from isk.web.jsonrpc import urlconf as jsonrpc_urlconf
@@ -42,6 +44,11 @@ class IskHTTPServer(Server):
         super().init_requirements(loop)
         periodic_db_saver = crontab(settings.PERIODIC_DB_SAVE_CRONTAB, self._periodic_dbs_save, start=False)
         periodic_db_saver.start()
+        periodic_compaction = crontab(settings.PERIODIC_COMPACTION_CRONTAB, self._periodic_compaction, start=False)
+        periodic_compaction.start()
+        if settings.EVICT_IDLE_AFTER:
+            periodic_eviction = crontab(settings.PERIODIC_EVICTION_CRONTAB, self._periodic_eviction, start=False)
+            periodic_eviction.start()
         self.app["jsonrpc_dispatcher"] = get_jsonrpc_dispatcher()
 
     def cleanup(self, *args, **kwargs):
@@ -55,5 +62,19 @@ class IskHTTPServer(Server):
         super().print_banner()
 
     async def _periodic_dbs_save(self):
-        num = save_all_dbs()
+        # changes are on the write ahead log already, once it grew enough this rewrites the changed db spaces
+        loop = asyncio.get_event_loop()
+        num = await loop.run_in_executor(isk_api_executor, checkpoint_dbs)
         logger.debug("Periodic DB save. %s spaces saved", num)
+
+    async def _periodic_compaction(self):
+        # runs on the api executor, so requests are served while it goes on
+        loop = asyncio.get_event_loop()
+        num = await loop.run_in_executor(isk_api_executor, compact_dbs)
+        logger.debug("Periodic compaction. %s removed images freed", num)
+
+    async def _periodic_eviction(self):
+        # may checkpoint first, so off the event loop too
+        loop = asyncio.get_event_loop()
+        num = await loop.run_in_executor(isk_api_executor, evict_idle_dbs)
+        logger.debug("Periodic eviction. %s idle spaces evicted", num)
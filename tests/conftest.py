@@ -0,0 +1,114 @@
+"""
+Engine tests. They need the imgdb extension built (``pip install -e .``), and are skipped otherwise.
+
+The engine keeps its db spaces in process wide state: the ``imgdb`` fixture closes every db space and the
+log after each test. Images are added from synthetic signatures, so no image files are needed.
+"""
+
+import os
+import random
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+
+NUM_COEFS = 40  # coefficients per color channel, see haar.h
+NUM_PIXELS_SQUARED = 128 * 128
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+Signature = Tuple[List[int], List[int], List[int], List[float], int, int]
+
+
+@pytest.fixture
+def imgdb():
+    imgdb = pytest.importorskip("isk.backends.imgseeklib.imgdb")
+    yield imgdb
+    imgdb.closeLog()
+    imgdb.closeDbase()
+    imgdb.setQueryThreads(1)
+
+
+def random_signature(rng: random.Random, like: Optional[Signature] = None, changed: int = 0) -> Signature:
+    """
+    Signature as given to imgdb.addImageSignature(). With ``like``, a copy of it with ``changed``
+    coefficients per channel replaced, so queries find images of many scores.
+    """
+    channels = []
+    for c in range(3):
+        coefs = list(like[c]) if like else []
+        for k in rng.sample(range(NUM_COEFS), changed) if like else range(NUM_COEFS):
+            taken = {abs(x) for x in coefs}
+            position = rng.randrange(1, NUM_PIXELS_SQUARED)
+            while position in taken:
+                position = rng.randrange(1, NUM_PIXELS_SQUARED)
+            coef = position * rng.choice((1, -1))
+            if like:
+                coefs[k] = coef
+            else:
+                coefs.append(coef)
+        channels.append(coefs)
+    if like:
+        avgl = [x + rng.uniform(-0.02, 0.02) for x in like[3]]
+    else:
+        avgl = [rng.uniform(0.1, 0.9), rng.uniform(-0.1, 0.1), rng.uniform(-0.1, 0.1)]
+    return channels[0], channels[1], channels[2], avgl, 64, 64
+
+
+def random_images(ids, seed: int = 0) -> Dict[int, Signature]:
+    """Signatures for images ``ids``, in groups of similar ones"""
+    rng = random.Random(seed)
+    base = None
+    signatures = {}
+    for k, image_id in enumerate(ids):
+        if k % 10 == 0:
+            base = random_signature(rng)
+        signatures[image_id] = random_signature(rng, base, rng.randrange(1, 30))
+    return signatures
+
+
+def add_random_images(imgdb, db_id: int, ids, seed: int = 0) -> Dict[int, Signature]:
+    """Add images ``ids`` to db space ``db_id``, in groups of similar ones. Returns their signatures"""
+    signatures = random_images(ids, seed)
+    for image_id, signature in signatures.items():
+        assert imgdb.addImageSignature(db_id, image_id, *signature)
+    return signatures
+
+
+def write_images(directory: str, count: int, seed: int = 0) -> List[str]:
+    """
+    Write ``count`` small PPM images on ``directory``, returning their paths. Every 7th one is a broken file
+    that fails to decode.
+    """
+    rng = random.Random(seed)
+    paths = []
+    for k in range(count):
+        if k % 7 == 6:
+            path = os.path.join(directory, "broken-%d.ppm" % k)
+            data = b"broken, not an image"
+        else:
+            path = os.path.join(directory, "image-%d.ppm" % k)
+            width, height = rng.randrange(16, 48), rng.randrange(16, 48)
+            data = b"P6 %d %d 255\n" % (width, height) + bytes(rng.randrange(256) for _ in range(3 * width * height))
+        with open(path, "wb") as f:
+            f.write(data)
+        paths.append(path)
+    return paths
+
+
+def run_engine(code: str) -> str:
+    """
+    Run ``code`` on a new process, with ``imgdb`` imported. Lets tests crash the engine (``os._exit()``)
+    without taking the test run with it. Returns what the process printed.
+    """
+    import isk
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(isk.__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([src_dir, os.path.dirname(os.path.abspath(__file__))]))
+    process = subprocess.run(
+        [sys.executable, "-c", "import os\nfrom isk.backends.imgseeklib import imgdb\n" + code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, env=env,
+    )
+    assert process.returncode == 0, process.stderr
+    return process.stdout
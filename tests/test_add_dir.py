@@ -0,0 +1,88 @@
+"""
+Adding directory trees: an add_dir() that stops half way resumes from its checkpoint, adding every image once.
+"""
+
+import os
+
+import pytest
+
+from conftest import write_images
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.fixture
+def tree(imgdb, tmp_path) -> str:
+    """A directory tree of images named by their id, with other files among them"""
+    root = str(tmp_path / "tree")
+    image_id = 1
+    for directory in ("a", "a/b", "a/b/c", "b", "d"):
+        path = os.path.join(root, directory)
+        os.makedirs(path)
+        for image in write_images(path, 8, seed=image_id):
+            if "broken" in image:
+                os.remove(image)
+            else:
+                os.rename(image, os.path.join(path, "%d.ppm" % image_id))
+                image_id += 1
+    with open(os.path.join(root, "a", "notes.txt"), "w") as f:
+        f.write("not an image")
+    os.makedirs(os.path.join(root, "c", "empty"))
+    return root
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+@pytest.mark.parametrize("crash_after", [1, 4])
+def test_resume(imgdb, tree, tmp_path, monkeypatch, workers, crash_after):
+    from isk.backends.imgseeklib import imagedb
+    from isk.backends.imgseeklib.indexing import DirIndexing
+
+    monkeypatch.setattr(imagedb, "ADD_BATCH_SIZE", 3)
+    db = imagedb.ImgDB(False, 0)
+    db.set_signature_workers(workers)
+    db.createdb(1)
+    db.createdb(2)
+    count = db.add_dir(2, tree, True, True)
+
+    # dies after checkpointing crash_after batches, before checkpointing the next one
+    calls = []
+    done = DirIndexing.done
+
+    def crashing_done(self, results):
+        calls.append(len(results))
+        if len(calls) > crash_after:
+            raise Crash()
+        done(self, results)
+
+    monkeypatch.setattr(DirIndexing, "done", crashing_done)
+    checkpoint = str(tmp_path / "add_dir.json")
+    runs = 0
+    redone = 0  # images of the batches added but not checkpointed
+    try:
+        while True:
+            runs += 1
+            del calls[:]
+            try:
+                db.add_dir(1, tree, True, True, checkpoint)
+                break
+            except Crash:
+                assert os.path.exists(checkpoint)
+                redone += calls[-1]
+    finally:
+        db.set_signature_workers(0)
+
+    assert runs > 2
+    assert not os.path.exists(checkpoint)
+    ids = sorted(imgdb.getImgIdList(1))
+    assert ids == sorted(imgdb.getImgIdList(2)) == list(range(1, count + 1))
+    for image_id in ids[::5]:
+        assert list(imgdb.queryImgID(1, image_id, 10, 0, False)) == list(imgdb.queryImgID(2, image_id, 10, 0, False))
+
+    # each run went on from the last batch the one before checkpointed: only the batch it died adding is
+    # added again, failing as its ids are taken already
+    indexings = db.get_dir_indexings()[-runs:]
+    assert [indexing["finished"] for indexing in indexings] == [False] * (runs - 1) + [True]
+    assert sum(indexing["added"] + indexing["failed"] for indexing in indexings) == count
+    assert sum(indexing["failed"] for indexing in indexings) == redone
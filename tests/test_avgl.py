@@ -0,0 +1,59 @@
+"""
+Average luminance distances, computed a column at a time (SSE2 when available), must be what the plain
+weighted sum gives, bit for bit.
+"""
+
+import struct
+
+import pytest
+
+from conftest import add_random_images
+
+
+# weights[sketch][0] of imgdb.h, in single precision as the engine keeps them
+WEIGHTS = [[struct.unpack("f", struct.pack("f", w))[0] for w in weights]
+           for weights in ((5.00, 19.21, 34.37), (4.04, 15.14, 22.62))]
+
+
+@pytest.fixture
+def db_space(imgdb):
+    imgdb.initDbase(1)
+    add_random_images(imgdb, 1, range(1, 304))
+    # an odd count of live images, with dead slots between them
+    imgdb.removeIDs(1, list(range(1, 304, 10)))
+    return 1
+
+
+def _distances(imgdb, db_id: int, avgl: list, sketch: int) -> dict:
+    count = imgdb.getImgCount(db_id)
+    ids, dists = bytearray(8 * count), bytearray(8 * count)
+    assert imgdb.getAvglDistances(db_id, avgl[0], avgl[1], avgl[2], sketch, ids, dists) == count
+    return dict(zip(struct.unpack("%dl" % count, ids), struct.unpack("%dd" % count, dists)))
+
+
+def _expected(imgdb, db_id: int, avgl: list, sketch: int) -> dict:
+    expected = {}
+    for image_id in imgdb.getImgIdList(db_id):
+        image_avgl = imgdb.getImageAvgl(db_id, image_id)
+        expected[image_id] = sum(w * abs(a - q) for w, a, q in zip(WEIGHTS[sketch], image_avgl, avgl))
+    return expected
+
+
+@pytest.mark.parametrize("sketch", [0, 1])
+@pytest.mark.parametrize("avgl", [[0.5, 0.0, 0.0], [0.13, -0.08, 0.091], [2.0, 1.0, -1.0]])
+def test_distances(imgdb, db_space, sketch, avgl):
+    assert _distances(imgdb, db_space, avgl, sketch) == _expected(imgdb, db_space, avgl, sketch)
+
+
+def test_color_only_query(imgdb, db_space):
+    avgl = list(imgdb.getImageAvgl(db_space, 42))
+    expected = _expected(imgdb, db_space, avgl, 0)
+    results = list(imgdb.queryImgID(db_space, 42, 20, 0, True))
+    assert [expected[int(image_id)] for image_id in results[0::2]] == results[1::2]
+    assert results[1::2] == sorted(expected.values())[:20][::-1]
+
+
+def test_small_buffers(imgdb, db_space):
+    ids, dists = bytearray(8), bytearray(8)
+    assert imgdb.getAvglDistances(db_space, 0.5, 0.0, 0.0, 0, ids, dists) == imgdb.getImgCount(db_space)
+    assert ids == bytearray(8)
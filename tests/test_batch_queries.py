@@ -0,0 +1,58 @@
+"""
+Batch queries score many images per scan of a db space, and must give what the same queries one at a time do.
+"""
+
+import pytest
+
+from conftest import add_random_images
+
+
+def _split(flat) -> list:
+    """Per query ``[id, score, ...]`` lists of queryImgIDsBatch() results"""
+    results, k = [], 0
+    while k < len(flat):
+        n = int(flat[k])
+        results.append(list(flat[k + 1:k + 1 + 2 * n]))
+        k += 1 + 2 * n
+    return results
+
+
+def assert_same_results(batch: list, single: list) -> None:
+    assert len(batch) == len(single)
+    for (batch_id, batch_score), (single_id, single_score) in zip(zip(batch[0::2], batch[1::2]),
+                                                                 zip(single[0::2], single[1::2])):
+        assert batch_score == pytest.approx(single_score, rel=1e-9, abs=1e-9)
+        if batch_id != single_id:
+            # equal scores rank in either order
+            tied = {x for x, score in zip(single[0::2], single[1::2]) if score == pytest.approx(batch_score)}
+            assert batch_id in tied
+
+
+@pytest.fixture
+def db_space(imgdb):
+    imgdb.initDbase(1)
+    add_random_images(imgdb, 1, range(1, 801))
+    for image_id in range(1, 801, 7):
+        assert imgdb.removeID(1, image_id)
+    return 1
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+@pytest.mark.parametrize("sketch", [0, 1])
+@pytest.mark.parametrize("color_only", [False, True])
+@pytest.mark.parametrize("numres", [1, 7, 50, 100000])
+def test_ids_batch(imgdb, db_space, threads, sketch, color_only, numres):
+    imgdb.setQueryThreads(threads)
+    ids = list(range(2, 800, 11)) + [1, 99999]  # removed and missing ones give no results
+
+    batch = _split(imgdb.queryImgIDsBatch(db_space, ids, numres, sketch, color_only))
+
+    assert len(batch) == len(ids)
+    for image_id, results in zip(ids, batch):
+        single = list(imgdb.queryImgID(db_space, image_id, numres, sketch, color_only))
+        assert_same_results(results, single)
+    assert batch[-2:] == [[], []]
+
+
+def test_empty_batch(imgdb, db_space):
+    assert list(imgdb.queryImgIDsBatch(db_space, [], 10, 0, False)) == []
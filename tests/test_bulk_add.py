@@ -0,0 +1,56 @@
+"""
+Images added in bulk, from files or blobs: the same ids and images as adding them one at a time.
+"""
+
+import pytest
+
+from conftest import write_images
+
+
+@pytest.fixture
+def database(imgdb, monkeypatch):
+    from isk.backends.imgseeklib import imagedb
+
+    # images are added a few at a time, so a bulk add takes many batches
+    monkeypatch.setattr(imagedb, "ADD_BATCH_SIZE", 4)
+    db = imagedb.ImgDB(False, 0)
+    db.createdb(1)
+    db.createdb(2)
+    yield db
+    db.set_signature_workers(0)
+
+
+def _image(imgdb, db_id: int, image_id: int) -> list:
+    return [list(imgdb.getImageAvgl(db_id, image_id)), imgdb.getImageWidth(db_id, image_id),
+            imgdb.getImageHeight(db_id, image_id), list(imgdb.queryImgID(db_id, image_id, 10, 0, False))]
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+@pytest.mark.parametrize("blobs", [False, True])
+def test_same_as_one_at_a_time(imgdb, database, tmp_path, workers, blobs):
+    paths = write_images(str(tmp_path), 30)
+    # some take the next free id
+    requested = [0 if k % 5 == 2 else 100 + k for k in range(len(paths))]
+    images = [(_read(path) if blobs else path, image_id) for path, image_id in zip(paths, requested)]
+
+    expected = []
+    for data, image_id in images:
+        added = database.add_image_blob(1, data, image_id) if blobs else database.add_image(1, data, image_id)
+        expected.append(database.db_spaces[1].lastId - 1 if added else 0)
+    assert expected.count(0) == sum("broken" in path for path in paths)
+
+    database.set_signature_workers(workers)
+    if blobs:
+        # taken from a generator, as a stream would give them
+        ids = database.add_image_blobs(2, (image for image in images), window=3)
+    else:
+        ids = database.add_images(2, images)
+    assert ids == expected
+    assert sorted(imgdb.getImgIdList(2)) == sorted(imgdb.getImgIdList(1))
+    for image_id in imgdb.getImgIdList(1):
+        assert _image(imgdb, 2, image_id) == _image(imgdb, 1, image_id)
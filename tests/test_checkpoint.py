@@ -0,0 +1,60 @@
+"""
+Checkpoints: only the db spaces changed since their last save are written again.
+"""
+
+import os
+
+from conftest import add_random_images
+
+
+def _files(spaces: str) -> dict:
+    """mtime and contents of each db space file"""
+    files = {}
+    for name in os.listdir(spaces):
+        path = os.path.join(spaces, name)
+        with open(path, "rb") as f:
+            files[name] = (os.stat(path).st_mtime_ns, f.read())
+    return files
+
+
+def _results(imgdb) -> dict:
+    results = {}
+    for db_id in sorted(imgdb.getDBList()):
+        ids = sorted(imgdb.getImgIdList(db_id))
+        results[db_id] = [ids] + [list(imgdb.queryImgID(db_id, image_id, 10, 0, False)) for image_id in ids[::9]]
+    return results
+
+
+def test_only_dirty_spaces_are_written(imgdb, tmp_path):
+    spaces = str(tmp_path / "spaces")
+    for db_id in (1, 2, 3, 4):
+        imgdb.initDbase(db_id)
+        add_random_images(imgdb, db_id, range(1, 101), seed=db_id)
+    assert imgdb.checkpointdbs(spaces) == 4
+    assert [imgdb.getUnsavedChanges(db_id) for db_id in (1, 2, 3, 4)] == [0, 0, 0, 0]
+    assert imgdb.checkpointdbs(spaces) == 0
+    before = _files(spaces)
+
+    imgdb.removeID(2, 5)
+    imgdb.addKeywordImg(3, 7, 11)
+    imgdb.removedb(4)
+    assert imgdb.getUnsavedChanges(1) == 0
+    assert imgdb.getUnsavedChanges(2) > 0 and imgdb.getUnsavedChanges(3) > 0
+    assert imgdb.checkpointdbs(spaces) == 2
+    after = _files(spaces)
+
+    assert sorted(after) == ["space-1.isk", "space-2.isk", "space-3.isk"]
+    assert after["space-1.isk"] == before["space-1.isk"]
+    assert after["space-2.isk"] != before["space-2.isk"]
+    assert after["space-3.isk"] != before["space-3.isk"]
+    assert [imgdb.getUnsavedChanges(db_id) for db_id in (1, 2, 3)] == [0, 0, 0]
+
+    # a file that went missing is written again, though its db space did not change
+    os.remove(os.path.join(spaces, "space-1.isk"))
+    assert imgdb.checkpointdbs(spaces) == 1
+
+    expected = _results(imgdb)
+    imgdb.closeDbase()
+    assert imgdb.loaddbsdir(spaces, 2) == 3
+    assert _results(imgdb) == expected
+    assert list(imgdb.getKeywordsImg(3, 7)) == [11]
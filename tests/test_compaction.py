@@ -0,0 +1,59 @@
+"""
+Compaction frees the slots of removed images, which stay on the buckets until then. It must not change what
+queries return.
+"""
+
+import pytest
+
+from conftest import add_random_images, random_images
+
+
+IDS = range(1, 801)
+
+
+def _results(imgdb, db_id: int, ids) -> list:
+    return [list(imgdb.queryImgID(db_id, image_id, numres, sketch, False))
+            for image_id in ids for numres, sketch in ((10, 0), (1000, 1))]
+
+
+def _ranked(results: list) -> list:
+    """(score, id) pairs of each result list, so images tied on score may come in any order"""
+    return [sorted(zip(result[1::2], result[0::2])) for result in results]
+
+
+@pytest.mark.parametrize("postings", ["plain", "packed", "mapped"])
+def test_results_unchanged(imgdb, tmp_path, postings):
+    imgdb.initDbase(1)
+    signatures = add_random_images(imgdb, 1, IDS)
+    if postings == "packed":
+        assert imgdb.packPostings(1)
+    elif postings == "mapped":
+        path = str(tmp_path / "space.isk")
+        assert imgdb.savedb(1, path)
+        imgdb.closeDbase()
+        assert imgdb.loaddb(1, path)
+    removed = list(range(1, 801, 3))
+    assert imgdb.removeIDs(1, removed) == len(removed)
+    kept = sorted(imgdb.getImgIdList(1))
+    expected = _results(imgdb, 1, kept[::13])
+    assert imgdb.getDeadCount(1) == len(removed)
+
+    # a few slots at a time, then the rest
+    assert imgdb.compactDbSpace(1, 50) == len(removed) - 50
+    assert imgdb.getDeadCount(1) == len(removed) - 50
+    assert _results(imgdb, 1, kept[::13]) == expected
+    assert imgdb.compactDbSpace(1, 100000) == 0
+    assert imgdb.getDeadCount(1) == 0
+    assert _results(imgdb, 1, kept[::13]) == expected
+
+    # new images take the freed slots, and queries find them as on a db space they were added to
+    added = random_images(range(1001, 1201), seed=1)
+    for image_id, signature in added.items():
+        assert imgdb.addImageSignature(1, image_id, *signature)
+    imgdb.initDbase(2)
+    for image_id in kept:
+        assert imgdb.addImageSignature(2, image_id, *signatures[image_id])
+    for image_id, signature in added.items():
+        assert imgdb.addImageSignature(2, image_id, *signature)
+    queried = kept[::13] + list(added)[::17]
+    assert _ranked(_results(imgdb, 1, queried)) == _ranked(_results(imgdb, 2, queried))
@@ -0,0 +1,60 @@
+"""
+Similarity queries restricted to images with some keywords: scoring only the candidates having them, or walking
+the buckets of the query over every image, must give the very same results.
+"""
+
+import random
+
+import pytest
+
+from conftest import add_random_images
+
+
+IMAGE_COUNT = 4000
+# images having each keyword: few enough for scoring candidates (see CANDIDATE_SCORE_COST), and plenty, which
+# walks the buckets
+RARE, COMMON = 1, 2
+
+
+@pytest.fixture
+def keyworded(imgdb):
+    """Keywords of each image of db space 1, which has some images removed"""
+    rng = random.Random(18)
+    imgdb.initDbase(1)
+    ids = list(range(1, IMAGE_COUNT + 1))
+    add_random_images(imgdb, 1, ids)
+    keywords = {image_id: set() for image_id in ids}
+    for image_id in rng.sample(ids, 12):
+        keywords[image_id].add(RARE)
+    for image_id in rng.sample(ids, IMAGE_COUNT * 3 // 5):
+        keywords[image_id].add(COMMON)
+    for image_id, have in keywords.items():
+        if have:
+            assert imgdb.addKeywordsImg(1, image_id, sorted(have))
+    removed = rng.sample(ids, 100)
+    assert imgdb.removeIDs(1, removed) == len(removed)
+    for image_id in removed:
+        del keywords[image_id]
+    return keywords
+
+
+def _filtered(imgdb, keywords: dict, image_id: int, numres: int, wanted: list, join: int, color_only: bool) -> list:
+    """Best numres results of a query over every image, of the images having the wanted keywords"""
+    results = list(imgdb.queryImgID(1, image_id, IMAGE_COUNT, 0, color_only))
+    pairs = [(results[k], results[k + 1]) for k in range(0, len(results), 2)
+             if (all if join else any)(kw in keywords[results[k]] for kw in wanted)]
+    return [value for pair in pairs[-numres:] for value in pair]
+
+
+@pytest.mark.parametrize("color_only", [False, True])
+@pytest.mark.parametrize("wanted, join", [([RARE], 1), ([COMMON], 1), ([RARE, COMMON], 1), ([RARE, COMMON], 0)])
+def test_same_as_filtered_query(imgdb, keyworded, wanted, join, color_only):
+    having = sorted(image_id for image_id, have in keyworded.items() if RARE in have)
+    for image_id in having[:3] + [having[-1] + 1]:
+        if image_id not in keyworded:
+            continue
+        for numres in (1, 10, 50, 1000):
+            expected = _filtered(imgdb, keyworded, image_id, numres, wanted, join, color_only)
+            assert expected
+            assert list(imgdb.queryImgIDKeywords(1, image_id, numres, join, wanted, color_only)) == expected
+
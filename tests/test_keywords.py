@@ -0,0 +1,203 @@
+"""
+Keywords: images found by their keywords, joined with AND or OR.
+"""
+
+import random
+
+import pytest
+
+from conftest import add_random_images, random_signature
+
+
+KEYWORDS = range(6)
+
+
+@pytest.fixture
+def keyworded(imgdb):
+    """Keywords of each image of db space 1, which has more images than a bitmap chunk holds (65536 slots)"""
+    rng = random.Random(5)
+    imgdb.initDbase(1)
+    # the images don't need signatures of their own here
+    signatures = [random_signature(rng) for _ in range(10)]
+    ids = rng.sample(range(1, 10 ** 9), 70000)
+    keywords = {}
+    for k, image_id in enumerate(ids):
+        assert imgdb.addImageSignature(1, image_id, *signatures[k % 10])
+        # keyword 5 is on most images, so its chunks are bitmaps, the others stay arrays
+        keywords[image_id] = {k for k in KEYWORDS if rng.random() < (0.9 if k == 5 else 0.05 * (k + 1))}
+        if keywords[image_id]:
+            imgdb.addKeywordsImg(1, image_id, sorted(keywords[image_id]))
+    for image_id in ids[::13]:
+        imgdb.removeID(1, image_id)
+        del keywords[image_id]
+    return keywords
+
+
+def _having(keywords: dict, wanted: list, join: int) -> list:
+    return sorted(image_id for image_id, have in keywords.items() if (all if join else any)(k in have for k in wanted))
+
+
+def test_pages(imgdb, keyworded):
+    for wanted, join in (([0], 1), ([5], 1), ([1, 2], 1), ([1, 5], 1), ([1, 2], 0), ([0, 5], 0), ([9], 0),
+                         ([9, 1], 0), ([9, 1], 1)):
+        expected = _having(keyworded, wanted, join)
+        for limit in (7, 5000):
+            listed, cursor = [], 0
+            while True:
+                *page, cursor = imgdb.getImgsByKeywordsPage(1, join, wanted, cursor, limit)
+                assert len(page) == limit or not cursor
+                listed += page
+                if not cursor:
+                    break
+            assert sorted(listed) == expected, (wanted, join, limit)
+            assert len(set(listed)) == len(listed)
+
+
+def test_page_out_of_range(imgdb, keyworded):
+    assert list(imgdb.getImgsByKeywordsPage(1, 1, [5], 10 ** 9, 10)) == [0]
+    assert list(imgdb.getImgsByKeywordsPage(1, 1, [5], -1, 10)) == []
+    assert list(imgdb.getImgsByKeywordsPage(1, 1, [], 0, 10)) == []
+
+
+def _top(counts: dict, count: int) -> list:
+    """keyword, frequency, ... as the engine gives them: most frequent first, then lowest keyword"""
+    top = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:count]
+    return [value for item in top for value in item]
+
+
+def _counts(keywords: dict, ids) -> dict:
+    counts = {}
+    for image_id in ids:
+        for keyword in keywords.get(image_id, ()):
+            counts[keyword] = counts.get(keyword, 0) + 1
+    return counts
+
+
+def test_popular_counts(imgdb):
+    rng = random.Random(8)
+    imgdb.initDbase(1)
+    ids = list(range(1, 501))
+    add_random_images(imgdb, 1, ids)
+    keywords = {}
+    for image_id in ids:
+        keywords[image_id] = set(rng.sample(range(40), rng.randrange(1, 8)))
+        assert imgdb.addKeywordsImg(1, image_id, sorted(keywords[image_id]))
+    for image_id in rng.sample(ids, 150):
+        keyword = rng.choice(sorted(keywords[image_id]))
+        assert imgdb.removeKeywordImg(1, image_id, keyword)
+        keywords[image_id].discard(keyword)
+    for image_id in rng.sample(ids, 100):
+        assert imgdb.removeID(1, image_id)
+        del keywords[image_id]
+
+    counts = _counts(keywords, keywords)
+    for count in (1, 10, 100):
+        assert list(imgdb.getKeywordsPopular(1, count)) == _top(counts, count)
+
+    # removed images count for nothing, ids listed twice count twice
+    some = rng.sample(ids, 200) + ids[:20]
+    excluded = [0, 5, 7]
+    counts = _counts(keywords, some)
+    for keyword in excluded:
+        counts.pop(keyword, None)
+    for count in (1, 10, 100):
+        assert list(imgdb.mostPopularKeywords(1, some, excluded, count, 0)) == _top(counts, count)
+
+
+def _change_keywords(imgdb, rng: random.Random, keywords: dict) -> None:
+    """Random keyword changes to the images of db space 1, made to ``keywords`` as well"""
+    for image_id, have in keywords.items():
+        change = rng.randrange(5)
+        if change == 0:
+            keyword = rng.randrange(30)
+            # false for one the image has already
+            assert imgdb.addKeywordImg(1, image_id, keyword) == (keyword not in have)
+            have.add(keyword)
+        elif change == 1:
+            # some images get more keywords than the compact arrays hold
+            added = rng.sample(range(30), rng.choice((2, 5, 25)))
+            assert imgdb.addKeywordsImg(1, image_id, added)
+            have.update(added)
+        elif change == 2 and have:
+            keyword = rng.choice(sorted(have))
+            assert imgdb.removeKeywordImg(1, image_id, keyword)
+            have.discard(keyword)
+        elif change == 3:
+            assert imgdb.removeAllKeywordImg(1, image_id)
+            have.clear()
+
+
+def _check_keywords(imgdb, keywords: dict) -> None:
+    assert sorted(imgdb.getImgIdList(1)) == sorted(keywords)
+    for image_id, have in keywords.items():
+        assert sorted(imgdb.getKeywordsImg(1, image_id)) == sorted(have), image_id
+
+
+def _keyword_changes(imgdb, tmp_path, check) -> None:
+    """Keyword changes to db space 1 mixed with removals, compaction, saves and loads, calling ``check`` after each"""
+    rng = random.Random(16)
+    imgdb.initDbase(1)
+    # enough changed images for a checkpoint to merge the overflow map (KEYWORD_OVERFLOW_MIN)
+    ids = list(range(1, 6001))
+    signatures = add_random_images(imgdb, 1, ids)
+    keywords = {image_id: set() for image_id in ids}
+    _change_keywords(imgdb, rng, keywords)
+    check(keywords)
+
+    # removed images lose their keywords, and have none when added again
+    removed = rng.sample(ids, 600)
+    assert imgdb.removeIDs(1, removed) == len(removed)
+    for image_id in removed:
+        del keywords[image_id]
+    check(keywords)
+    for image_id in removed[:200]:
+        assert imgdb.addImageSignature(1, image_id, *signatures[image_id])
+        keywords[image_id] = set()
+    _change_keywords(imgdb, rng, keywords)
+    check(keywords)
+
+    # images move to other slots
+    removed = rng.sample(sorted(keywords), 400)
+    assert imgdb.removeIDs(1, removed) == len(removed)
+    for image_id in removed:
+        del keywords[image_id]
+    assert imgdb.compactDbSpace(1, 10 ** 6) == 0
+    check(keywords)
+    _change_keywords(imgdb, rng, keywords)
+    check(keywords)
+
+    path = str(tmp_path / "space.isk")
+    assert imgdb.savedb(1, path)
+    imgdb.closeDbase()
+    assert imgdb.loaddb(1, path)
+    check(keywords)
+    # changes on top of the mapped file
+    _change_keywords(imgdb, rng, keywords)
+    check(keywords)
+
+    spaces = str(tmp_path / "spaces")
+    assert imgdb.checkpointdbs(spaces) == 1
+    imgdb.closeDbase()
+    assert imgdb.loaddbsdir(spaces, 1) == 1
+    check(keywords)
+
+
+def test_keywords_of_images(imgdb, tmp_path):
+    _keyword_changes(imgdb, tmp_path, lambda keywords: _check_keywords(imgdb, keywords))
+
+
+def _check_joins(imgdb, keywords: dict) -> None:
+    for wanted in ([3], [29], [0, 1], [2, 7, 11], [40]):
+        for join in (0, 1):
+            found = list(imgdb.getAllImgsByKeywords(1, 10 ** 6, join, wanted))
+            assert sorted(found) == _having(keywords, wanted, join), (wanted, join)
+            assert len(set(found)) == len(found)
+
+
+def test_joins_after_changes(imgdb, tmp_path):
+    # keywords of another db space are not found on this one
+    imgdb.initDbase(2)
+    add_random_images(imgdb, 2, range(1, 3001))
+    for image_id in range(1, 3001):
+        assert imgdb.addKeywordsImg(2, image_id, [3, 29, 40])
+    _keyword_changes(imgdb, tmp_path, lambda keywords: _check_joins(imgdb, keywords))
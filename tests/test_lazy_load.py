@@ -0,0 +1,72 @@
+"""
+Lazy loading: db spaces are loaded from their file on first use, and idle ones are evicted back to it.
+"""
+
+import pytest
+
+from conftest import add_random_images
+
+
+@pytest.fixture
+def database(imgdb, tmp_path):
+    """Three db spaces checkpointed next to a database file, and no db space loaded"""
+    fname = str(tmp_path / "isk-db")
+    for db_id in (1, 2, 3):
+        imgdb.initDbase(db_id)
+        add_random_images(imgdb, db_id, range(1, 151), seed=db_id)
+    assert imgdb.checkpointdbs(fname + ".spaces") == 3
+    imgdb.closeDbase()
+    return fname
+
+
+def _results(db, db_id: int) -> list:
+    ids = sorted(db.get_img_id_list(db_id))
+    return [ids] + [list(db.query_img_id(db_id, image_id, 10)) for image_id in ids[::11]]
+
+
+def _loaded(imgdb) -> list:
+    return [db_id for db_id in (1, 2, 3) if imgdb.isLoadedDB(db_id)]
+
+
+def test_load_on_first_use(imgdb, database):
+    from isk.backends.imgseeklib.imagedb import ImgDB
+
+    eager = ImgDB(False, 0)
+    assert eager.load_database(database) == 3
+    expected = {db_id: _results(eager, db_id) for db_id in (1, 2, 3)}
+    imgdb.closeDbase()
+
+    db = ImgDB(False, 0)
+    assert db.load_database(database, lazy=True) == 3
+    assert _loaded(imgdb) == []
+    assert sorted(db.get_db_list()) == [1, 2, 3]
+    assert list(db.query_img_id(2, 1, 10)) == expected[2][1]
+    assert _loaded(imgdb) == [2]
+    assert _results(db, 3) == expected[3]
+    assert _loaded(imgdb) == [2, 3]
+
+
+def test_evict_and_query_again(imgdb, database):
+    from isk.backends.imgseeklib.imagedb import ImgDB
+
+    db = ImgDB(False, 0)
+    db.load_database(database, lazy=True)
+    db.remove_img(1, 12)
+    db.add_keyword_img(1, 13, 5)
+    expected = {db_id: _results(db, db_id) for db_id in (1, 2)}
+    assert _loaded(imgdb) == [1, 2]
+
+    # calls in flight keep their db space
+    with db.using_db_space(2):
+        assert db.evict_idle_db_spaces(0) == 1
+        assert _loaded(imgdb) == [2]
+    assert db.evict_idle_db_spaces(0) == 1
+    assert _loaded(imgdb) == []
+    assert sorted(imgdb.getDBList()) == [1, 2, 3]
+
+    # changes made before evicting were checkpointed, so they are loaded back
+    assert list(db.query_img_id(1, 13, 10)) == expected[1][2]
+    assert _results(db, 1) == expected[1]
+    assert list(db.get_keywords_img(1, 13)) == [5]
+    assert _results(db, 2) == expected[2]
+    assert _loaded(imgdb) == [1, 2]
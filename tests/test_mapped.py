@@ -0,0 +1,107 @@
+"""
+Mapped index files: db spaces used in place from the file they are saved on.
+"""
+
+import struct
+
+import pytest
+
+from conftest import add_random_images
+
+
+SPACE_OFFSET = 65536  # MAPPED_SPACE_ALIGN, the first db space of a file starts there
+HEADER = struct.Struct("l13L")  # MappedSpaceHeader
+HEADER_FIELDS = ("db_id", "count", "length", "sigs", "avgl_y", "avgl_i", "avgl_q", "bucket_starts", "bucket_slots",
+                 "ids", "keyword_starts", "keywords", "ids_filter", "ids_filter_bytes")
+ID_SLOT = struct.Struct("lII")  # IdSlot
+
+
+@pytest.fixture
+def saved(imgdb, tmp_path):
+    """A db space saved on a file of its own, and no db space loaded"""
+    imgdb.initDbase(1)
+    add_random_images(imgdb, 1, range(1, 201))
+    path = str(tmp_path / "space.isk")
+    assert imgdb.savedb(1, path)
+    imgdb.closeDbase()
+    return path
+
+
+def _header(data: bytearray) -> dict:
+    return dict(zip(HEADER_FIELDS, HEADER.unpack_from(data, SPACE_OFFSET)))
+
+
+def _corrupt(path: str, corrupt) -> None:
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    corrupt(data, _header(data))
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _slot_out_of_range(data, header):
+    struct.pack_into("=I", data, SPACE_OFFSET + header["bucket_slots"], header["count"])
+
+
+def _bucket_unsorted(data, header):
+    # the first bucket of two slots or more gets them backwards
+    starts = struct.unpack_from("%dL" % (3 * 2 * 16384 + 1), data, SPACE_OFFSET + header["bucket_starts"])
+    k = next(k for k in range(len(starts) - 1) if starts[k + 1] - starts[k] >= 2)
+    at = SPACE_OFFSET + header["bucket_slots"] + 4 * starts[k]
+    first, second = struct.unpack_from("=II", data, at)
+    struct.pack_into("=II", data, at, second, first)
+
+
+def _ids_unsorted(data, header):
+    at = SPACE_OFFSET + header["ids"]
+    first = data[at:at + ID_SLOT.size]
+    data[at:at + ID_SLOT.size] = data[at + ID_SLOT.size:at + 2 * ID_SLOT.size]
+    data[at + ID_SLOT.size:at + 2 * ID_SLOT.size] = first
+
+
+def _id_slot_out_of_range(data, header):
+    at = SPACE_OFFSET + header["ids"]
+    image_id, _, unused = ID_SLOT.unpack_from(data, at)
+    ID_SLOT.pack_into(data, at, image_id, header["count"] + 10, unused)
+
+
+@pytest.mark.parametrize("corrupt", [_slot_out_of_range, _bucket_unsorted, _ids_unsorted, _id_slot_out_of_range])
+def test_corrupt_file_fails_to_load(imgdb, saved, corrupt):
+    _corrupt(saved, corrupt)
+    assert not imgdb.loaddb(1, saved)
+    assert 1 not in imgdb.getDBList()
+
+
+def test_intact_file_loads(imgdb, saved):
+    assert imgdb.loaddb(1, saved)
+    assert imgdb.getImgCount(1) == 200
+
+
+def _results(imgdb, db_id: int) -> list:
+    ids = sorted(imgdb.getImgIdList(db_id))
+    return [ids] + [list(imgdb.queryImgID(db_id, image_id, 10, 0, False)) for image_id in ids[::7]]
+
+
+def test_round_trip(imgdb, tmp_path):
+    imgdb.initDbase(1)
+    add_random_images(imgdb, 1, range(1, 301))
+    # packed buckets, then freed slots taken again by images added later, which go to the plain slots
+    imgdb.packPostings(1)
+    imgdb.removeIDs(1, list(range(1, 301, 3)))
+    imgdb.compactDbSpace(1, 1000)
+    add_random_images(imgdb, 1, range(301, 401), seed=1)
+    expected = _results(imgdb, 1)
+    path = str(tmp_path / "space.isk")
+    assert imgdb.savedb(1, path)
+    imgdb.closeDbase()
+
+    assert imgdb.loaddb(1, path)
+    assert _results(imgdb, 1) == expected
+    # changes go on top of the mapped file
+    imgdb.removeIDs(1, list(range(2, 401, 5)))
+    add_random_images(imgdb, 1, range(401, 451), seed=2)
+    expected = _results(imgdb, 1)
+    assert imgdb.savedb(1, path)
+    imgdb.closeDbase()
+    assert imgdb.loaddb(1, path)
+    assert _results(imgdb, 1) == expected
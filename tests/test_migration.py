@@ -0,0 +1,87 @@
+"""
+Index files of isk 0.11, with 32 bit coefficients and double avgl, loaded into the compact 0.12 layout.
+
+data/isk-0.11 holds a db space saved by isk 0.11, on its own file (checkpointdbs()) and on a single file
+(savealldbs()), and the results 0.11 gave to queries on it. Rankings must stay the same, scores within
+RELATIVE_TOLERANCE.
+"""
+
+import gzip
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import DATA_DIR
+
+
+RELATIVE_TOLERANCE = 1e-5
+
+OLD_DIR = os.path.join(DATA_DIR, "isk-0.11")
+
+
+@pytest.fixture
+def expected():
+    with open(os.path.join(OLD_DIR, "expected.json")) as f:
+        return json.load(f)
+
+
+def _unzip(name: str, path: str) -> str:
+    with gzip.open(os.path.join(OLD_DIR, name + ".gz")) as src, open(path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    return path
+
+
+def _close(a: float, b: float) -> bool:
+    return abs(a - b) <= RELATIVE_TOLERANCE * max(abs(a), abs(b), 1.0)
+
+
+def assert_same_db_space(imgdb, expected: dict) -> None:
+    assert sorted(imgdb.getImgIdList(1)) == expected["ids"]
+    for image_id, keywords in expected["keywords"].items():
+        assert sorted(imgdb.getKeywordsImg(1, int(image_id))) == keywords
+
+    for query in expected["queries"]:
+        result = imgdb.queryImgID(1, query["id"], len(query["ids"]), query["sketch"], query["color_only"])
+        ids, scores = [int(x) for x in result[0::2]], list(result[1::2])
+        assert len(ids) == len(query["ids"]), query
+        for rank, (score, old_score) in enumerate(zip(scores, query["scores"])):
+            assert _close(score, old_score), (query, rank)
+        old_scores = query["scores"]
+        for rank, old_id in enumerate(query["ids"]):
+            # images scoring the same within tolerance may swap places
+            tied = [
+                query["ids"][k] for k in range(len(old_scores)) if _close(old_scores[k], old_scores[rank])
+            ]
+            assert ids[rank] == old_id or ids[rank] in tied, (query, rank)
+
+
+def test_space_file(imgdb, expected, tmp_path):
+    spaces = tmp_path / "spaces"
+    spaces.mkdir()
+    _unzip("space-1.isk", str(spaces / "space-1.isk"))
+
+    assert imgdb.loaddbsdir(str(spaces), 1) == 1
+    assert_same_db_space(imgdb, expected)
+    # converted on load, so the next checkpoint rewrites it
+    assert imgdb.getUnsavedChanges(1) > 0
+
+    assert imgdb.checkpointdbs(str(spaces)) == 1
+    imgdb.closeDbase()
+    assert imgdb.loaddbsdir(str(spaces), 1) == 1
+    assert imgdb.getUnsavedChanges(1) == 0
+    assert_same_db_space(imgdb, expected)
+
+
+def test_single_file(imgdb, expected, tmp_path):
+    path = _unzip("all.db", str(tmp_path / "all.db"))
+
+    assert imgdb.loadalldbs(path) == 1
+    assert_same_db_space(imgdb, expected)
+
+    resaved = str(tmp_path / "resaved.db")
+    assert imgdb.savealldbs(resaved)
+    imgdb.closeDbase()
+    assert imgdb.loadalldbs(resaved) == 1
+    assert_same_db_space(imgdb, expected)
@@ -0,0 +1,53 @@
+"""
+Queries split in parts across threads (setQueryThreads()) must give what the same queries on one thread do.
+"""
+
+import random
+
+import pytest
+
+from conftest import random_signature
+
+
+SLOT_COUNT = 3 * 65536 + 5000  # MIN_SLOTS_PER_QUERY_PART, so queries split in 3 parts
+
+
+@pytest.fixture
+def big_space(imgdb):
+    """A db space big enough to split queries, with some images removed"""
+    rng = random.Random(4)
+    imgdb.initDbase(1)
+    signatures = [random_signature(rng) for _ in range(500)]
+    ids, coefs, avgls, sizes = [], [], [], []
+    for image_id in range(1, SLOT_COUNT + 1):
+        sig1, sig2, sig3, avgl, width, height = signatures[image_id % len(signatures)]
+        ids.append(image_id)
+        coefs += sig1 + sig2 + sig3
+        # images sharing coefficients still score apart
+        avgls += [x + rng.uniform(-0.05, 0.05) for x in avgl]
+        sizes += [width, height]
+    assert all(imgdb.addImageSignatures(1, ids, coefs, avgls, sizes))
+    assert imgdb.removeIDs(1, ids[::17]) == len(ids[::17])
+    return 1
+
+
+def _queries(imgdb, db_id: int, threads: int) -> list:
+    imgdb.setQueryThreads(threads)
+    results = []
+    for image_id in (2, 1000, 70000, SLOT_COUNT - 3):
+        for numres, sketch, color_only in ((1, 0, False), (20, 0, False), (1000, 1, False), (50, 0, True)):
+            results.append(list(imgdb.queryImgID(db_id, image_id, numres, sketch, color_only)))
+    return results
+
+
+def test_parts_match_single_thread(imgdb, big_space):
+    single = _queries(imgdb, big_space, 1)
+    assert _queries(imgdb, big_space, 4) == single
+    assert all(len(result) for result in single)
+
+
+def test_packed_parts_match_single_thread(imgdb, big_space):
+    single = _queries(imgdb, big_space, 1)
+    assert imgdb.packPostings(big_space)
+    assert _queries(imgdb, big_space, 1) == single
+    assert _queries(imgdb, big_space, 4) == single
@@ -0,0 +1,62 @@
+"""
+Removed images leave a db space answering queries as one those images were never added to.
+"""
+
+import pytest
+
+from conftest import add_random_images, random_images
+
+
+IDS = range(1, 601)
+
+
+def _results(imgdb, db_id: int, ids) -> list:
+    return [list(imgdb.queryImgID(db_id, image_id, numres, sketch, False))
+            for image_id in ids for numres, sketch in ((10, 0), (1000, 1))]
+
+
+def _fresh(imgdb, db_id: int, signatures: dict, ids) -> None:
+    imgdb.initDbase(db_id)
+    for image_id in ids:
+        assert imgdb.addImageSignature(db_id, image_id, *signatures[image_id])
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_like_never_added(imgdb, packed):
+    imgdb.initDbase(1)
+    signatures = add_random_images(imgdb, 1, IDS)
+    if packed:
+        assert imgdb.packPostings(1)
+    one_by_one = set(range(1, 601, 4))
+    for image_id in one_by_one:
+        assert imgdb.removeID(1, image_id)
+    # missing, repeated and removed ids are skipped
+    in_bulk = set(range(300, 350))
+    assert imgdb.removeIDs(1, sorted(in_bulk) + [300, 301, 99999, 5]) == len(in_bulk - one_by_one)
+    removed = one_by_one | in_bulk
+
+    kept = [image_id for image_id in IDS if image_id not in removed]
+    _fresh(imgdb, 2, signatures, kept)
+    assert sorted(imgdb.getImgIdList(1)) == kept
+    assert imgdb.getImgCount(1) == len(kept)
+    assert _results(imgdb, 1, kept[::9]) == _results(imgdb, 2, kept[::9])
+
+    for image_id in (1, 300, 349):
+        assert not imgdb.isImageOnDB(1, image_id)
+        assert not imgdb.removeID(1, image_id)
+        assert list(imgdb.queryImgID(1, image_id, 10, 0, False)) == []
+
+
+def test_added_again(imgdb):
+    imgdb.initDbase(1)
+    signatures = add_random_images(imgdb, 1, IDS)
+    removed = list(range(2, 601, 3))
+    assert imgdb.removeIDs(1, removed) == len(removed)
+    # back with other signatures
+    again = random_images(removed, seed=1)
+    for image_id in removed:
+        assert imgdb.addImageSignature(1, image_id, *again[image_id])
+
+    kept = [image_id for image_id in IDS if image_id not in set(removed)]
+    _fresh(imgdb, 2, {**signatures, **again}, kept + removed)
+    assert _results(imgdb, 1, IDS[::11]) == _results(imgdb, 2, IDS[::11])
@@ -0,0 +1,74 @@
+"""
+Signatures computed apart from the db spaces, possibly on worker processes, then added by the engine: images must
+end up as if added from their file or data directly.
+"""
+
+import pytest
+
+from conftest import write_images
+
+
+@pytest.fixture
+def image_paths(imgdb, tmp_path):
+    return write_images(str(tmp_path), 30)
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _image(imgdb, db_id: int, image_id: int) -> list:
+    return [list(imgdb.getImageAvgl(db_id, image_id)), imgdb.getImageWidth(db_id, image_id),
+            imgdb.getImageHeight(db_id, image_id), list(imgdb.queryImgID(db_id, image_id, 10, 0, False))]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+@pytest.mark.parametrize("blobs", [False, True])
+def test_same_as_added_directly(imgdb, image_paths, workers, blobs):
+    from isk.backends.imgseeklib.signatures import SignaturePool, blob_signature, path_signature
+
+    imgdb.initDbase(1)
+    imgdb.initDbase(2)
+    items = [(image_id, _read(path) if blobs else path) for image_id, path in enumerate(image_paths, 1)]
+    for image_id, data in items:
+        added = imgdb.addImageBlob(1, image_id, data) if blobs else imgdb.addImage(1, image_id, data)
+        assert bool(added) == ("broken" not in image_paths[image_id - 1])
+
+    pool = SignaturePool(workers)
+    try:
+        signatures = list(pool.map(blob_signature if blobs else path_signature, items))
+    finally:
+        pool.shutdown()
+    # in order, None for the broken ones
+    assert [image_id for image_id, _ in signatures] == [image_id for image_id, _ in items]
+    for image_id, signature in signatures:
+        assert (signature is None) == (not imgdb.isImageOnDB(1, image_id))
+        if signature is not None:
+            assert imgdb.addImageSignature(2, image_id, *signature)
+
+    ids = sorted(imgdb.getImgIdList(1))
+    assert sorted(imgdb.getImgIdList(2)) == ids
+    for image_id in ids:
+        assert _image(imgdb, 2, image_id) == _image(imgdb, 1, image_id)
+
+
+def _changed(signature, channel: int, k: int, coef: int):
+    channels = [list(c) for c in signature[:3]]
+    channels[channel][k] = coef
+    return channels + list(signature[3:])
+
+
+def test_malformed_signatures_refused(imgdb, image_paths):
+    from isk.backends.imgseeklib.signatures import path_signature
+
+    imgdb.initDbase(1)
+    signature = path_signature(image_paths[0])
+    first = signature.sig2[0]
+    for malformed in (_changed(signature, 1, 1, first), _changed(signature, 1, 1, -first), _changed(signature, 0, 3, 0),
+                      _changed(signature, 2, 5, 128 * 128)):
+        assert not imgdb.addImageSignature(1, 1, *malformed)
+        assert list(imgdb.addImageSignatures(1, [1], [c for channel in malformed[:3] for c in channel],
+                                             malformed[3], malformed[4:])) == [0]
+    assert imgdb.getImgCount(1) == 0
+    assert imgdb.addImageSignature(1, 1, *signature)
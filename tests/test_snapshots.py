@@ -0,0 +1,92 @@
+"""
+Snapshots are written by a forked child while changes go on. Each must hold the db space as it was at one
+point, and changes made meanwhile must stay to be saved.
+"""
+
+import os
+import threading
+
+from conftest import add_random_images, random_images
+
+
+FIRST = range(1, 301)
+MORE = range(1001, 4001)
+
+
+class Adder(threading.Thread):
+    """Adds images to a db space, in order, on a thread of its own"""
+
+    def __init__(self, imgdb, db_id: int, signatures: dict):
+        super().__init__()
+        self.imgdb = imgdb
+        self.db_id = db_id
+        self.signatures = signatures
+        self.started_adding = threading.Event()
+
+    def run(self):
+        for k, (image_id, signature) in enumerate(self.signatures.items()):
+            assert self.imgdb.addImageSignature(self.db_id, image_id, *signature)
+            if k == 100:
+                self.started_adding.set()
+
+
+def _results(imgdb, db_id: int, ids) -> list:
+    return [list(imgdb.queryImgID(db_id, image_id, 20, 0, False)) for image_id in ids]
+
+
+def _check_snapshot(imgdb, path: str, signatures: dict) -> None:
+    """The db space on path holds the first images and the ones added before some point, as if saved then"""
+    assert imgdb.loaddb(2, path)
+    ids = set(imgdb.getImgIdList(2))
+    assert ids >= set(FIRST)
+    added = [image_id for image_id in MORE if image_id in ids]
+    assert added == list(MORE)[:len(added)]
+
+    imgdb.initDbase(3)
+    for image_id in list(FIRST) + added:
+        assert imgdb.addImageSignature(3, image_id, *signatures[image_id])
+    queried = list(FIRST)[::29] + added[::97]
+    assert _results(imgdb, 2, queried) == _results(imgdb, 3, queried)
+    imgdb.removedb(2)
+    imgdb.removedb(3)
+
+
+def test_save_while_adding(imgdb, tmp_path):
+    imgdb.initDbase(1)
+    signatures = add_random_images(imgdb, 1, FIRST)
+    more = random_images(MORE, seed=1)
+    signatures.update(more)
+
+    adder = Adder(imgdb, 1, more)
+    adder.start()
+    adder.started_adding.wait()
+    paths = []
+    while adder.is_alive() and len(paths) < 5:
+        paths.append(str(tmp_path / ("snapshot-%d.isk" % len(paths))))
+        assert imgdb.savedb(1, paths[-1])
+    adder.join()
+
+    assert imgdb.getImgCount(1) == len(FIRST) + len(MORE)
+    for path in paths:
+        _check_snapshot(imgdb, path, signatures)
+
+
+def test_checkpoint_while_adding(imgdb, tmp_path):
+    spaces = str(tmp_path / "spaces")
+    imgdb.initDbase(1)
+    signatures = add_random_images(imgdb, 1, FIRST)
+    more = random_images(MORE, seed=1)
+    signatures.update(more)
+
+    adder = Adder(imgdb, 1, more)
+    adder.start()
+    adder.started_adding.wait()
+    assert imgdb.checkpointdbs(spaces) == 1
+    _check_snapshot(imgdb, os.path.join(spaces, "space-1.isk"), signatures)
+    adder.join()
+
+    # what was added after the snapshot is still to be saved
+    assert imgdb.checkpointdbs(spaces) >= 0
+    assert imgdb.getUnsavedChanges(1) == 0
+    assert imgdb.loaddb(2, os.path.join(spaces, "space-1.isk"))
+    assert sorted(imgdb.getImgIdList(2)) == list(FIRST) + list(MORE)
@@ -0,0 +1,49 @@
+"""
+Query results: the numres best scored images, selected over the whole db space.
+"""
+
+import random
+
+import pytest
+
+from conftest import add_random_images, random_signature
+
+
+@pytest.fixture
+def db_space(imgdb):
+    """Db space 1, with some removed images and groups of images having the very same signature"""
+    imgdb.initDbase(1)
+    add_random_images(imgdb, 1, range(1, 501))
+    imgdb.removeIDs(1, list(range(1, 501, 9)))
+    rng = random.Random(6)
+    for group in range(5):
+        signature = random_signature(rng)
+        for image_id in range(1000 + 10 * group, 1010 + 10 * group):
+            assert imgdb.addImageSignature(1, image_id, *signature)
+    return 1
+
+
+def _all_results(imgdb, db_id: int, image_id: int, sketch: int, color_only: bool) -> list:
+    results = list(imgdb.queryImgID(db_id, image_id, 100000, sketch, color_only))
+    assert sorted(results[0::2]) == sorted(imgdb.getImgIdList(db_id))
+    return results
+
+
+@pytest.mark.parametrize("sketch, color_only", [(0, False), (1, False), (0, True)])
+@pytest.mark.parametrize("image_id", [2, 250, 1003, 1045])
+def test_best_of_all(imgdb, db_space, image_id, sketch, color_only):
+    results = _all_results(imgdb, db_space, image_id, sketch, color_only)
+    scores = results[1::2]
+    # the best come last
+    assert scores == sorted(scores, reverse=True)
+    for numres in (1, 3, 10, 100):
+        assert list(imgdb.queryImgID(db_space, image_id, numres, sketch, color_only)) == results[-2 * numres:]
+
+
+def test_ties(imgdb, db_space):
+    # every image of the group scores the same, which ones make the results must not change
+    results = list(imgdb.queryImgID(db_space, 1012, 4, 0, False))
+    assert len(set(results[1::2])) == 1
+    assert set(results[0::2]) <= set(range(1010, 1020))
+    for _ in range(3):
+        assert list(imgdb.queryImgID(db_space, 1012, 4, 0, False)) == results
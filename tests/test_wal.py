@@ -0,0 +1,133 @@
+"""
+Write ahead log: changes made since the last checkpoint are replayed after a crash.
+
+Each step runs on a process of its own, that makes changes and dies without closing anything, then a new
+one loads the checkpoint and replays the log, and must find the db spaces as the first one left them.
+"""
+
+import json
+import os
+
+import pytest
+
+from conftest import run_engine
+
+
+FINGERPRINT = '''
+import json
+from conftest import add_random_images
+def fingerprint():
+    spaces = {}
+    for db_id in sorted(imgdb.getDBList()):
+        ids = sorted(imgdb.getImgIdList(db_id))
+        spaces[db_id] = {
+            "ids": ids,
+            "keywords": {image_id: sorted(imgdb.getKeywordsImg(db_id, image_id)) for image_id in ids},
+            "queries": [list(imgdb.queryImgID(db_id, image_id, 10, 0, False)) for image_id in ids[::23]],
+        }
+    return json.dumps(spaces, sort_keys=True)
+'''
+
+OPEN = '''
+imgdb.loaddbsdir({spaces!r}, 2)
+replayed = imgdb.openLog({log!r}, {sync_ms})
+'''
+
+CHANGES = '''
+imgdb.initDbase(1); imgdb.initDbase(2); imgdb.initDbase(3)
+add_random_images(imgdb, 1, range(1, 301))
+add_random_images(imgdb, 2, range(1, 101), seed=2)
+for image_id in range(1, 301, 5): imgdb.removeID(1, image_id)
+imgdb.removeIDs(2, list(range(1, 50, 3)))
+for image_id in range(2, 300, 3): imgdb.addKeywordImg(1, image_id, image_id % 7)
+for image_id in range(2, 300, 11): imgdb.addKeywordsImg(1, image_id, [100, 101, 102])
+for image_id in range(2, 300, 22): imgdb.removeKeywordImg(1, image_id, 101)
+for image_id in range(2, 300, 33): imgdb.removeAllKeywordImg(1, image_id)
+add_random_images(imgdb, 1, range(1, 301, 10), seed=3)
+imgdb.removedb(3)
+imgdb.initDbase(4); add_random_images(imgdb, 4, [7]); imgdb.resetdb(4); add_random_images(imgdb, 4, [8])
+'''
+
+MORE_CHANGES = '''
+add_random_images(imgdb, 1, range(301, 401), seed=4)
+for image_id in range(2, 200, 4): imgdb.removeID(1, image_id)
+for image_id in range(301, 401, 2): imgdb.addKeywordImg(1, image_id, 55)
+'''
+
+CRASH = '''
+print(fingerprint())
+os._exit(0)
+'''
+
+RECOVER = '''
+print(fingerprint())
+print(replayed)
+'''
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return {"spaces": str(tmp_path / "spaces"), "log": str(tmp_path / "db.wal"), "sync_ms": 0}
+
+
+def _run(paths: dict, code: str, **kwargs) -> list:
+    return run_engine(FINGERPRINT + OPEN.format(**dict(paths, **kwargs)) + code).splitlines()
+
+
+def test_replay_after_crash(paths):
+    expected = _run(paths, CHANGES + CRASH)[-1]
+    recovered, replayed = _run(paths, RECOVER)
+    assert recovered == expected
+    assert int(replayed) > 0
+    assert json.loads(recovered).keys() == {"1", "2", "4"}
+
+
+def test_replay_after_checkpoint(paths):
+    _run(paths, CHANGES + "imgdb.closeLog()\n")
+    expected = _run(paths, "assert imgdb.checkpointdbs({!r}) > 0\n".format(paths["spaces"]) + MORE_CHANGES + CRASH)
+    recovered, replayed = _run(paths, RECOVER)
+    assert recovered == expected[-1]
+    # the segments the checkpoint covers are dropped: only the later changes are replayed
+    assert 0 < int(replayed) < 300
+
+
+def test_torn_tail(paths, tmp_path):
+    expected = _run(paths, CHANGES + CRASH)[-1]
+    segments = sorted(name for name in os.listdir(str(tmp_path)) if name.startswith("db.wal."))
+    with open(str(tmp_path / segments[-1]), "ab") as f:
+        f.write(b"\x30\x00\x00\x00garbage")  # a record cut short by the crash
+    recovered, _ = _run(paths, RECOVER)
+    assert recovered == expected
+
+
+def test_interval_sync(paths):
+    expected = _run(paths, CHANGES + "imgdb.closeLog()\nprint(fingerprint())\n", sync_ms=5)[-1]
+    recovered, _ = _run(paths, RECOVER, sync_ms=5)
+    assert recovered == expected
+
+
+FAILING_LOG = '''
+import resource, signal
+imgdb.initDbase(1)
+add_random_images(imgdb, 1, range(1, 11))
+# writes past the limit fail with EFBIG instead of killing the process
+signal.signal(signal.SIGXFSZ, signal.SIG_IGN)
+limits = resource.getrlimit(resource.RLIMIT_FSIZE)
+resource.setrlimit(resource.RLIMIT_FSIZE, (imgdb.getLogSize(), limits[1]))
+print(imgdb.removeID(1, 1), imgdb.isImageOnDB(1, 1), imgdb.isLogBroken())
+resource.setrlimit(resource.RLIMIT_FSIZE, limits)
+# refused until a checkpoint, though the disk takes them again
+print(imgdb.removeID(1, 2), imgdb.addKeywordImg(1, 3, 5), imgdb.isImageOnDB(1, 2))
+print(imgdb.checkpointdbs({spaces!r}) > 0, imgdb.isLogBroken())
+print(imgdb.removeID(1, 2), imgdb.isImageOnDB(1, 2))
+print(fingerprint())
+os._exit(0)
+'''
+
+
+def test_failed_append_refuses_changes(paths):
+    *results, expected = _run(paths, FAILING_LOG.format(**paths))
+    assert results == ["0 True True", "0 False True", "True False", "1 False"]
+    recovered, _ = _run(paths, RECOVER)
+    assert recovered == expected
+    assert json.loads(recovered)["1"]["ids"] == [1] + list(range(3, 11))
@@ -0,0 +1,182 @@
+"""
+Images uploaded to the REST endpoints, served on a local port. These need the web dependencies (sunhead and the
+aiohttp it runs on), and are skipped otherwise.
+"""
+
+import asyncio
+import io
+import tarfile
+
+import pytest
+
+from conftest import write_images
+
+
+DB_ID = 1
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    """The REST views on a database of their own: event loop, url prefix and api backend"""
+    aiohttp = pytest.importorskip("aiohttp")
+    conf = pytest.importorskip("sunhead.conf")
+    from aiohttp import web
+
+    conf.settings.configure(custom_envvar="ISK_SETTINGS_MODULE", fallback_module="isk.global_settings")
+    conf.settings.DATABASE_PATH = str(tmp_path_factory.mktemp("web") / "isk-db")
+    conf.settings.WRITE_AHEAD_LOG = False
+    from isk.backends.factory import backend
+    from isk.backends.imgseeklib import imgdb
+    from isk.web.rest.urls import urlconf
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    # routed as sunhead's http server does
+    app = web.Application()
+    for method, url, view in urlconf:
+        app.router.add_route(method, url, view)
+    listening = loop.run_until_complete(loop.create_server(app.make_handler(), "127.0.0.1", 0))
+    session = aiohttp.ClientSession()
+    url = "http://127.0.0.1:%d/db/%d/" % (listening.sockets[0].getsockname()[1], DB_ID)
+    yield loop, session, url, backend
+
+    session.close()
+    listening.close()
+    loop.run_until_complete(listening.wait_closed())
+    loop.close()
+    imgdb.closeDbase()
+    backend.db_spaces.clear()
+
+
+@pytest.fixture
+def backend(server):
+    """The api backend, with an empty db space DB_ID"""
+    backend = server[3]
+    backend.createdb(DB_ID)
+    return backend
+
+
+@pytest.fixture
+def images(tmp_path) -> dict:
+    """Image file data by image id"""
+    images = {}
+    for path in write_images(str(tmp_path), 40):
+        if "broken" not in path:
+            with open(path, "rb") as f:
+                images[len(images) + 1] = f.read()
+    return images
+
+
+def _request(server, method: str, path: str, **kwargs):
+    """Status and body of a request to the db space url, ``path`` relative to it"""
+    loop, session, url, _ = server
+
+    async def request():
+        async with session.request(method, url + path, **kwargs) as response:
+            return response.status, await response.read()
+
+    return loop.run_until_complete(request())
+
+
+def _added(backend, images: dict) -> None:
+    """Db space DB_ID holds exactly ``images``, as added from their data"""
+    from isk.backends.imgseeklib.signatures import blob_signature
+
+    assert sorted(backend.get_img_id_list(DB_ID)) == sorted(images)
+    for image_id, data in images.items():
+        assert list(backend.get_image_avgl(DB_ID, image_id)) == list(blob_signature(data).avgl)
+
+
+def _tgz(members) -> bytes:
+    """Archive of ``(name, data)`` members, data None for a directory"""
+    f = io.BytesIO()
+    with tarfile.open(fileobj=f, mode="w:gz") as tar:
+        for name, data in members:
+            tarinfo = tarfile.TarInfo(name)
+            if data is None:
+                tarinfo.type = tarfile.DIRTYPE
+                tar.addfile(tarinfo)
+            else:
+                tarinfo.size = len(data)
+                tar.addfile(tarinfo, io.BytesIO(data))
+    return f.getvalue()
+
+
+def test_tgz(server, backend, images, monkeypatch):
+    from sunhead.conf import settings
+
+    biggest = max(len(data) for data in images.values())
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", biggest)
+    members = [("%d.ppm" % image_id, data) for image_id, data in images.items()]
+    # none of these is added
+    members[5:5] = [("notes.txt", b"not an image"), ("cover.ppm", images[1]), ("0.ppm", images[2]), ("sub", None),
+                    ("1000.ppm", b"\0" * (biggest + 1))]
+
+    status, _ = _request(server, "POST", "dropbox/tgz/", data=io.BytesIO(_tgz(members)))
+    assert status == 202
+    _added(backend, images)
+
+
+def test_tgz_cut_short(server, backend, images):
+    archive = _tgz(("%d.ppm" % image_id, data) for image_id, data in images.items())
+
+    status, _ = _request(server, "POST", "dropbox/tgz/", data=io.BytesIO(archive[:len(archive) // 2]))
+    assert status == 202
+    # the images read before the archive ended are added
+    added = sorted(backend.get_img_id_list(DB_ID))
+    assert added == list(range(1, len(added) + 1))
+    assert 0 < len(added) < len(images)
+    _added(backend, {image_id: images[image_id] for image_id in added})
+
+
+def _form(*fields):
+    """Multipart form of ``(name, value)`` fields, bytes values as files"""
+    from aiohttp import FormData
+
+    form = FormData()
+    for name, value in fields:
+        if isinstance(value, bytes):
+            form.add_field(name, value, filename="%s.ppm" % name, content_type="application/octet-stream")
+        else:
+            form.add_field(name, value)
+    return form
+
+
+def test_upload(server, backend, images):
+    for image_id, data in images.items():
+        status, _ = _request(server, "POST", "dropbox/image/", data=_form(("image_id", str(image_id)), ("image", data)))
+        assert status == 202
+    _added(backend, images)
+
+
+def test_upload_over_cap(server, backend, images, monkeypatch):
+    from sunhead.conf import settings
+
+    # every field counts, whether the view reads it or not
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", len(images[1]) + len("1") + 10)
+    for fields in ((("image_id", "2"), ("image", images[1] + b"\0" * 11)),
+                   (("image_id", "3"), ("comment", "x" * 11), ("image", images[1]))):
+        status, _ = _request(server, "POST", "dropbox/image/", data=_form(*fields))
+        assert status == 413
+        status, _ = _request(server, "POST", "query/", data=_form(*fields))
+        assert status == 413
+    status, _ = _request(server, "POST", "dropbox/image/", data=_form(("image_id", "1"), ("image", images[1])))
+    assert status == 202
+    _added(backend, {1: images[1]})
+
+
+def test_query_post_as_get(server, backend, images):
+    import json
+
+    backend.add_image_blobs(DB_ID, [(data, image_id) for image_id, data in images.items()])
+    for image_id in (1, 7, 20):
+        status, body = _request(server, "GET", "query/?image_id=%d&results=5" % image_id)
+        assert status == 200
+        expected = json.loads(body.decode())["results"]
+        status, body = _request(server, "POST", "query/?results=5", data=_form(("image", images[image_id])))
+        assert status == 200
+        results = json.loads(body.decode())["results"]
+        assert [result[0] for result in results] == [result[0] for result in expected]
+        assert [result[1] for result in results] == pytest.approx([result[1] for result in expected])
+    status, _ = _request(server, "POST", "query/", data=_form(("image_id", "1")))
+    assert status == 400